@@ -0,0 +1 @@
+"""Benchmark suite for the hot paths of blueprints, run with ``python -m benchmarks``."""
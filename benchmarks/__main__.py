@@ -0,0 +1,87 @@
+"""Run the benchmark suite and compare the times with the stored baseline.
+
+Usage, from the root of the repository::
+
+    python -m benchmarks                  # compare with benchmarks/baseline.json, exit code 1 on a regression
+    python -m benchmarks --threshold 0.1  # report slowdowns of more than 10%
+    python -m benchmarks -k formulas      # only run the benchmarks with "formulas" in their name
+    python -m benchmarks --save           # store the times as the new baseline
+    python -m benchmarks --save -k geometry  # only update the baseline of the benchmarks with "geometry" in their name
+
+Times are compared relative to a reference workload, so the baseline can be stored on another machine than the one running the suite.
+Store a new baseline after an intended change in performance, in a commit of its own, so a slowdown of a change is not hidden by the
+baseline stored along with it.
+"""
+
+import argparse
+import sys
+
+from benchmarks.cases import all_benchmarks
+from benchmarks.harness import DEFAULT_THRESHOLD, compare, load_baseline, run, save_baseline
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Run the benchmark suite.
+
+    Parameters
+    ----------
+    arguments : list[str] | None, default None
+        The command line arguments. Defaults to the arguments of the process.
+
+    Returns
+    -------
+    int
+        The exit code: 1 if a benchmark is slower than the baseline by more than the threshold, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the hot paths of blueprints.")
+    parser.add_argument("-k", "--filter", default="", help="only run the benchmarks with this text in their name")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="relative slowdown reported as regression (default: %(default)s)")
+    parser.add_argument("--min-duration", type=float, default=0.02, help="minimum duration of a timing loop in seconds (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=7, help="number of timing loops per benchmark (default: %(default)s)")
+    parser.add_argument("--save", action="store_true", help="store the times as the new baseline")
+    options = parser.parse_args(arguments)
+
+    benchmarks = [benchmark for benchmark in all_benchmarks() if options.filter in benchmark.name]
+    times, calibration = run(benchmarks, min_duration=options.min_duration, repeat=options.repeat)
+
+    if options.save:
+        baseline = load_baseline()
+        if options.filter and baseline.get("calibration"):
+            # keep the baseline of the benchmarks that did not run, and scale the new times to the speed of the machine of the baseline
+            scale = baseline["calibration"] / calibration
+            times = baseline["benchmarks"] | {name: time * scale for name, time in times.items()}
+            calibration = baseline["calibration"]
+        save_baseline(times, calibration)
+        _report(f"Stored the baseline of {len(times)} benchmarks.")
+        return 0
+
+    baseline = load_baseline()
+    comparisons = compare(times, calibration, baseline, threshold=options.threshold)
+    suspect_names = {comparison.name for comparison in comparisons if comparison.is_regression}
+    suspects = [benchmark for benchmark in benchmarks if benchmark.name in suspect_names]
+    if suspects:
+        # measure the suspected regressions again, to rule out a temporary slowdown of the machine
+        suspect_times, suspect_calibration = run(suspects, min_duration=options.min_duration, repeat=options.repeat)
+        for name, time in suspect_times.items():
+            times[name] = min(times[name], time * calibration / suspect_calibration)
+        comparisons = compare(times, calibration, baseline, threshold=options.threshold)
+    width = max((len(comparison.name) for comparison in comparisons), default=0)
+    for comparison in comparisons:
+        reference = "no baseline" if comparison.baseline_time is None else f"{comparison.baseline_time * 1e6:10.2f} us {comparison.change:+7.1%}"
+        flag = "  REGRESSION" if comparison.is_regression else ""
+        _report(f"{comparison.name:<{width}}  {comparison.time * 1e6:10.2f} us  {reference}{flag}")
+
+    regressions = [comparison.name for comparison in comparisons if comparison.is_regression]
+    if regressions:
+        _report(f"\n{len(regressions)} benchmark(s) slower than the baseline by more than {options.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def _report(line: str) -> None:
+    """Report a line of the results on the console."""
+    print(line)  # noqa: T201
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,355 @@
+"""Module with the benchmarks of the hot paths of blueprints."""
+
+import importlib
+
+import numpy as np
+from shapely import Point
+
+from benchmarks.harness import Benchmark
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
+    Carbonation,
+    Chemical,
+    Chloride,
+    ChlorideSeawater,
+    FreezeThaw,
+    Table4Dot1ExposureClasses,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_3 import Table4Dot3ConcreteStructuralClass
+from blueprints.codes.formula import Formula
+from blueprints.geometry.line import Line
+from blueprints.geometry.line_collection import LineCollection
+from blueprints.geometry.operations import CoordinateSystemOptions, calculate_rotation_angles
+from blueprints.geometry.spatial_index import LineIndex
+from blueprints.materials.concrete import CementClass, ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.concrete_creep import CreepModel
+from blueprints.materials.concrete_shrinkage import ShrinkageModel
+from blueprints.materials.concrete_stress_strain import ParabolaRectangleDiagram, SarginDiagram
+from blueprints.materials.concrete_time_history import concrete_time_history
+from blueprints.materials.prestressing_steel_relaxation import RelaxationClass, RelaxationModel
+from blueprints.materials.reinforcement_steel import ReinforcementDiagramType, ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.materials.reinforcement_steel_stress_strain import design_diagram
+from blueprints.structural_elements.beam import BeamConnectivity
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.cross_section_shapes import CircularCrossSection, RectangularCrossSection
+
+FORMULA_CASES: dict[str, dict[str, list[tuple[str, dict]]]] = {
+    "nen_9997_1_c2_2017": {
+        "chapter_1_general_rules": [
+            ("Form1Dot0Dot1EquivalentPilePointCenterline", {"a": 300, "b": 400}),
+        ],
+        "chapter_2_basic_of_geotechnical_design": [
+            ("Form2Dot1aDesignValueLoad", {"gamma_f": 1.35, "f_rep": 100}),
+            ("Form2Dot1bRepresentativeValue", {"psi": 0.7, "f_k": 100}),
+            ("Form2Dot2DesignValueGeotechnicalParameter", {"x_k": 30, "gamma_m": 1.25}),
+        ],
+    },
+    "nen_en_1992_1_1_c2_2011": {
+        "chapter_3_materials": [
+            ("Form3Dot1EstimationConcreteCompressiveStrength", {"beta_cc_t": 1, "f_cm": 10}),
+            ("Form3Dot8TotalShrinkage", {"epsilon_cd": 0.25, "epsilon_ca": 0.33}),
+            ("Form3Dot12AutogeneShrinkageInfinity", {"f_ck": 15.8}),
+            ("Form3Dot15DesignValueCompressiveStrength", {"alpha_cc": 0.85, "f_ck": 10.5, "gamma_c": 0.8}),
+            ("Form3Dot23FlexuralTensileStrength", {"h": 305.3, "f_ctm": 23.8}),
+        ],
+        "chapter_4_durability_and_cover": [
+            ("Form4Dot1NominalConcreteCover", {"c_min": 60, "delta_c_dev": 5}),
+            (
+                "Form4Dot2MinimumConcreteCover",
+                {"c_min_b": 5, "c_min_dur": 15, "delta_c_dur_gamma": 5, "delta_c_dur_st": 0, "delta_c_dur_add": 0},
+            ),
+            ("Table4Dot2MinimumCoverWithRegardToBond", {"diameter": 16, "nominal_max_aggregate_size_greater_than_32_mm": False}),
+        ],
+        "chapter_5_structural_analysis": [
+            ("Form5Dot14SlendernessRatio", {"l_0": 5000, "i": 100}),
+            ("Form5Dot15EffectiveLengthBraced", {"k_1": 0.1, "k_2": 0.2, "height": 3000}),
+            ("Form5Dot4TransverseForceEffectBracingSystem", {"theta_i": 0.005, "n_a": 1000, "n_b": 1200}),
+            ("Form5Dot8EffectiveSpan", {"l_n": 6000, "a_1": 150, "a_2": 150}),
+        ],
+        "chapter_6_ultimate_limit_state": [
+            ("Form6Dot1DesignShearStrength", {"v_rd_s": 100, "v_ccd": 20, "v_td": 10}),
+            ("Form6Dot76DesignFatigueStrengthConcrete", {"k_1": 0.85, "beta_cc_t0": 1, "f_cd": 20, "f_ck": 30}),
+        ],
+        "chapter_7_serviceability_limit_state": [
+            ("Form7Dot3CoefficientKc", {"f_cr": 100, "a_ct": 1000, "f_ct_eff": 2.9}),
+        ],
+        "chapter_8_detailing_of_reinforcement_and_prestressing_tendons": [
+            ("Form8Dot2UltimateBondStress", {"eta_1": 1, "eta_2": 1, "f_ctd": 1.2}),
+            ("Form8Dot3RequiredAnchorageLength", {"diameter": 16, "sigma_sd": 435, "f_bd": 2.7}),
+            (
+                "Form8Dot4DesignAnchorageLength",
+                {"alpha_1": 1, "alpha_2": 1, "alpha_3": 1, "alpha_4": 1, "alpha_5": 1, "l_b_rqd": 644, "l_b_min": 200},
+            ),
+            ("Form8Dot14EquivalentDiameterBundledBars", {"diameter": 16, "n_b": 2}),
+        ],
+        "chapter_9_detailling_and_specific_rules": [
+            ("Form9Dot1nMinimumTensileReinforcementBeam", {"f_ctm": 2.9, "f_yk": 500, "b_t": 300, "d": 450}),
+            ("Form9Dot4ShearReinforcementRatio", {"a_sw": 100, "s": 200, "b_w": 300, "alpha": 90}),
+            ("Form9Dot5nMinimumShearReinforcementRatio", {"f_ck": 30, "f_yk": 500}),
+        ],
+    },
+    "nen_en_1993_1_1_c2_a1_2016": {
+        "chapter_2_basic_of_design": [
+            ("Form2Dot2CharacteristicValueResistance", {"r_d": 100, "gamma_mi": 1.1}),
+        ],
+        "chapter_6_ultimate_limit_state": [
+            ("Form6Dot2UtilizationRatio", {"n_ed": 100, "n_rd": 300, "m_y_ed": 50, "m_y_rd": 150, "m_z_ed": 10, "m_z_rd": 60}),
+            ("Form6Dot5UnityCheckTensileStrength", {"n_ed": 100, "n_t_rd": 300}),
+        ],
+    },
+    "nen_en_1993_1_9_c2_2012": {
+        "annex_a_determination_of_fatigue_load_parameters_and_verification_formats": [
+            ("FormADot1DamageDuringDesignLife", {"n_e": [1000, 2000], "n_r": [10_000, 20_000]}),
+            ("FormADot2CriteriaBasedOnDamageAccumulation", {"d_d": 0.5}),
+        ],
+    },
+    "nen_en_1993_5_2008": {
+        "chapter_5_ultimate_limit_states": [
+            ("Form5Dot2DesignMomentResistanceClass1Or2", {"beta_b": 1, "w_pl": 1000, "f_y": 355, "gamma_m_0": 1}),
+            ("Form5Dot5PlasticShearResistance", {"a_v": 1000, "f_y": 355, "gamma_m_0": 1}),
+            ("Form5Dot6ProjectedShearArea", {"h": 300, "t_f": 10, "t_w": 8}),
+        ],
+    },
+}
+"""Formulas with realistic input values, by chapter and by source document package, to benchmark the construction and latex rendering."""
+
+CONCRETE_PROPERTIES = [
+    "e_c",
+    "f_ck",
+    "f_ck_cube",
+    "f_cd",
+    "f_cm",
+    "f_cm_cube",
+    "f_ctm",
+    "f_ctk_0_05",
+    "f_ctd",
+    "f_ctk_0_95",
+    "e_cm",
+    "eps_c1",
+    "eps_cu1",
+    "eps_c2",
+    "eps_cu2",
+    "n_factor",
+    "eps_c3",
+    "eps_cu3",
+]
+"""Properties of ConcreteMaterial that are accessed in the benchmark."""
+
+
+def _formula_cases(document: str, chapter: str) -> list[tuple[type[Formula], dict]]:
+    """The formula classes and their input values of a chapter."""
+    module = importlib.import_module(f"blueprints.codes.eurocode.{document}.{chapter}")
+    return [(getattr(module, name), kwargs) for name, kwargs in FORMULA_CASES[document][chapter]]
+
+
+def _short_chapter_name(chapter: str) -> str:
+    """Short name of a chapter, for example "chapter_8" for "chapter_8_detailing_of_reinforcement_and_prestressing_tendons"."""
+    kind, number, *_ = chapter.split("_")
+    return f"{kind}_{number}"
+
+
+def formula_benchmarks() -> list[Benchmark]:
+    """Benchmarks of the construction and the latex rendering of the formulas of every chapter."""
+    benchmarks = []
+    for document, chapters in FORMULA_CASES.items():
+        for chapter in chapters:
+            cases = _formula_cases(document, chapter)
+            name = f"{document}.{_short_chapter_name(chapter)}"
+
+            def construct(cases: list[tuple[type[Formula], dict]] = cases) -> None:
+                for formula, kwargs in cases:
+                    formula(**kwargs)
+
+            benchmarks.append(Benchmark(name=f"formulas.{name}", function=construct))
+
+            results = [formula(**kwargs) for formula, kwargs in cases if hasattr(formula, "latex")]
+            if results:
+
+                def render(results: list = results) -> None:
+                    for result in results:
+                        result.latex().complete
+
+                benchmarks.append(Benchmark(name=f"latex.{name}", function=render))
+    return benchmarks
+
+
+def material_benchmarks() -> list[Benchmark]:
+    """Benchmarks of the materials."""
+    concrete = ConcreteMaterial(ConcreteStrengthClass.C30_37)
+
+    parabola_rectangle = ParabolaRectangleDiagram.from_material(concrete)
+    sargin = SarginDiagram.from_material(concrete)
+    fiber_strains = np.linspace(-0.001, 0.0035, 10_000)
+    reinforcement = design_diagram(ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.BILINEAR_INCLINED))
+    bar_strains = np.linspace(-0.01, 0.05, 10_000)
+    pours = [ConcreteMaterial(concrete_class, cement_class) for concrete_class in ConcreteStrengthClass for cement_class in CementClass]
+    days = np.arange(1, 366)
+    segments = ShrinkageModel.from_cross_section(concrete, a_c=np.linspace(2e6, 8e6, 100), u=np.full(100, 2e4), relative_humidity=80, t_s=3)
+    ages = np.logspace(0, 4, 1000)
+    creep = CreepModel.from_cross_section(concrete, a_c=np.linspace(2e6, 8e6, 10), u=np.full(10, 2e4), relative_humidity=80)
+    stages = np.linspace(7, 10_000, 1000)
+    stress_history = 5 + np.sin(stages / 100)
+    strands = RelaxationModel(RelaxationClass.CLASS_2, sigma_pi=np.linspace(1100, 1400, 1000), f_pk=1860, t_eq=20)
+    production_hours = np.linspace(0, 1000, 1000)
+    interned_steels = [ReinforcementSteelMaterial.get(steel_quality) for steel_quality in ReinforcementSteelQuality]
+    steel_qualities = [steel.steel_quality for steel in interned_steels] * 100
+
+    def access_concrete_properties() -> None:
+        for name in CONCRETE_PROPERTIES:
+            getattr(concrete, name)
+
+    def evaluate_concrete_diagrams() -> None:
+        parabola_rectangle.stress_and_tangent(fiber_strains)
+        sargin.stress_and_tangent(fiber_strains)
+
+    def evaluate_reinforcement_diagram() -> None:
+        reinforcement.stress_and_tangent(bar_strains)
+
+    def develop_concrete_properties() -> None:
+        concrete_time_history(pours, days)
+
+    def evaluate_shrinkage() -> None:
+        segments.total_shrinkage(ages)
+
+    def evaluate_creep() -> None:
+        creep.creep_strain(stages, stress_history)
+
+    def evaluate_relaxation() -> None:
+        strands.loss(production_hours)
+
+    def intern_materials() -> None:
+        list(map(ReinforcementSteelMaterial.get, steel_qualities))
+
+    return [
+        Benchmark(name="materials.concrete_properties", function=access_concrete_properties),
+        Benchmark(name="materials.concrete_stress_strain", function=evaluate_concrete_diagrams),
+        Benchmark(name="materials.reinforcement_stress_strain", function=evaluate_reinforcement_diagram),
+        Benchmark(name="materials.concrete_time_history", function=develop_concrete_properties),
+        Benchmark(name="materials.concrete_shrinkage", function=evaluate_shrinkage),
+        Benchmark(name="materials.concrete_creep", function=evaluate_creep),
+        Benchmark(name="materials.prestressing_steel_relaxation", function=evaluate_relaxation),
+        Benchmark(name="materials.interning", function=intern_materials),
+    ]
+
+
+def exposure_benchmarks() -> list[Benchmark]:
+    """Benchmarks of the exposure classes and the structural class of table 4.3."""
+    carbonation = list(Carbonation)
+    exposure_classes = Table4Dot1ExposureClasses(Carbonation.XC2, Chloride.XD1, ChlorideSeawater.XS3, FreezeThaw.XF4, Chemical.XA1)
+    concrete = ConcreteMaterial(ConcreteStrengthClass.C20_25)
+
+    def compare_exposures() -> None:
+        for first in carbonation:
+            for second in carbonation:
+                first < second
+                first == second
+        max(carbonation)
+
+    def construct_structural_class() -> None:
+        Table4Dot3ConcreteStructuralClass(exposure_classes, 50, concrete, True, False)
+
+    return [
+        Benchmark(name="exposure.comparisons", function=compare_exposures),
+        Benchmark(name="exposure.table_4_3_structural_class", function=construct_structural_class),
+    ]
+
+
+def geometry_benchmarks() -> list[Benchmark]:
+    """Benchmarks of the line operations."""
+    start_point, end_point = Point(0, 0, 0), Point(1000, 2000, 3000)
+    line = Line(start_point, end_point)
+    members = np.random.default_rng(0).uniform(0, 10_000, size=(2, 10_000, 3))
+    collection = LineCollection(members[0], members[1])
+    short_members = LineCollection(members[0], members[0] + members[1] / 20)
+    member_index = LineIndex(short_members)
+    load_points = members[1][:1000]
+
+    def construct_line() -> None:
+        Line(start_point, end_point)
+
+    def measure_line() -> None:
+        line.length
+        line.midpoint
+        line.unit_vector
+        line.angle()
+
+    def divide_line() -> None:
+        line.get_internal_point(500)
+        line.divide_into_n_lines(10)
+
+    def calculate_member_orientations() -> None:
+        for coordinate_system in CoordinateSystemOptions:
+            calculate_rotation_angles(members[0], members[1], coordinate_system)
+
+    def query_line_index() -> None:
+        LineIndex(short_members)
+        member_index.nearest(load_points)
+        member_index.within_distance(load_points, 100)
+
+    def measure_line_collection() -> None:
+        LineCollection(members[0], members[1])
+        collection.unit_vectors
+        collection.midpoints
+        collection.angles()
+        collection.divide_into_n_lines(10)
+
+    return [
+        Benchmark(name="geometry.line_construction", function=construct_line),
+        Benchmark(name="geometry.line_properties", function=measure_line),
+        Benchmark(name="geometry.line_division", function=divide_line),
+        Benchmark(name="geometry.line_collection", function=measure_line_collection),
+        Benchmark(name="geometry.rotation_angles", function=calculate_member_orientations),
+        Benchmark(name="geometry.line_index", function=query_line_index),
+    ]
+
+
+def structural_element_benchmarks() -> list[Benchmark]:
+    """Benchmarks of the structural elements."""
+    # a frame of 20 x 20 x 10 nodes with beams along the three axes, with end points that differ within the tolerance
+    nodes = np.stack(np.meshgrid(np.arange(20), np.arange(20), np.arange(10), indexing="ij"), axis=-1) * 3000.0
+    start_points = np.concatenate([nodes[:-1].reshape(-1, 3), nodes[:, :-1].reshape(-1, 3), nodes[:, :, :-1].reshape(-1, 3)])
+    end_points = np.concatenate([nodes[1:].reshape(-1, 3), nodes[:, 1:].reshape(-1, 3), nodes[:, :, 1:].reshape(-1, 3)])
+    jitter = np.random.default_rng(0).uniform(-1e-4, 1e-4, size=(2, *start_points.shape))
+    frame = LineCollection(start_points + jitter[0], end_points + jitter[1])
+
+    def build_connectivity() -> None:
+        BeamConnectivity.from_lines(frame)
+
+    return [
+        Benchmark(name="structural_elements.beam_connectivity", function=build_connectivity),
+    ]
+
+
+def section_benchmarks() -> list[Benchmark]:
+    """Benchmarks of the cross-section shapes."""
+    heights = range(300, 1000, 10)
+    column = CircularCrossSection(diameter=500.0, x=0.0, y=0.0)
+
+    def sweep_section_properties() -> None:
+        for height in heights:
+            section = RectangularCrossSection(width=300.0, height=height)
+            section.area
+            section.centroid
+            section.section_modulus_x
+        column.geometry
+        column.vertices
+
+    return [
+        Benchmark(name="sections.cross_section_properties", function=sweep_section_properties),
+    ]
+
+
+def all_benchmarks() -> list[Benchmark]:
+    """All benchmarks of the suite.
+
+    Returns
+    -------
+    list[Benchmark]
+        The benchmarks, with unique names.
+    """
+    return [
+        *formula_benchmarks(),
+        *material_benchmarks(),
+        *exposure_benchmarks(),
+        *geometry_benchmarks(),
+        *structural_element_benchmarks(),
+        *section_benchmarks(),
+    ]
@@ -0,0 +1,177 @@
+"""Module for timing benchmarks and comparing them with a stored baseline."""
+
+import json
+import platform
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+"""Path of the stored baseline."""
+
+DEFAULT_THRESHOLD = 0.25
+"""Default relative slowdown (with respect to the baseline) that is reported as a regression."""
+
+
+class Benchmark(NamedTuple):
+    """Benchmark of a hot path.
+
+    Attributes
+    ----------
+    name : str
+        The unique name of the benchmark, for example "formulas.nen_en_1992_1_1_c2_2011.chapter_8".
+    function : Callable[[], object]
+        The function that runs the hot path once. Set-up work is done before creating the benchmark, so it is not timed.
+    """
+
+    name: str
+    function: Callable[[], object]
+
+
+class Comparison(NamedTuple):
+    """Comparison of the time of a benchmark with its baseline.
+
+    Attributes
+    ----------
+    name : str
+        The name of the benchmark.
+    time : float
+        The measured time per call in seconds.
+    baseline_time : float | None
+        The time per call in the baseline, scaled to the speed of the current machine. None if the benchmark has no baseline yet.
+    change : float | None
+        The relative change of the time with respect to the baseline, for example 0.3 for 30% slower. None if there is no baseline.
+    is_regression : bool
+        True if the change exceeds the threshold.
+    """
+
+    name: str
+    time: float
+    baseline_time: float | None
+    change: float | None
+    is_regression: bool
+
+
+def _reference_workload() -> object:
+    """Fixed workload, timed as a measure of the speed of the current machine."""
+    values = {str(number): float(number) for number in range(200)}
+    return sum(value * 1.5 for key, value in values.items() if key.isdigit())
+
+
+REFERENCE = Benchmark(name="reference", function=_reference_workload)
+"""Benchmark of a fixed workload, run along with every suite, as a measure of the speed of the current machine.
+
+Times are compared with the baseline relative to this reference, so a baseline stored on one machine can be used on another machine.
+"""
+
+
+def run(benchmarks: list[Benchmark], min_duration: float = 0.02, repeat: int = 7) -> tuple[dict[str, float], float]:
+    """Measure the time per call of every benchmark, and of the reference workload.
+
+    Every benchmark is called in loops that take at least ``min_duration`` seconds, and the fastest of ``repeat`` loops is used, as slower
+    loops are slowed down by other processes rather than by the benchmark itself. The loops of all benchmarks are interleaved, so a
+    temporary slowdown of the machine does not affect all loops of a single benchmark.
+
+    Parameters
+    ----------
+    benchmarks : list[Benchmark]
+        The benchmarks.
+    min_duration : float, default 0.02
+        Minimum duration of a loop in seconds.
+    repeat : int, default 7
+        Number of loops per benchmark.
+
+    Returns
+    -------
+    tuple[dict[str, float], float]
+        The time per call in seconds by name of the benchmark, and the time per call of the reference workload.
+    """
+    timers = {}
+    for benchmark in [REFERENCE, *benchmarks]:
+        timer = timeit.Timer(benchmark.function)
+        number = 1
+        while timer.timeit(number) < min_duration:
+            number *= 2
+        timers[benchmark.name] = (timer, number)
+
+    reference_timer, reference_number = timers.pop(REFERENCE.name)
+    calibration = float("inf")
+    times = dict.fromkeys(timers, float("inf"))
+    for _ in range(repeat):
+        for name, (timer, number) in timers.items():
+            # the reference is timed before every benchmark, as its time scales the times of all benchmarks
+            calibration = min(calibration, reference_timer.timeit(reference_number) / reference_number)
+            times[name] = min(times[name], timer.timeit(number) / number)
+        calibration = min(calibration, reference_timer.timeit(reference_number) / reference_number)
+    return times, calibration
+
+
+def compare(times: dict[str, float], calibration: float, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[Comparison]:
+    """Compare measured times with a baseline.
+
+    Parameters
+    ----------
+    times : dict[str, float]
+        The measured time per call in seconds, by name of the benchmark.
+    calibration : float
+        The time per call of the reference workload on the current machine, see :func:`run`.
+    baseline : dict
+        The baseline, as returned by :func:`load_baseline`.
+    threshold : float, default DEFAULT_THRESHOLD
+        Relative slowdown that is reported as a regression.
+
+    Returns
+    -------
+    list[Comparison]
+        The comparison per benchmark, in the order of the measured times.
+    """
+    scale = calibration / baseline["calibration"] if baseline.get("calibration") else 1.0
+    baseline_times = baseline.get("benchmarks", {})
+    comparisons = []
+    for name, time in times.items():
+        if name not in baseline_times:
+            comparisons.append(Comparison(name=name, time=time, baseline_time=None, change=None, is_regression=False))
+            continue
+        baseline_time = baseline_times[name] * scale
+        change = time / baseline_time - 1
+        comparisons.append(Comparison(name=name, time=time, baseline_time=baseline_time, change=change, is_regression=change > threshold))
+    return comparisons
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    """Load the stored baseline.
+
+    Parameters
+    ----------
+    path : Path, default BASELINE_PATH
+        The path of the baseline.
+
+    Returns
+    -------
+    dict
+        The baseline, with the ``calibration`` time and the time per call of the ``benchmarks`` by name. Empty if no baseline is stored.
+    """
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(times: dict[str, float], calibration: float, path: Path = BASELINE_PATH) -> None:
+    """Store measured times as the baseline.
+
+    Parameters
+    ----------
+    times : dict[str, float]
+        The measured time per call in seconds, by name of the benchmark.
+    calibration : float
+        The time per call of the reference workload on the current machine, see :func:`run`.
+    path : Path, default BASELINE_PATH
+        The path of the baseline.
+    """
+    baseline = {
+        "python": platform.python_version(),
+        "calibration": calibration,
+        "benchmarks": dict(sorted(times.items())),
+    }
+    path.write_text(json.dumps(baseline, indent=4) + "\n", encoding="utf-8")
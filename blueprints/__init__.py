@@ -1,3 +1,24 @@
 """Blueprints."""
 
+from blueprints.utils.lazy_import import lazy_import
+
 __version__ = "0.0.6"
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=[
+        "checks",
+        "codes",
+        "external",
+        "geometry",
+        "materials",
+        "product_data",
+        "soil_profiles",
+        "structural_elements",
+        "structural_sections",
+        "type_alias",
+        "unit_conversion",
+        "utils",
+        "validations",
+    ],
+)
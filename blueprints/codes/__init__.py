@@ -1 +1,19 @@
 """Codes package."""
+
+from blueprints.utils.lazy_import import lazy_import
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=["cur", "eurocode"],
+    submodule_attributes={
+        "calculation_graph": ["CalculationGraph"],
+        "formula": ["Formula"],
+        "formula_batch": ["BatchResult", "BatchRunner", "RowError"],
+        "formula_cache": ["CacheInfo", "FormulaCache"],
+        "formula_profiler": ["FormulaProfiler", "ProfileRecord", "profiled"],
+        "formula_registry": ["FormulaEntry", "FormulaRegistry"],
+        "formula_results": ["FormulaResults"],
+        "formula_serialization": ["dumps_results", "loads_results"],
+        "latex_formula": ["LatexFormula"],
+    },
+)
@@ -0,0 +1,217 @@
+"""Module for chaining formulas in a calculation graph, with lazy and incremental (re)evaluation."""
+
+from __future__ import annotations
+
+import copy
+import inspect
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from blueprints.codes.formula import Formula
+
+
+class _Node(NamedTuple):
+    """Formula node of a calculation graph, with the name of the input or node that provides each parameter."""
+
+    formula: type[Formula]
+    sources: dict[str, str]
+
+
+class CalculationGraph:
+    """Graph of chained formulas, in which the parameters of a formula are provided by inputs or by the results of other formulas.
+
+    Every formula node has a name, which is the name of its result. A parameter of a formula is provided by the input or node with the same
+    name as the parameter, unless another source is given when adding the formula. Nodes are evaluated lazily, when their result (or the
+    result of a dependent node) is requested. When an input changes, only the nodes that depend on it are evaluated again.
+
+    If any of the input values of a node is an array, the node is evaluated with :meth:`Formula.evaluate_many` and its result is an array, so
+    a chain can be evaluated for many bars at once. Otherwise, the result is a :class:`Formula` instance.
+
+    Examples
+    --------
+    >>> graph = (
+    ...     CalculationGraph(diameter=16, sigma_sd=435, f_ctd=1.2, bond_quality="good")
+    ...     .add("eta_1", SubForm8Dot2CoefficientQualityOfBond)
+    ...     .add("eta_2", SubForm8Dot2CoefficientBarDiameter)
+    ...     .add("f_bd", Form8Dot2UltimateBondStress)
+    ...     .add("l_b_rqd", Form8Dot3RequiredAnchorageLength)
+    ... )
+    >>> graph["l_b_rqd"]
+    644.444...
+    >>> graph.set_inputs(f_ctd=1.5)  # only f_bd and l_b_rqd are evaluated again
+    >>> graph["l_b_rqd"]
+    515.555...
+
+    Parameters
+    ----------
+    **inputs
+        The initial input values, by name.
+    """
+
+    def __init__(self, **inputs) -> None:
+        self._inputs: dict[str, object] = {name: _stored_value(value) for name, value in inputs.items()}
+        self._nodes: dict[str, _Node] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._results: dict[str, object] = {}
+        self.evaluations = 0
+        """Number of node evaluations so far."""
+
+    def add(self, name: str, formula: type[Formula], **sources: str) -> Self:
+        """Add a formula node to the graph.
+
+        Parameters
+        ----------
+        name : str
+            The name of the node, which is the name of its result.
+        formula : type[Formula]
+            The formula class of the node.
+        **sources : str
+            Name of the input or node that provides a parameter, by parameter name. Defaults to the name of the parameter itself.
+
+        Returns
+        -------
+        Self
+            The graph, to chain calls.
+
+        Raises
+        ------
+        ValueError
+            If an input or node with the given name already exists.
+        """
+        if name in self._inputs or name in self._nodes:
+            raise ValueError(f"An input or formula named '{name}' already exists in the graph.")
+        parameters = [parameter for parameter in inspect.signature(formula.__init__).parameters if parameter != "self"]
+        unknown_parameters = set(sources) - set(parameters)
+        if unknown_parameters:
+            raise ValueError(f"'{formula.__name__}' has no parameters {sorted(unknown_parameters)}.")
+        node = _Node(formula=formula, sources={parameter: sources.get(parameter, parameter) for parameter in parameters})
+        self._nodes[name] = node
+        for source in node.sources.values():
+            self._dependents.setdefault(source, set()).add(name)
+        return self
+
+    def set_inputs(self, **inputs) -> None:
+        """Set (or change) input values, and mark the nodes that depend on a changed input for re-evaluation.
+
+        Array input values are copied, so an array that is changed in place must be set again, which then marks its dependent nodes.
+
+        Parameters
+        ----------
+        **inputs
+            The input values, by name.
+
+        Raises
+        ------
+        ValueError
+            If a name is the name of a formula node.
+        """
+        formula_names = set(inputs) & set(self._nodes)
+        if formula_names:
+            raise ValueError(f"Cannot set the results of formulas {sorted(formula_names)} as input.")
+        for name, value in inputs.items():
+            if name in self._inputs and _is_same_value(self._inputs[name], value):
+                continue
+            self._inputs[name] = _stored_value(value)
+            self._invalidate_dependents(name)
+
+    def is_dirty(self, name: str) -> bool:
+        """Whether the formula node with the given name must be (re-)evaluated before its result is available.
+
+        Parameters
+        ----------
+        name : str
+            The name of the formula node.
+
+        Returns
+        -------
+        bool
+            True if the node has no up-to-date result.
+        """
+        if name not in self._nodes:
+            raise KeyError(f"No formula named '{name}' in the graph.")
+        return name not in self._results
+
+    def __getitem__(self, name: str) -> object:
+        """Return an input value, or the result of a formula node, evaluating it (and its dependencies) if needed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the input or formula node.
+
+        Returns
+        -------
+        object
+            The input value, or the result of the formula (a Formula instance, or an array for array input values).
+        """
+        return self._get(name, ())
+
+    def evaluate(self, *names: str) -> dict[str, object]:
+        """Return the results of the given formula nodes, or of all formula nodes if no names are given.
+
+        Parameters
+        ----------
+        *names : str
+            The names of the formula nodes.
+
+        Returns
+        -------
+        dict[str, object]
+            The results, by name.
+        """
+        return {name: self[name] for name in names or self._nodes}
+
+    def _get(self, name: str, path: tuple[str, ...]) -> object:
+        """Return the input value or result with the given name, with the path of the dependent nodes to detect cycles."""
+        if name in self._inputs:
+            return self._inputs[name]
+        if name in self._results:
+            return self._results[name]
+        if name not in self._nodes:
+            dependent = f" for '{path[-1]}'" if path else ""
+            raise KeyError(f"No input or formula named '{name}' in the graph{dependent}.")
+        if name in path:
+            raise ValueError(f"Circular dependency in the graph: {' -> '.join((*path[path.index(name) :], name))}.")
+        node = self._nodes[name]
+        kwargs = {parameter: self._get(source, (*path, name)) for parameter, source in node.sources.items()}
+        if any(_is_array(value) for value in kwargs.values()):
+            result: object = node.formula.evaluate_many(**kwargs)
+        else:
+            result = node.formula(**kwargs)
+        self.evaluations += 1
+        self._results[name] = result
+        return result
+
+    def _invalidate_dependents(self, name: str) -> None:
+        """Remove the results of all nodes that (indirectly) depend on the input or node with the given name."""
+        for dependent in self._dependents.get(name, ()):
+            if self._results.pop(dependent, None) is not None:
+                self._invalidate_dependents(dependent)
+
+
+def _is_array(value: object) -> bool:
+    """Whether an input value is an array of values (records, like the named tuple of exposure classes, and strings are single values)."""
+    return not isinstance(value, tuple | str) and np.ndim(value) > 0  # type: ignore[arg-type]
+
+
+def _stored_value(value: object) -> object:
+    """Copy an array input value, so that changing the array in place is detected as a change when it is set again."""
+    return copy.deepcopy(value) if _is_array(value) else value
+
+
+def _is_same_value(old: object, new: object) -> bool:
+    """Whether a new input value is the same as the old one, so the dependent nodes do not have to be evaluated again."""
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, np.ndarray):
+        return np.array_equal(old, new)  # type: ignore[arg-type]
+    try:
+        return bool(old == new)
+    except ValueError:
+        return False
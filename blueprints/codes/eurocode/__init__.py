@@ -1 +1,16 @@
 """Eurocodes package."""
+
+from blueprints.utils.lazy_import import lazy_import
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=[
+        "exposure_classes",
+        "nen_9997_1_c2_2017",
+        "nen_en_1992_1_1_c2_2011",
+        "nen_en_1993_1_1_c2_a1_2016",
+        "nen_en_1993_1_9_c2_2012",
+        "nen_en_1993_5_2008",
+        "structural_class",
+    ],
+)
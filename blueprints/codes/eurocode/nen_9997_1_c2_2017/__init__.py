@@ -1,3 +1,24 @@
 """NEN 9997-1-C2:2017."""
 
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .chapter_1_general_rules.formula_1_0_1 import Form1Dot0Dot1EquivalentPilePointCenterline
+    from .chapter_2_basic_of_geotechnical_design.formula_2_1_a import Form2Dot1aDesignValueLoad
+    from .chapter_2_basic_of_geotechnical_design.formula_2_1_b import Form2Dot1bRepresentativeValue
+    from .chapter_2_basic_of_geotechnical_design.formula_2_2 import Form2Dot2DesignValueGeotechnicalParameter
+
 NEN_9997_1_C2_2017 = "NEN 9997-1-C2:2017"
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=[
+        "chapter_1_general_rules",
+        "chapter_2_basic_of_geotechnical_design",
+    ],
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
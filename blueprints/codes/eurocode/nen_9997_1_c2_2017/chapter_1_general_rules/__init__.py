@@ -1 +1,15 @@
 """Package representing the formulas chapter 1 from NEN-EN 1997-1:2017."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_1_0_1 import Form1Dot0Dot1EquivalentPilePointCenterline
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
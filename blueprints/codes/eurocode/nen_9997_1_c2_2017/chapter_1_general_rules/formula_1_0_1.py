@@ -6,7 +6,7 @@ from blueprints.codes.eurocode.nen_9997_1_c2_2017 import NEN_9997_1_C2_2017
 from blueprints.codes.formula import Formula
 from blueprints.codes.latex_formula import LatexFormula, latex_fraction
 from blueprints.type_alias import M
-from blueprints.validations import raise_if_less_or_equal_to_zero
+from blueprints.validations import any_true, raise_if_less_or_equal_to_zero
 
 
 class Form1Dot0Dot1EquivalentPilePointCenterline(Formula):
@@ -40,7 +40,7 @@ class Form1Dot0Dot1EquivalentPilePointCenterline(Formula):
     ) -> M:
         """Evaluates the formula, for more information see the __init__ method."""
         raise_if_less_or_equal_to_zero(a=a, b=b)
-        if b > 1.5 * a:
+        if any_true(b > 1.5 * a):
             raise ValueError("b must be less than or equal to 1.5 * a")
         return 1.13 * a * np.sqrt(b / a)
 
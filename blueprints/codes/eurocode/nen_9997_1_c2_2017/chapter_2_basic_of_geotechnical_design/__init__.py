@@ -1 +1,17 @@
 """Package contains the formulas from chapter 2: Basic of geotechnical design of NEN 9997-1+C2:2017."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_2_1_a import Form2Dot1aDesignValueLoad
+    from .formula_2_1_b import Form2Dot1bRepresentativeValue
+    from .formula_2_2 import Form2Dot2DesignValueGeotechnicalParameter
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
@@ -1,3 +1,143 @@
 """Eurocode NEN-EN 1992-1-1+C2:2011."""
 
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .chapter_3_materials.formula_3_1 import Form3Dot1EstimationConcreteCompressiveStrength
+    from .chapter_3_materials.formula_3_2 import Form3Dot2CoefficientDependentOfConcreteAge, SubForm3Dot2CoefficientTypeOfCementS
+    from .chapter_3_materials.formula_3_3 import Form3Dot3AxialTensileStrengthFromTensileSplittingStrength
+    from .chapter_3_materials.formula_3_4 import Form3Dot4DevelopmentTensileStrength, SubForm3Dot4CoefficientAgeConcreteAlpha
+    from .chapter_3_materials.formula_3_5 import Form3Dot5ApproximationVarianceElasticModulusOverTime
+    from .chapter_3_materials.formula_3_6 import Form3Dot6CreepDeformationOfConcrete
+    from .chapter_3_materials.formula_3_7 import Form3Dot7NonLinearCreepCoefficient
+    from .chapter_3_materials.formula_3_8 import Form3Dot8TotalShrinkage
+    from .chapter_3_materials.formula_3_9 import Form3Dot9DryingShrinkage
+    from .chapter_3_materials.formula_3_10 import Form3Dot10CoefficientAgeConcreteDryingShrinkage, SubForm3Dot10FictionalCrossSection
+    from .chapter_3_materials.formula_3_11 import Form3Dot11AutogeneShrinkage
+    from .chapter_3_materials.formula_3_12 import Form3Dot12AutogeneShrinkageInfinity
+    from .chapter_3_materials.formula_3_13 import Form3Dot13CoefficientTimeAutogeneShrinkage
+    from .chapter_3_materials.formula_3_14 import Form3Dot14StressStrainForShortTermLoading, SubForm3Dot14Eta, SubForm3Dot14K
+    from .chapter_3_materials.formula_3_15 import Form3Dot15DesignValueCompressiveStrength
+    from .chapter_3_materials.formula_3_16 import Form3Dot16DesignValueTensileStrength
+    from .chapter_3_materials.formula_3_17 import Form3Dot17CompressiveStressConcrete
+    from .chapter_3_materials.formula_3_18 import Form3Dot18CompressiveStressConcrete
+    from .chapter_3_materials.formula_3_19_20 import Form3Dot19And20EffectivePressureZoneHeight
+    from .chapter_3_materials.formula_3_21_22 import Form3Dot21And22EffectiveStrength
+    from .chapter_3_materials.formula_3_23 import Form3Dot23FlexuralTensileStrength
+    from .chapter_3_materials.formula_3_24 import Form3Dot24IncreasedCharacteristicCompressiveStrength
+    from .chapter_3_materials.formula_3_25 import Form3Dot25IncreasedCharacteristicCompressiveStrength
+    from .chapter_3_materials.formula_3_26 import Form3Dot26IncreasedStrainAtMaxStrength
+    from .chapter_3_materials.formula_3_27 import Form3Dot27IncreasedStrainLimitValue
+    from .chapter_3_materials.formula_3_28 import Form3Dot28RatioLossOfPreStressClass1
+    from .chapter_3_materials.formula_3_29 import Form3Dot29RatioLossOfPreStressClass2
+    from .chapter_3_materials.formula_3_30 import Form3Dot30RatioLossOfPreStressClass3
+    from .chapter_3_materials.sub_formula_3_28_29_30 import SubForm3Dot282930Mu
+    from .chapter_4_durability_and_cover.formula_4_1 import Form4Dot1NominalConcreteCover
+    from .chapter_4_durability_and_cover.formula_4_2 import Form4Dot2MinimumConcreteCover
+    from .chapter_4_durability_and_cover.table_4_1 import Carbonation, Chemical, Chloride, ChlorideSeawater, FreezeThaw, Table4Dot1ExposureClasses
+    from .chapter_4_durability_and_cover.table_4_2 import Table4Dot2MinimumCoverWithRegardToBond
+    from .chapter_4_durability_and_cover.table_4_3 import ConcreteStructuralClassCalculator, Table4Dot3ConcreteStructuralClass
+    from .chapter_4_durability_and_cover.table_4_4n import Table4Dot4nMinimumCoverDurabilityReinforcementSteel
+    from .chapter_4_durability_and_cover.table_4_5n import Table4Dot5nMinimumCoverDurabilityPrestressingSteel
+    from .chapter_5_structural_analysis.formula_5_1 import (
+        Form5Dot1Imperfections,
+        SubForm5Dot1ReductionFactorLengthOrHeight,
+        SubForm5Dot1ReductionFactorNumberOfMembers,
+    )
+    from .chapter_5_structural_analysis.formula_5_2 import Form5Dot2Eccentricity
+    from .chapter_5_structural_analysis.formula_5_3a import Form5Dot3aTransverseForceUnbracedMembers
+    from .chapter_5_structural_analysis.formula_5_3b import Form5Dot3bTransverseForceBracedMembers
+    from .chapter_5_structural_analysis.formula_5_4 import Form5Dot4TransverseForceEffectBracingSystem
+    from .chapter_5_structural_analysis.formula_5_5 import Form5Dot5TransverseForceEffectFloorDiaphragm
+    from .chapter_5_structural_analysis.formula_5_6 import Form5Dot6TransverseForceEffectRoofDiaphragm
+    from .chapter_5_structural_analysis.formula_5_7 import Form5Dot7EffectiveFlangeWidth
+    from .chapter_5_structural_analysis.formula_5_7a import Form5Dot7aFlangeEffectiveFlangeWidth
+    from .chapter_5_structural_analysis.formula_5_7ab import Form5Dot7abFlangeEffectiveFlangeWidth
+    from .chapter_5_structural_analysis.formula_5_7b import Form5Dot7bFlangeEffectiveFlangeWidth
+    from .chapter_5_structural_analysis.formula_5_8 import Form5Dot8EffectiveSpan
+    from .chapter_5_structural_analysis.formula_5_9 import Form5Dot9DesignSupportMomentReduction
+    from .chapter_5_structural_analysis.formula_5_11n import Form5Dot11nShearSlendernessCorrectionFactor
+    from .chapter_5_structural_analysis.formula_5_12n import Form5Dot12nRatioDistancePointZeroAndMaxMoment
+    from .chapter_5_structural_analysis.formula_5_14 import Form5Dot14SlendernessRatio
+    from .chapter_5_structural_analysis.formula_5_15 import Form5Dot15EffectiveLengthBraced
+    from .chapter_5_structural_analysis.formula_5_16 import Form5Dot16EffectiveLengthUnbraced
+    from .chapter_6_ultimate_limit_state.formula_6_1 import Form6Dot1DesignShearStrength
+    from .chapter_6_ultimate_limit_state.formula_6_71 import (
+        Form6Dot71CriteriaBasedOnStressRange,
+        Form6Dot71CriteriaBasedOnStressRangeLHS,
+        Form6Dot71CriteriaBasedOnStressRangeRHS,
+    )
+    from .chapter_6_ultimate_limit_state.formula_6_76 import Form6Dot76DesignFatigueStrengthConcrete
+    from .chapter_7_serviceability_limit_state.formula_7_3 import Form7Dot3CoefficientKc
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_1 import Form8Dot1RequiredMinimumMandrelDiameter
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2 import (
+        Form8Dot2UltimateBondStress,
+        SubForm8Dot2CoefficientBarDiameter,
+        SubForm8Dot2CoefficientQualityOfBond,
+    )
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import Form8Dot3RequiredAnchorageLength
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_4 import Form8Dot4DesignAnchorageLength
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_6 import Form8Dot6MinimumTensionAnchorage
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_7 import Form8Dot7MinimumCompressionAnchorage
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n import (
+        Form8Dot8nAnchorageCapacityWeldedTransverseBar,
+        SubForm8Dot8nConcreteStress,
+        SubForm8Dot8nDesignLengthOfTransverseBar,
+        SubForm8Dot8nFunctionX,
+        SubForm8Dot8nFunctionY,
+    )
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_9 import Form8Dot9AnchorageCapacityWeldedTransverseBarSmallDiameter
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_10 import Form8Dot10DesignLapLength, SubForm8Dot10Alpha6
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_11 import Form8Dot11MinimumDesignLapLength
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_12 import Form8Dot12AdditionalShearReinforcement
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_13 import Form8Dot13AdditionalShearReinforcement
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_14 import Form8Dot14EquivalentDiameterBundledBars
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_15 import (
+        Form8Dot15PrestressTransferStress,
+        SubForm8Dot15EtaP1,
+        SubForm8Dot15TensileStrengthAtRelease,
+    )
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_16 import (
+        Form8Dot16BasicTransmissionLength,
+        SubForm8Dot16Alpha1,
+        SubForm8Dot16Alpha2,
+    )
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_17 import Form8Dot17DesignValueTransmissionLength1
+    from .chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_18 import Form8Dot18DesignValueTransmissionLength2
+    from .chapter_9_detailling_and_specific_rules.formula_9_1n import Form9Dot1nMinimumTensileReinforcementBeam
+    from .chapter_9_detailling_and_specific_rules.formula_9_2 import Form9Dot2ShiftInMomentDiagram
+    from .chapter_9_detailling_and_specific_rules.formula_9_3 import Form9Dot3ShiftInMomentDiagram
+    from .chapter_9_detailling_and_specific_rules.formula_9_4 import Form9Dot4ShearReinforcementRatio
+    from .chapter_9_detailling_and_specific_rules.formula_9_5n import Form9Dot5nMinimumShearReinforcementRatio
+    from .chapter_9_detailling_and_specific_rules.formula_9_6n import Form9Dot6nMaximumDistanceShearReinforcement
+    from .chapter_9_detailling_and_specific_rules.formula_9_7n import Form9Dot7nMaximumDistanceBentUpBars
+    from .chapter_9_detailling_and_specific_rules.formula_9_8n import Form9Dot8nMaximumTransverseDistanceLegsSeriesShearLinks
+    from .chapter_9_detailling_and_specific_rules.formula_9_9 import Form9Dot9MaximumSpacingSeriesOfLinks
+    from .chapter_9_detailling_and_specific_rules.formula_9_10 import Form9Dot10MaximumSpacingBentUpBars
+    from .chapter_9_detailling_and_specific_rules.formula_9_12n import Form9Dot12nMinimumLongitudinalReinforcementColumns
+    from .chapter_9_detailling_and_specific_rules.formula_9_13 import Form9Dot13TensileForceToBeAnchored
+    from .chapter_9_detailling_and_specific_rules.formula_9_14 import Form9Dot14SplittingForceColumnOnRock
+    from .chapter_9_detailling_and_specific_rules.formula_9_16 import Form9Dot16MinimumForceOnInternalBeamLine
+
 NEN_EN_1992_1_1_C2_2011 = "NEN-EN 1992-1-1+C2:2011"
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=[
+        "chapter_3_materials",
+        "chapter_4_durability_and_cover",
+        "chapter_5_structural_analysis",
+        "chapter_6_ultimate_limit_state",
+        "chapter_7_serviceability_limit_state",
+        "chapter_8_detailing_of_reinforcement_and_prestressing_tendons",
+        "chapter_9_detailling_and_specific_rules",
+        "chapter_10_precast_concrete_elements_and_structures",
+        "chapter_11_lightweight_aggregate_concrete_structures",
+        "chapter_12_plain_and_lightly_reinforced_concrete_structures",
+    ],
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
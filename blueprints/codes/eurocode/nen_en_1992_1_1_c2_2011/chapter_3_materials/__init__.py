@@ -1 +1,43 @@
 """Package containing all formulas from NEN-EN 1992-1-1+C2:2011: Chapter 3 - Materials."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_3_1 import Form3Dot1EstimationConcreteCompressiveStrength
+    from .formula_3_2 import Form3Dot2CoefficientDependentOfConcreteAge, SubForm3Dot2CoefficientTypeOfCementS
+    from .formula_3_3 import Form3Dot3AxialTensileStrengthFromTensileSplittingStrength
+    from .formula_3_4 import Form3Dot4DevelopmentTensileStrength, SubForm3Dot4CoefficientAgeConcreteAlpha
+    from .formula_3_5 import Form3Dot5ApproximationVarianceElasticModulusOverTime
+    from .formula_3_6 import Form3Dot6CreepDeformationOfConcrete
+    from .formula_3_7 import Form3Dot7NonLinearCreepCoefficient
+    from .formula_3_8 import Form3Dot8TotalShrinkage
+    from .formula_3_9 import Form3Dot9DryingShrinkage
+    from .formula_3_10 import Form3Dot10CoefficientAgeConcreteDryingShrinkage, SubForm3Dot10FictionalCrossSection
+    from .formula_3_11 import Form3Dot11AutogeneShrinkage
+    from .formula_3_12 import Form3Dot12AutogeneShrinkageInfinity
+    from .formula_3_13 import Form3Dot13CoefficientTimeAutogeneShrinkage
+    from .formula_3_14 import Form3Dot14StressStrainForShortTermLoading, SubForm3Dot14Eta, SubForm3Dot14K
+    from .formula_3_15 import Form3Dot15DesignValueCompressiveStrength
+    from .formula_3_16 import Form3Dot16DesignValueTensileStrength
+    from .formula_3_17 import Form3Dot17CompressiveStressConcrete
+    from .formula_3_18 import Form3Dot18CompressiveStressConcrete
+    from .formula_3_19_20 import Form3Dot19And20EffectivePressureZoneHeight
+    from .formula_3_21_22 import Form3Dot21And22EffectiveStrength
+    from .formula_3_23 import Form3Dot23FlexuralTensileStrength
+    from .formula_3_24 import Form3Dot24IncreasedCharacteristicCompressiveStrength
+    from .formula_3_25 import Form3Dot25IncreasedCharacteristicCompressiveStrength
+    from .formula_3_26 import Form3Dot26IncreasedStrainAtMaxStrength
+    from .formula_3_27 import Form3Dot27IncreasedStrainLimitValue
+    from .formula_3_28 import Form3Dot28RatioLossOfPreStressClass1
+    from .formula_3_29 import Form3Dot29RatioLossOfPreStressClass2
+    from .formula_3_30 import Form3Dot30RatioLossOfPreStressClass3
+    from .sub_formula_3_28_29_30 import SubForm3Dot282930Mu
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
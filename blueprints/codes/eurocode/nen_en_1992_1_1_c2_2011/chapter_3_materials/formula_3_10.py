@@ -5,6 +5,7 @@ import numpy as np
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import DAYS, MM, MM2
+from blueprints.validations import any_true
 
 
 class Form3Dot10CoefficientAgeConcreteDryingShrinkage(Formula):
@@ -50,13 +51,13 @@ class Form3Dot10CoefficientAgeConcreteDryingShrinkage(Formula):
         h_0: MM,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if t <= 0:
+        if any_true(t <= 0):
             raise ValueError(f"Invalid t: {t}. t cannot be negative or zero")
-        if t_s < 0:
+        if any_true(t_s < 0):
             raise ValueError(f"Negative t_s: {t_s}. t_s cannot be negative")
-        if t <= t_s:
+        if any_true(t <= t_s):
             raise ValueError("Invalid t and t_s combination. t has to be larger than t_s")
-        if h_0 <= 0:
+        if any_true(h_0 <= 0):
             raise ValueError(f"Invalid h_0: {h_0}. h_0 cannot be negative or zero")
         return (t - t_s) / ((t - t_s) + 0.04 * np.sqrt(h_0**3))
 
@@ -93,8 +94,8 @@ class SubForm3Dot10FictionalCrossSection(Formula):
         u: MM,
     ) -> MM:
         """Evaluates the formula, for more information see the __init__ method."""
-        if a_c <= 0:
+        if any_true(a_c <= 0):
             raise ValueError(f"Invalid a_c: {a_c}. a_c cannot be negative or zero")
-        if u <= 0:
+        if any_true(u <= 0):
             raise ValueError(f"Invalid u: {u}. u cannot be negative or zero")
         return 2 * a_c / u
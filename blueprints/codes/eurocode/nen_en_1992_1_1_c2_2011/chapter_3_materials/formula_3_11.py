@@ -2,6 +2,7 @@
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
+from blueprints.validations import any_true
 
 
 class Form3Dot11AutogeneShrinkage(Formula):
@@ -44,6 +45,6 @@ class Form3Dot11AutogeneShrinkage(Formula):
         epsilon_ca_inf: float,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if beta_as_t < 0:
+        if any_true(beta_as_t < 0):
             raise ValueError(f"Invalid beta_as_t: {beta_as_t}. beta_as_t cannot be negative")
         return beta_as_t * epsilon_ca_inf
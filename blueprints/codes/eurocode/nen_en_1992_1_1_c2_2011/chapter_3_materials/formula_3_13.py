@@ -5,6 +5,7 @@ import numpy as np
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import DAYS
+from blueprints.validations import any_true
 
 
 class Form3Dot13CoefficientTimeAutogeneShrinkage(Formula):
@@ -38,6 +39,6 @@ class Form3Dot13CoefficientTimeAutogeneShrinkage(Formula):
         t: DAYS,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if t < 0:
+        if any_true(t < 0):
             raise ValueError(f"Invalid t: {t}. t cannot be negative")
         return 1 - np.exp(-0.2 * t**0.5)
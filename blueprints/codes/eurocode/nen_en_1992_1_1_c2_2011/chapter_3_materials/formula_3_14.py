@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot14StressStrainForShortTermLoading(Formula):
@@ -45,9 +46,9 @@ class Form3Dot14StressStrainForShortTermLoading(Formula):
         eta: float,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if k < 0:
+        if any_true(k < 0):
             raise ValueError(f"Invalid k: {k}. k cannot be negative")
-        if eta < 0:
+        if any_true(eta < 0):
             raise ValueError(f"Invalid eta: {eta}. eta cannot be negative")
         return (k * eta - eta**2) / (1 + (k - 2) * eta)
 
@@ -119,8 +120,8 @@ class SubForm3Dot14K(Formula):
         f_cm: MPA,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if e_cm < 0:
+        if any_true(e_cm < 0):
             raise ValueError(f"Invalid e_cm: {e_cm}. e_cm cannot be negative")
-        if f_cm <= 0:
+        if any_true(f_cm <= 0):
             raise ValueError(f"Invalid f_cm: {f_cm}. f_cm cannot be negative or zero")
         return 1.05 * e_cm * abs(epsilon_c1) / f_cm
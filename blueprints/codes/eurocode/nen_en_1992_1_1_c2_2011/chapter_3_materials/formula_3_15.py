@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot15DesignValueCompressiveStrength(Formula):
@@ -47,10 +48,10 @@ class Form3Dot15DesignValueCompressiveStrength(Formula):
         gamma_c: float,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if alpha_cc < 0:
+        if any_true(alpha_cc < 0):
             raise ValueError(f"Invalid alpha_cc: {alpha_cc}. alpha_cc cannot be negative")
-        if f_ck < 0:
+        if any_true(f_ck < 0):
             raise ValueError(f"Invalid f_ck: {f_ck}. f_ck cannot be negative")
-        if gamma_c <= 0:
+        if any_true(gamma_c <= 0):
             raise ValueError(f"Invalid gamma_c: {gamma_c}. gamma_c cannot be negative or zero")
         return alpha_cc * f_ck / gamma_c
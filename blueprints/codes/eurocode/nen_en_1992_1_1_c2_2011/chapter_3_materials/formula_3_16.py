@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot16DesignValueTensileStrength(Formula):
@@ -47,10 +48,10 @@ class Form3Dot16DesignValueTensileStrength(Formula):
         gamma_c: float,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if alpha_ct < 0:
+        if any_true(alpha_ct < 0):
             raise ValueError(f"Invalid alpha_ct: {alpha_ct}. alpha_ct cannot be negative")
-        if f_ctk_0_05 < 0:
+        if any_true(f_ctk_0_05 < 0):
             raise ValueError(f"Invalid f_ctk_0_05: {f_ctk_0_05}. f_ctk_0_05 cannot be negative")
-        if gamma_c <= 0:
+        if any_true(gamma_c <= 0):
             raise ValueError(f"Invalid gamma_c: {gamma_c}. gamma_c cannot be negative or zero")
         return alpha_ct * f_ctk_0_05 / gamma_c
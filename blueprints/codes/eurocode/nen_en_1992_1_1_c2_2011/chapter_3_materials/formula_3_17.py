@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot17CompressiveStressConcrete(Formula):
@@ -51,10 +52,10 @@ class Form3Dot17CompressiveStressConcrete(Formula):
         n: float,
     ) -> MPA:
         """Evaluates the formula, for more information see the __init__ method."""
-        if f_cd < 0:
+        if any_true(f_cd < 0):
             raise ValueError(f"Invalid f_cd: {f_cd}. f_cd cannot be negative")
-        if epsilon_c < 0:
+        if any_true(epsilon_c < 0):
             raise ValueError(f"Invalid epsilon_c: {epsilon_c}. epsilon_c cannot be negative")
-        if epsilon_c > epsilon_c2:
+        if any_true(epsilon_c > epsilon_c2):
             raise ValueError(f"epsilon_c: {epsilon_c} > epsilon_c2: {epsilon_c2}. Try using Form3Dot18CompressiveStressConcrete class.")
         return f_cd * (1 - (1 - (epsilon_c / epsilon_c2)) ** n)
@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot18CompressiveStressConcrete(Formula):
@@ -36,6 +37,6 @@ class Form3Dot18CompressiveStressConcrete(Formula):
         f_cd: MPA,
     ) -> MPA:
         """Evaluates the formula, for more information see the __init__ method."""
-        if f_cd < 0:
+        if any_true(f_cd < 0):
             raise ValueError(f"Invalid f_cd: {f_cd}. f_cd cannot be negative")
         return f_cd
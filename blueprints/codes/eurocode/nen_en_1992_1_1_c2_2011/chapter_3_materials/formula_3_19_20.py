@@ -1,8 +1,11 @@
 """Formula 3.19 and 3.20 from NEN-EN 1992-1-1+C2:2011: Chapter 3 - Materials."""
 
+import numpy as np
+
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, where
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot19And20EffectivePressureZoneHeight(Formula):
@@ -35,10 +38,8 @@ class Form3Dot19And20EffectivePressureZoneHeight(Formula):
     @staticmethod
     def _evaluate(
         f_ck: MPA,
-    ) -> float:
+    ) -> float | np.ndarray:
         """Evaluates the formula, for more information see the __init__ method."""
-        if f_ck <= 50:
-            return 0.8
-        if f_ck <= 90:
-            return 0.8 - (f_ck - 50) / 400
-        raise ValueError(f"Invalid f_ck: {f_ck}. Maximum of f_ck is 90 MPa")
+        if any_true(f_ck > 90):
+            raise ValueError(f"Invalid f_ck: {f_ck}. Maximum of f_ck is 90 MPa")
+        return where(f_ck <= 50, 0.8, 0.8 - (f_ck - 50) / 400)
@@ -3,8 +3,9 @@
 import numpy as np
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, lookup
 from blueprints.type_alias import DAYS
+from blueprints.validations import any_true
 
 
 class Form3Dot2CoefficientDependentOfConcreteAge(Formula):
@@ -47,9 +48,9 @@ class Form3Dot2CoefficientDependentOfConcreteAge(Formula):
         t: DAYS,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if s < 0:
+        if any_true(s < 0):
             raise ValueError(f"Invalid s: {s}. s cannot be negative")
-        if t <= 0:
+        if any_true(t <= 0):
             raise ValueError(f"Invalid t: {t}. t cannot be negative or zero")
         return np.exp(s * (1 - (28 / t) ** (1 / 2)))
 
@@ -83,14 +84,9 @@ class SubForm3Dot2CoefficientTypeOfCementS(Formula):
     @staticmethod
     def _evaluate(
         cement_class: str,
-    ) -> float:
+    ) -> float | np.ndarray:
         """Evaluates the formula, for more information see the __init__ method."""
-        match cement_class.lower():
-            case "r":
-                return 0.20
-            case "n":
-                return 0.25
-            case "s":
-                return 0.38
-            case _:
-                raise ValueError(f"Invalid cement class: {cement_class}. Options: 'R', 'N' or 'S'")
+        coefficient = lookup(cement_class, {"r": 0.20, "n": 0.25, "s": 0.38})
+        if any_true(np.isnan(coefficient)):
+            raise ValueError(f"Invalid cement class: {cement_class}. Options: 'R', 'N' or 'S'")
+        return coefficient
@@ -1,8 +1,9 @@
 """Formula 3.23 from NEN-EN 1992-1-1+C2:2011: Chapter 3 - Materials."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.type_alias import MM, MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot23FlexuralTensileStrength(Formula):
@@ -41,8 +42,8 @@ class Form3Dot23FlexuralTensileStrength(Formula):
         f_ctm: MPA,
     ) -> MPA:
         """Evaluates the formula, for more information see the __init__ method."""
-        if h < 0:
+        if any_true(h < 0):
             raise ValueError(f"Invalid h: {h}. h cannot be negative")
-        if f_ctm < 0:
+        if any_true(f_ctm < 0):
             raise ValueError(f"Invalid f_ctm: {f_ctm}. f_ctm cannot be negative")
-        return max((1.6 - h / 1000) * f_ctm, f_ctm)
+        return maximum((1.6 - h / 1000) * f_ctm, f_ctm)
@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot24IncreasedCharacteristicCompressiveStrength(Formula):
@@ -42,8 +43,8 @@ class Form3Dot24IncreasedCharacteristicCompressiveStrength(Formula):
         sigma_2: MPA,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if f_ck < 0:
+        if any_true(f_ck < 0):
             raise ValueError(f"Invalid f_ck: {f_ck}. f_ck cannot be negative")
-        if sigma_2 > 0.05 * f_ck:
+        if any_true(sigma_2 > 0.05 * f_ck):
             raise ValueError(f"Invalid sigma_2: {sigma_2}. Try using Form3Dot25IncreasedCharacteristicCompressiveStrength class.")
         return f_ck * (1.000 + 5.0 * sigma_2 / f_ck)
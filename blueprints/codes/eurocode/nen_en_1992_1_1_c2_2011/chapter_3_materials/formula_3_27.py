@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot27IncreasedStrainLimitValue(Formula):
@@ -46,6 +47,6 @@ class Form3Dot27IncreasedStrainLimitValue(Formula):
         epsilon_cu2: float,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if f_ck < 0:
+        if any_true(f_ck < 0):
             raise ValueError(f"Invalid f_ck: {f_ck}. f_ck cannot be negative")
         return epsilon_cu2 + 0.2 * sigma_2 / f_ck
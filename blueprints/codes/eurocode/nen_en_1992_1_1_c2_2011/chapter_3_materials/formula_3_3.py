@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot3AxialTensileStrengthFromTensileSplittingStrength(Formula):
@@ -37,6 +38,6 @@ class Form3Dot3AxialTensileStrengthFromTensileSplittingStrength(Formula):
         f_ct_sp: MPA,
     ) -> MPA:
         """Evaluates the formula, for more information see the __init__ method."""
-        if f_ct_sp < 0:
+        if any_true(f_ct_sp < 0):
             raise ValueError(f"Negative f_ct_sp: {f_ct_sp}. f_ct_sp cannot be negative")
         return 0.9 * f_ct_sp
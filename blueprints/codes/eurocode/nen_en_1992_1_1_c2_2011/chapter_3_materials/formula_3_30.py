@@ -5,6 +5,7 @@ import numpy as np
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import HOURS, PERCENTAGE
+from blueprints.validations import any_true
 
 
 class Form3Dot30RatioLossOfPreStressClass3(Formula):
@@ -50,8 +51,8 @@ class Form3Dot30RatioLossOfPreStressClass3(Formula):
         t: HOURS,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if rho_1000 < 0:
+        if any_true(rho_1000 < 0):
             raise ValueError(f"Invalid rho_1000: {rho_1000}. rho_1000 cannot be negative")
-        if t < 0:
+        if any_true(t < 0):
             raise ValueError(f"Invalid t: {t}. t cannot be negative")
         return 1.98 * rho_1000 * np.exp(8 * mu) * (t / 1000) ** (0.75 * (1 - mu)) * 10**-5
@@ -1,8 +1,11 @@
 """Formula 3.4 from NEN-EN 1992-1-1+C2:2011: Chapter 3 - Materials."""
 
+import numpy as np
+
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, where
 from blueprints.type_alias import DAYS, MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot4DevelopmentTensileStrength(Formula):
@@ -49,11 +52,11 @@ class Form3Dot4DevelopmentTensileStrength(Formula):
         f_ctm: MPA,
     ) -> MPA:
         """Evaluates the formula, for more information see the __init__ method."""
-        if beta_cc_t < 0:
+        if any_true(beta_cc_t < 0):
             raise ValueError(f"Negative beta_cc_t: {beta_cc_t}. beta_cc_t cannot be negative")
-        if f_ctm < 0:
+        if any_true(f_ctm < 0):
             raise ValueError(f"Negative f_ctm: {f_ctm}. f_ctm cannot be negative")
-        if alpha < 0:
+        if any_true(alpha < 0):
             raise ValueError(f"Negative alpha: {alpha}. alpha cannot be negative")
         return beta_cc_t**alpha * f_ctm
 
@@ -83,10 +86,8 @@ class SubForm3Dot4CoefficientAgeConcreteAlpha(Formula):
     @staticmethod
     def _evaluate(
         t: DAYS,
-    ) -> float:
+    ) -> float | np.ndarray:
         """Evaluates the formula, for more information see the __init__ method."""
-        if t <= 0:
+        if any_true(t <= 0):
             raise ValueError(f"Invalid t: {t}. t cannot be negative or zero")
-        if t < 28:
-            return 1.0
-        return 2 / 3
+        return where(t < 28, 1.0, 2 / 3)
@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot5ApproximationVarianceElasticModulusOverTime(Formula):
@@ -46,10 +47,10 @@ class Form3Dot5ApproximationVarianceElasticModulusOverTime(Formula):
         e_cm: MPA,
     ) -> MPA:
         """Evaluates the formula, for more information see the __init__ method."""
-        if f_cm_t < 0:
+        if any_true(f_cm_t < 0):
             raise ValueError(f"Negative f_cm_t: {f_cm_t}. f_cm_t cannot be negative")
-        if f_cm < 0:
+        if any_true(f_cm < 0):
             raise ValueError(f"Negative f_cm: {f_cm}. f_cm cannot be negative")
-        if e_cm < 0:
+        if any_true(e_cm < 0):
             raise ValueError(f"Negative e_cm: {e_cm}. e_cm cannot be negative")
         return (f_cm_t / f_cm) ** 0.3 * e_cm
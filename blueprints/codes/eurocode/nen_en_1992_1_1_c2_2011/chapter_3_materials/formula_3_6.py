@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class Form3Dot6CreepDeformationOfConcrete(Formula):
@@ -46,10 +47,10 @@ class Form3Dot6CreepDeformationOfConcrete(Formula):
         e_c: MPA,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if phi_inf_t0 < 0:
+        if any_true(phi_inf_t0 < 0):
             raise ValueError(f"Negative phi_inf_t0: {phi_inf_t0}. phi_inf_t0 cannot be negative")
-        if sigma_c < 0:
+        if any_true(sigma_c < 0):
             raise ValueError(f"Negative sigma_c: {sigma_c}. sigma_c cannot be negative")
-        if e_c < 0:
+        if any_true(e_c < 0):
             raise ValueError(f"Negative e_c: {e_c}. e_c cannot be negative")
         return phi_inf_t0 * sigma_c / e_c
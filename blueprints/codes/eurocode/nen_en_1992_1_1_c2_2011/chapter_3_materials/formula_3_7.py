@@ -4,6 +4,7 @@ import numpy as np
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
+from blueprints.validations import any_true
 
 
 class Form3Dot7NonLinearCreepCoefficient(Formula):
@@ -42,8 +43,8 @@ class Form3Dot7NonLinearCreepCoefficient(Formula):
         k_sigma: float,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if phi_inf_t0 < 0:
+        if any_true(phi_inf_t0 < 0):
             raise ValueError(f"Negative phi_inf_t0: {phi_inf_t0}. phi_inf_t0 cannot be negative")
-        if k_sigma < 0:
+        if any_true(k_sigma < 0):
             raise ValueError(f"Negative k_sigma: {k_sigma}. k_sigma cannot be negative")
         return phi_inf_t0 * np.exp(1.5 * (k_sigma - 0.45))
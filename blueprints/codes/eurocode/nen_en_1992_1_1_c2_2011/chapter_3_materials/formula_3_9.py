@@ -2,6 +2,7 @@
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
+from blueprints.validations import any_true
 
 
 class Form3Dot9DryingShrinkage(Formula):
@@ -49,8 +50,8 @@ class Form3Dot9DryingShrinkage(Formula):
         epsilon_cd_0: float,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if beta_ds_tt_s < 0:
+        if any_true(beta_ds_tt_s < 0):
             raise ValueError(f"Negative beta_ds_tt_s: {beta_ds_tt_s}. beta_ds_tt_s cannot be negative")
-        if k_h < 0:
+        if any_true(k_h < 0):
             raise ValueError(f"Negative k_h: {k_h}. k_h cannot be negative")
         return beta_ds_tt_s * k_h * epsilon_cd_0
@@ -3,6 +3,7 @@
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.type_alias import MPA
+from blueprints.validations import any_true
 
 
 class SubForm3Dot282930Mu(Formula):
@@ -41,6 +42,6 @@ class SubForm3Dot282930Mu(Formula):
         f_pk: MPA,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if f_pk < 0:
+        if any_true(f_pk < 0):
             raise ValueError(f"Invalid f_pk: {f_pk}. f_pk cannot be negative")
         return sigma_pi / f_pk
@@ -1 +1,21 @@
 """Package containing all formulas from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and cover to reinforcement."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_4_1 import Form4Dot1NominalConcreteCover
+    from .formula_4_2 import Form4Dot2MinimumConcreteCover
+    from .table_4_1 import Carbonation, Chemical, Chloride, ChlorideSeawater, FreezeThaw, Table4Dot1ExposureClasses
+    from .table_4_2 import Table4Dot2MinimumCoverWithRegardToBond
+    from .table_4_3 import ConcreteStructuralClassCalculator, Table4Dot3ConcreteStructuralClass
+    from .table_4_4n import Table4Dot4nMinimumCoverDurabilityReinforcementSteel
+    from .table_4_5n import Table4Dot5nMinimumCoverDurabilityPrestressingSteel
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
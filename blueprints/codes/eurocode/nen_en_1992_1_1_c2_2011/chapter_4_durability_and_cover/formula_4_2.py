@@ -1,7 +1,7 @@
 """Formula 4.2 from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and cover to reinforcement."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.codes.latex_formula import LatexFormula, latex_max_curly_brackets
 from blueprints.type_alias import MM
 from blueprints.validations import raise_if_negative
@@ -70,7 +70,7 @@ class Form4Dot2MinimumConcreteCover(Formula):
             delta_c_dur_add=delta_c_dur_add,
         )
         minimum_cover = 10  # mm
-        return max(c_min_b, c_min_dur + delta_c_dur_gamma - delta_c_dur_st - delta_c_dur_add, minimum_cover)
+        return maximum(c_min_b, c_min_dur + delta_c_dur_gamma - delta_c_dur_st - delta_c_dur_add, minimum_cover)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 4.2."""
@@ -1,5 +1,7 @@
 """Table 4.2 from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and cover to reinforcement."""
 
+import numpy as np
+
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
 from blueprints.codes.latex_formula import LatexFormula
@@ -42,7 +44,7 @@ class Table4Dot2MinimumCoverWithRegardToBond(Formula):
     ) -> MM:
         """For more detailed documentation see the class docstring."""
         raise_if_less_or_equal_to_zero(diameter=diameter)
-        if not isinstance(nominal_max_aggregate_size_greater_than_32_mm, bool):
+        if np.asarray(nominal_max_aggregate_size_greater_than_32_mm).dtype != bool:
             raise TypeError("The parameter 'nominal_max_aggregate_size_greater_than_32_mm' must be a boolean.")
         return diameter + 5 * nominal_max_aggregate_size_greater_than_32_mm
 
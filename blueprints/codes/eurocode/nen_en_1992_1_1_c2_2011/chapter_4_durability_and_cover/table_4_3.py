@@ -110,12 +110,12 @@ class ConcreteStructuralClassCalculator(AbstractConcreteStructuralClassCalculato
             if decisive_exposure_class.intersection(exposure_classes):
                 return (
                     self.update_structural_class(0, "no reduction with respect to concrete grade")
-                    if self.concrete_material.f_ck < ConcreteMaterial(concrete_grade).f_ck
+                    if self.concrete_material.f_ck < ConcreteMaterial.get(concrete_grade).f_ck
                     else self.update_structural_class(-1, f"concrete grade >= {concrete_grade.value}")
                 )
         return (
             self.update_structural_class(0, "no reduction with respect to concrete grade")
-            if self.concrete_material.f_ck < ConcreteMaterial(ConcreteStrengthClass("C30/37")).f_ck
+            if self.concrete_material.f_ck < ConcreteMaterial.get(ConcreteStrengthClass.C30_37).f_ck
             else self.update_structural_class(-1, "concrete grade >= C30/37")
         )
 
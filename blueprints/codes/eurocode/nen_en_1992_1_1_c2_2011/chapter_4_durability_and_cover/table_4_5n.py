@@ -1,9 +1,13 @@
 """Table 4.5N from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and cover to reinforcement."""
 
+from operator import attrgetter
+
+import numpy as np
+
 from blueprints.codes.eurocode.exposure_classes import ExposureClassesBase
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.eurocode.structural_class import ConcreteStructuralClassBase
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum, select
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import MM
 
@@ -43,26 +47,36 @@ class Table4Dot5nMinimumCoverDurabilityPrestressingSteel(Formula):
         structural_class: ConcreteStructuralClassBase,
     ) -> MM:
         """For more detailed documentation see the class docstring."""
-        if not isinstance(structural_class, int):
+        if not np.issubdtype(np.asarray(structural_class).dtype, np.integer):
             raise TypeError(f"Structural class must be (a subclass of) an integer, not {type(structural_class)}.")
 
-        if exposure_classes.chloride.value in [
-            "XD3",
-            "XD2",
-        ] or exposure_classes.chloride_seawater.value in ["XS2", "XS3"]:
-            calculated_cover = 25 + structural_class * 5
-        elif exposure_classes.chloride.value == "XD1" or exposure_classes.chloride_seawater.value == "XS1":
-            calculated_cover = 20 + structural_class * 5
-        elif exposure_classes.carbonation.value == "XC4":
-            calculated_cover = 15 + structural_class * 5
-        elif exposure_classes.carbonation.value in ["XC2", "XC3"]:
-            calculated_cover = 10 + structural_class * 5
-        elif exposure_classes.carbonation.value == "XC1":
-            calculated_cover = max(15, (structural_class * 5))
+        if isinstance(exposure_classes, ExposureClassesBase):
+            chloride = exposure_classes.chloride.value
+            chloride_seawater = exposure_classes.chloride_seawater.value
+            carbonation = exposure_classes.carbonation.value
         else:
-            calculated_cover = max(10, ((structural_class - 2) * 5))
+            # array of exposure classes, see Formula.evaluate_many
+            chloride, chloride_seawater, carbonation = np.frompyfunc(
+                attrgetter("chloride.value", "chloride_seawater.value", "carbonation.value"), 1, 3
+            )(exposure_classes)
 
-        return calculated_cover
+        return select(
+            [
+                (chloride == "XD3") | (chloride == "XD2") | (chloride_seawater == "XS2") | (chloride_seawater == "XS3"),
+                (chloride == "XD1") | (chloride_seawater == "XS1"),
+                carbonation == "XC4",
+                (carbonation == "XC2") | (carbonation == "XC3"),
+                carbonation == "XC1",
+            ],
+            [
+                25 + structural_class * 5,
+                20 + structural_class * 5,
+                15 + structural_class * 5,
+                10 + structural_class * 5,
+                maximum(15, structural_class * 5),
+            ],
+            default=maximum(10, (structural_class - 2) * 5),
+        )
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for table 4.5N."""
@@ -1 +1,32 @@
 """Module containing all formulas from NEN-EN 1992-1-1+C2:2011: Chapter 5 - Structural Analysis."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_5_1 import Form5Dot1Imperfections, SubForm5Dot1ReductionFactorLengthOrHeight, SubForm5Dot1ReductionFactorNumberOfMembers
+    from .formula_5_2 import Form5Dot2Eccentricity
+    from .formula_5_3a import Form5Dot3aTransverseForceUnbracedMembers
+    from .formula_5_3b import Form5Dot3bTransverseForceBracedMembers
+    from .formula_5_4 import Form5Dot4TransverseForceEffectBracingSystem
+    from .formula_5_5 import Form5Dot5TransverseForceEffectFloorDiaphragm
+    from .formula_5_6 import Form5Dot6TransverseForceEffectRoofDiaphragm
+    from .formula_5_7 import Form5Dot7EffectiveFlangeWidth
+    from .formula_5_7a import Form5Dot7aFlangeEffectiveFlangeWidth
+    from .formula_5_7ab import Form5Dot7abFlangeEffectiveFlangeWidth
+    from .formula_5_7b import Form5Dot7bFlangeEffectiveFlangeWidth
+    from .formula_5_8 import Form5Dot8EffectiveSpan
+    from .formula_5_9 import Form5Dot9DesignSupportMomentReduction
+    from .formula_5_11n import Form5Dot11nShearSlendernessCorrectionFactor
+    from .formula_5_12n import Form5Dot12nRatioDistancePointZeroAndMaxMoment
+    from .formula_5_14 import Form5Dot14SlendernessRatio
+    from .formula_5_15 import Form5Dot15EffectiveLengthBraced
+    from .formula_5_16 import Form5Dot16EffectiveLengthUnbraced
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
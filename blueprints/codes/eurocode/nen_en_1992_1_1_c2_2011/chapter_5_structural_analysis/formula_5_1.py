@@ -3,7 +3,7 @@
 import numpy as np
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, clip
 from blueprints.type_alias import DIMENSIONLESS, M
 from blueprints.validations import raise_if_less_or_equal_to_zero, raise_if_negative
 
@@ -84,12 +84,7 @@ class SubForm5Dot1ReductionFactorLengthOrHeight(Formula):
         """Evaluates the formula, for more information see the __init__ method."""
         raise_if_less_or_equal_to_zero(length=length)
         # the value of alpha_h is between 2/3 and 1.0
-        alpha_h = 2 / np.sqrt(length)
-        if alpha_h < 2 / 3:
-            return 2 / 3
-        if alpha_h > 1:
-            return 1
-        return alpha_h
+        return clip(2 / np.sqrt(length), 2 / 3, 1)
 
 
 class SubForm5Dot1ReductionFactorNumberOfMembers(Formula):
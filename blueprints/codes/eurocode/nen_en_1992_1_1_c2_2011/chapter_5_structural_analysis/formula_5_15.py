@@ -1,6 +1,6 @@
 """Formula 5.15 from NEN-EN 1992-1-1+C2:2011: Chapter 5 - Structural Analysis."""
 
-import math
+import numpy as np
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
@@ -42,7 +42,7 @@ class Form5Dot15EffectiveLengthBraced(Formula):
     ) -> M:
         """Evaluates the formula, for more information see the __init__ method."""
         raise_if_negative(k_1=k_1, k_2=k_2, height=height)
-        return 0.5 * height * math.sqrt((1 + k_1 / (0.45 + k_1)) * (1 + k_2 / (0.45 + k_2)))
+        return 0.5 * height * np.sqrt((1 + k_1 / (0.45 + k_1)) * (1 + k_2 / (0.45 + k_2)))
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 5.15."""
@@ -1,9 +1,9 @@
 """Formula 5.16 from NEN-EN 1992-1-1+C2:2011: Chapter 5 - Structural Analysis."""
 
-import math
+import numpy as np
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import DIMENSIONLESS, M
 from blueprints.validations import raise_if_negative
@@ -42,7 +42,7 @@ class Form5Dot16EffectiveLengthUnbraced(Formula):
     ) -> M:
         """Evaluates the formula, for more information see the __init__ method."""
         raise_if_negative(k_1=k_1, k_2=k_2, height=height)
-        return height * max(math.sqrt(1.0 + 10 * (k_1 * k_2 / (k_1 + k_2))), (1.0 + k_1 / (1.0 + k_1)) * (1.0 + k_2 / (1.0 + k_2)))
+        return height * maximum(np.sqrt(1.0 + 10 * (k_1 * k_2 / (k_1 + k_2))), (1.0 + k_1 / (1.0 + k_1)) * (1.0 + k_2 / (1.0 + k_2)))
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 5.16."""
@@ -1,7 +1,7 @@
 """Formula 5.7 from NEN-EN 1992-1-1+C2:2011: Chapter 5 - Structural Analysis."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, minimum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import M
 from blueprints.validations import raise_if_negative
@@ -55,7 +55,7 @@ class Form5Dot7EffectiveFlangeWidth(Formula):
             b_w=b_w,
             b=b,
         )
-        return min(sum(b_eff_i) + b_w, b)
+        return minimum(sum(b_eff_i) + b_w, b)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 5.7."""
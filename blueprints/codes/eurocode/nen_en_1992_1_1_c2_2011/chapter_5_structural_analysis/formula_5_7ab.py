@@ -1,7 +1,7 @@
 """Formula 5.7a and 5.7b from NEN-EN 1992-1-1+C2:2011: Chapter 5 - Structural Analysis."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, minimum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import M
 from blueprints.validations import raise_if_negative
@@ -49,7 +49,7 @@ class Form5Dot7abFlangeEffectiveFlangeWidth(Formula):
             b_i=b_i,
             l_0=l_0,
         )
-        return min(0.2 * b_i + 0.1 * l_0, 0.2 * l_0, b_i)
+        return minimum(0.2 * b_i + 0.1 * l_0, 0.2 * l_0, b_i)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 5.7."""
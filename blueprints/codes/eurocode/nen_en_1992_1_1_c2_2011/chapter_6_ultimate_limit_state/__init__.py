@@ -1 +1,17 @@
 """Module containing all formulas from NEN-EN 1992-1-1+C2:2011: Chapter 6 - Ultimate limit state."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_6_1 import Form6Dot1DesignShearStrength
+    from .formula_6_71 import Form6Dot71CriteriaBasedOnStressRange, Form6Dot71CriteriaBasedOnStressRangeLHS, Form6Dot71CriteriaBasedOnStressRangeRHS
+    from .formula_6_76 import Form6Dot76DesignFatigueStrengthConcrete
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
@@ -4,6 +4,7 @@ from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2
 from blueprints.codes.formula import Formula
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import KN
+from blueprints.validations import any_true
 
 
 class Form6Dot1DesignShearStrength(Formula):
@@ -43,11 +44,11 @@ class Form6Dot1DesignShearStrength(Formula):
         v_td: KN,
     ) -> KN:
         """Evaluates the formula, for more information see the __init__ method."""
-        if v_rd_s < 0:
+        if any_true(v_rd_s < 0):
             raise ValueError(f"Negative v_rd_s: {v_rd_s}. v_rd_s cannot be negative")
-        if v_ccd < 0:
+        if any_true(v_ccd < 0):
             raise ValueError(f"Negative v_ccd: {v_ccd}. v_ccd cannot be negative")
-        if v_td < 0:
+        if any_true(v_td < 0):
             raise ValueError(f"Negative v_td: {v_td}. v_td cannot be negative")
         return v_rd_s + v_ccd + v_td
 
@@ -2,6 +2,7 @@
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.formula import Formula
+from blueprints.codes.formula_profiler import profiled
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import DIMENSIONLESS, MPA
 from blueprints.validations import raise_if_less_or_equal_to_zero, raise_if_negative
@@ -173,6 +174,7 @@ class Form6Dot71CriteriaBasedOnStressRange:
         """Ratio between left hand side and right hand side of the formula, commonly referred to as unity check."""
         return self.left_hand_side / self.right_hand_side
 
+    @profiled
     def __bool__(self) -> bool:
         """Evaluates the formula, for more information see the __init__ method."""
         lhs = Form6Dot71CriteriaBasedOnStressRangeLHS(gamma_f_fat=self.gamma_f_fat, delta_sigma_s_equ_n_star=self.delta_sigma_s_equ_n_star)
@@ -1,10 +1,11 @@
 """Formula 7.3 from NEN-EN 1992-1-1+C2:2011: Chapter 7 - Serviceability limit state (SLS)."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import KN, MM2, MPA
 from blueprints.unit_conversion import KN_TO_N
+from blueprints.validations import any_true
 
 
 class Form7Dot3CoefficientKc(Formula):
@@ -46,11 +47,11 @@ class Form7Dot3CoefficientKc(Formula):
         f_ct_eff: MPA,
     ) -> float:
         """Evaluates the formula, for more information see the __init__ method."""
-        if a_ct <= 0:
+        if any_true(a_ct <= 0):
             raise ValueError("The value of a_ct must be greater than zero.")
-        if f_ct_eff <= 0:
+        if any_true(f_ct_eff <= 0):
             raise ValueError("The value of f_ct_eff must be greater than zero.")
-        return max(0.9 * (abs(f_cr) * KN_TO_N / (a_ct * f_ct_eff)), 0.5)
+        return maximum(0.9 * (abs(f_cr) * KN_TO_N / (a_ct * f_ct_eff)), 0.5)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 7.3."""
@@ -1 +1,37 @@
 """Package containing all formulas from NEN-EN 1992-1-1+C2:2011: Chapter 8 - Detailing of reinforcement and prestressing tendons - General."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_8_1 import Form8Dot1RequiredMinimumMandrelDiameter
+    from .formula_8_2 import Form8Dot2UltimateBondStress, SubForm8Dot2CoefficientBarDiameter, SubForm8Dot2CoefficientQualityOfBond
+    from .formula_8_3 import Form8Dot3RequiredAnchorageLength
+    from .formula_8_4 import Form8Dot4DesignAnchorageLength
+    from .formula_8_6 import Form8Dot6MinimumTensionAnchorage
+    from .formula_8_7 import Form8Dot7MinimumCompressionAnchorage
+    from .formula_8_8n import (
+        Form8Dot8nAnchorageCapacityWeldedTransverseBar,
+        SubForm8Dot8nConcreteStress,
+        SubForm8Dot8nDesignLengthOfTransverseBar,
+        SubForm8Dot8nFunctionX,
+        SubForm8Dot8nFunctionY,
+    )
+    from .formula_8_9 import Form8Dot9AnchorageCapacityWeldedTransverseBarSmallDiameter
+    from .formula_8_10 import Form8Dot10DesignLapLength, SubForm8Dot10Alpha6
+    from .formula_8_11 import Form8Dot11MinimumDesignLapLength
+    from .formula_8_12 import Form8Dot12AdditionalShearReinforcement
+    from .formula_8_13 import Form8Dot13AdditionalShearReinforcement
+    from .formula_8_14 import Form8Dot14EquivalentDiameterBundledBars
+    from .formula_8_15 import Form8Dot15PrestressTransferStress, SubForm8Dot15EtaP1, SubForm8Dot15TensileStrengthAtRelease
+    from .formula_8_16 import Form8Dot16BasicTransmissionLength, SubForm8Dot16Alpha1, SubForm8Dot16Alpha2
+    from .formula_8_17 import Form8Dot17DesignValueTransmissionLength1
+    from .formula_8_18 import Form8Dot18DesignValueTransmissionLength2
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
@@ -1,7 +1,7 @@
 """Formula 8.10 from NEN-EN 1992-1-1+C2:2011: Chapter 8: Detailing of reinforcement and prestressing tendons."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, clip, maximum
 from blueprints.codes.latex_formula import LatexFormula, latex_max_curly_brackets, latex_min_curly_brackets
 from blueprints.type_alias import DIMENSIONLESS, MM
 from blueprints.validations import raise_if_negative
@@ -123,7 +123,7 @@ class Form8Dot10DesignLapLength(Formula):
             l_b_rqd=l_b_rqd,
             l_0_min=l_0_min,
         )
-        return max(alpha_1 * alpha_2 * alpha_3 * alpha_5 * alpha_6 * l_b_rqd, l_0_min)
+        return maximum(alpha_1 * alpha_2 * alpha_3 * alpha_5 * alpha_6 * l_b_rqd, l_0_min)
 
     def latex(self) -> LatexFormula:
         """Returns a LatexFormula representation of the formula."""
@@ -164,8 +164,7 @@ class SubForm8Dot10Alpha6(Formula):
     def _evaluate(rho_1: DIMENSIONLESS) -> DIMENSIONLESS:
         """Evaluates the formula, for more information see the __init__ method."""
         raise_if_negative(rho_l=rho_1)
-        value_max_1_5 = min((rho_1 / 25) ** 0.5, 1.5)
-        return max(value_max_1_5, 1)
+        return clip((rho_1 / 25) ** 0.5, 1, 1.5)
 
     def latex(self) -> LatexFormula:
         """Returns a LatexFormula representation of the formula."""
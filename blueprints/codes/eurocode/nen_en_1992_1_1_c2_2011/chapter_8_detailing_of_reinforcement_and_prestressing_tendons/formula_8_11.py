@@ -1,7 +1,7 @@
 """Formula 8.11 from NEN-EN 1992-1-1+C2:2011: Chapter 8: Detailing of reinforcement and prestressing tendons."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.codes.latex_formula import LatexFormula, latex_max_curly_brackets
 from blueprints.type_alias import DIMENSIONLESS, MM
 from blueprints.validations import raise_if_negative
@@ -59,7 +59,7 @@ class Form8Dot11MinimumDesignLapLength(Formula):
             l_b_rqd=l_b_rqd,
             diameter=diameter,
         )
-        return max(0.3 * alpha_6 * l_b_rqd, 15 * diameter, 200)
+        return maximum(0.3 * alpha_6 * l_b_rqd, 15 * diameter, 200)
 
     def latex(self) -> LatexFormula:
         """Returns a representation of the formula in LaTeX format."""
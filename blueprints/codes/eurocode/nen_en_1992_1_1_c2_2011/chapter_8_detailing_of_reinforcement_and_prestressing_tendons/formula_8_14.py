@@ -3,7 +3,7 @@
 import numpy as np
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, minimum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import DIMENSIONLESS, MM
 from blueprints.validations import raise_if_negative
@@ -46,7 +46,7 @@ class Form8Dot14EquivalentDiameterBundledBars(Formula):
             diameter=diameter,
             n_b=n_b,
         )
-        return min(diameter * np.sqrt(n_b), 55)
+        return minimum(diameter * np.sqrt(n_b), 55)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 8.14."""
@@ -1,10 +1,12 @@
 """Formula 8.15 from NEN-EN 1992-1-1+C2:2011: Chapter 8: Detailing of reinforcement and prestressing tendons."""
 
+import numpy as np
+
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, lookup
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import DIMENSIONLESS, MPA
-from blueprints.validations import raise_if_less_or_equal_to_zero, raise_if_negative
+from blueprints.validations import any_true, raise_if_less_or_equal_to_zero, raise_if_negative
 
 
 class Form8Dot15PrestressTransferStress(Formula):
@@ -109,15 +111,12 @@ class SubForm8Dot15EtaP1(Formula):
         self.type_of_wire = type_of_wire
 
     @staticmethod
-    def _evaluate(type_of_wire: str) -> DIMENSIONLESS:
+    def _evaluate(type_of_wire: str) -> DIMENSIONLESS | np.ndarray:
         """Evaluates the formula, for more information see the __init__ method."""
-        match type_of_wire.lower():
-            case "indented":
-                return 2.7
-            case "3_7_wire_strands":
-                return 3.2
-            case _:
-                raise ValueError(f"Invalid type of wire: {type_of_wire}. Options: 'indented' or '3_7_wire_strands'")
+        coefficient = lookup(type_of_wire, {"indented": 2.7, "3_7_wire_strands": 3.2})
+        if any_true(np.isnan(coefficient)):
+            raise ValueError(f"Invalid type of wire: {type_of_wire}. Options: 'indented' or '3_7_wire_strands'")
+        return coefficient
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for the first subformula of formula 8.15."""
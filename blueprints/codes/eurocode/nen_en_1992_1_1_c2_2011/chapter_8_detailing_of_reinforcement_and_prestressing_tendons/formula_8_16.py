@@ -1,10 +1,12 @@
 """Formula 8.16 from NEN-EN 1992-1-1+C2:2011: Chapter 8: Detailing of reinforcement and prestressing tendons."""
 
+import numpy as np
+
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, lookup
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import DIMENSIONLESS, MM, MPA
-from blueprints.validations import raise_if_less_or_equal_to_zero, raise_if_negative
+from blueprints.validations import any_true, raise_if_less_or_equal_to_zero, raise_if_negative
 
 
 class Form8Dot16BasicTransmissionLength(Formula):
@@ -110,15 +112,12 @@ class SubForm8Dot16Alpha1(Formula):
         self.release_type = release_type
 
     @staticmethod
-    def _evaluate(release_type: str) -> DIMENSIONLESS:
+    def _evaluate(release_type: str) -> DIMENSIONLESS | np.ndarray:
         """Evaluates the formula, for more information see the __init__ method."""
-        match release_type.lower():
-            case "gradual":
-                return 1.0
-            case "sudden":
-                return 1.25
-            case _:
-                raise ValueError(f"Invalid release type: {release_type}. Valid values are 'gradual' or 'sudden'.")
+        coefficient = lookup(release_type, {"gradual": 1.0, "sudden": 1.25})
+        if any_true(np.isnan(coefficient)):
+            raise ValueError(f"Invalid release type: {release_type}. Valid values are 'gradual' or 'sudden'.")
+        return coefficient
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for the first subformula of formula 8.16."""
@@ -158,15 +157,12 @@ class SubForm8Dot16Alpha2(Formula):
         self.type_of_wire = type_of_wire
 
     @staticmethod
-    def _evaluate(type_of_wire: str) -> DIMENSIONLESS:
+    def _evaluate(type_of_wire: str) -> DIMENSIONLESS | np.ndarray:
         """Evaluates the formula, for more information see the __init__ method."""
-        match type_of_wire.lower():
-            case "circular":
-                return 0.25
-            case "3_7_wire_strands":
-                return 0.19
-            case _:
-                raise ValueError(f"Invalid type of wire: {type_of_wire}. Valid values are 'circular' or '3_7_wire_strands'.")
+        coefficient = lookup(type_of_wire, {"circular": 0.25, "3_7_wire_strands": 0.19})
+        if any_true(np.isnan(coefficient)):
+            raise ValueError(f"Invalid type of wire: {type_of_wire}. Valid values are 'circular' or '3_7_wire_strands'.")
+        return coefficient
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for the second subformula of formula 8.16."""
@@ -1,10 +1,12 @@
 """Formula 8.2 from NEN-EN 1992-1-1+C2:2011: Chapter 8: Detailing of reinforcement and prestressing tendons."""
 
+import numpy as np
+
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, lookup, where
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import DIMENSIONLESS, MM, MPA
-from blueprints.validations import raise_if_negative
+from blueprints.validations import any_true, raise_if_negative
 
 
 class Form8Dot2UltimateBondStress(Formula):
@@ -90,15 +92,12 @@ class SubForm8Dot2CoefficientQualityOfBond(Formula):
         self.bond_quality = bond_quality
 
     @staticmethod
-    def _evaluate(bond_quality: str) -> DIMENSIONLESS:
+    def _evaluate(bond_quality: str) -> DIMENSIONLESS | np.ndarray:
         """Evaluates the formula, for more information see the __init__ method."""
-        match bond_quality.lower():
-            case "good":
-                return 1
-            case "other":
-                return 0.7
-            case _:
-                raise ValueError(f"Invalid bond quality: {bond_quality}. Options: 'good' or 'other'")
+        coefficient = lookup(bond_quality, {"good": 1, "other": 0.7})
+        if any_true(np.isnan(coefficient)):
+            raise ValueError(f"Invalid bond quality: {bond_quality}. Options: 'good' or 'other'")
+        return coefficient
 
 
 class SubForm8Dot2CoefficientBarDiameter(Formula):
@@ -121,12 +120,10 @@ class SubForm8Dot2CoefficientBarDiameter(Formula):
         self.diameter = diameter
 
     @staticmethod
-    def _evaluate(diameter: MM) -> DIMENSIONLESS:
+    def _evaluate(diameter: MM) -> DIMENSIONLESS | np.ndarray:
         """Evaluates the formula, for more information see the __init__ method."""
         raise_if_negative(diameter=diameter)
-        if diameter <= 32:
-            return 1
-        return (132 - diameter) / 100
+        return where(diameter <= 32, 1, (132 - diameter) / 100)
 
     def latex(self) -> LatexFormula:
         """Returns a LatexFormula object for this formula."""
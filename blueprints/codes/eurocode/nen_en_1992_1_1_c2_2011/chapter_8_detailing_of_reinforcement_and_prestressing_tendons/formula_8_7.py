@@ -1,7 +1,7 @@
 """Formula 8.7 from NEN-EN 1992-1-1+C2:2011: Chapter 8: Detailing of reinforcement and prestressing tendons."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.codes.latex_formula import LatexFormula, latex_max_curly_brackets
 from blueprints.type_alias import MM
 from blueprints.validations import raise_if_negative
@@ -41,7 +41,7 @@ class Form8Dot7MinimumCompressionAnchorage(Formula):
     def _evaluate(l_b_rqd: MM, diameter: MM) -> MM:
         """Evaluates the formula, for more information see the __init__ method."""
         raise_if_negative(diameter=diameter, l_b_rqd=l_b_rqd)
-        return max(0.6 * l_b_rqd, 10 * diameter, 100)
+        return maximum(0.6 * l_b_rqd, 10 * diameter, 100)
 
     def latex(self) -> LatexFormula:
         """Returns a LatexFormula object for this formula."""
@@ -3,7 +3,7 @@
 import numpy as np
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, minimum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import DIMENSIONLESS, KN, MM, MPA
 from blueprints.unit_conversion import N_TO_KN
@@ -71,7 +71,7 @@ class Form8Dot8nAnchorageCapacityWeldedTransverseBar(Formula):
             sigma_td=sigma_td,
             f_wd=f_wd,
         )
-        return min(l_td * diameter_t * sigma_td * N_TO_KN, f_wd)
+        return minimum(l_td * diameter_t * sigma_td * N_TO_KN, f_wd)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 8.8N."""
@@ -136,7 +136,7 @@ class SubForm8Dot8nDesignLengthOfTransverseBar(Formula):
             l_t=l_t,
         )
         raise_if_less_or_equal_to_zero(sigma_td=sigma_td)
-        return min(1.16 * diameter_t * (f_yd / sigma_td) ** 0.5, l_t)
+        return minimum(1.16 * diameter_t * (f_yd / sigma_td) ** 0.5, l_t)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 8.8N transverse bar."""
@@ -204,7 +204,7 @@ class SubForm8Dot8nConcreteStress(Formula):
             f_cd=f_cd,
         )
         raise_if_less_or_equal_to_zero(y_function=y_function)
-        return min((f_ctd + sigma_cm) / y_function, 3 * f_cd)
+        return minimum((f_ctd + sigma_cm) / y_function, 3 * f_cd)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 8.8N concrete stress."""
@@ -1,7 +1,7 @@
 """Formula 8.9 from NEN-EN 1992-1-1+C2:2011: Chapter 8: Detailing of reinforcement and prestressing tendons."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, minimum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import KN, MM, MM2, MPA
 from blueprints.unit_conversion import N_TO_KN
@@ -69,7 +69,7 @@ class Form8Dot9AnchorageCapacityWeldedTransverseBarSmallDiameter(Formula):
             f_cd=f_cd,
         )
         raise_if_less_or_equal_to_zero(diameter_l=diameter_l)
-        return min(f_wd, N_TO_KN * 16 * a_s * f_cd * (diameter_t / diameter_l))
+        return minimum(f_wd, N_TO_KN * 16 * a_s * f_cd * (diameter_t / diameter_l))
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 8.9."""
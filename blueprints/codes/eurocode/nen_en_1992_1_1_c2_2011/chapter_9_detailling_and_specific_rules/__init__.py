@@ -1 +1,28 @@
 """Package containing all formulas from NEN-EN 1992-1-1+C2:2011: Chapter 9 - Detailing of members and particular rules."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_9_1n import Form9Dot1nMinimumTensileReinforcementBeam
+    from .formula_9_2 import Form9Dot2ShiftInMomentDiagram
+    from .formula_9_3 import Form9Dot3ShiftInMomentDiagram
+    from .formula_9_4 import Form9Dot4ShearReinforcementRatio
+    from .formula_9_5n import Form9Dot5nMinimumShearReinforcementRatio
+    from .formula_9_6n import Form9Dot6nMaximumDistanceShearReinforcement
+    from .formula_9_7n import Form9Dot7nMaximumDistanceBentUpBars
+    from .formula_9_8n import Form9Dot8nMaximumTransverseDistanceLegsSeriesShearLinks
+    from .formula_9_9 import Form9Dot9MaximumSpacingSeriesOfLinks
+    from .formula_9_10 import Form9Dot10MaximumSpacingBentUpBars
+    from .formula_9_12n import Form9Dot12nMinimumLongitudinalReinforcementColumns
+    from .formula_9_13 import Form9Dot13TensileForceToBeAnchored
+    from .formula_9_14 import Form9Dot14SplittingForceColumnOnRock
+    from .formula_9_16 import Form9Dot16MinimumForceOnInternalBeamLine
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
@@ -1,7 +1,7 @@
 """Formula 9.12N from NEN-EN 1992-1-1+C2:2011: Chapter 9 - Detailling and specific rules."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import KN, MM2, MPA
 from blueprints.unit_conversion import KN_TO_N
@@ -46,7 +46,7 @@ class Form9Dot12nMinimumLongitudinalReinforcementColumns(Formula):
     ) -> MM2:
         """For more detailed documentation see the class docstring."""
         raise_if_negative(n_ed=n_ed, f_yd=f_yd, a_c=a_c)
-        return max(0.1 * n_ed * KN_TO_N / f_yd, 0.002 * a_c)
+        return maximum(0.1 * n_ed * KN_TO_N / f_yd, 0.002 * a_c)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 9.12N."""
@@ -1,7 +1,7 @@
 """Formula 9.16 from NEN-EN 1992-1-1+C2:2011: Chapter 9 - Detailling and specific rules."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import KN, KN_M, M
 from blueprints.validations import raise_if_negative
@@ -50,7 +50,7 @@ class Form9Dot16MinimumForceOnInternalBeamLine(Formula):
     ) -> KN:
         """For more detailed documentation see the class docstring."""
         raise_if_negative(q_3=q_3, l_1=l_1, l_2=l_2, q_4=q_4)
-        return max(q_3 * (l_1 + l_2) / 2, q_4)
+        return maximum(q_3 * (l_1 + l_2) / 2, q_4)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 9.16."""
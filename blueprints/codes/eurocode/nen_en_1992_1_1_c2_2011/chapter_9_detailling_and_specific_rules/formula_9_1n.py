@@ -1,7 +1,7 @@
 """Formula 9.1N from NEN-EN 1992-1-1+C2:2011: Chapter 9 - Detailing of members and particular rules."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, maximum
 from blueprints.codes.latex_formula import LatexFormula, latex_fraction, latex_max_curly_brackets
 from blueprints.type_alias import MM, MM2, MPA
 from blueprints.validations import raise_if_negative
@@ -56,7 +56,7 @@ class Form9Dot1nMinimumTensileReinforcementBeam(Formula):
     ) -> MM2:
         """For more detailed documentation see the class docstring."""
         raise_if_negative(f_ctm=f_ctm, f_yk=f_yk, b_t=b_t, d=d)
-        return max(0.26 * (f_ctm / f_yk) * b_t * d, 0.0013 * b_t * d)
+        return maximum(0.26 * (f_ctm / f_yk) * b_t * d, 0.0013 * b_t * d)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 9.1N."""
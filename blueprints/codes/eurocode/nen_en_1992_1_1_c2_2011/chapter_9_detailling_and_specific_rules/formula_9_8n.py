@@ -1,7 +1,7 @@
 """Formula 9.8N from NEN-EN 1992-1-1+C2:2011: Chapter 9 - Detailing of members and particular rules."""
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, minimum
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import MM
 from blueprints.validations import raise_if_negative
@@ -32,7 +32,7 @@ class Form9Dot8nMaximumTransverseDistanceLegsSeriesShearLinks(Formula):
     def _evaluate(d: MM) -> MM:
         """For more detailed documentation see the class docstring."""
         raise_if_negative(d=d)
-        return min(0.75 * d, 600)
+        return minimum(0.75 * d, 600)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 9.8N."""
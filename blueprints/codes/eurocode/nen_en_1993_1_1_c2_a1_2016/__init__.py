@@ -1,3 +1,23 @@
 """NEN-EN 1993-1-1+C2+A1:2016."""
 
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .chapter_2_basic_of_design.formula_2_2 import Form2Dot2CharacteristicValueResistance
+    from .chapter_6_ultimate_limit_state.formula_6_2 import Form6Dot2UtilizationRatio
+    from .chapter_6_ultimate_limit_state.formula_6_5 import Form6Dot5UnityCheckTensileStrength
+
 NEN_EN_1993_1_1_C2_A1_2016 = "NEN-EN 1993-1-1+C2+A1:2016"
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=[
+        "chapter_2_basic_of_design",
+        "chapter_6_ultimate_limit_state",
+    ],
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
@@ -1 +1,16 @@
 """Module containing all formulas from 1993-1-1+C2+A1:2016: Chapter 6 - Ultimate limit state."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_6_2 import Form6Dot2UtilizationRatio
+    from .formula_6_5 import Form6Dot5UnityCheckTensileStrength
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
@@ -1,3 +1,21 @@
 """NEN-EN 1993-1-9+C2:2012."""
 
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_1 import FormADot1DamageDuringDesignLife
+    from .annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_2 import FormADot2CriteriaBasedOnDamageAccumulation
+
 NEN_EN_1993_1_9_C2_2012 = "NEN-EN 1993-1-9+C2:2012"
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=[
+        "annex_a_determination_of_fatigue_load_parameters_and_verification_formats",
+    ],
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
@@ -1,5 +1,7 @@
 """Formula A.1 from NEN-EN 1993-1-9+C2:2012: Annex A - Determination of fatigue load parameters and verification formats."""
 
+import numpy as np
+
 from blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012 import NEN_EN_1993_1_9_C2_2012
 from blueprints.codes.formula import Formula
 from blueprints.codes.latex_formula import LatexFormula
@@ -41,6 +43,11 @@ class FormADot1DamageDuringDesignLife(Formula):
     ) -> DIMENSIONLESS:
         """Evaluates the formula, for more information see the __init__ method."""
         raise_if_lists_differ_in_length(n_e=n_e, n_r=n_r)
+        if isinstance(n_e, np.ndarray) or isinstance(n_r, np.ndarray):
+            raise_if_negative(n_e_min=np.min(n_e))
+            raise_if_less_or_equal_to_zero(n_r_min=np.min(n_r))
+            # the bands are summed over the last axis, so rows of bands can be evaluated at once
+            return np.sum(np.divide(n_e, n_r), axis=-1)
         raise_if_negative(n_e_min=min(n_e))
         raise_if_less_or_equal_to_zero(n_r_min=min(n_r))
         return sum([n_e[i] / n_r[i] for i in range(len(n_e))])
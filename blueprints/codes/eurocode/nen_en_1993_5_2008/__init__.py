@@ -1,3 +1,27 @@
 """NEN-EN 1993-5:2008."""
 
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .chapter_5_ultimate_limit_states.formula_5_2 import Form5Dot2DesignMomentResistanceClass1Or2
+    from .chapter_5_ultimate_limit_states.formula_5_3 import Form5Dot3DesignMomentResistanceClass3
+    from .chapter_5_ultimate_limit_states.formula_5_5 import Form5Dot5PlasticShearResistance
+    from .chapter_5_ultimate_limit_states.formula_5_6 import Form5Dot6ProjectedShearArea
+    from .chapter_5_ultimate_limit_states.formula_5_7 import Form5Dot7ShearBucklingResistance
+    from .chapter_5_ultimate_limit_states.formula_5_8 import Form5Dot8RelativeWebSlenderness
+    from .chapter_5_ultimate_limit_states.formula_5_9 import Form5Dot9ReducedBendingMomentResistance
+    from .chapter_5_ultimate_limit_states.formula_5_10 import Form5Dot10ReductionFactorShearArea
+
 NEN_EN_1993_5_2008 = "NEN-EN 1993-5:2008"
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=[
+        "chapter_5_ultimate_limit_states",
+    ],
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
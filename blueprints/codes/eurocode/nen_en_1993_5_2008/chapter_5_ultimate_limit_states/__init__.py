@@ -1 +1,22 @@
 """Module containing all formulas from 1993-5:2008 Chapter 5 - Ultimate limit states."""
+
+from blueprints.codes.formula_manifest import MODULE_EXPORTS
+from blueprints.utils.lazy_import import lazy_import, package_exports
+
+# not imported from typing, see blueprints.utils.lazy_import
+TYPE_CHECKING = False
+# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit
+if TYPE_CHECKING:
+    from .formula_5_2 import Form5Dot2DesignMomentResistanceClass1Or2
+    from .formula_5_3 import Form5Dot3DesignMomentResistanceClass3
+    from .formula_5_5 import Form5Dot5PlasticShearResistance
+    from .formula_5_6 import Form5Dot6ProjectedShearArea
+    from .formula_5_7 import Form5Dot7ShearBucklingResistance
+    from .formula_5_8 import Form5Dot8RelativeWebSlenderness
+    from .formula_5_9 import Form5Dot9ReducedBendingMomentResistance
+    from .formula_5_10 import Form5Dot10ReductionFactorShearArea
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodule_attributes=package_exports(__name__, MODULE_EXPORTS),
+)
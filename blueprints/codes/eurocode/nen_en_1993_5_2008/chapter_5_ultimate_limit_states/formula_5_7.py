@@ -5,7 +5,7 @@ from blueprints.codes.formula import Formula
 from blueprints.codes.latex_formula import LatexFormula, latex_fraction
 from blueprints.type_alias import DIMENSIONLESS, KN, MM, MPA
 from blueprints.unit_conversion import N_TO_KN
-from blueprints.validations import raise_if_less_or_equal_to_zero
+from blueprints.validations import any_true, raise_if_less_or_equal_to_zero
 
 
 class Form5Dot7ShearBucklingResistance(Formula):
@@ -63,7 +63,7 @@ class Form5Dot7ShearBucklingResistance(Formula):
             f_bv=f_bv,
             gamma_m_0=gamma_m_0,
         )
-        if t_f >= h:
+        if any_true(t_f >= h):
             raise ValueError("The thickness of the flange should be less than the height of the web.")
         return ((h - t_f) * t_w * f_bv / gamma_m_0) * N_TO_KN
 
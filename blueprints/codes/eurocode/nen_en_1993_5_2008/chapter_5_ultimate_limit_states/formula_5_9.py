@@ -3,7 +3,7 @@
 import numpy as np
 
 from blueprints.codes.eurocode.nen_en_1993_5_2008 import NEN_EN_1993_5_2008
-from blueprints.codes.formula import Formula
+from blueprints.codes.formula import Formula, minimum
 from blueprints.codes.latex_formula import LatexFormula, latex_fraction, latex_min_curly_brackets
 from blueprints.type_alias import DEG, DIMENSIONLESS, KNM, MM, MM2, MM3, MPA
 from blueprints.unit_conversion import NMM_TO_KNM
@@ -90,7 +90,7 @@ class Form5Dot9ReducedBendingMomentResistance(Formula):
         """Evaluates the formula for reduced bending moment resistance."""
         raise_if_less_or_equal_to_zero(beta_b=beta_b, w_pl=w_pl, rho=rho, a_v=a_v, t_w=t_w, alpha=alpha, f_y=f_y, gamma_m_0=gamma_m_0, mc_rd=mc_rd)
         m_v_rd = ((beta_b * w_pl) - ((rho * a_v**2) / (4.0 * t_w * np.sin(np.deg2rad(alpha))))) * (f_y / gamma_m_0) * NMM_TO_KNM
-        return min(m_v_rd, mc_rd)
+        return minimum(m_v_rd, mc_rd)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for formula 5.9."""
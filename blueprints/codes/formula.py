@@ -1,16 +1,95 @@
 """Module for the abstract base class Formula."""
 
-from abc import ABC, abstractmethod
+import threading
+from abc import ABCMeta, abstractmethod
+from collections.abc import Mapping, Sequence
+from functools import reduce
+from typing import TypeGuard, overload
 
+import numpy as np
 
-class Formula(float, ABC):
+from blueprints.codes.formula_cache import FormulaCache
+from blueprints.codes.formula_profiler import FormulaProfiler
+
+
+class FormulaMeta(ABCMeta):
+    """Metaclass for Formula.
+
+    When a :class:`FormulaCache` is active, instantiating a formula with the same input values as before returns the cached instance, without
+    evaluating and initializing the formula again. When a :class:`FormulaProfiler` is active, every instantiation is timed.
+
+    The instrumented instantiation is only installed as ``__call__`` of the metaclass while a cache or profiler is entered (in any context), see
+    :func:`enable_instrumentation`. Otherwise, formulas are instantiated like any other class, without a lookup of the active cache or profiler.
+    """
+
+    def _cached_call(cls, *args, **kwargs) -> "Formula":
+        """Create a new instance of the formula, or return the cached instance if a cache is active."""
+        cache = FormulaCache.active()
+        if cache is None:
+            return super().__call__(*args, **kwargs)
+        key = FormulaCache.make_key(cls, args, kwargs)
+        try:
+            cached_result = cache.lookup(key)
+        except TypeError:
+            # unhashable input values, like lists, are not cached
+            return super().__call__(*args, **kwargs)
+        if cached_result is not None:
+            return cached_result
+        result = super().__call__(*args, **kwargs)
+        cache.store(key, result)
+        return result
+
+
+def _instrumented_call(cls: FormulaMeta, *args, **kwargs) -> "Formula":
+    """Create a new instance of the formula, timed if a profiler is active, or return the cached instance if a cache is active."""
+    profiler = FormulaProfiler.active()
+    if profiler is None:
+        return cls._cached_call(*args, **kwargs)
+    measurement = profiler.start()
+    try:
+        return cls._cached_call(*args, **kwargs)
+    finally:
+        profiler.stop(cls, measurement)
+
+
+# the number of caches and profilers that are entered in all contexts, while positive the instrumented instantiation is installed
+_instrumentation_users = 0
+_instrumentation_lock = threading.Lock()
+
+
+def enable_instrumentation() -> None:
+    """Install the instrumented instantiation of formulas, called when a :class:`FormulaCache` or :class:`FormulaProfiler` is entered.
+
+    Every call must be matched by a call of :func:`disable_instrumentation`.
+    """
+    global _instrumentation_users  # noqa: PLW0603
+    with _instrumentation_lock:
+        _instrumentation_users += 1
+        if _instrumentation_users == 1:
+            FormulaMeta.__call__ = _instrumented_call  # type: ignore[assignment]
+
+
+def disable_instrumentation() -> None:
+    """Remove the instrumented instantiation of formulas once no :class:`FormulaCache` or :class:`FormulaProfiler` is entered anymore."""
+    global _instrumentation_users  # noqa: PLW0603
+    with _instrumentation_lock:
+        _instrumentation_users -= 1
+        if _instrumentation_users == 0:
+            del FormulaMeta.__call__
+
+
+class Formula(float, metaclass=FormulaMeta):
     """Abstract base class for formulas used in the codes."""
 
+    # the initialization flag is stored in a slot instead of the instance dictionary, which keeps the dictionary (and instance) smaller
+    __slots__ = ("_initialized",)
+
     def __new__(cls, *args, **kwargs) -> "Formula":
         """Method for creating a new instance of the class."""
         result = cls._evaluate(*args, **kwargs)
         instance = float.__new__(cls, result)
-        instance._initialized = False  # noqa: SLF001
+        # the slot is set directly, as the read-only check of __setattr__ would look up the (unset) slot, which raises an AttributeError
+        object.__setattr__(instance, "_initialized", False)
         return instance
 
     def __init__(self, *args, **kwargs) -> None:
@@ -28,10 +107,55 @@ class Formula(float, ABC):
         value : str | float
             The value to be assigned to the attribute.
         """
-        if getattr(self, "_initialized", False) and name in self.__dict__:
+        if getattr(self, "_initialized", False) and (name in self.__dict__ or name == "_initialized"):
             raise AttributeError(f"Attribute '{name}' of '{type(self).__name__}' object is read-only and cannot be modified after initialization.")
         super().__setattr__(name, value)
 
+    def __reduce__(self) -> tuple:
+        """Support pickling (and copying) of the result, for example to send it between the processes of a process pool.
+
+        The default protocol of float subclasses would call ``cls.__new__(cls, value)`` when unpickling, which evaluates the formula with the
+        result as its only input value. Instead, the computed result and the input values are restored without evaluating the formula again.
+
+        Returns
+        -------
+        tuple
+            The callable to restore the result, and its arguments.
+        """
+        return _restore_formula, (type(self), float(self), self.__dict__)
+
+    @classmethod
+    def evaluate_many(cls: type["Formula"], *args, **kwargs) -> np.ndarray:
+        """Evaluate the formula for many sets of input values at once.
+
+        The input values are broadcast against each other and passed to the (array-safe) logic of the formula in one pass, without creating
+        a :class:`Formula` instance per set of input values.
+
+        Examples
+        --------
+        >>> Form8Dot3RequiredAnchorageLength.evaluate_many(diameter=[12, 16], sigma_sd=435, f_bd=np.array([2.7, 3.0]))
+        array([483.33333333, 580.        ])
+
+        Parameters
+        ----------
+        *args
+            Positional arguments of the formula, as scalars, sequences, NumPy arrays or pandas Series.
+        **kwargs
+            Keyword arguments of the formula, as scalars, sequences, NumPy arrays or pandas Series.
+
+        Returns
+        -------
+        np.ndarray
+            The results of the formula, with the broadcast shape of the input values, a new array that shares no memory with the input values.
+        """
+        arrays = np.broadcast_arrays(*(_as_array(value) for value in (*args, *kwargs.values())))
+        positional_arrays, keyword_arrays = arrays[: len(args)], dict(zip(kwargs, arrays[len(args) :]))
+        results = np.asarray(cls._evaluate(*positional_arrays, **keyword_arrays), dtype=float)
+        # a formula that returns (a view of) one of its input values must not return the array of the caller
+        if any(np.may_share_memory(results, array) for array in arrays):
+            results = results.copy()
+        return results
+
     @property
     @abstractmethod
     def label(self) -> str:
@@ -76,12 +200,252 @@ class Formula(float, ABC):
 
     @staticmethod
     @abstractmethod
-    def _evaluate(*args, **kwargs) -> float:
+    def _evaluate(*args, **kwargs) -> float | np.ndarray:
         """Abstract method for the logic of the formula.
 
+        The logic must be array-safe: when called with (broadcast) NumPy arrays, as done by :meth:`evaluate_many`, it evaluates all values
+        element-wise and returns an array.
+
         Returns
         -------
-        float
+        float | np.ndarray
             The result of the formula.
             This is an abstract method and must be implemented in all subclasses.
         """
+
+
+def _restore_formula(formula_class: type[Formula], result: float, inputs: dict) -> Formula:
+    """Restore a pickled formula result, without evaluating the formula.
+
+    Parameters
+    ----------
+    formula_class : type[Formula]
+        The class of the formula.
+    result : float
+        The computed result of the formula.
+    inputs : dict
+        The attributes of the formula instance, like the input values.
+
+    Returns
+    -------
+    Formula
+        The (read-only) formula instance.
+    """
+    instance = float.__new__(formula_class, result)
+    instance.__dict__.update(inputs)
+    instance._initialized = True  # noqa: SLF001
+    return instance
+
+
+def _as_array(value: object) -> np.ndarray:
+    """Convert an input value of a formula to a NumPy array.
+
+    Tuples (for example the named tuple of exposure classes) are records and are therefore kept together as a single object.
+    A list of records becomes a one-dimensional object array.
+
+    Parameters
+    ----------
+    value : object
+        The input value, as a scalar, record, sequence, NumPy array or pandas Series.
+
+    Returns
+    -------
+    np.ndarray
+        The input value as a NumPy array.
+    """
+    if isinstance(value, tuple):
+        array = np.empty((), dtype=object)
+        array[()] = value
+        return array
+    if isinstance(value, list) and value and isinstance(value[0], tuple):
+        return np.fromiter(value, dtype=object, count=len(value))
+    return np.asarray(value)
+
+
+@overload
+def maximum(*values: float) -> float: ...
+
+
+@overload
+def maximum(*values: float | np.ndarray) -> float | np.ndarray: ...
+
+
+def maximum(*values: float | np.ndarray) -> float | np.ndarray:
+    """Return the (element-wise) maximum of the values, for use in the logic of a formula.
+
+    Scalars are compared with the builtin ``max``, which is much cheaper than a NumPy ufunc, arrays (as passed by
+    :meth:`Formula.evaluate_many`) with ``np.maximum``.
+
+    Parameters
+    ----------
+    *values : float | np.ndarray
+        The values, scalars or arrays that are broadcast against each other.
+
+    Returns
+    -------
+    float | np.ndarray
+        The maximum of the values.
+    """
+    if _are_scalars(values):
+        return max(values)
+    return reduce(np.maximum, values)
+
+
+@overload
+def minimum(*values: float) -> float: ...
+
+
+@overload
+def minimum(*values: float | np.ndarray) -> float | np.ndarray: ...
+
+
+def minimum(*values: float | np.ndarray) -> float | np.ndarray:
+    """Return the (element-wise) minimum of the values, for use in the logic of a formula.
+
+    Scalars are compared with the builtin ``min``, arrays with ``np.minimum``, see :func:`maximum`.
+
+    Parameters
+    ----------
+    *values : float | np.ndarray
+        The values, scalars or arrays that are broadcast against each other.
+
+    Returns
+    -------
+    float | np.ndarray
+        The minimum of the values.
+    """
+    if _are_scalars(values):
+        return min(values)
+    return reduce(np.minimum, values)
+
+
+@overload
+def clip(value: float, lower: float, upper: float) -> float: ...
+
+
+@overload
+def clip(value: float | np.ndarray, lower: float, upper: float) -> float | np.ndarray: ...
+
+
+def clip(value: float | np.ndarray, lower: float, upper: float) -> float | np.ndarray:
+    """Return the (element-wise) value limited to the range from lower to upper, for use in the logic of a formula.
+
+    Parameters
+    ----------
+    value : float | np.ndarray
+        The value, a scalar or an array.
+    lower : float
+        The lower limit.
+    upper : float
+        The upper limit.
+
+    Returns
+    -------
+    float | np.ndarray
+        The limited value.
+    """
+    if not isinstance(value, np.ndarray):
+        return min(max(value, lower), upper)
+    return np.clip(value, lower, upper)
+
+
+@overload
+def where(condition: bool, if_true: float, if_false: float) -> float: ...
+
+
+@overload
+def where(condition: bool | np.ndarray, if_true: float | np.ndarray, if_false: float | np.ndarray) -> float | np.ndarray: ...
+
+
+def where(condition: bool | np.ndarray, if_true: float | np.ndarray, if_false: float | np.ndarray) -> float | np.ndarray:
+    """Return the value for a condition, element-wise for arrays, for use in the logic of a formula.
+
+    A scalar condition is an ordinary if-else, an array of conditions uses ``np.where``.
+
+    Parameters
+    ----------
+    condition : bool | np.ndarray
+        The condition.
+    if_true : float | np.ndarray
+        The value where the condition holds.
+    if_false : float | np.ndarray
+        The value where the condition does not hold.
+
+    Returns
+    -------
+    float | np.ndarray
+        The selected value.
+    """
+    if _are_scalars((condition, if_true, if_false)):
+        return if_true if condition else if_false
+    return np.where(condition, if_true, if_false)
+
+
+@overload
+def select(conditions: Sequence[bool], choices: Sequence[float], default: float) -> float: ...
+
+
+@overload
+def select(conditions: Sequence[bool | np.ndarray], choices: Sequence[float | np.ndarray], default: float | np.ndarray) -> float | np.ndarray: ...
+
+
+def select(conditions: Sequence[bool | np.ndarray], choices: Sequence[float | np.ndarray], default: float | np.ndarray) -> float | np.ndarray:
+    """Return the value of the first condition that holds, element-wise for arrays, for use in the logic of a formula.
+
+    Scalar conditions are an ordinary if-elif-else chain, arrays of conditions use ``np.select``.
+
+    Parameters
+    ----------
+    conditions : Sequence[bool | np.ndarray]
+        The conditions, in order of priority.
+    choices : Sequence[float | np.ndarray]
+        The value for every condition.
+    default : float | np.ndarray
+        The value where none of the conditions hold.
+
+    Returns
+    -------
+    float | np.ndarray
+        The selected value.
+    """
+    if _are_scalars((*conditions, *choices, default)):
+        return next((choice for condition, choice in zip(conditions, choices) if condition), default)
+    return np.select(conditions, choices, default=default)
+
+
+@overload
+def lookup(key: str, options: Mapping[str, float]) -> float: ...
+
+
+@overload
+def lookup(key: str | np.ndarray, options: Mapping[str, float]) -> float | np.ndarray: ...
+
+
+def lookup(key: str | np.ndarray, options: Mapping[str, float]) -> float | np.ndarray:
+    """Return the value of a (case-insensitive) option, element-wise for arrays, for use in the logic of a formula.
+
+    Parameters
+    ----------
+    key : str | np.ndarray
+        The option, a string or an array of strings.
+    options : Mapping[str, float]
+        The value per option, with lowercase options.
+
+    Returns
+    -------
+    float | np.ndarray
+        The value of the option, or NaN for a key that is not an option.
+    """
+    if isinstance(key, str):
+        return options.get(key.lower(), np.nan)
+    keys = np.char.lower(key)
+    return np.select([keys == option for option in options], list(options.values()), default=np.nan)
+
+
+def _are_scalars(values: tuple[float | np.ndarray, ...]) -> TypeGuard[tuple[float, ...]]:
+    """Check if none of the values is a NumPy array, so the builtins can be used instead of NumPy functions."""
+    # a plain loop, as this check runs for every scalar evaluation and is about twice as fast as all() with a generator
+    for value in values:  # noqa: SIM110
+        if isinstance(value, np.ndarray):
+            return False
+    return True
@@ -0,0 +1,274 @@
+"""Module for evaluating formulas and checks for large tables of input values, in parallel."""
+
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Literal, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from blueprints.codes.formula import Formula, _as_array
+from blueprints.codes.formula_results import _element
+from blueprints.validations import raise_if_arrays_differ_in_length, raise_if_less_or_equal_to_zero
+
+
+class RowError(NamedTuple):
+    """Error raised for a single row of input values.
+
+    The error is stored by type name and message, so it can always be sent back from a worker process.
+
+    Attributes
+    ----------
+    error_type : str
+        The name of the type of the error, for example "NegativeValueError".
+    message : str
+        The message of the error.
+    """
+
+    error_type: str
+    message: str
+
+
+class BatchResult(NamedTuple):
+    """Result of a batch run.
+
+    Attributes
+    ----------
+    results : np.ndarray
+        The result per row, in the order of the input values. NaN for rows that raised an error or were not processed.
+    errors : dict[int, RowError]
+        The errors, by row index.
+    processed : np.ndarray
+        Boolean mask of the rows that were processed. Only False for rows that were skipped because the run was cancelled.
+    """
+
+    results: np.ndarray
+    errors: dict[int, RowError]
+    processed: np.ndarray
+
+
+class BatchRunner:
+    """Evaluates a formula or check for every row of a table of input values, in chunks on a process or thread pool.
+
+    For a :class:`Formula`, every chunk is evaluated at once with :meth:`Formula.evaluate_many`. If that raises an error, the rows of the chunk
+    are evaluated one by one, so the error of every invalid row is captured while the valid rows still get a result. A check callable is
+    called per row with the input values of the row as keyword arguments, and must return a number (or bool).
+
+    Use ``executor="thread"`` when the vectorized path (NumPy) does most of the work, as it releases the GIL, and ``executor="process"`` for
+    checks that run in Python per row. The formula or check, the input values and the results must be picklable for a process pool.
+
+    Examples
+    --------
+    >>> runner = BatchRunner(Form8Dot3RequiredAnchorageLength, progress=lambda done, total: print(f"{done}/{total}"))
+    >>> batch = runner.run(pd.DataFrame({"diameter": diameters, "sigma_sd": 435, "f_bd": f_bd}))
+    >>> batch.results, batch.errors
+
+    Parameters
+    ----------
+    target : type[Formula] | Callable[..., float]
+        The formula class or check callable to evaluate per row.
+    executor : Literal["process", "thread", "serial"], default "process"
+        Where to evaluate the chunks: on a process pool, on a thread pool or in the calling thread.
+    max_workers : int | None, default None
+        Maximum number of workers of the pool. Defaults to the default of the pool.
+    chunk_size : int | None, default None
+        Number of rows per chunk. If None, the chunk size is tuned by timing a first (pilot) chunk in the calling thread, aiming at
+        ``target_chunk_duration`` seconds per chunk while keeping at least four chunks per worker.
+    progress : Callable[[int, int], None] | None, default None
+        Called with the number of processed rows and the total number of rows, every time a chunk is done.
+    target_chunk_duration : float, default 0.1
+        The aimed duration of a chunk in seconds, used when tuning the chunk size.
+    """
+
+    pilot_size = 512
+    """Number of rows of the pilot chunk, used to tune the chunk size."""
+
+    def __init__(
+        self,
+        target: type[Formula] | Callable[..., float],
+        *,
+        executor: Literal["process", "thread", "serial"] = "process",
+        max_workers: int | None = None,
+        chunk_size: int | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        target_chunk_duration: float = 0.1,
+    ) -> None:
+        if executor not in ("process", "thread", "serial"):
+            raise ValueError(f"Invalid executor: '{executor}'. Options: 'process', 'thread' or 'serial'.")
+        if max_workers is not None:
+            raise_if_less_or_equal_to_zero(max_workers=max_workers)
+        if chunk_size is not None:
+            raise_if_less_or_equal_to_zero(chunk_size=chunk_size)
+        raise_if_less_or_equal_to_zero(target_chunk_duration=target_chunk_duration)
+        self.target = target
+        self.executor = executor
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.target_chunk_duration = target_chunk_duration
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Cancel the current run, or the next run if no run is in progress.
+
+        Chunks that are not started yet are skipped, and :meth:`run` returns the results of the processed rows. Can be called from another
+        thread or from the progress callback.
+        """
+        self._cancelled.set()
+
+    def run(self, inputs: pd.DataFrame | Mapping[str, npt.ArrayLike]) -> BatchResult:
+        """Evaluate the formula or check for every row of input values.
+
+        Parameters
+        ----------
+        inputs : pd.DataFrame | Mapping[str, npt.ArrayLike]
+            The input values, by parameter name. Scalars are used for every row.
+
+        Returns
+        -------
+        BatchResult
+            The results and errors per row, in the order of the input values.
+
+        Raises
+        ------
+        ArraysNotSameLengthError
+            If the arrays of input values are not of the same length.
+        """
+        try:
+            return self._run(_as_columns(inputs))
+        finally:
+            # a cancellation applies to a single run
+            self._cancelled.clear()
+
+    def _run(self, columns: dict[str, np.ndarray]) -> BatchResult:
+        """Evaluate the rows of the input values in chunks, see :meth:`run`."""
+        number_of_rows = len(next(iter(columns.values()))) if columns else 0
+        batch = BatchResult(results=np.full(number_of_rows, np.nan), errors={}, processed=np.zeros(number_of_rows, dtype=bool))
+        if self._cancelled.is_set():
+            return batch
+
+        start = 0
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            start = min(self.pilot_size, number_of_rows)
+            started_at = time.perf_counter()
+            self._store(batch, 0, start, _evaluate_chunk(self.target, _slice(columns, 0, start), 0))
+            chunk_size = self._tune_chunk_size(time.perf_counter() - started_at, start, number_of_rows - start)
+
+        chunks = [(chunk_start, min(chunk_start + chunk_size, number_of_rows)) for chunk_start in range(start, number_of_rows, chunk_size)]
+        if self.executor == "serial":
+            for chunk_start, chunk_stop in chunks:
+                if self._cancelled.is_set():
+                    break
+                self._store(batch, chunk_start, chunk_stop, _evaluate_chunk(self.target, _slice(columns, chunk_start, chunk_stop), chunk_start))
+            return batch
+
+        with self._create_executor() as executor:
+            futures: dict[Future, tuple[int, int]] = {
+                executor.submit(_evaluate_chunk, self.target, _slice(columns, chunk_start, chunk_stop), chunk_start): (chunk_start, chunk_stop)
+                for chunk_start, chunk_stop in chunks
+            }
+            for future in as_completed(futures):
+                self._store(batch, *futures[future], future.result())
+                if self._cancelled.is_set():
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    break
+        return batch
+
+    def _create_executor(self) -> Executor:
+        """Create the process or thread pool."""
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _tune_chunk_size(self, pilot_duration: float, pilot_size: int, remaining_rows: int) -> int:
+        """Determine the chunk size from the duration of the pilot chunk.
+
+        Parameters
+        ----------
+        pilot_duration : float
+            Duration of the pilot chunk in seconds.
+        pilot_size : int
+            Number of rows of the pilot chunk.
+        remaining_rows : int
+            Number of rows after the pilot chunk.
+
+        Returns
+        -------
+        int
+            The chunk size, at least 1.
+        """
+        workers = 1 if self.executor == "serial" else self.max_workers or _default_workers()
+        max_chunk_size = max(math.ceil(remaining_rows / (4 * workers)), 1)
+        if pilot_size == 0 or pilot_duration <= 0:
+            return max_chunk_size
+        return max(min(int(self.target_chunk_duration * pilot_size / pilot_duration), max_chunk_size), 1)
+
+    def _store(self, batch: BatchResult, start: int, stop: int, chunk_result: tuple[np.ndarray, dict[int, RowError]]) -> None:
+        """Store the results and errors of a chunk and report the progress."""
+        results, errors = chunk_result
+        batch.results[start:stop] = results
+        batch.errors.update(errors)
+        batch.processed[start:stop] = True
+        if self.progress is not None:
+            self.progress(int(np.count_nonzero(batch.processed)), len(batch.processed))
+
+
+def _default_workers() -> int:
+    """Default number of workers of the pools."""
+    return os.cpu_count() or 1
+
+
+def _as_columns(inputs: pd.DataFrame | Mapping[str, npt.ArrayLike]) -> dict[str, np.ndarray]:
+    """Convert the input values to one-dimensional arrays of equal length, by parameter name, broadcasting the scalars."""
+    if isinstance(inputs, pd.DataFrame):
+        return {str(name): inputs[name].to_numpy() for name in inputs.columns}
+    arrays = {name: _as_array(value) for name, value in inputs.items()}
+    raise_if_arrays_differ_in_length(**{name: array for name, array in arrays.items() if array.ndim > 0})
+    length = max((len(array) for array in arrays.values() if array.ndim > 0), default=1)
+    return {name: np.broadcast_to(array, (length,)) if array.ndim == 0 else array for name, array in arrays.items()}
+
+
+def _slice(columns: dict[str, np.ndarray], start: int, stop: int) -> dict[str, np.ndarray]:
+    """Select the rows of a chunk."""
+    return {name: array[start:stop] for name, array in columns.items()}
+
+
+def _evaluate_chunk(
+    target: type[Formula] | Callable[..., float], columns: dict[str, np.ndarray], offset: int
+) -> tuple[np.ndarray, dict[int, RowError]]:
+    """Evaluate a chunk of rows, capturing the error per row.
+
+    Parameters
+    ----------
+    target : type[Formula] | Callable[..., float]
+        The formula class or check callable.
+    columns : dict[str, np.ndarray]
+        The input values of the chunk, by parameter name.
+    offset : int
+        The row index of the first row of the chunk.
+
+    Returns
+    -------
+    tuple[np.ndarray, dict[int, RowError]]
+        The results of the rows of the chunk, and the errors by row index.
+    """
+    number_of_rows = len(next(iter(columns.values()))) if columns else 0
+    if isinstance(target, type) and issubclass(target, Formula):
+        try:
+            return np.broadcast_to(target.evaluate_many(**columns), (number_of_rows,)).copy(), {}
+        except Exception:
+            pass  # evaluate the rows one by one, to find the rows that raise an error
+    results = np.full(number_of_rows, np.nan)
+    errors: dict[int, RowError] = {}
+    for row in range(number_of_rows):
+        try:
+            results[row] = target(**{name: _element(array, row) for name, array in columns.items()})
+        except Exception as error:  # noqa: PERF203
+            errors[offset + row] = RowError(error_type=type(error).__name__, message=str(error))
+    return results, errors
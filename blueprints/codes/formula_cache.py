@@ -0,0 +1,191 @@
+"""Module for the opt-in memoization of Formula results."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import TYPE_CHECKING, NamedTuple
+
+from blueprints.validations import raise_if_less_or_equal_to_zero
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from blueprints.codes.formula import Formula
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a FormulaCache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of formula instantiations that returned a cached result.
+    misses : int
+        Number of formula instantiations that evaluated the formula.
+    maxsize : int
+        Maximum number of cached results.
+    currsize : int
+        Current number of cached results.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_active_cache: ContextVar[FormulaCache | None] = ContextVar("active_formula_cache", default=None)
+# the tokens to re-activate the previously active caches, stored per context so that threads (and tasks) can enter caches independently
+_previous_caches: ContextVar[tuple[Token[FormulaCache | None], ...]] = ContextVar("previous_formula_caches", default=())
+
+
+class FormulaCache:
+    """Thread-safe, size-bounded cache for the results of formulas.
+
+    While a cache is active, instantiating a formula with the same input values as before returns the cached (read-only) instance, instead of
+    evaluating the formula again. When the cache is full, the least recently used result is evicted.
+
+    The cache is activated by using it as a context manager. Leaving the context clears the cache and re-activates the previously active cache,
+    if any. The active cache is a context variable, so activating a cache in one thread does not affect other threads. To use the cache in
+    worker threads, run the work in a copy of the context, for example ``executor.submit(contextvars.copy_context().run, function)``.
+
+    Examples
+    --------
+    >>> with FormulaCache(maxsize=10_000) as cache:
+    ...     for diameter in diameters:
+    ...         eta_2 = SubForm8Dot2CoefficientBarDiameter(diameter=diameter)
+    ...     print(cache.info())
+    CacheInfo(hits=..., misses=..., maxsize=10000, currsize=...)
+
+    Parameters
+    ----------
+    maxsize : int, default 4096
+        Maximum number of cached results.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        raise_if_less_or_equal_to_zero(maxsize=maxsize)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[Hashable, Formula] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def active() -> FormulaCache | None:
+        """Return the cache that is active in the current context, used by all formulas. None if caching is disabled."""
+        return _active_cache.get()
+
+    @staticmethod
+    def make_key(formula_class: type, args: tuple, kwargs: dict) -> Hashable:
+        """Create the cache key of a formula instantiation.
+
+        The types of the input values are part of the key, so for example `True` and `1` do not share a cached result.
+        The order of the keyword arguments does not matter.
+
+        Parameters
+        ----------
+        formula_class : type
+            The class of the formula.
+        args : tuple
+            The positional arguments of the formula.
+        kwargs : dict
+            The keyword arguments of the formula.
+
+        Returns
+        -------
+        Hashable
+            The cache key.
+        """
+        return (
+            formula_class,
+            tuple((type(value), value) for value in args),
+            tuple(sorted((name, type(value), value) for name, value in kwargs.items())),
+        )
+
+    def lookup(self, key: Hashable) -> Formula | None:
+        """Return the cached result for the given key and mark it as most recently used, or None if there is no cached result.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key, see :meth:`make_key`.
+
+        Returns
+        -------
+        Formula | None
+            The cached result, if any.
+
+        Raises
+        ------
+        TypeError
+            If the key is not hashable, for example because one of the input values is a list.
+        """
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def store(self, key: Hashable, result: Formula) -> None:
+        """Store the result for the given key, evicting the least recently used result if the cache is full.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key, see :meth:`make_key`.
+        result : Formula
+            The result to cache.
+        """
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the statistics."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            The number of hits and misses, the maximum size and the current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self._results))
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._results)
+
+    def __enter__(self) -> Self:
+        """Activate this cache for all formulas in the current context."""
+        from blueprints.codes.formula import enable_instrumentation  # imported here, as the formula module imports this module
+
+        _previous_caches.set((*_previous_caches.get(), _active_cache.set(self)))
+        enable_instrumentation()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Clear this cache and re-activate the previously active cache."""
+        from blueprints.codes.formula import disable_instrumentation  # imported here, as the formula module imports this module
+
+        *previous_caches, token = _previous_caches.get()
+        _previous_caches.set(tuple(previous_caches))
+        _active_cache.reset(token)
+        disable_instrumentation()
+        self.clear()
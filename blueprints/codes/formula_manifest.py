@@ -0,0 +1,1212 @@
+"""Manifest of all formulas in the codes, generated by `python -m blueprints.codes.formula_registry`. Do not edit."""
+
+FORMULA_MANIFEST = (
+    (
+        "NEN 9997-1-C2:2017",
+        "1.0.1",
+        "D_{eq}",
+        ("a", "b"),
+        "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_1_general_rules.formula_1_0_1",
+        "Form1Dot0Dot1EquivalentPilePointCenterline",
+    ),
+    (
+        "NEN 9997-1-C2:2017",
+        "2.1a",
+        "F_d",
+        ("gamma_f", "f_rep"),
+        "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_1_a",
+        "Form2Dot1aDesignValueLoad",
+    ),
+    (
+        "NEN 9997-1-C2:2017",
+        "2.1b",
+        "F_{rep}",
+        ("psi", "f_k"),
+        "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_1_b",
+        "Form2Dot1bRepresentativeValue",
+    ),
+    (
+        "NEN 9997-1-C2:2017",
+        "2.2",
+        "X_d",
+        ("x_k", "gamma_m"),
+        "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_2",
+        "Form2Dot2DesignValueGeotechnicalParameter",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.1",
+        None,
+        ("beta_cc_t", "f_cm"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_1",
+        "Form3Dot1EstimationConcreteCompressiveStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.10",
+        None,
+        ("t", "t_s", "h_0"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10",
+        "Form3Dot10CoefficientAgeConcreteDryingShrinkage",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.10",
+        None,
+        ("a_c", "u"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10",
+        "SubForm3Dot10FictionalCrossSection",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.11",
+        None,
+        ("beta_as_t", "epsilon_ca_inf"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_11",
+        "Form3Dot11AutogeneShrinkage",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.12",
+        None,
+        ("f_ck",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_12",
+        "Form3Dot12AutogeneShrinkageInfinity",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.13",
+        None,
+        ("t",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_13",
+        "Form3Dot13CoefficientTimeAutogeneShrinkage",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.14",
+        None,
+        ("k", "eta"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_14",
+        "Form3Dot14StressStrainForShortTermLoading",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.14",
+        None,
+        ("epsilon_c", "epsilon_c1"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_14",
+        "SubForm3Dot14Eta",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.14",
+        None,
+        ("e_cm", "epsilon_c1", "f_cm"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_14",
+        "SubForm3Dot14K",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.15",
+        None,
+        ("alpha_cc", "f_ck", "gamma_c"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_15",
+        "Form3Dot15DesignValueCompressiveStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.16",
+        None,
+        ("alpha_ct", "f_ctk_0_05", "gamma_c"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_16",
+        "Form3Dot16DesignValueTensileStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.17",
+        None,
+        ("f_cd", "epsilon_c", "epsilon_c2", "n"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_17",
+        "Form3Dot17CompressiveStressConcrete",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.18",
+        None,
+        ("f_cd",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_18",
+        "Form3Dot18CompressiveStressConcrete",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.19 - 3.20",
+        None,
+        ("f_ck",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_19_20",
+        "Form3Dot19And20EffectivePressureZoneHeight",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.2",
+        None,
+        ("s", "t"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_2",
+        "Form3Dot2CoefficientDependentOfConcreteAge",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.2",
+        None,
+        ("cement_class",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_2",
+        "SubForm3Dot2CoefficientTypeOfCementS",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.21 - 3.22",
+        None,
+        ("f_ck",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_21_22",
+        "Form3Dot21And22EffectiveStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.23",
+        None,
+        ("h", "f_ctm"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_23",
+        "Form3Dot23FlexuralTensileStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.24",
+        None,
+        ("f_ck", "sigma_2"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_24",
+        "Form3Dot24IncreasedCharacteristicCompressiveStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.25",
+        None,
+        ("f_ck", "sigma_2"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_25",
+        "Form3Dot25IncreasedCharacteristicCompressiveStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.26",
+        None,
+        ("f_ck", "f_ck_c", "epsilon_c2"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_26",
+        "Form3Dot26IncreasedStrainAtMaxStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.27",
+        None,
+        ("f_ck", "sigma_2", "epsilon_cu2"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_27",
+        "Form3Dot27IncreasedStrainLimitValue",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.28",
+        None,
+        ("rho_1000", "mu", "t"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_28",
+        "Form3Dot28RatioLossOfPreStressClass1",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.29",
+        None,
+        ("rho_1000", "mu", "t"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_29",
+        "Form3Dot29RatioLossOfPreStressClass2",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.3",
+        None,
+        ("f_ct_sp",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_3",
+        "Form3Dot3AxialTensileStrengthFromTensileSplittingStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.30",
+        None,
+        ("rho_1000", "mu", "t"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_30",
+        "Form3Dot30RatioLossOfPreStressClass3",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.4",
+        None,
+        ("beta_cc_t", "alpha", "f_ctm"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_4",
+        "Form3Dot4DevelopmentTensileStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.4",
+        None,
+        ("t",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_4",
+        "SubForm3Dot4CoefficientAgeConcreteAlpha",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.5",
+        None,
+        ("f_cm_t", "f_cm", "e_cm"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_5",
+        "Form3Dot5ApproximationVarianceElasticModulusOverTime",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.6",
+        None,
+        ("phi_inf_t0", "sigma_c", "e_c"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_6",
+        "Form3Dot6CreepDeformationOfConcrete",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.7",
+        None,
+        ("phi_inf_t0", "k_sigma"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_7",
+        "Form3Dot7NonLinearCreepCoefficient",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.8",
+        None,
+        ("epsilon_cd", "epsilon_ca"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_8",
+        "Form3Dot8TotalShrinkage",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.9",
+        None,
+        ("beta_ds_tt_s", "k_h", "epsilon_cd_0"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_9",
+        "Form3Dot9DryingShrinkage",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.28 - 3.29 - 3.30",
+        None,
+        ("sigma_pi", "f_pk"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.sub_formula_3_28_29_30",
+        "SubForm3Dot282930Mu",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.1",
+        "c_{nom}",
+        ("c_min", "delta_c_dev"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_1",
+        "Form4Dot1NominalConcreteCover",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.2",
+        "c_{min}",
+        ("c_min_b", "c_min_dur", "delta_c_dur_gamma", "delta_c_dur_st", "delta_c_dur_add"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_2",
+        "Form4Dot2MinimumConcreteCover",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.2",
+        "c_{min,b}",
+        ("diameter", "nominal_max_aggregate_size_greater_than_32_mm"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_2",
+        "Table4Dot2MinimumCoverWithRegardToBond",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.4N",
+        "c_{min,dur}",
+        ("exposure_classes", "structural_class"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n",
+        "Table4Dot4nMinimumCoverDurabilityReinforcementSteel",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.5N",
+        "c_{min,dur}",
+        ("exposure_classes", "structural_class"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_5n",
+        "Table4Dot5nMinimumCoverDurabilityPrestressingSteel",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.1",
+        None,
+        ("theta_0", "alpha_h", "alpha_m"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_1",
+        "Form5Dot1Imperfections",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.1",
+        None,
+        ("length",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_1",
+        "SubForm5Dot1ReductionFactorLengthOrHeight",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.1",
+        None,
+        ("members",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_1",
+        "SubForm5Dot1ReductionFactorNumberOfMembers",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.11N",
+        "k_{λ}",
+        ("lambda_factor",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_11n",
+        "Form5Dot11nShearSlendernessCorrectionFactor",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.12N",
+        "λ",
+        ("m_sd", "v_sd", "d"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_12n",
+        "Form5Dot12nRatioDistancePointZeroAndMaxMoment",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.14",
+        "λ",
+        ("l_0", "i"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_14",
+        "Form5Dot14SlendernessRatio",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.15",
+        "l_0",
+        ("k_1", "k_2", "height"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_15",
+        "Form5Dot15EffectiveLengthBraced",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.16",
+        "l_0",
+        ("k_1", "k_2", "height"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_16",
+        "Form5Dot16EffectiveLengthUnbraced",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.2",
+        None,
+        ("theta_i", "l_0"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_2",
+        "Form5Dot2Eccentricity",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.3a",
+        None,
+        ("theta_i", "n_axial_force"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_3a",
+        "Form5Dot3aTransverseForceUnbracedMembers",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.3b",
+        "H_{i}",
+        ("theta_i", "n_axial_force"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_3b",
+        "Form5Dot3bTransverseForceBracedMembers",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.4",
+        "H_{i}",
+        ("theta_i", "n_a", "n_b"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_4",
+        "Form5Dot4TransverseForceEffectBracingSystem",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.5",
+        "H_{i}",
+        ("theta_i", "n_a", "n_b"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_5",
+        "Form5Dot5TransverseForceEffectFloorDiaphragm",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.6",
+        "H_{i}",
+        ("theta_i", "n_a"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_6",
+        "Form5Dot6TransverseForceEffectRoofDiaphragm",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.7",
+        "b_{eff}",
+        ("*b_eff_i", "b_w", "b"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7",
+        "Form5Dot7EffectiveFlangeWidth",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.7a",
+        "b_{eff,i}",
+        ("b_i", "l_0"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7a",
+        "Form5Dot7aFlangeEffectiveFlangeWidth",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.7a, 5.7b",
+        "b_{eff,i}",
+        ("b_i", "l_0"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7ab",
+        "Form5Dot7abFlangeEffectiveFlangeWidth",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.7b",
+        "b_{eff,i}",
+        ("b_i", "l_0"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7b",
+        "Form5Dot7bFlangeEffectiveFlangeWidth",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.8",
+        "l_{eff}",
+        ("l_n", "a_1", "a_2"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_8",
+        "Form5Dot8EffectiveSpan",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.9",
+        "ΔM_{Ed}",
+        ("f_ed_sup", "t"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_9",
+        "Form5Dot9DesignSupportMomentReduction",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.1",
+        "V_{Rd}",
+        ("v_rd_s", "v_ccd", "v_td"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_1",
+        "Form6Dot1DesignShearStrength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.71 (LHS)",
+        "\\Delta \\sigma_{Ed}",
+        ("gamma_f_fat", "delta_sigma_s_equ_n_star"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_71",
+        "Form6Dot71CriteriaBasedOnStressRangeLHS",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.71 (RHS)",
+        "\\Delta \\sigma_{Rd}",
+        ("delta_sigma_rsk_n_star", "gamma_s_fat"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_71",
+        "Form6Dot71CriteriaBasedOnStressRangeRHS",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.71",
+        "CHECK",
+        ("gamma_f_fat", "delta_sigma_s_equ_n_star", "delta_sigma_rsk_n_star", "gamma_s_fat"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_71",
+        "Form6Dot71CriteriaBasedOnStressRange",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.76",
+        "f_{cd,fat}",
+        ("k_1", "beta_cc_t0", "f_cd", "f_ck"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_76",
+        "Form6Dot76DesignFatigueStrengthConcrete",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "7.3",
+        "k_c",
+        ("f_cr", "a_ct", "f_ct_eff"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_7_serviceability_limit_state.formula_7_3",
+        "Form7Dot3CoefficientKc",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.1",
+        "Ø_{m,min}",
+        ("f_bt", "a_b", "diameter", "f_cd"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_1",
+        "Form8Dot1RequiredMinimumMandrelDiameter",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.10",
+        "l_{0}",
+        ("alpha_1", "alpha_2", "alpha_3", "alpha_5", "alpha_6", "l_b_rqd", "l_0_min"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_10",
+        "Form8Dot10DesignLapLength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8",
+        "\\alpha_6",
+        ("rho_1",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_10",
+        "SubForm8Dot10Alpha6",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.11",
+        "l_{Ø,min}",
+        ("alpha_6", "l_b_rqd", "diameter"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_11",
+        "Form8Dot11MinimumDesignLapLength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.12",
+        "A_{sh}",
+        ("a_s", "n_1"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_12",
+        "Form8Dot12AdditionalShearReinforcement",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.13",
+        "A_{sv}",
+        ("a_s", "n_2"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_13",
+        "Form8Dot13AdditionalShearReinforcement",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.14",
+        "Ø_n",
+        ("diameter", "n_b"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_14",
+        "Form8Dot14EquivalentDiameterBundledBars",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.15",
+        "f_{bpt}",
+        ("eta_p1", "eta_1", "f_ctd_t"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_15",
+        "Form8Dot15PrestressTransferStress",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.15",
+        "\\eta_{p1}",
+        ("type_of_wire",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_15",
+        "SubForm8Dot15EtaP1",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.15",
+        "f_{ctd}(t)",
+        ("alpha_ct", "f_ctm_t", "gamma_c"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_15",
+        "SubForm8Dot15TensileStrengthAtRelease",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.16",
+        "l_{pt}",
+        ("alpha_1", "alpha_2", "diameter", "sigma_pm0", "f_bpt"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_16",
+        "Form8Dot16BasicTransmissionLength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.16",
+        "\\alpha_1",
+        ("release_type",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_16",
+        "SubForm8Dot16Alpha1",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.16",
+        "\\alpha_2",
+        ("type_of_wire",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_16",
+        "SubForm8Dot16Alpha2",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.17",
+        "l_{pt1}",
+        ("l_pt",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_17",
+        "Form8Dot17DesignValueTransmissionLength1",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.18",
+        "l_{pt2}",
+        ("l_pt",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_18",
+        "Form8Dot18DesignValueTransmissionLength2",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.2",
+        "f_{bd}",
+        ("eta_1", "eta_2", "f_ctd"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2",
+        "Form8Dot2UltimateBondStress",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.2",
+        None,
+        ("bond_quality",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2",
+        "SubForm8Dot2CoefficientQualityOfBond",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.2",
+        "\\eta_2",
+        ("diameter",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2",
+        "SubForm8Dot2CoefficientBarDiameter",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.3",
+        "l_{b,rqd}",
+        ("diameter", "sigma_sd", "f_bd"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3",
+        "Form8Dot3RequiredAnchorageLength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.4",
+        "l_{bd}",
+        ("alpha_1", "alpha_2", "alpha_3", "alpha_4", "alpha_5", "l_b_rqd", "l_b_min"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_4",
+        "Form8Dot4DesignAnchorageLength",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.6",
+        "l_{b,min}",
+        ("l_b_rqd", "diameter"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_6",
+        "Form8Dot6MinimumTensionAnchorage",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.7",
+        "l_{b,min}",
+        ("l_b_rqd", "diameter"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_7",
+        "Form8Dot7MinimumCompressionAnchorage",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+        "F_{btd}",
+        ("l_td", "diameter_t", "sigma_td", "f_wd"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "Form8Dot8nAnchorageCapacityWeldedTransverseBar",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+        "l_{td}",
+        ("diameter_t", "f_yd", "sigma_td", "l_t"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "SubForm8Dot8nDesignLengthOfTransverseBar",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+        "\\sigma_{td}",
+        ("f_ctd", "sigma_cm", "y_function", "f_cd"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "SubForm8Dot8nConcreteStress",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+        "y",
+        ("x_function",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "SubForm8Dot8nFunctionY",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+        "x",
+        ("cover", "diameter_t"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "SubForm8Dot8nFunctionX",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.9",
+        "F_{btd}",
+        ("f_wd", "diameter_t", "diameter_l", "a_s", "f_cd"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_9",
+        "Form8Dot9AnchorageCapacityWeldedTransverseBarSmallDiameter",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.10",
+        "s_{max}",
+        ("d",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_10",
+        "Form9Dot10MaximumSpacingBentUpBars",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.12N",
+        "A_{s,min}",
+        ("n_ed", "f_yd", "a_c"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_12n",
+        "Form9Dot12nMinimumLongitudinalReinforcementColumns",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.13",
+        "F_s",
+        ("r", "z_e", "z_i"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_13",
+        "Form9Dot13TensileForceToBeAnchored",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.14",
+        "F_s",
+        ("c", "h", "n_ed"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_14",
+        "Form9Dot14SplittingForceColumnOnRock",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.16",
+        "F_{tie}",
+        ("q_3", "l_1", "l_2", "q_4"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_16",
+        "Form9Dot16MinimumForceOnInternalBeamLine",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.1N",
+        "A_{s,min}",
+        ("f_ctm", "f_yk", "b_t", "d"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_1n",
+        "Form9Dot1nMinimumTensileReinforcementBeam",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.2",
+        "a_l",
+        ("z", "theta", "alpha"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_2",
+        "Form9Dot2ShiftInMomentDiagram",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.3",
+        "F_E",
+        ("v_ed", "a_l", "z", "n_ed"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_3",
+        "Form9Dot3ShiftInMomentDiagram",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.4",
+        "\\rho_w",
+        ("a_sw", "s", "b_w", "alpha"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_4",
+        "Form9Dot4ShearReinforcementRatio",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.5N",
+        "\\rho_{w,min}",
+        ("f_ck", "f_yk"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_5n",
+        "Form9Dot5nMinimumShearReinforcementRatio",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.6N",
+        "s_{l,max}",
+        ("d", "alpha"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_6n",
+        "Form9Dot6nMaximumDistanceShearReinforcement",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.7N",
+        "s_{b,max}",
+        ("d", "alpha"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_7n",
+        "Form9Dot7nMaximumDistanceBentUpBars",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.8N",
+        "s_{t,max}",
+        ("d",),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_8n",
+        "Form9Dot8nMaximumTransverseDistanceLegsSeriesShearLinks",
+    ),
+    (
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.9",
+        "s_{max}",
+        ("d", "alpha"),
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_9",
+        "Form9Dot9MaximumSpacingSeriesOfLinks",
+    ),
+    (
+        "NEN-EN 1993-1-1+C2+A1:2016",
+        "2.2",
+        "R_{k}",
+        ("r_d", "gamma_mi"),
+        "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_2_basic_of_design.formula_2_2",
+        "Form2Dot2CharacteristicValueResistance",
+    ),
+    (
+        "NEN-EN 1993-1-1+C2+A1:2016",
+        "6.2",
+        "UC",
+        ("n_ed", "n_rd", "m_y_ed", "m_y_rd", "m_z_ed", "m_z_rd"),
+        "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_2",
+        "Form6Dot2UtilizationRatio",
+    ),
+    (
+        "NEN-EN 1993-1-1+C2+A1:2016",
+        "6.5",
+        "N_{Ed}/N_{t,Rd}",
+        ("n_ed", "n_t_rd"),
+        "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_5",
+        "Form6Dot5UnityCheckTensileStrength",
+    ),
+    (
+        "NEN-EN 1993-1-9+C2:2012",
+        "A.1",
+        "D_d",
+        ("n_e", "n_r"),
+        "blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_1",
+        "FormADot1DamageDuringDesignLife",
+    ),
+    (
+        "NEN-EN 1993-1-9+C2:2012",
+        "A.2",
+        "CHECK",
+        ("d_d",),
+        "blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_2",
+        "FormADot2CriteriaBasedOnDamageAccumulation",
+    ),
+    (
+        "NEN-EN 1993-5:2008",
+        "5.10",
+        "\\rho",
+        ("v_ed", "v_pl_rd"),
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_10",
+        "Form5Dot10ReductionFactorShearArea",
+    ),
+    (
+        "NEN-EN 1993-5:2008",
+        "5.2",
+        "M_{c,Rd}",
+        ("beta_b", "w_pl", "f_y", "gamma_m_0"),
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_2",
+        "Form5Dot2DesignMomentResistanceClass1Or2",
+    ),
+    (
+        "NEN-EN 1993-5:2008",
+        "5.3",
+        "M_{c,Rd}",
+        ("beta_b", "w_el", "f_y", "gamma_m_0"),
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_3",
+        "Form5Dot3DesignMomentResistanceClass3",
+    ),
+    (
+        "NEN-EN 1993-5:2008",
+        "5.5",
+        "V_{pl,Rd}",
+        ("a_v", "f_y", "gamma_m_0"),
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_5",
+        "Form5Dot5PlasticShearResistance",
+    ),
+    (
+        "NEN-EN 1993-5:2008",
+        "5.6",
+        "A_v",
+        ("h", "t_f", "t_w"),
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_6",
+        "Form5Dot6ProjectedShearArea",
+    ),
+    (
+        "NEN-EN 1993-5:2008",
+        "5.7",
+        "V_{b,Rd}",
+        ("h", "t_f", "t_w", "f_bv", "gamma_m_0"),
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_7",
+        "Form5Dot7ShearBucklingResistance",
+    ),
+    (
+        "NEN-EN 1993-5:2008",
+        "5.8",
+        "\\overline{\\lambda}",
+        ("c", "t_w", "f_y", "e"),
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_8",
+        "Form5Dot8RelativeWebSlenderness",
+    ),
+    (
+        "NEN-EN 1993-5:2008",
+        "5.9",
+        "M_{V,Rd}",
+        ("beta_b", "w_pl", "rho", "a_v", "t_w", "alpha", "f_y", "gamma_m_0", "mc_rd"),
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_9",
+        "Form5Dot9ReducedBendingMomentResistance",
+    ),
+)
+
+# the public names of the modules in the chapters of the Eurocodes, exposed lazily by their chapter and document packages
+MODULE_EXPORTS = {
+    "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_1_general_rules.formula_1_0_1": ("Form1Dot0Dot1EquivalentPilePointCenterline",),
+    "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_1_a": ("Form2Dot1aDesignValueLoad",),
+    "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_1_b": ("Form2Dot1bRepresentativeValue",),
+    "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_2": ("Form2Dot2DesignValueGeotechnicalParameter",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_1": ("Form3Dot1EstimationConcreteCompressiveStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_2": (
+        "Form3Dot2CoefficientDependentOfConcreteAge",
+        "SubForm3Dot2CoefficientTypeOfCementS",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_3": (
+        "Form3Dot3AxialTensileStrengthFromTensileSplittingStrength",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_4": (
+        "Form3Dot4DevelopmentTensileStrength",
+        "SubForm3Dot4CoefficientAgeConcreteAlpha",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_5": ("Form3Dot5ApproximationVarianceElasticModulusOverTime",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_6": ("Form3Dot6CreepDeformationOfConcrete",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_7": ("Form3Dot7NonLinearCreepCoefficient",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_8": ("Form3Dot8TotalShrinkage",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_9": ("Form3Dot9DryingShrinkage",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10": (
+        "Form3Dot10CoefficientAgeConcreteDryingShrinkage",
+        "SubForm3Dot10FictionalCrossSection",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_11": ("Form3Dot11AutogeneShrinkage",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_12": ("Form3Dot12AutogeneShrinkageInfinity",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_13": ("Form3Dot13CoefficientTimeAutogeneShrinkage",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_14": (
+        "Form3Dot14StressStrainForShortTermLoading",
+        "SubForm3Dot14Eta",
+        "SubForm3Dot14K",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_15": ("Form3Dot15DesignValueCompressiveStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_16": ("Form3Dot16DesignValueTensileStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_17": ("Form3Dot17CompressiveStressConcrete",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_18": ("Form3Dot18CompressiveStressConcrete",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_19_20": ("Form3Dot19And20EffectivePressureZoneHeight",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_21_22": ("Form3Dot21And22EffectiveStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_23": ("Form3Dot23FlexuralTensileStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_24": ("Form3Dot24IncreasedCharacteristicCompressiveStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_25": ("Form3Dot25IncreasedCharacteristicCompressiveStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_26": ("Form3Dot26IncreasedStrainAtMaxStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_27": ("Form3Dot27IncreasedStrainLimitValue",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_28": ("Form3Dot28RatioLossOfPreStressClass1",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_29": ("Form3Dot29RatioLossOfPreStressClass2",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_30": ("Form3Dot30RatioLossOfPreStressClass3",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.sub_formula_3_28_29_30": ("SubForm3Dot282930Mu",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_1": ("Form4Dot1NominalConcreteCover",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_2": ("Form4Dot2MinimumConcreteCover",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1": (
+        "Carbonation",
+        "Chemical",
+        "Chloride",
+        "ChlorideSeawater",
+        "FreezeThaw",
+        "Table4Dot1ExposureClasses",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_2": ("Table4Dot2MinimumCoverWithRegardToBond",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_3": (
+        "ConcreteStructuralClassCalculator",
+        "Table4Dot3ConcreteStructuralClass",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n": (
+        "Table4Dot4nMinimumCoverDurabilityReinforcementSteel",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_5n": (
+        "Table4Dot5nMinimumCoverDurabilityPrestressingSteel",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_1": (
+        "Form5Dot1Imperfections",
+        "SubForm5Dot1ReductionFactorLengthOrHeight",
+        "SubForm5Dot1ReductionFactorNumberOfMembers",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_2": ("Form5Dot2Eccentricity",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_3a": ("Form5Dot3aTransverseForceUnbracedMembers",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_3b": ("Form5Dot3bTransverseForceBracedMembers",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_4": ("Form5Dot4TransverseForceEffectBracingSystem",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_5": ("Form5Dot5TransverseForceEffectFloorDiaphragm",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_6": ("Form5Dot6TransverseForceEffectRoofDiaphragm",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7": ("Form5Dot7EffectiveFlangeWidth",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7a": ("Form5Dot7aFlangeEffectiveFlangeWidth",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7ab": ("Form5Dot7abFlangeEffectiveFlangeWidth",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7b": ("Form5Dot7bFlangeEffectiveFlangeWidth",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_8": ("Form5Dot8EffectiveSpan",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_9": ("Form5Dot9DesignSupportMomentReduction",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_11n": ("Form5Dot11nShearSlendernessCorrectionFactor",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_12n": (
+        "Form5Dot12nRatioDistancePointZeroAndMaxMoment",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_14": ("Form5Dot14SlendernessRatio",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_15": ("Form5Dot15EffectiveLengthBraced",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_16": ("Form5Dot16EffectiveLengthUnbraced",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_1": ("Form6Dot1DesignShearStrength",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_71": (
+        "Form6Dot71CriteriaBasedOnStressRange",
+        "Form6Dot71CriteriaBasedOnStressRangeLHS",
+        "Form6Dot71CriteriaBasedOnStressRangeRHS",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_76": ("Form6Dot76DesignFatigueStrengthConcrete",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_7_serviceability_limit_state.formula_7_3": ("Form7Dot3CoefficientKc",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_1": (
+        "Form8Dot1RequiredMinimumMandrelDiameter",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2": (
+        "Form8Dot2UltimateBondStress",
+        "SubForm8Dot2CoefficientBarDiameter",
+        "SubForm8Dot2CoefficientQualityOfBond",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3": (
+        "Form8Dot3RequiredAnchorageLength",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_4": (
+        "Form8Dot4DesignAnchorageLength",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_6": (
+        "Form8Dot6MinimumTensionAnchorage",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_7": (
+        "Form8Dot7MinimumCompressionAnchorage",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n": (
+        "Form8Dot8nAnchorageCapacityWeldedTransverseBar",
+        "SubForm8Dot8nConcreteStress",
+        "SubForm8Dot8nDesignLengthOfTransverseBar",
+        "SubForm8Dot8nFunctionX",
+        "SubForm8Dot8nFunctionY",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_9": (
+        "Form8Dot9AnchorageCapacityWeldedTransverseBarSmallDiameter",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_10": (
+        "Form8Dot10DesignLapLength",
+        "SubForm8Dot10Alpha6",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_11": (
+        "Form8Dot11MinimumDesignLapLength",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_12": (
+        "Form8Dot12AdditionalShearReinforcement",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_13": (
+        "Form8Dot13AdditionalShearReinforcement",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_14": (
+        "Form8Dot14EquivalentDiameterBundledBars",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_15": (
+        "Form8Dot15PrestressTransferStress",
+        "SubForm8Dot15EtaP1",
+        "SubForm8Dot15TensileStrengthAtRelease",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_16": (
+        "Form8Dot16BasicTransmissionLength",
+        "SubForm8Dot16Alpha1",
+        "SubForm8Dot16Alpha2",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_17": (
+        "Form8Dot17DesignValueTransmissionLength1",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_18": (
+        "Form8Dot18DesignValueTransmissionLength2",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_1n": (
+        "Form9Dot1nMinimumTensileReinforcementBeam",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_2": ("Form9Dot2ShiftInMomentDiagram",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_3": ("Form9Dot3ShiftInMomentDiagram",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_4": ("Form9Dot4ShearReinforcementRatio",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_5n": (
+        "Form9Dot5nMinimumShearReinforcementRatio",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_6n": (
+        "Form9Dot6nMaximumDistanceShearReinforcement",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_7n": (
+        "Form9Dot7nMaximumDistanceBentUpBars",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_8n": (
+        "Form9Dot8nMaximumTransverseDistanceLegsSeriesShearLinks",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_9": (
+        "Form9Dot9MaximumSpacingSeriesOfLinks",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_10": ("Form9Dot10MaximumSpacingBentUpBars",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_12n": (
+        "Form9Dot12nMinimumLongitudinalReinforcementColumns",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_13": ("Form9Dot13TensileForceToBeAnchored",),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_14": (
+        "Form9Dot14SplittingForceColumnOnRock",
+    ),
+    "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_16": (
+        "Form9Dot16MinimumForceOnInternalBeamLine",
+    ),
+    "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_2_basic_of_design.formula_2_2": ("Form2Dot2CharacteristicValueResistance",),
+    "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_2": ("Form6Dot2UtilizationRatio",),
+    "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_5": ("Form6Dot5UnityCheckTensileStrength",),
+    "blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_1": (
+        "FormADot1DamageDuringDesignLife",
+    ),
+    "blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_2": (
+        "FormADot2CriteriaBasedOnDamageAccumulation",
+    ),
+    "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_2": ("Form5Dot2DesignMomentResistanceClass1Or2",),
+    "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_3": ("Form5Dot3DesignMomentResistanceClass3",),
+    "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_5": ("Form5Dot5PlasticShearResistance",),
+    "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_6": ("Form5Dot6ProjectedShearArea",),
+    "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_7": ("Form5Dot7ShearBucklingResistance",),
+    "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_8": ("Form5Dot8RelativeWebSlenderness",),
+    "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_9": ("Form5Dot9ReducedBendingMomentResistance",),
+    "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_10": ("Form5Dot10ReductionFactorShearArea",),
+}
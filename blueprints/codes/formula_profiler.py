@@ -0,0 +1,281 @@
+"""Module for the opt-in profiling of formulas and checks."""
+
+from __future__ import annotations
+
+import functools
+import json
+import random
+import threading
+import time
+from array import array
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from blueprints.validations import disable_validation_timing, enable_validation_timing, validation_timer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+    import pandas as pd
+    from typing_extensions import Self
+
+
+class ProfileRecord(NamedTuple):
+    """Profile of a formula (or check) class. All times are in seconds.
+
+    Attributes
+    ----------
+    source_document : str
+        The source document of the formula.
+    label : str
+        The label of the formula.
+    formula : str
+        The name of the class of the formula, to distinguish sub-formulas with the same label.
+    calls : int
+        Number of instantiations (or evaluations of a check).
+    total_time : float
+        Cumulative time of all calls, including the validations (and cache lookups, if a FormulaCache is active).
+    mean_time : float
+        Mean time per call.
+    p50_time : float
+        Median time per call, of a uniform random sample of at most 10 000 calls.
+    p90_time : float
+        90th percentile of the time per call, of the same sample.
+    p99_time : float
+        99th percentile of the time per call, of the same sample.
+    validation_time : float
+        Cumulative time spent in the validations (the ``raise_if_...`` functions) of all calls.
+    """
+
+    source_document: str
+    label: str
+    formula: str
+    calls: int
+    total_time: float
+    mean_time: float
+    p50_time: float
+    p90_time: float
+    p99_time: float
+    validation_time: float
+
+
+# the number of durations per formula class that are kept for the percentiles, as a uniform random sample of all calls
+_SAMPLE_SIZE = 10_000
+
+
+class _Stats:
+    """Accumulated measurements of a formula class, with a bounded sample of the durations for the percentiles."""
+
+    __slots__ = ("calls", "durations", "total_time", "validation_time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.validation_time = 0.0
+        self.durations = array("d")
+
+    def add(self, duration: float, validation_time: float) -> None:
+        """Add the measurement of a call, keeping the sample of durations uniform with reservoir sampling (J. Vitter, Algorithm R, 1985)."""
+        self.calls += 1
+        self.total_time += duration
+        self.validation_time += validation_time
+        if len(self.durations) < _SAMPLE_SIZE:
+            self.durations.append(duration)
+        else:
+            index = random.randrange(self.calls)
+            if index < _SAMPLE_SIZE:
+                self.durations[index] = duration
+
+
+_active_profiler: ContextVar[FormulaProfiler | None] = ContextVar("active_formula_profiler", default=None)
+# the tokens to re-activate the previously active profilers (and their validation timers), stored per context
+_previous_profilers: ContextVar[tuple[tuple[Token[FormulaProfiler | None], Token[Callable[[float], None] | None]], ...]] = ContextVar(
+    "previous_formula_profilers", default=()
+)
+
+
+class FormulaProfiler:
+    """Profiler that records the number of calls, the evaluation time and the validation time of every formula and check.
+
+    The profiler is activated by using it as a context manager. While no profiler is active, formulas are not instrumented at all. Leaving
+    the context re-activates the previously active profiler, if any, and keeps the recorded profiles. The active profiler is a context
+    variable, so activating a profiler in one thread does not affect other threads.
+
+    Examples
+    --------
+    >>> with FormulaProfiler() as profiler:
+    ...     run_all_checks()
+    >>> profiler.to_dataframe().sort_values("total_time", ascending=False).head()
+
+    Notes
+    -----
+    While a profiler is active, it is set as the :data:`~blueprints.validations.validation_timer` of the current context. While any
+    profiler is entered, the ``raise_if_...`` functions and ``any_true`` of :mod:`blueprints.validations` are replaced by timed versions
+    that pass their duration to it (see :func:`~blueprints.validations.enable_validation_timing`), so the time spent in validations can be
+    attributed to the formula that calls them. Formulas and validations are not instrumented at all while no profiler (or cache) is entered.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[type, _Stats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @staticmethod
+    def active() -> FormulaProfiler | None:
+        """Return the profiler that is active in the current context, used by all formulas. None if profiling is disabled."""
+        return _active_profiler.get()
+
+    def start(self) -> list:
+        """Start measuring a call of a formula, and return the measurement to pass to :meth:`stop`.
+
+        Returns
+        -------
+        list
+            The measurement: the start time and the validation time so far.
+        """
+        measurement = [time.perf_counter(), 0.0]
+        self._stack().append(measurement)
+        return measurement
+
+    def stop(self, formula_class: type, measurement: list) -> None:
+        """Stop measuring a call of a formula and record it.
+
+        Parameters
+        ----------
+        formula_class : type
+            The class of the formula (or check).
+        measurement : list
+            The measurement returned by :meth:`start`.
+        """
+        duration = time.perf_counter() - measurement[0]
+        self._stack().pop()
+        with self._lock:
+            stats = self._stats.get(formula_class)
+            if stats is None:
+                stats = self._stats[formula_class] = _Stats()
+            stats.add(duration, measurement[1])
+
+    def record_validation(self, duration: float) -> None:
+        """Add the duration of a validation to the innermost formula call that is measured in the current thread.
+
+        Parameters
+        ----------
+        duration : float
+            The duration of the validation in seconds.
+        """
+        stack = self._stack()
+        if stack:
+            stack[-1][1] += duration
+
+    def records(self) -> list[ProfileRecord]:
+        """Return the profiles of all formulas that were called.
+
+        Returns
+        -------
+        list[ProfileRecord]
+            The profile per formula class, sorted by total time (descending).
+        """
+        with self._lock:
+            stats_by_class = [(formula_class, stats, np.array(stats.durations)) for formula_class, stats in self._stats.items()]
+        records = [
+            ProfileRecord(
+                source_document=str(getattr(formula_class, "source_document", "")),
+                label=str(getattr(formula_class, "label", "")),
+                formula=formula_class.__name__,
+                calls=stats.calls,
+                total_time=stats.total_time,
+                mean_time=stats.total_time / stats.calls,
+                p50_time=float(np.percentile(durations, 50)),
+                p90_time=float(np.percentile(durations, 90)),
+                p99_time=float(np.percentile(durations, 99)),
+                validation_time=stats.validation_time,
+            )
+            for formula_class, stats, durations in stats_by_class
+        ]
+        return sorted(records, key=lambda record: record.total_time, reverse=True)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the profiles of all formulas as a DataFrame, with one row per formula class.
+
+        Returns
+        -------
+        pd.DataFrame
+            The profiles, with the fields of :class:`ProfileRecord` as columns, sorted by total time (descending).
+        """
+        import pandas as pd  # imported here, as every formula imports this module and importing pandas is slow
+
+        return pd.DataFrame(self.records(), columns=list(ProfileRecord._fields))
+
+    def to_json(self) -> str:
+        """Return the profiles of all formulas as JSON.
+
+        Returns
+        -------
+        str
+            A JSON array with an object per formula class, with the fields of :class:`ProfileRecord`, sorted by total time (descending).
+        """
+        return json.dumps([record._asdict() for record in self.records()])
+
+    def clear(self) -> None:
+        """Remove all recorded profiles."""
+        with self._lock:
+            self._stats.clear()
+
+    def _stack(self) -> list[list]:
+        """The measurements of the formula calls in progress in the current thread, innermost last."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def __enter__(self) -> Self:
+        """Activate this profiler for all formulas in the current context."""
+        from blueprints.codes.formula import enable_instrumentation  # imported here, as the formula module imports this module
+
+        enable_instrumentation()
+        enable_validation_timing()
+        tokens = (_active_profiler.set(self), validation_timer.set(self.record_validation))
+        _previous_profilers.set((*_previous_profilers.get(), tokens))
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Re-activate the previously active profiler."""
+        from blueprints.codes.formula import disable_instrumentation  # imported here, as the formula module imports this module
+
+        *previous_profilers, (profiler_token, timer_token) = _previous_profilers.get()
+        _previous_profilers.set(tuple(previous_profilers))
+        validation_timer.reset(timer_token)
+        _active_profiler.reset(profiler_token)
+        disable_validation_timing()
+        disable_instrumentation()
+
+
+def profiled(method: Callable) -> Callable:
+    """Decorate the method that evaluates a check class (that is not a Formula), to profile it while a FormulaProfiler is active.
+
+    Parameters
+    ----------
+    method : Callable
+        The method that evaluates the check, for example ``__bool__``.
+
+    Returns
+    -------
+    Callable
+        The decorated method.
+    """
+
+    @functools.wraps(method)
+    def profiled_method(self: object, *args, **kwargs) -> object:
+        profiler = FormulaProfiler.active()
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        measurement = profiler.start()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            profiler.stop(type(self), measurement)
+
+    return profiled_method
@@ -0,0 +1,459 @@
+"""Module for finding formulas by source document, label, return symbol and parameter names, without importing them."""
+
+import ast
+import importlib
+import re
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple, TypeVar
+
+from blueprints.codes.formula_manifest import FORMULA_MANIFEST
+from blueprints.utils.lazy_import import package_exports
+
+CODES_DIRECTORY = Path(__file__).parent
+"""Directory of the codes package, which is scanned for formulas."""
+
+MANIFEST_PATH = CODES_DIRECTORY / "formula_manifest.py"
+"""Path of the generated manifest of all formulas."""
+
+GENERATED_IMPORTS_COMMENT = "# the imports for type checkers are generated by `python -m blueprints.codes.formula_registry`, do not edit"
+"""Comment above the generated ``if TYPE_CHECKING:`` imports of the packages of the Eurocodes."""
+
+T = TypeVar("T")
+
+
+class FormulaEntry(NamedTuple):
+    """Entry of a formula (or check) in the registry.
+
+    Attributes
+    ----------
+    document : str
+        The source document of the formula, for example "NEN-EN 1992-1-1+C2:2011".
+    label : str
+        The label of the formula, for example "8.3".
+    return_symbol : str | None
+        The LaTeX symbol of the result of the formula, for example "l_{b,rqd}". None if it could not be determined.
+    parameters : tuple[str, ...]
+        The names of the parameters of the formula, variable positional parameters are prefixed with "*".
+    module : str
+        The name of the module that defines the formula.
+    name : str
+        The name of the class of the formula.
+    """
+
+    document: str
+    label: str
+    return_symbol: str | None
+    parameters: tuple[str, ...]
+    module: str
+    name: str
+
+    def load(self) -> type:
+        """Import the class of the formula.
+
+        Returns
+        -------
+        type
+            The class of the formula.
+        """
+        return getattr(importlib.import_module(self.module), self.name)
+
+
+class FormulaRegistry:
+    """Index of all formulas (and checks) in the codes, by source document, label, return symbol and parameter names.
+
+    The registry is built from a precomputed manifest, so finding a formula only imports the module of that formula.
+
+    Examples
+    --------
+    >>> registry = FormulaRegistry()
+    >>> registry.get(document="NEN-EN 1992-1-1+C2:2011", label="8.3")
+    <class '...formula_8_3.Form8Dot3RequiredAnchorageLength'>
+    >>> [entry.name for entry in registry.find(label="6.71")]
+    ['Form6Dot71CriteriaBasedOnStressRange']
+    >>> [entry.name for entry in registry.find(label="6.71 (LHS)")]
+    ['Form6Dot71CriteriaBasedOnStressRangeLHS']
+
+    Parameters
+    ----------
+    entries : Iterable[FormulaEntry] | None, default None
+        The entries of the registry. Defaults to all formulas in the manifest.
+    """
+
+    def __init__(self, entries: Iterable[FormulaEntry] | None = None) -> None:
+        if entries is None:
+            entries = (FormulaEntry(*entry) for entry in FORMULA_MANIFEST)
+        self._entries = tuple(entries)
+        self._by_document: defaultdict[str, list[FormulaEntry]] = defaultdict(list)
+        self._by_label: defaultdict[str, list[FormulaEntry]] = defaultdict(list)
+        self._by_return_symbol: defaultdict[str, list[FormulaEntry]] = defaultdict(list)
+        self._by_parameter: defaultdict[str, list[FormulaEntry]] = defaultdict(list)
+        for entry in self._entries:
+            self._by_document[entry.document].append(entry)
+            self._by_label[entry.label].append(entry)
+            if entry.return_symbol is not None:
+                self._by_return_symbol[entry.return_symbol].append(entry)
+            for parameter in entry.parameters:
+                self._by_parameter[parameter].append(entry)
+
+    def find(
+        self,
+        *,
+        document: str | None = None,
+        label: str | None = None,
+        return_symbol: str | None = None,
+        parameters: Iterable[str] = (),
+    ) -> list[FormulaEntry]:
+        """Find the entries of the formulas that match all given criteria.
+
+        Parameters
+        ----------
+        document : str | None, default None
+            The source document of the formula.
+        label : str | None, default None
+            The label of the formula.
+        return_symbol : str | None, default None
+            The LaTeX symbol of the result of the formula.
+        parameters : Iterable[str], default ()
+            Names of parameters the formula must have.
+
+        Returns
+        -------
+        list[FormulaEntry]
+            The matching entries, in the order of the manifest.
+        """
+        candidates: list[list[FormulaEntry]] = []
+        if document is not None:
+            candidates.append(self._by_document.get(document, []))
+        if label is not None:
+            candidates.append(self._by_label.get(label, []))
+        if return_symbol is not None:
+            candidates.append(self._by_return_symbol.get(return_symbol, []))
+        candidates.extend(self._by_parameter.get(parameter, []) for parameter in parameters)
+        if not candidates:
+            return list(self._entries)
+        # intersect, starting with the smallest list of candidates
+        smallest, *others = sorted(candidates, key=len)
+        other_sets = [set(other) for other in others]
+        return [entry for entry in smallest if all(entry in other for other in other_sets)]
+
+    def get(self, *, document: str, label: str) -> type:
+        """Import and return the formula with the given label from the given source document.
+
+        Sub-formulas (classes named ``SubForm...``) share the label of their main formula; if the label matches more than one formula, the
+        main formula is returned.
+
+        Parameters
+        ----------
+        document : str
+            The source document of the formula, for example "NEN-EN 1992-1-1+C2:2011".
+        label : str
+            The label of the formula, for example "8.3".
+
+        Returns
+        -------
+        type
+            The class of the formula.
+
+        Raises
+        ------
+        LookupError
+            If there is no formula, or more than one formula, with the given label in the given document.
+        """
+        entries = self.find(document=document, label=label)
+        if len(entries) > 1:
+            entries = [entry for entry in entries if not entry.name.startswith("SubForm")]
+        if len(entries) != 1:
+            names = ", ".join(entry.name for entry in entries)
+            raise LookupError(f"Expected one formula with label '{label}' in '{document}', found {len(entries)}{': ' + names if names else ''}.")
+        return entries[0].load()
+
+    @property
+    def documents(self) -> list[str]:
+        """The source documents in the registry."""
+        return list(self._by_document)
+
+    def __iter__(self) -> Iterator[FormulaEntry]:
+        """Iterate over the entries of the registry."""
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """Number of entries in the registry."""
+        return len(self._entries)
+
+
+def build_manifest(codes_directory: Path = CODES_DIRECTORY) -> list[FormulaEntry]:
+    """Build the manifest of all formulas by parsing the source code of the codes package, without importing it.
+
+    Every class that defines (or inherits) both a ``label`` and a ``source_document`` is a formula. The source document can be a string or the
+    name of a string constant defined in a package. The return symbol is taken from the ``LatexFormula`` returned by ``latex()``, and the
+    parameters from ``__init__``, both also when inherited.
+
+    Parameters
+    ----------
+    codes_directory : Path, default CODES_DIRECTORY
+        The directory of the codes package.
+
+    Returns
+    -------
+    list[FormulaEntry]
+        The entries of all formulas, sorted by module and order of definition.
+    """
+    package_root = codes_directory.parent.parent
+    modules = {
+        ".".join(path.relative_to(package_root).with_suffix("").parts).removesuffix(".__init__"): ast.parse(path.read_text(encoding="utf-8"))
+        for path in sorted(codes_directory.rglob("*.py"))
+    }
+    # classes and constants are keyed by module and name, so equal names in different modules are distinct
+    imports = {module: _imported_names(tree) for module, tree in modules.items()}
+    constants = {
+        (module, node.targets[0].id): node.value.value
+        for module, tree in modules.items()
+        for node in tree.body
+        if isinstance(node, ast.Assign)
+        and isinstance(node.targets[0], ast.Name)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    }
+    classes = {(module, node.name): node for module, tree in modules.items() for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    entries = []
+    for module, name in classes:
+        label = _resolve(classes, imports, (module, name), _class_constant, "label")
+        source_document = _resolve(classes, imports, (module, name), _class_constant, "source_document")
+        if label is not None and isinstance(label[1], str) and source_document is not None:
+            document_module, document = source_document
+            if isinstance(document, ast.Name):
+                document = constants.get(_definition(imports, document_module, document.id))
+            return_symbol = _resolve(classes, imports, (module, name), _return_symbol, "latex")
+            parameters = _resolve(classes, imports, (module, name), _parameters, "__init__")
+            entries.append(
+                FormulaEntry(
+                    document=str(document),
+                    label=label[1],
+                    return_symbol=return_symbol[1] if return_symbol is not None else None,
+                    parameters=parameters[1] if parameters is not None else (),
+                    module=module,
+                    name=name,
+                )
+            )
+    return entries
+
+
+def build_exports(codes_directory: Path = CODES_DIRECTORY) -> dict[str, tuple[str, ...]]:
+    """Build the public names of the modules in the chapters of the Eurocodes, which their chapter and document packages expose lazily.
+
+    Parameters
+    ----------
+    codes_directory : Path, default CODES_DIRECTORY
+        The directory of the codes package.
+
+    Returns
+    -------
+    dict[str, tuple[str, ...]]
+        The names of the public classes and functions defined in every module, by the name of the module, in natural order.
+    """
+    package_root = codes_directory.parent.parent
+    exports = {}
+    for path in codes_directory.glob("eurocode/*/*/*.py"):
+        if path.name != "__init__.py":
+            module = ".".join(path.relative_to(package_root).with_suffix("").parts)
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+            names = [node.name for node in tree.body if isinstance(node, ast.ClassDef | ast.FunctionDef) and not node.name.startswith("_")]
+            if names:
+                exports[module] = tuple(sorted(names, key=_import_order))
+    return dict(sorted(exports.items(), key=lambda item: _natural_key(item[0])))
+
+
+def build_type_checking_imports(codes_directory: Path = CODES_DIRECTORY) -> dict[Path, str]:
+    """Build the ``if TYPE_CHECKING:`` imports of the chapter and document packages of the Eurocodes.
+
+    The packages expose the names of their modules lazily, the imports let type checkers see the classes and functions behind them.
+
+    Parameters
+    ----------
+    codes_directory : Path, default CODES_DIRECTORY
+        The directory of the codes package.
+
+    Returns
+    -------
+    dict[Path, str]
+        The imports (with the comment above them) of every package that exposes names, by the path of its ``__init__.py``.
+    """
+    package_root = codes_directory.parent.parent
+    exports = build_exports(codes_directory)
+    imports = {}
+    for init_path in sorted(codes_directory.glob("eurocode/*/__init__.py")) + sorted(codes_directory.glob("eurocode/*/*/__init__.py")):
+        package = ".".join(init_path.parent.relative_to(package_root).parts)
+        package_modules = package_exports(package, exports)
+        if package_modules:
+            lines = [GENERATED_IMPORTS_COMMENT, "if TYPE_CHECKING:"]
+            for submodule, names in package_modules.items():
+                line = f"    from .{submodule} import {', '.join(names)}"
+                if len(line) > LINE_LENGTH:
+                    lines += [f"    from .{submodule} import (", *(f"        {name}," for name in names), "    )"]
+                else:
+                    lines.append(line)
+            imports[init_path] = "\n".join(lines) + "\n"
+    return imports
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> None:
+    """Write the manifest of all formulas and the public names of the modules of the Eurocodes to the manifest module.
+
+    The ``if TYPE_CHECKING:`` imports of the chapter and document packages are updated as well. Run ``python -m
+    blueprints.codes.formula_registry`` after adding or changing formulas.
+
+    Parameters
+    ----------
+    path : Path, default MANIFEST_PATH
+        The path of the manifest module.
+    """
+    lines = [
+        '"""Manifest of all formulas in the codes, generated by `python -m blueprints.codes.formula_registry`. Do not edit."""',
+        "",
+        "FORMULA_MANIFEST = (",
+    ]
+    for entry in build_manifest():
+        parameters = ", ".join(_string_literal(parameter) for parameter in entry.parameters)
+        lines += [
+            "    (",
+            f"        {_string_literal(entry.document)},",
+            f"        {_string_literal(entry.label)},",
+            f"        {_string_literal(entry.return_symbol)},",
+            f"        ({parameters}{',' if len(entry.parameters) == 1 else ''}),",
+            f"        {_string_literal(entry.module)},",
+            f"        {_string_literal(entry.name)},",
+            "    ),",
+        ]
+    lines += [")", "", "# the public names of the modules in the chapters of the Eurocodes, exposed lazily by their chapter and document packages"]
+    lines += ["MODULE_EXPORTS = {"]
+    for module, names in build_exports().items():
+        line = f"    {_string_literal(module)}: ({', '.join(_string_literal(name) for name in names)}{',' if len(names) == 1 else ''}),"
+        if len(line) > LINE_LENGTH:
+            lines += [f"    {_string_literal(module)}: (", *(f"        {_string_literal(name)}," for name in names), "    ),"]
+        else:
+            lines.append(line)
+    lines += ["}", ""]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    for init_path, imports in build_type_checking_imports().items():
+        source = init_path.read_text(encoding="utf-8")
+        init_path.write_text(_GENERATED_IMPORTS.sub(lambda _: imports, source, count=1), encoding="utf-8")
+
+
+LINE_LENGTH = 150
+"""Maximum line length of the generated code."""
+
+# the generated imports, from the comment above them up to the first line that is not indented
+_GENERATED_IMPORTS = re.compile(rf"^{re.escape(GENERATED_IMPORTS_COMMENT)}\nif TYPE_CHECKING:\n(?:    .*\n)*", re.MULTILINE)
+
+
+def _natural_key(text: str) -> list[int | str]:
+    """Sort key for the natural order of text with numbers, so "formula_3_2" comes before "formula_3_10"."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", text)]
+
+
+def _import_order(name: str) -> tuple[int, list[int | str]]:
+    """Sort key for the names of an import, in the order of isort: constants, classes and then functions."""
+    kind = 0 if name.isupper() else 1 if name[0].isupper() else 2
+    return kind, _natural_key(name)
+
+
+def _string_literal(value: str | None) -> str:
+    """Python literal of a string (or None), with double quotes."""
+    if value is None:
+        return "None"
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _imported_names(tree: ast.Module) -> dict[str, tuple[str, str]]:
+    """The module and name of every name imported with an absolute ``from ... import ...`` in a module (also in ``if`` blocks), by local name."""
+    statements = [statement for node in tree.body for statement in (node.body if isinstance(node, ast.If) else [node])]
+    return {
+        alias.asname or alias.name: (statement.module, alias.name)
+        for statement in statements
+        if isinstance(statement, ast.ImportFrom) and statement.module is not None and statement.level == 0
+        for alias in statement.names
+    }
+
+
+def _definition(imports: dict[str, dict[str, tuple[str, str]]], module: str, name: str) -> tuple[str, str]:
+    """The module and name of the definition of a name used in a module, following the imports (and re-exports by packages)."""
+    seen = set()
+    while name in imports.get(module, {}) and (module, name) not in seen:
+        seen.add((module, name))
+        module, name = imports[module][name]
+    return module, name
+
+
+def _resolve(
+    classes: dict[tuple[str, str], ast.ClassDef],
+    imports: dict[str, dict[str, tuple[str, str]]],
+    key: tuple[str, str],
+    extract: Callable[[ast.ClassDef, str], T | None],
+    member: str,
+) -> tuple[str, T] | None:
+    """Extract a member of a class, or of its first base class that defines it, with the module of the class that defines it."""
+    node = classes.get(key)
+    if node is None:
+        return None
+    module, _ = key
+    value = extract(node, member)
+    if value is not None:
+        return module, value
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            base_key = _definition(imports, module, base.id)
+            if base_key != key:
+                resolved = _resolve(classes, imports, base_key, extract, member)
+                if resolved is not None:
+                    return resolved
+    return None
+
+
+def _class_constant(node: ast.ClassDef, member: str) -> str | ast.Name | None:
+    """The string (or name of the constant) assigned to a class attribute."""
+    for statement in node.body:
+        if isinstance(statement, ast.Assign) and any(isinstance(target, ast.Name) and target.id == member for target in statement.targets):
+            if isinstance(statement.value, ast.Constant) and isinstance(statement.value.value, str):
+                return statement.value.value
+            if isinstance(statement.value, ast.Name):
+                return statement.value
+    return None
+
+
+def _method(node: ast.ClassDef, member: str) -> ast.FunctionDef | None:
+    """The method with the given name defined in a class."""
+    return next((statement for statement in node.body if isinstance(statement, ast.FunctionDef) and statement.name == member), None)
+
+
+def _return_symbol(node: ast.ClassDef, member: str) -> str | None:
+    """The string passed as ``return_symbol`` to the ``LatexFormula`` in a method."""
+    method = _method(node, member)
+    if method is None:
+        return None
+    for call in ast.walk(method):
+        if isinstance(call, ast.Call):
+            for keyword in call.keywords:
+                if keyword.arg == "return_symbol" and isinstance(keyword.value, ast.Constant) and isinstance(keyword.value.value, str):
+                    return keyword.value.value
+    return None
+
+
+def _parameters(node: ast.ClassDef, member: str) -> tuple[str, ...] | None:
+    """The names of the parameters of a method, without ``self``."""
+    method = _method(node, member)
+    if method is None:
+        return None
+    arguments = method.args
+    names = [argument.arg for argument in (*arguments.posonlyargs, *arguments.args)][1:]
+    if arguments.vararg is not None:
+        names.append(f"*{arguments.vararg.arg}")
+    names.extend(argument.arg for argument in arguments.kwonlyargs)
+    return tuple(names)
+
+
+if __name__ == "__main__":
+    write_manifest()
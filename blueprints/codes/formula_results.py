@@ -0,0 +1,134 @@
+"""Module for array-backed records of many Formula results."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+
+from blueprints.codes.formula import Formula, _as_array
+from blueprints.codes.latex_formula import LatexFormula
+
+
+class FormulaResults:
+    """Read-only, array-backed records of the results of a formula for many sets of input values.
+
+    Instead of one :class:`Formula` instance per result (a float with an instance dictionary, roughly 400 bytes), the results and input values
+    are stored as NumPy arrays (8 bytes per result and per varying input value, scalar inputs are not repeated). A :class:`Formula` instance is
+    only created on request for a single record, for example to render its LaTeX representation.
+
+    Examples
+    --------
+    >>> results = FormulaResults(Form8Dot3RequiredAnchorageLength, diameter=diameters, sigma_sd=435, f_bd=2.7)
+    >>> results.results.max()
+    >>> results.latex(17).complete
+
+    Parameters
+    ----------
+    formula : type[Formula]
+        The formula class to evaluate.
+    *args
+        Positional arguments of the formula, as scalars, sequences, NumPy arrays or pandas Series.
+    **kwargs
+        Keyword arguments of the formula, as scalars, sequences, NumPy arrays or pandas Series.
+    """
+
+    __slots__ = ("_args", "_kwargs", "_results", "formula")
+
+    def __init__(self, formula: type[Formula], *args, **kwargs) -> None:
+        self.formula = formula
+        # a read-only view of the results, so an array that is shared with the caller is never frozen
+        self._results = formula.evaluate_many(*args, **kwargs).view()
+        self._results.flags.writeable = False
+        # scalar inputs become zero-copy (read-only) broadcast views, so they are not repeated in memory
+        self._args = tuple(self._as_input_array(value) for value in args)
+        self._kwargs = {name: self._as_input_array(value) for name, value in kwargs.items()}
+
+    def _as_input_array(self, value: object) -> np.ndarray:
+        """Convert an input value to a read-only array with the (leading) shape of the results."""
+        array = _as_array(value)
+        if array.ndim < self._results.ndim:
+            return np.broadcast_to(array, self._results.shape)
+        # a read-only view, so the array of the caller stays writeable
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def label(self) -> str:
+        """The label of the formula."""
+        return self.formula.label  # type: ignore[return-value]
+
+    @property
+    def source_document(self) -> str:
+        """The source document of the formula."""
+        return self.formula.source_document  # type: ignore[return-value]
+
+    @property
+    def results(self) -> np.ndarray:
+        """Read-only array with the results of the formula."""
+        return self._results
+
+    @property
+    def inputs(self) -> dict[str, np.ndarray]:
+        """Read-only arrays with the keyword input values of the formula, by parameter name."""
+        return dict(self._kwargs)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the results and (non-repeated) input values."""
+        arrays = (self._results, *self._args, *self._kwargs.values())
+        # broadcast dimensions (stride 0) do not take up memory
+        return sum(array.itemsize * int(np.prod([size for size, stride in zip(array.shape, array.strides) if stride != 0])) for array in arrays)
+
+    def __len__(self) -> int:
+        """Number of results."""
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the results as floats."""
+        return iter(self._results.tolist())
+
+    def __getitem__(self, index: int) -> Formula:
+        """Create the :class:`Formula` instance of a single record, with its input values.
+
+        Parameters
+        ----------
+        index : int
+            The index of the record.
+
+        Returns
+        -------
+        Formula
+            The formula instance of the record.
+        """
+        args = [_element(array, index) for array in self._args]
+        kwargs = {name: _element(array, index) for name, array in self._kwargs.items()}
+        return self.formula(*args, **kwargs)
+
+    def latex(self, index: int) -> LatexFormula:
+        """Returns the LatexFormula object of a single record.
+
+        Parameters
+        ----------
+        index : int
+            The index of the record.
+
+        Returns
+        -------
+        LatexFormula
+            The LaTeX representation of the record.
+        """
+        return self[index].latex()  # type: ignore[attr-defined]
+
+    def __repr__(self) -> str:
+        """Representation of the records."""
+        return f"{type(self).__name__}({self.formula.__name__}, {len(self)} results)"
+
+
+def _element(array: np.ndarray, index: int) -> object:
+    """Return an element of an input array as a plain Python value (or list of values)."""
+    element = array[index]
+    if isinstance(element, np.ndarray | np.generic):
+        return element.tolist()
+    return element
@@ -0,0 +1,94 @@
+"""Module for the compact serialization of many Formula results."""
+
+import pickle
+from collections.abc import Sequence
+
+import numpy as np
+
+from blueprints.codes.formula import Formula, _restore_formula
+
+
+def dumps_results(results: Sequence[Formula]) -> bytes:
+    """Serialize a sequence of formula results to bytes, in a compact, columnar format.
+
+    Results are grouped by formula class (and attribute names). Per group, the formula class and attribute names are stored once and the
+    results and input values are stored as columns, using NumPy arrays for columns of only floats or only integers, and storing a column with a
+    single (repeated) float or integer only once. The formulas are not evaluated again when the results are loaded with :func:`loads_results`.
+
+    Examples
+    --------
+    >>> data = dumps_results(anchorage_lengths)
+    >>> loads_results(data) == anchorage_lengths
+    True
+
+    Parameters
+    ----------
+    results : Sequence[Formula]
+        The formula results to serialize, of one or more formula classes.
+
+    Returns
+    -------
+    bytes
+        The serialized results.
+    """
+    groups: dict[tuple[type[Formula], tuple[str, ...]], list[int]] = {}
+    for index, result in enumerate(results):
+        groups.setdefault((type(result), tuple(result.__dict__)), []).append(index)
+
+    columnar_groups = []
+    for (formula_class, names), indices in groups.items():
+        group = [results[index] for index in indices]
+        columns = [_as_column([result.__dict__[name] for result in group]) for name in names]
+        positions = np.asarray(indices, dtype=np.min_scalar_type(len(results)))
+        columnar_groups.append((formula_class, names, positions, np.asarray(group, dtype=float), columns))
+    return pickle.dumps((len(results), columnar_groups), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads_results(data: bytes) -> list[Formula]:
+    """Deserialize formula results that were serialized with :func:`dumps_results`.
+
+    Only load data from trusted sources, because the data is unpickled.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized results.
+
+    Returns
+    -------
+    list[Formula]
+        The (read-only) formula results, in the original order.
+    """
+    number_of_results, columnar_groups = pickle.loads(data)
+    results: list = [None] * number_of_results
+    for formula_class, names, indices, values, columns in columnar_groups:
+        rows = zip(*(_from_column(column, len(indices)) for column in columns)) if columns else ((),) * len(indices)
+        for index, value, row in zip(indices.tolist(), values.tolist(), rows):
+            results[index] = _restore_formula(formula_class, value, dict(zip(names, row)))
+    return results
+
+
+def _as_column(values: list) -> np.ndarray | list:
+    """Store a column of only floats or integers as a NumPy array (zero-dimensional if all values are equal), and any other column as a list."""
+    if all(type(value) is float for value in values):
+        array = np.asarray(values, dtype=float)
+    elif all(type(value) is int for value in values):
+        try:
+            array = np.asarray(values, dtype=np.int64)
+        except OverflowError:
+            return values
+    else:
+        return values
+    # bitwise comparison, so for example -0.0 and 0.0 are not considered equal
+    if (array.view(np.int64) == array.view(np.int64)[0]).all():
+        return array[0:1].reshape(())
+    return array
+
+
+def _from_column(column: np.ndarray | list, length: int) -> list:
+    """Convert a column to a list of plain Python values."""
+    if isinstance(column, np.ndarray):
+        if column.ndim == 0:
+            return [column.item()] * length
+        return column.tolist()
+    return column
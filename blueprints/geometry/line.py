@@ -4,10 +4,12 @@ from enum import Enum
 from typing import Literal
 
 import numpy as np
+import shapely
 from shapely import Point
 from typing_extensions import Self
 
 from blueprints.geometry.operations import CoordinateSystemOptions, calculate_rotation_angle
+from blueprints.geometry.point import Point3D
 from blueprints.type_alias import DEG
 from blueprints.unit_conversion import RAD_TO_DEG
 
@@ -63,26 +65,31 @@ class Line:
 
     @property
     def _start(self) -> np.ndarray:
-        """Return the start point as a numpy array."""
-        return np.array(self._start_point.coords)
+        """Return the start point as a numpy array with shape (3,)."""
+        return self._start_coordinates.coordinates
 
     @property
     def _end(self) -> np.ndarray:
-        """Return the end point as a numpy array."""
-        return np.array(self._end_point.coords)
+        """Return the end point as a numpy array with shape (3,)."""
+        return self._end_coordinates.coordinates
 
     def _validate_points(self) -> None:
-        """Validate if the points are different."""
+        """Validate if the points are different, and store their coordinates for the calculations of the line."""
+        # if points have no z value, then declare zero as default
+        start_coordinates, end_coordinates = Point3D.from_shapely(self._start_point), Point3D.from_shapely(self._end_point)
+
         # Check if start and end point are the same
-        if list(self.start_point.coords) == list(self.end_point.coords):
+        if start_coordinates == end_coordinates:
             msg = f"Start and end point can't be equal. {self.start_point=} | {self.end_point=}"
             raise ValueError(msg)
 
-        # if points have no z value, then declare zero as default
-        if not self.start_point.has_z:
-            self.start_point = Point(self.start_point.x, self.start_point.y, 0.0)
-        if not self.end_point.has_z:
-            self.end_point = Point(self.end_point.x, self.end_point.y, 0.0)
+        if not self._start_point.has_z:
+            self._start_point = start_coordinates.to_shapely()
+        if not self._end_point.has_z:
+            self._end_point = end_coordinates.to_shapely()
+        self._start_coordinates, self._end_coordinates = start_coordinates, end_coordinates
+        self._delta = end_coordinates.coordinates - start_coordinates.coordinates
+        self._length = float(np.linalg.norm(self._delta))
 
     @property
     def midpoint(self) -> Point:
@@ -92,22 +99,22 @@ class Line:
     @property
     def delta_x(self) -> float:
         """Difference in X-coordinate between starting and end point (X end - X start)."""
-        return self.end_point.x - self.start_point.x
+        return float(self._delta[0])
 
     @property
     def delta_y(self) -> float:
         """Difference in Y-coordinate between starting and end point (Y end - Y start)."""
-        return self.end_point.y - self.start_point.y
+        return float(self._delta[1])
 
     @property
     def delta_z(self) -> float:
         """Difference in Z-coordinate between starting and end point (Z end - Z start)."""
-        return self.end_point.z - self.start_point.z
+        return float(self._delta[2])
 
     @property
     def length(self) -> float:
         """Return the total length of the line."""
-        return float(np.linalg.norm(self._end - self._start))
+        return self._length
 
     def angle(self, coordinate_system: CoordinateSystemOptions = CoordinateSystemOptions.XY) -> DEG:
         """
@@ -138,8 +145,8 @@ class Line:
 
     @property
     def unit_vector(self) -> np.ndarray:
-        """Return the unit vector of the line."""
-        return (self._end - self._start) / self.length
+        """Return the unit vector of the line, an array with shape (1, 3) like the coordinates of a shapely point."""
+        return (self._delta / self._length).reshape(1, 3)
 
     def get_internal_point(self, distance: float, reference: Literal["start", "end"] = "start") -> Point:
         """Return an internal point within the line in a given distance from the reference point.
@@ -171,9 +178,9 @@ class Line:
 
         match reference.lower():
             case "start":
-                internal_point = self._start + distance * self.unit_vector
+                internal_point = self._start + (distance / self._length) * self._delta
             case "end":
-                internal_point = self._end - distance * self.unit_vector
+                internal_point = self._end - (distance / self._length) * self._delta
             case _:
                 msg = f"'{reference}' is an invalid input for 'reference_point', use 'start' or 'end'."
                 raise ValueError(msg)
@@ -199,11 +206,9 @@ class Line:
 
         match direction.lower():
             case "end":
-                new_point = self._end + distance * self.unit_vector
-                self.end_point = Point(new_point)
+                self.end_point = Point(self._end + (distance / self._length) * self._delta)
             case "start":
-                new_point = self._start - distance * self.unit_vector
-                self.start_point = Point(new_point)
+                self.start_point = Point(self._start - (distance / self._length) * self._delta)
             case _:
                 msg = "Invalid input for 'direction', use 'start' or 'end'."
                 raise ValueError(msg)
@@ -224,10 +229,10 @@ class Line:
             msg = "n must be equal or greater than 2"
             raise ValueError(msg)
 
-        # Create a list of evenly spaced points
-        evenly_spaced_points = np.linspace(start=0, stop=self.length, num=n, endpoint=True)
-
-        return [Point(self._start + distance * self.unit_vector) for distance in evenly_spaced_points]
+        # Create the evenly spaced points as one array, converted to shapely points at once
+        fractions = np.linspace(start=0, stop=1, num=n, endpoint=True)
+        evenly_spaced_points = self._start + fractions[:, None] * self._delta
+        return list(np.asarray(shapely.points(evenly_spaced_points)))
 
     def divide_into_n_lines(self, n: int = 2) -> list["Line"]:
         """Return a list of evenly divided lines.
@@ -0,0 +1,301 @@
+"""Line collection module, for the geometry of many lines at once."""
+
+from collections.abc import Iterable
+from typing import Literal, overload
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+from typing_extensions import Self
+
+from blueprints.geometry.line import Line
+from blueprints.geometry.operations import CoordinateSystemOptions, calculate_rotation_angles
+from blueprints.unit_conversion import RAD_TO_DEG
+
+
+class LineCollection:
+    """Represents many lines in a 3D modelling space, stored as arrays of start and end points.
+
+    The operations of :class:`Line` are evaluated for all lines at once. A line collection is immutable: the operations that change the
+    lines return a new line collection.
+
+    Parameters
+    ----------
+    start_points : npt.ArrayLike
+        Starting points, an array with shape (N, 3), or (N, 2) for points without z value (which is then declared zero).
+    end_points : npt.ArrayLike
+        End points, an array with the shape of the starting points.
+
+    Raises
+    ------
+    ValueError
+        If the points do not have shape (N, 2) or (N, 3), the start and end points do not have the same shape, or the start and end point
+        of a line are equal.
+    """
+
+    def __init__(self, start_points: npt.ArrayLike, end_points: npt.ArrayLike) -> None:
+        """Initialize the line collection."""
+        self._start = self._as_points(start_points)
+        self._end = self._as_points(end_points)
+        if self._start.shape != self._end.shape:
+            msg = f"Start and end points must have the same shape. {self._start.shape=} | {self._end.shape=}"
+            raise ValueError(msg)
+
+        self._delta = self._end - self._start
+        self._lengths = np.linalg.norm(self._delta, axis=1)
+        (equal,) = np.nonzero(self._lengths == 0)
+        if equal.size:
+            msg = f"Start and end point can't be equal. Lines with equal points: {equal.tolist()}"
+            raise ValueError(msg)
+        for array in (self._start, self._end, self._delta, self._lengths):
+            array.flags.writeable = False
+
+    @staticmethod
+    def _as_points(points: npt.ArrayLike) -> np.ndarray:
+        """Convert the points to a float array with shape (N, 3), with a zero z value for points without z value."""
+        points = np.array(points, dtype=np.float64, ndmin=2)
+        if points.ndim != 2 or points.shape[1] not in (2, 3):
+            msg = f"Points must have shape (N, 2) or (N, 3), but got shape {points.shape}"
+            raise ValueError(msg)
+        if points.shape[1] == 2:
+            points = np.column_stack((points, np.zeros(len(points))))
+        return points
+
+    @classmethod
+    def from_lines(cls: type[Self], lines: Iterable[Line]) -> Self:
+        """Create a line collection from lines.
+
+        Parameters
+        ----------
+        lines : Iterable[Line]
+            The lines.
+
+        Returns
+        -------
+        Self
+            The line collection, with the lines in the same order.
+        """
+        lines = list(lines)
+        start_points = shapely.get_coordinates([line.start_point for line in lines], include_z=True)
+        end_points = shapely.get_coordinates([line.end_point for line in lines], include_z=True)
+        return cls(start_points.reshape(-1, 3), end_points.reshape(-1, 3))
+
+    def to_lines(self) -> list[Line]:
+        """Return the lines of the collection as :class:`Line` objects.
+
+        Returns
+        -------
+        list[Line]
+            The lines, in the order of the collection.
+        """
+        start_points, end_points = np.asarray(shapely.points(self._start)), np.asarray(shapely.points(self._end))
+        return [Line(start_point, end_point) for start_point, end_point in zip(start_points, end_points)]
+
+    def __len__(self) -> int:
+        """Return the number of lines."""
+        return len(self._start)
+
+    @overload
+    def __getitem__(self, index: int) -> Line: ...
+
+    @overload
+    def __getitem__(self, index: slice | npt.ArrayLike) -> Self: ...
+
+    def __getitem__(self, index: int | slice | npt.ArrayLike) -> Line | Self:
+        """Return a line for an integer index, or a line collection for a slice, an array of indices or a boolean mask."""
+        if isinstance(index, int | np.integer):
+            return Line(shapely.points(self._start[index]), shapely.points(self._end[index]))
+        rows: slice | np.ndarray = index if isinstance(index, slice) else np.asarray(index)
+        return type(self)(self._start[rows], self._end[rows])
+
+    @property
+    def start_points(self) -> np.ndarray:
+        """Return the starting points, a read-only array with shape (N, 3)."""
+        return self._start
+
+    @property
+    def end_points(self) -> np.ndarray:
+        """Return the end points, a read-only array with shape (N, 3)."""
+        return self._end
+
+    @property
+    def delta(self) -> np.ndarray:
+        """Differences in coordinates between the starting and end points (end - start), a read-only array with shape (N, 3)."""
+        return self._delta
+
+    @property
+    def delta_x(self) -> np.ndarray:
+        """Differences in X-coordinate between the starting and end points (X end - X start)."""
+        return self._delta[:, 0]
+
+    @property
+    def delta_y(self) -> np.ndarray:
+        """Differences in Y-coordinate between the starting and end points (Y end - Y start)."""
+        return self._delta[:, 1]
+
+    @property
+    def delta_z(self) -> np.ndarray:
+        """Differences in Z-coordinate between the starting and end points (Z end - Z start)."""
+        return self._delta[:, 2]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Return the total lengths of the lines, a read-only array with shape (N,)."""
+        return self._lengths
+
+    @property
+    def unit_vectors(self) -> np.ndarray:
+        """Return the unit vectors of the lines, an array with shape (N, 3)."""
+        return self._delta / self._lengths[:, None]
+
+    @property
+    def midpoints(self) -> np.ndarray:
+        """Return the midpoints of the lines, an array with shape (N, 3)."""
+        midpoints = np.add(self._start, self._end)
+        midpoints /= 2
+        return midpoints
+
+    def angles(self, coordinate_system: CoordinateSystemOptions = CoordinateSystemOptions.XY) -> np.ndarray:
+        """
+        Calculates rotation of the end points in relation to the start points in a given plane/coordinate system [deg].
+
+        - The rotation is calculated in the given plane in relation to the start point.
+        - The rotation is calculated in the range [0, 360).
+        - The rotation is calculated in the counter-clockwise direction.
+        - A line that is perpendicular to the plane has a rotation of zero.
+
+        Parameters
+        ----------
+        coordinate_system: CoordinateSystemOptions
+            Desired plane that will be used as reference to calculate the rotation. Standard is XY-plane.
+
+        Returns
+        -------
+        np.ndarray
+            rotations of the end points relative to the start points in degrees in the given plane [deg], an array with shape (N,).
+        """
+        angles, _ = calculate_rotation_angles(self._start, self._end, coordinate_system)
+        angles *= RAD_TO_DEG
+        return angles
+
+    def get_internal_points(self, distances: npt.ArrayLike, reference: Literal["start", "end"] = "start") -> np.ndarray:
+        """Return an internal point within every line in a given distance from the reference point.
+
+        Parameters
+        ----------
+        distances : npt.ArrayLike
+            Distances from the given reference point following the axis of the lines, a single distance or a distance per line.
+        reference: Literal["start", "end"]
+            Reference point in the lines where given distances are declared. Default -> "start"
+
+        Returns
+        -------
+        np.ndarray
+            Internal points within the lines, an array with shape (N, 3).
+
+        Raises
+        ------
+        ValueError
+            If a distance is greater than the total length of its line.
+            If a distance is a negative number.
+        """
+        distances = np.broadcast_to(np.asarray(distances, dtype=np.float64), self._lengths.shape)
+        if np.any(distances > self._lengths):
+            msg = f"Distances must be equal or less than total length of the lines. Lines: {np.nonzero(distances > self._lengths)[0].tolist()}"
+            raise ValueError(msg)
+        if np.any(distances < 0):
+            msg = "Given Distances must be positive numbers."
+            raise ValueError(msg)
+
+        match reference.lower():
+            case "start":
+                return self._start + (distances / self._lengths)[:, None] * self._delta
+            case "end":
+                return self._end - (distances / self._lengths)[:, None] * self._delta
+            case _:
+                msg = f"'{reference}' is an invalid input for 'reference_point', use 'start' or 'end'."
+                raise ValueError(msg)
+
+    def adjust_length(self, distances: npt.ArrayLike, direction: Literal["start", "end"] = "end") -> Self:
+        """Extends or shortens the lines in a given direction. The end of the lines is the default direction.
+
+        Parameters
+        ----------
+        distances : npt.ArrayLike
+            Distances to extend or shorten the lines, a single distance or a distance per line. Positive numbers extend the lines, negative
+            numbers shorten the lines.
+        direction: Literal["start", "end"]
+            Given direction where the lines need to be extended. Default towards the end of the lines.
+
+        Returns
+        -------
+        Self
+            A new line collection with the adjusted lengths.
+        """
+        distances = np.broadcast_to(np.asarray(distances, dtype=np.float64), self._lengths.shape)
+        if np.any((distances < 0) & (np.abs(distances) >= self._lengths)):
+            raise ValueError("When shortening the lines, the absolute value of the extra length must be less than the total length of the lines.")
+
+        shift = (distances / self._lengths)[:, None] * self._delta
+        match direction.lower():
+            case "end":
+                return type(self)(self._start, self._end + shift)
+            case "start":
+                return type(self)(self._start - shift, self._end)
+            case _:
+                msg = "Invalid input for 'direction', use 'start' or 'end'."
+                raise ValueError(msg)
+
+    def get_evenly_spaced_points(self, n: int = 2) -> np.ndarray:
+        """Return evenly spaced internal points of every line from start to end point with an n number of desired points.
+
+        Parameters
+        ----------
+        n : int
+            Total number of internal points desired per line. A minimum of 2 points are required.
+
+        Returns
+        -------
+        np.ndarray
+            The points, an array with shape (N, n, 3).
+        """
+        if not isinstance(n, int):
+            msg = "n must be an integer"
+            raise TypeError(msg)
+        if n < 2:
+            msg = "n must be equal or greater than 2"
+            raise ValueError(msg)
+
+        fractions = np.linspace(start=0, stop=1, num=n, endpoint=True)
+        points = fractions[None, :, None] * self._delta[:, None, :]
+        points += self._start[:, None, :]
+        # the last point is the end point itself, without rounding errors
+        points[:, -1] = self._end
+        return points
+
+    def divide_into_n_lines(self, n: int = 2) -> Self:
+        """Return a line collection of evenly divided lines.
+
+        Parameters
+        ----------
+        n : int
+            Total number of lines desired per line. A minimum of 2 lines are required.
+
+        Returns
+        -------
+        Self
+            The line collection with N * n lines, with the n parts of the first line first.
+        """
+        if not isinstance(n, int):
+            msg = "n must be an integer"
+            raise TypeError(msg)
+        if n < 2:
+            msg = "n must be equal or greater than 2"
+            raise ValueError(msg)
+
+        points = self.get_evenly_spaced_points(n + 1)
+        return type(self)(points[:, :-1].reshape(-1, 3), points[:, 1:].reshape(-1, 3))
+
+    def __repr__(self) -> str:
+        """Return the representation of the line collection."""
+        return f"LineCollection({len(self)} lines)"
@@ -3,6 +3,8 @@
 import math
 from enum import Enum, auto
 
+import numpy as np
+import numpy.typing as npt
 from shapely import Point
 
 from blueprints.type_alias import RAD
@@ -16,6 +18,21 @@ class CoordinateSystemOptions(Enum):
     YZ = auto()
 
 
+_COORDINATE_ATTRIBUTES = {
+    CoordinateSystemOptions.XY: ("x", "y"),
+    CoordinateSystemOptions.XZ: ("x", "z"),
+    CoordinateSystemOptions.YZ: ("y", "z"),
+}
+"""Names of the horizontal and vertical coordinate of every plane."""
+
+_COORDINATE_AXES = {
+    CoordinateSystemOptions.XY: (0, 1),
+    CoordinateSystemOptions.XZ: (0, 2),
+    CoordinateSystemOptions.YZ: (1, 2),
+}
+"""Indices of the horizontal and vertical coordinate of every plane in an array of points."""
+
+
 def calculate_rotation_angle(
     start_point: Point,
     end_point: Point,
@@ -57,13 +74,7 @@ def calculate_rotation_angle(
         msg = f"Coordinate system '{coordinate_system}' requires z value in both points."
         raise ValueError(msg)
 
-    # Map coordinate system to the corresponding attributes
-    coordinates_map = {
-        CoordinateSystemOptions.XY: ("x", "y"),
-        CoordinateSystemOptions.XZ: ("x", "z"),
-        CoordinateSystemOptions.YZ: ("y", "z"),
-    }
-    horizontal_attr, vertical_attr = coordinates_map[coordinate_system]
+    horizontal_attr, vertical_attr = _COORDINATE_ATTRIBUTES[coordinate_system]
 
     # Extract the coordinates for the specified plane
     horizontal_1, vertical_1 = getattr(start_point, horizontal_attr), getattr(start_point, vertical_attr)
@@ -81,3 +92,61 @@ def calculate_rotation_angle(
         angle += 2 * math.pi
 
     return angle
+
+
+def calculate_rotation_angles(
+    start_points: npt.ArrayLike,
+    end_points: npt.ArrayLike,
+    coordinate_system: CoordinateSystemOptions = CoordinateSystemOptions.XY,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates rotations of end points in relation to start points in a given plane/coordinate system for arrays of point pairs [rad].
+
+    This is the array version of :func:`calculate_rotation_angle`, which calculates all rotations at once.
+
+    - The rotation is calculated in the given plane in relation to the start point.
+    - The rotation is calculated in the range [0, 2*pi).
+    - The rotation is calculated in the counter-clockwise direction.
+    - A pair of points without a direction in the given plane (equal points, or points on a line perpendicular to the plane) is
+      degenerate. Its rotation is zero, and it is marked in the returned mask instead of raising an error.
+
+    Parameters
+    ----------
+    start_points: npt.ArrayLike
+        Starting points that will be used as reference, an array with shape (N, 3), or (N, 2) for the XY-plane.
+    end_points: npt.ArrayLike
+        End points, an array with the shape of the starting points.
+    coordinate_system: CoordinateSystemOptions
+        Desired plane that will be used as reference to calculate the rotation. Standard is XY-plane.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The rotations of the end points relative to the start points in radians in the given plane [rad], and a boolean mask of the
+        degenerate pairs of points, both arrays with shape (N,).
+
+    Raises
+    ------
+    ValueError
+        If the start and end points do not have the same shape.
+        If the points do not have z values when rotation angles in XZ or YZ plane are requested.
+    """
+    start_points, end_points = np.asarray(start_points, dtype=np.float64), np.asarray(end_points, dtype=np.float64)
+    if start_points.shape != end_points.shape:
+        msg = f"Start and end points must have the same shape. {start_points.shape=} | {end_points.shape=}"
+        raise ValueError(msg)
+
+    horizontal_axis, vertical_axis = _COORDINATE_AXES[coordinate_system]
+    if start_points.shape[-1] <= vertical_axis:
+        msg = f"Coordinate system '{coordinate_system}' requires z value in both points."
+        raise ValueError(msg)
+
+    dx = end_points[..., horizontal_axis] - start_points[..., horizontal_axis]
+    dy = end_points[..., vertical_axis] - start_points[..., vertical_axis]
+    degenerate = (dx == 0) & (dy == 0)
+
+    # atan2 gives (-pi, pi], the negative angles are shifted a full turn (in which the smallest ones can round up to exactly 2*pi)
+    angles = np.arctan2(dy, dx, out=np.empty(np.shape(dx)))
+    angles[angles < 0] += 2 * math.pi
+    angles[angles >= 2 * math.pi] = 0.0
+    return angles, degenerate
@@ -1 +1,114 @@
 """Point module."""
+
+import numpy as np
+import numpy.typing as npt
+from shapely import Point
+from typing_extensions import Self
+
+
+class Point3D:
+    """Represents a point in a 3D modelling space, stored as a read-only array of its coordinates.
+
+    A lightweight alternative to the shapely :class:`~shapely.Point` for the internal calculations of the geometry, which are converted to
+    shapely points only where they are returned.
+
+    Parameters
+    ----------
+    x : float
+        X-coordinate of the point.
+    y : float
+        Y-coordinate of the point.
+    z : float, default 0.0
+        Z-coordinate of the point.
+    """
+
+    __slots__ = ("_coordinates",)
+
+    def __init__(self, x: float, y: float, z: float = 0.0) -> None:
+        """Initialize the point."""
+        self._coordinates = np.array((x, y, z), dtype=np.float64)
+        self._coordinates.flags.writeable = False
+
+    @classmethod
+    def from_array(cls: type[Self], coordinates: npt.ArrayLike) -> Self:
+        """Create a point from an array of its coordinates.
+
+        Parameters
+        ----------
+        coordinates : npt.ArrayLike
+            The coordinates, an array with shape (3,), or (2,) for a point without z value (which is then declared zero).
+
+        Returns
+        -------
+        Self
+            The point.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.shape not in ((2,), (3,)):
+            msg = f"Coordinates must have shape (2,) or (3,), but got shape {coordinates.shape}"
+            raise ValueError(msg)
+        return cls(*coordinates)
+
+    @classmethod
+    def from_shapely(cls: type[Self], point: Point) -> Self:
+        """Create a point from a shapely point.
+
+        Parameters
+        ----------
+        point : Point
+            The shapely point, a point without z value is declared with a zero z value.
+
+        Returns
+        -------
+        Self
+            The point.
+        """
+        return cls(point.x, point.y, point.z if point.has_z else 0.0)
+
+    def to_shapely(self) -> Point:
+        """Return the point as a shapely point with z value."""
+        return Point(self._coordinates)
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Return the coordinates of the point, a read-only array with shape (3,)."""
+        return self._coordinates
+
+    @property
+    def x(self) -> float:
+        """Return the X-coordinate of the point."""
+        return float(self._coordinates[0])
+
+    @property
+    def y(self) -> float:
+        """Return the Y-coordinate of the point."""
+        return float(self._coordinates[1])
+
+    @property
+    def z(self) -> float:
+        """Return the Z-coordinate of the point."""
+        return float(self._coordinates[2])
+
+    def distance(self, other: "Point3D") -> float:
+        """Return the 3D distance to another point."""
+        return float(np.linalg.norm(other.coordinates - self._coordinates))
+
+    def __array__(self, dtype: npt.DTypeLike | None = None, copy: bool | None = None) -> np.ndarray:
+        """Return the coordinates of the point as an array, for use in numpy functions."""
+        if copy:
+            return np.array(self._coordinates, dtype=dtype)
+        return np.asarray(self._coordinates, dtype=dtype)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if the points have equal coordinates."""
+        if not isinstance(other, Point3D):
+            return NotImplemented
+        return bool(np.array_equal(self._coordinates, other._coordinates))
+
+    def __hash__(self) -> int:
+        """Return the hash of the coordinates of the point."""
+        return hash(tuple(self._coordinates.tolist()))
+
+    def __repr__(self) -> str:
+        """Return the representation of the point."""
+        return f"Point3D({self.x}, {self.y}, {self.z})"
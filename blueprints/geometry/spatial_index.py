@@ -0,0 +1,293 @@
+"""Spatial index module, for bulk proximity queries on the lines of a structural model."""
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.geometry.line_collection import LineCollection
+from blueprints.type_alias import MM
+
+# the largest number of pieces the lines are split into, each piece is registered in at most 8 cells, which bounds the memory of the index
+_MAX_LINE_PIECES = 10_000_000
+# the largest number of cells of the grid, for which the keys of the cells fit in a 64-bit integer
+_MAX_GRID_CELLS = 2**62
+
+
+class LineIndex:
+    """Spatial index of the lines of a line collection, for proximity queries of many points, boxes or segments at once.
+
+    The index is a uniform grid of cubic cells in 3D (a spatial hash), in which every line is registered in the cells it passes through.
+    A query only looks up the lines in the cells around the queried point, box or segment, and calculates the exact 3D distances or
+    intersections of only these candidate lines. For local queries this costs O(1) per query on average, instead of a scan of all lines.
+
+    The queries for pairs return an array with shape (2, M), with the index of the queried point, box or segment in the first row and the
+    index of the line in the second row, sorted by the first row and then by the second row.
+
+    Parameters
+    ----------
+    lines : LineCollection
+        The lines to index.
+    cell_size : MM | None, default None
+        The size of the cells of the grid [mm]. Defaults to the median length of the lines, for which most lines are registered in a few
+        cells only. A line is registered in a number of cells proportional to its length divided by the cell size, so long lines
+        don't fill the cells of their whole bounding box.
+
+    Raises
+    ------
+    ValueError
+        If the cell size is not a positive value, or it is so small compared to the lines that the index would need too many cells.
+    """
+
+    def __init__(self, lines: LineCollection, cell_size: MM | None = None) -> None:
+        """Initialize the spatial index."""
+        if cell_size is None:
+            cell_size = self._default_cell_size(lines)
+        if cell_size <= 0:
+            msg = f"Cell size must be a positive value, but got {cell_size}"
+            raise ValueError(msg)
+        self.lines = lines
+        self.cell_size = cell_size
+
+        # split every line into pieces of at most one cell along every axis, the cells of the bounding box of a piece (at most 8) include
+        # all cells the piece passes through
+        pieces = np.maximum(np.ceil(np.abs(lines.delta).max(axis=1, initial=0) / cell_size), 1)
+        if pieces.sum() > _MAX_LINE_PIECES:
+            msg = f"Cell size of {cell_size} mm is too small, the lines would be split into {pieces.sum():.0f} pieces (max {_MAX_LINE_PIECES})"
+            raise ValueError(msg)
+        pieces = pieces.astype(np.int64)
+        owners = np.repeat(np.arange(len(lines)), pieces)
+        positions = np.arange(owners.size) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+        piece_starts = lines.start_points[owners] + (positions / pieces[owners])[:, None] * lines.delta[owners]
+        piece_ends = lines.start_points[owners] + ((positions + 1) / pieces[owners])[:, None] * lines.delta[owners]
+
+        lower_cells = self._cells(np.minimum(piece_starts, piece_ends))
+        upper_cells = self._cells(np.maximum(piece_starts, piece_ends))
+        self._origin = lower_cells.min(axis=0) if len(lines) else np.zeros(3, dtype=np.int64)
+        self._shape = upper_cells.max(axis=0) - self._origin + 1 if len(lines) else np.ones(3, dtype=np.int64)
+        if np.prod(self._shape.astype(np.float64)) > _MAX_GRID_CELLS:
+            msg = f"Cell size of {cell_size} mm is too small for the extent of the lines, the grid would have more than {_MAX_GRID_CELLS} cells"
+            raise ValueError(msg)
+
+        # the lines sorted by the keys of their cells, with the range of every occupied cell in this order (a compressed sparse layout); the
+        # neighbouring pieces of a line share cells, in which the line is registered once
+        piece_indices, keys = self._expand_cell_ranges(lower_cells - self._origin, upper_cells - self._origin)
+        line_indices = owners[piece_indices]
+        order = np.lexsort((line_indices, keys))
+        line_indices, keys = line_indices[order], keys[order]
+        unique = np.concatenate(([True], (keys[1:] != keys[:-1]) | (line_indices[1:] != line_indices[:-1])))
+        self._lines_by_cell = line_indices[unique]
+        self._cell_keys, self._cell_starts, counts = np.unique(keys[unique], return_index=True, return_counts=True)
+        self._cell_ends = self._cell_starts + counts
+
+    @staticmethod
+    def _default_cell_size(lines: LineCollection) -> MM:
+        """Return the default size of the cells of the grid for the lines, their median length [mm]."""
+        return float(np.median(lines.lengths)) if len(lines) else 1.0
+
+    def __len__(self) -> int:
+        """Return the number of indexed lines."""
+        return len(self.lines)
+
+    def nearest(self, points: npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """Return the nearest line of every point, and its distance in 3D.
+
+        Parameters
+        ----------
+        points : npt.ArrayLike
+            The points, an array with shape (N, 3).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The index of the nearest line of every point (the lowest index if several lines are equally near), and the distance to this
+            line [mm], both arrays with shape (N,).
+        """
+        points = self._as_points(points)
+        nearest_lines, nearest_distances = np.zeros(len(points), dtype=np.intp), np.full(len(points), np.inf)
+        if not len(self):
+            return nearest_lines, nearest_distances
+
+        # the lines within a distance r of a point are all registered in the cells of the cube around the point with half side r, so the
+        # nearest line in this cube is the nearest line of all if its distance is at most r; otherwise the cube is enlarged
+        unresolved, radius = np.arange(len(points)), self.cell_size
+        while unresolved.size:
+            lower_cells, upper_cells = self._cells(points[unresolved] - radius), self._cells(points[unresolved] + radius)
+            covers_grid = np.all((lower_cells <= self._origin) & (upper_cells >= self._origin + self._shape - 1), axis=1)
+            query_indices, line_indices = self._candidates(lower_cells, upper_cells)
+            distances = self._point_distances(points[unresolved[query_indices]], line_indices)
+
+            # the candidates are sorted by query and then by line, so the first candidate at the smallest distance has the lowest index
+            group_starts = _group_starts(query_indices)
+            smallest = np.minimum.reduceat(distances, group_starts) if group_starts.size else distances[:0]
+            (nearest,) = np.nonzero(distances == np.repeat(smallest, np.diff(np.append(group_starts, len(distances)))))
+            nearest = nearest[_group_starts(query_indices[nearest])]
+            nearest_lines[unresolved[query_indices[nearest]]] = line_indices[nearest]
+            nearest_distances[unresolved[query_indices[nearest]]] = distances[nearest]
+
+            resolved = covers_grid | (nearest_distances[unresolved] <= radius)
+            unresolved, radius = unresolved[~resolved], 2 * radius
+        return nearest_lines, nearest_distances
+
+    def within_distance(self, points: npt.ArrayLike, distance: MM | npt.ArrayLike) -> np.ndarray:
+        """Return the pairs of points and lines that are within a distance of each other in 3D.
+
+        Parameters
+        ----------
+        points : npt.ArrayLike
+            The points, an array with shape (N, 3).
+        distance : MM | npt.ArrayLike
+            The distance [mm], a single distance or a distance per point.
+
+        Returns
+        -------
+        np.ndarray
+            The pairs of the indices of the points and the lines, an array with shape (2, M).
+        """
+        points = self._as_points(points)
+        distance = np.broadcast_to(np.asarray(distance, dtype=np.float64), (len(points),))
+        margins = distance[:, None]
+        query_indices, line_indices = self._candidates(self._cells(points - margins), self._cells(points + margins))
+        within = self._point_distances(points[query_indices], line_indices) <= distance[query_indices]
+        return np.stack((query_indices[within], line_indices[within]))
+
+    def in_boxes(self, lower_corners: npt.ArrayLike, upper_corners: npt.ArrayLike) -> np.ndarray:
+        """Return the pairs of axis-aligned boxes and the lines that intersect (or lie inside) them.
+
+        Parameters
+        ----------
+        lower_corners : npt.ArrayLike
+            The corners of the boxes with the smallest coordinates, an array with shape (N, 3).
+        upper_corners : npt.ArrayLike
+            The corners of the boxes with the largest coordinates, an array with shape (N, 3).
+
+        Returns
+        -------
+        np.ndarray
+            The pairs of the indices of the boxes and the lines, an array with shape (2, M).
+        """
+        lower_corners, upper_corners = self._as_points(lower_corners), self._as_points(upper_corners)
+        query_indices, line_indices = self._candidates(self._cells(lower_corners), self._cells(upper_corners))
+
+        # clip every candidate line to the slabs of its box, the line intersects the box if a part of it remains
+        starts, deltas = self.lines.start_points[line_indices], self.lines.delta[line_indices]
+        lower, upper = lower_corners[query_indices] - starts, upper_corners[query_indices] - starts
+        parallel = deltas == 0
+        divisors = np.where(parallel, 1.0, deltas)
+        entries, exits = np.minimum(lower / divisors, upper / divisors), np.maximum(lower / divisors, upper / divisors)
+        # a line that is parallel to a slab lies inside it for all its parameters, or for none
+        outside = parallel & ((lower > 0) | (upper < 0))
+        entries[parallel], exits[parallel] = -np.inf, np.inf
+        entries[outside], exits[outside] = np.inf, -np.inf
+        intersects = np.maximum(entries.max(axis=1), 0) <= np.minimum(exits.min(axis=1), 1)
+        return np.stack((query_indices[intersects], line_indices[intersects]))
+
+    def intersections(self, segments: LineCollection, tolerance: MM = 1e-6) -> np.ndarray:
+        """Return the pairs of segments and lines that intersect (or touch) each other in 3D.
+
+        Parameters
+        ----------
+        segments : LineCollection
+            The segments.
+        tolerance : MM
+            The largest distance between a segment and a line that still counts as an intersection [mm].
+
+        Returns
+        -------
+        np.ndarray
+            The pairs of the indices of the segments and the lines, an array with shape (2, M).
+        """
+        lower_bounds = np.minimum(segments.start_points, segments.end_points) - tolerance
+        upper_bounds = np.maximum(segments.start_points, segments.end_points) + tolerance
+        query_indices, line_indices = self._candidates(self._cells(lower_bounds), self._cells(upper_bounds))
+        distances = _segment_distances(
+            segments.start_points[query_indices],
+            segments.delta[query_indices],
+            self.lines.start_points[line_indices],
+            self.lines.delta[line_indices],
+        )
+        intersects = distances <= tolerance
+        return np.stack((query_indices[intersects], line_indices[intersects]))
+
+    def _cells(self, coordinates: np.ndarray) -> np.ndarray:
+        """Return the integer coordinates of the cells of the grid that contain the given coordinates."""
+        return np.floor(coordinates / self.cell_size).astype(np.int64)
+
+    def _expand_cell_ranges(self, lower_cells: np.ndarray, upper_cells: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return every cell of every range of cells (relative to the origin of the grid), as the index of its range and its key."""
+        sizes = np.maximum(upper_cells - lower_cells + 1, 0)
+        counts = np.prod(sizes, axis=1)
+        owners = np.repeat(np.arange(len(counts)), counts)
+        # the position of every cell within its range, decomposed into its offsets along the three axes
+        positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        sizes, cells = sizes[owners], lower_cells[owners]
+        cells[:, 2] += positions % sizes[:, 2]
+        positions //= sizes[:, 2]
+        cells[:, 1] += positions % sizes[:, 1]
+        cells[:, 0] += positions // sizes[:, 1]
+        return owners, (cells[:, 0] * self._shape[1] + cells[:, 1]) * self._shape[2] + cells[:, 2]
+
+    def _candidates(self, lower_cells: np.ndarray, upper_cells: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the unique pairs of queries and the lines that are registered in the cells of their range of cells."""
+        lower_cells = np.maximum(lower_cells - self._origin, 0)
+        upper_cells = np.minimum(upper_cells - self._origin, self._shape - 1)
+        query_indices, keys = self._expand_cell_ranges(lower_cells, upper_cells)
+        if not len(self):
+            return query_indices[:0], query_indices[:0]
+
+        # look up the occupied cells, and expand their ranges of lines
+        positions = np.minimum(np.searchsorted(self._cell_keys, keys), len(self._cell_keys) - 1)
+        occupied = self._cell_keys[positions] == keys
+        starts, counts = self._cell_starts[positions[occupied]], self._cell_ends[positions[occupied]] - self._cell_starts[positions[occupied]]
+        query_indices = np.repeat(query_indices[occupied], counts)
+        line_indices = self._lines_by_cell[np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts - starts, counts)]
+
+        # a line that is registered in several cells of a range is a candidate once
+        pairs = np.sort(query_indices * len(self) + line_indices)
+        pairs = pairs[_group_starts(pairs)]
+        return pairs // len(self), pairs % len(self)
+
+    def _point_distances(self, points: np.ndarray, line_indices: np.ndarray) -> np.ndarray:
+        """Return the 3D distance of every point to the line with the same position in ``line_indices``."""
+        starts, deltas = self.lines.start_points[line_indices], self.lines.delta[line_indices]
+        offsets = points - starts
+        fractions = np.einsum("ij,ij->i", offsets, deltas) / self.lines.lengths[line_indices] ** 2
+        np.clip(fractions, 0, 1, out=fractions)
+        offsets -= fractions[:, None] * deltas
+        return np.linalg.norm(offsets, axis=1)
+
+    @staticmethod
+    def _as_points(points: npt.ArrayLike) -> np.ndarray:
+        """Convert the points to a float array with shape (N, 3)."""
+        points = np.array(points, dtype=np.float64, ndmin=2)
+        if points.ndim != 2 or points.shape[1] != 3:
+            msg = f"Points must have shape (N, 3), but got shape {points.shape}"
+            raise ValueError(msg)
+        return points
+
+
+def _group_starts(values: np.ndarray) -> np.ndarray:
+    """Return the positions of the first value of every group of equal values in a sorted array."""
+    return np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1]))) if values.size else np.zeros(0, dtype=np.intp)
+
+
+def _segment_distances(starts_1: np.ndarray, deltas_1: np.ndarray, starts_2: np.ndarray, deltas_2: np.ndarray) -> np.ndarray:
+    """Return the shortest 3D distance between every pair of segments, which have no length of zero.
+
+    The closest points of every pair are found with the clamped parameters of both segments, see C. Ericson, Real-Time Collision Detection
+    (2005), section 5.1.9.
+    """
+    offsets = starts_1 - starts_2
+    a = np.einsum("ij,ij->i", deltas_1, deltas_1)
+    b = np.einsum("ij,ij->i", deltas_1, deltas_2)
+    c = np.einsum("ij,ij->i", deltas_1, offsets)
+    e = np.einsum("ij,ij->i", deltas_2, deltas_2)
+    f = np.einsum("ij,ij->i", deltas_2, offsets)
+
+    # parallel segments have no unique closest points, any parameter of the first segment is then valid as start
+    denominator = a * e - b * b
+    parallel = denominator <= 1e-12 * a * e
+    s = np.where(parallel, 0.0, np.clip((b * f - c * e) / np.where(parallel, 1.0, denominator), 0, 1))
+    t = (b * s + f) / e
+    s = np.where(t < 0, np.clip(-c / a, 0, 1), np.where(t > 1, np.clip((b - c) / a, 0, 1), s))
+    np.clip(t, 0, 1, out=t)
+
+    return np.linalg.norm(offsets + s[:, None] * deltas_1 - t[:, None] * deltas_2, axis=1)
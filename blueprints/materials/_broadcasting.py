@@ -0,0 +1,24 @@
+"""Module with the broadcasting shared by the time-dependent material models (shrinkage, creep and relaxation)."""
+
+import numpy as np
+
+
+def expand_for_times(values: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Add an axis of length one to the values of the members for every axis of the times, to broadcast them to shape S + T.
+
+    The time-dependent models store their properties with the shape ``S`` of the members (cross-sections or tendons), and evaluate them at
+    times (or ages) with shape ``T``, which gives results with shape ``S + T``.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The values of the members, with shape ``S``.
+    t : np.ndarray
+        The times, with shape ``T``.
+
+    Returns
+    -------
+    np.ndarray
+        A view of the values with shape ``S + (1,) * len(T)``.
+    """
+    return values.reshape(values.shape + (1,) * t.ndim)
@@ -1,13 +1,24 @@
 """Module for concrete material properties."""
 
+from __future__ import annotations
+
 import math
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
 
+from blueprints.materials.interning import InternedMaterial
 from blueprints.type_alias import DIMENSIONLESS, KG_M3, MM, MPA, PER_DEGREE, PER_MILLE, PERCENTAGE
 from blueprints.unit_conversion import GPA_TO_MPA
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ConcreteAggregateType(Enum):
     """Enumeration of concrete aggregate types."""
@@ -66,8 +77,196 @@ class CementType(Enum):
     CEM_V = "CEM V"
 
 
+class ConcreteClassProperties(NamedTuple):
+    """Strength and deformation characteristics of a concrete strength class, a row of table 3.1 from NEN-EN 1992-1-1.
+
+    See the properties of :class:`ConcreteMaterial` with the same names for a description of the values.
+    """
+
+    f_ck: MPA
+    f_ck_cube: MPA
+    f_cm: MPA
+    f_cm_cube: MPA
+    f_ctm: MPA
+    f_ctk_0_05: MPA
+    f_ctk_0_95: MPA
+    e_cm: MPA
+    eps_c1: PER_MILLE
+    eps_cu1: PER_MILLE
+    eps_c2: PER_MILLE
+    eps_cu2: PER_MILLE
+    n_factor: DIMENSIONLESS
+    eps_c3: PER_MILLE
+    eps_cu3: PER_MILLE
+
+
+def _calculate_concrete_class_properties(concrete_class: ConcreteStrengthClass) -> ConcreteClassProperties:
+    """Calculate the row of table 3.1 from NEN-EN 1992-1-1 of a concrete strength class, from the strengths in its name."""
+    value = concrete_class.value
+    if not (match := re.search(pattern=r"C(\d+)/", string=value)):
+        raise ValueError("No match found for f_ck. Concrete class is invalid.")
+    f_ck = int(match.group(1))
+    if not (match := re.search(pattern=r"/(\d+)", string=value)):
+        raise ValueError("No match found for f_ck_cube. Concrete class is invalid.")
+    f_ck_cube = int(match.group(1))
+
+    f_cm = f_ck + 8
+    f_ctm = 0.30 * f_ck ** (2 / 3) if f_ck <= 50 else 2.12 * math.log(1 + (f_cm / 10))
+    high_strength = f_ck >= 50
+    return ConcreteClassProperties(
+        f_ck=f_ck,
+        f_ck_cube=f_ck_cube,
+        f_cm=f_cm,
+        f_cm_cube=f_ck_cube + 8,
+        f_ctm=f_ctm,
+        f_ctk_0_05=f_ctm * 0.7,
+        f_ctk_0_95=f_ctm * 1.3,
+        e_cm=int(22 * ((f_cm / 10) ** 0.3) * GPA_TO_MPA),
+        eps_c1=min(0.7 * f_cm**0.31, 2.8),
+        eps_cu1=2.8 + 27 * ((98 - f_cm) / 100) ** 4 if high_strength else 3.5,
+        eps_c2=2.0 + 0.085 * (f_ck - 50) ** 0.53 if high_strength else 2.0,
+        eps_cu2=2.6 + 35 * ((90 - f_ck) / 100) ** 4 if high_strength else 3.5,
+        n_factor=1.4 + 23.4 * ((90 - f_ck) / 100) ** 4 if high_strength else 2.0,
+        eps_c3=1.75 + 0.55 * ((f_ck - 50) / 40) if high_strength else 1.75,
+        eps_cu3=2.6 + 35 * ((90 - f_ck) / 100) ** 4 if high_strength else 3.5,
+    )
+
+
+_CONCRETE_CLASS_PROPERTIES = {concrete_class: _calculate_concrete_class_properties(concrete_class) for concrete_class in ConcreteStrengthClass}
+"""Precomputed rows of table 3.1, by concrete strength class."""
+
+_ROW_INDEX = {key: index for index, concrete_class in enumerate(ConcreteStrengthClass) for key in (concrete_class, concrete_class.value)}
+"""Index of the row of table 3.1, by concrete strength class and by its name."""
+
+_INTEGER_PROPERTIES = ("f_ck", "f_ck_cube", "f_cm", "f_cm_cube", "e_cm")
+"""Properties of table 3.1 with integer values."""
+
+TABLE_3_1: np.ndarray = np.array(
+    [tuple(properties) for properties in _CONCRETE_CLASS_PROPERTIES.values()],
+    dtype=[(name, np.int64 if name in _INTEGER_PROPERTIES else np.float64) for name in ConcreteClassProperties._fields],
+)
+"""Table 3.1 from NEN-EN 1992-1-1 as a read-only structured array, with a row per concrete strength class (in the order of
+:class:`ConcreteStrengthClass`) and a field per property of :class:`ConcreteClassProperties`."""
+TABLE_3_1.flags.writeable = False
+
+
+_CEMENT_CLASSES = {cement_class.value: cement_class for cement_class in CementClass}
+"""Cement classes by name."""
+
+
+def concrete_class_properties(concrete_class: ConcreteStrengthClass) -> ConcreteClassProperties:
+    """Return the strength and deformation characteristics of a concrete strength class, from table 3.1 of NEN-EN 1992-1-1.
+
+    Parameters
+    ----------
+    concrete_class : ConcreteStrengthClass
+        The concrete strength class.
+
+    Returns
+    -------
+    ConcreteClassProperties
+        The row of table 3.1 of the concrete strength class.
+
+    Raises
+    ------
+    ValueError
+        If the strengths cannot be read from the name of the concrete strength class.
+    """
+    properties = _CONCRETE_CLASS_PROPERTIES.get(concrete_class)
+    if properties is None:
+        return _calculate_concrete_class_properties(concrete_class)
+    return properties
+
+
+def table_3_1(concrete_classes: npt.ArrayLike, name: str | None = None) -> np.ndarray:
+    """Look up the rows (or a single property) of table 3.1 from NEN-EN 1992-1-1 for an array of concrete strength classes.
+
+    Examples
+    --------
+    >>> table_3_1([ConcreteStrengthClass.C20_25, ConcreteStrengthClass.C30_37], "f_ctm")
+    array([2.21042..., 2.89646...])
+    >>> table_3_1(["C20/25", "C30/37"])["e_cm"]
+    array([29962, 32836])
+
+    Parameters
+    ----------
+    concrete_classes : npt.ArrayLike
+        The concrete strength classes, or their names (for example "C30/37"), in an array of any shape.
+    name : str | None, default None
+        The name of the property, a field of :class:`ConcreteClassProperties`. If None, the complete rows are returned.
+
+    Returns
+    -------
+    np.ndarray
+        The rows of table 3.1 as a structured array, or the values of the property, with the shape of ``concrete_classes``.
+
+    Raises
+    ------
+    ValueError
+        If a concrete strength class or the name of the property is unknown.
+    """
+    classes = np.asarray(concrete_classes, dtype=object)
+    try:
+        indices = np.fromiter((_ROW_INDEX[concrete_class] for concrete_class in classes.flat), dtype=np.intp, count=classes.size)
+    except KeyError as error:
+        raise ValueError(f"Unknown concrete strength class: {error.args[0]!r}. Options: {[c.value for c in ConcreteStrengthClass]}.") from None
+    if name is None:
+        return TABLE_3_1[indices.reshape(classes.shape)]
+    if name not in ConcreteClassProperties._fields:
+        raise ValueError(f"Unknown property of table 3.1: '{name}'. Options: {list(ConcreteClassProperties._fields)}.")
+    return TABLE_3_1[name][indices.reshape(classes.shape)]
+
+
+def table_3_1_dataframe() -> pd.DataFrame:
+    """Return table 3.1 from NEN-EN 1992-1-1 as a DataFrame.
+
+    Returns
+    -------
+    pd.DataFrame
+        The table, indexed by the name of the concrete strength class, with a column per property of :class:`ConcreteClassProperties`.
+    """
+    import pandas as pd  # imported here, as importing pandas is slow and not needed for the materials themselves
+
+    return pd.DataFrame(TABLE_3_1, index=pd.Index([concrete_class.value for concrete_class in ConcreteStrengthClass], name="concrete_class"))
+
+
+def cement_class_coefficients(cement_classes: CementClass | str | npt.ArrayLike, coefficients: Mapping[CementClass, float]) -> np.ndarray:
+    """Look up a coefficient that depends on the cement class, for an array of cement classes.
+
+    Examples
+    --------
+    >>> cement_class_coefficients([CementClass.S, "r"], {CementClass.S: -1, CementClass.N: 0, CementClass.R: 1})
+    array([-1.,  1.])
+
+    Parameters
+    ----------
+    cement_classes : CementClass | str | npt.ArrayLike
+        The cement classes, or their names ('S', 'N' or 'R', in any case), in an array of any shape (or a single cement class).
+    coefficients : Mapping[CementClass, float]
+        The coefficient of every cement class.
+
+    Returns
+    -------
+    np.ndarray
+        The coefficients, with the shape of ``cement_classes``.
+
+    Raises
+    ------
+    ValueError
+        If a cement class is unknown.
+    """
+    classes = np.asarray(cement_classes, dtype=object)
+    values = np.empty(classes.shape)
+    for index, cement_class in np.ndenumerate(classes):
+        key = cement_class if isinstance(cement_class, CementClass) else _CEMENT_CLASSES.get(str(cement_class).upper())
+        if key is None:
+            raise ValueError(f"Invalid cement class: {cement_class}. Options: 'R', 'N' or 'S'")
+        values[index] = coefficients[key]
+    return values
+
+
 @dataclass(frozen=True)
-class ConcreteMaterial:
+class ConcreteMaterial(InternedMaterial):
     """Representation of the strength and deformation characteristics for concrete material based on the analytical
     relation shown on tabel 3.1 from NEN-EN 1992-1-1.
 
@@ -151,10 +350,7 @@ class ConcreteMaterial:
         MPA
             Example: 30 (for C30/37)
         """
-        value = self.concrete_class.value
-        if match := re.search(pattern=r"C(\d+)/", string=value):
-            return int(match.group(1))
-        raise ValueError("No match found for f_ck. Concrete class is invalid.")
+        return concrete_class_properties(self.concrete_class).f_ck
 
     @property
     def f_ck_cube(self) -> MPA:
@@ -165,10 +361,7 @@ class ConcreteMaterial:
         MPA
             Example: 37 (for C30/37)
         """
-        value = self.concrete_class.value
-        if match := re.search(pattern=r"/(\d+)", string=value):
-            return int(match.group(1))
-        raise ValueError("No match found for f_ck_cube. Concrete class is invalid.")
+        return concrete_class_properties(self.concrete_class).f_ck_cube
 
     @property
     def f_cd(self) -> MPA:
@@ -190,7 +383,7 @@ class ConcreteMaterial:
         MPA
             Example: 38 (for C30/37)
         """
-        return self.f_ck + 8
+        return concrete_class_properties(self.concrete_class).f_cm
 
     @property
     def f_cm_cube(self) -> MPA:
@@ -201,7 +394,7 @@ class ConcreteMaterial:
         MPA
             Example: 45 (for C30/37)
         """
-        return self.f_ck_cube + 8
+        return concrete_class_properties(self.concrete_class).f_cm_cube
 
     @property
     def f_ctm(self) -> MPA:
@@ -212,9 +405,7 @@ class ConcreteMaterial:
         MPA
             Example: 2.896468153816889 (for C30/37)
         """
-        if self.f_ck <= 50:
-            return 0.30 * self.f_ck ** (2 / 3)
-        return 2.12 * math.log(1 + (self.f_cm / 10))
+        return concrete_class_properties(self.concrete_class).f_ctm
 
     @property
     def sigma_cr(self) -> MPA:
@@ -247,7 +438,7 @@ class ConcreteMaterial:
         MPA
             Example: 2.027527707671822 (for C30/37)
         """
-        return self.f_ctm * 0.7
+        return concrete_class_properties(self.concrete_class).f_ctk_0_05
 
     @property
     def f_ctd(self) -> MPA:
@@ -269,7 +460,7 @@ class ConcreteMaterial:
         MPA
             Example: 3.765408599961956 (for C30/37)
         """
-        return self.f_ctm * 1.3
+        return concrete_class_properties(self.concrete_class).f_ctk_0_95
 
     @property
     def e_cm(self) -> MPA:
@@ -280,7 +471,7 @@ class ConcreteMaterial:
         MPA
             Example: 32836 (for C30/37)
         """
-        return int(22 * ((self.f_cm / 10) ** 0.3) * GPA_TO_MPA)
+        return concrete_class_properties(self.concrete_class).e_cm
 
     @property
     def custom_e_c_present(self) -> bool:
@@ -303,7 +494,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 2.1618768697354804 (for C30/37)
         """
-        return min(0.7 * self.f_cm**0.31, 2.8)
+        return concrete_class_properties(self.concrete_class).eps_c1
 
     @property
     def eps_cu1(self) -> PER_MILLE:
@@ -314,9 +505,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 3.5 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 2.8 + 27 * ((98 - self.f_cm) / 100) ** 4
-        return 3.5
+        return concrete_class_properties(self.concrete_class).eps_cu1
 
     @property
     def eps_c2(self) -> PER_MILLE:
@@ -328,9 +517,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 2.0 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 2.0 + 0.085 * (self.f_ck - 50) ** 0.53
-        return 2.0
+        return concrete_class_properties(self.concrete_class).eps_c2
 
     @property
     def eps_cu2(self) -> PER_MILLE:
@@ -342,9 +529,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 3.5 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 2.6 + 35 * ((90 - self.f_ck) / 100) ** 4
-        return 3.5
+        return concrete_class_properties(self.concrete_class).eps_cu2
 
     @property
     def n_factor(self) -> DIMENSIONLESS:
@@ -355,9 +540,7 @@ class ConcreteMaterial:
         DIMENSIONLESS
             Example: 2.0 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 1.4 + 23.4 * ((90 - self.f_ck) / 100) ** 4
-        return 2.0
+        return concrete_class_properties(self.concrete_class).n_factor
 
     @property
     def eps_c3(self) -> PER_MILLE:
@@ -370,9 +553,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 1.75 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 1.75 + 0.55 * ((self.f_ck - 50) / 40)
-        return 1.75
+        return concrete_class_properties(self.concrete_class).eps_c3
 
     @property
     def eps_cu3(self) -> PER_MILLE:
@@ -385,9 +566,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 3.5 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 2.6 + 35 * ((90 - self.f_ck) / 100) ** 4
-        return 3.5
+        return concrete_class_properties(self.concrete_class).eps_cu3
 
     def rho_min(self, f_yd: MPA) -> PERCENTAGE:
         """[:math:`ρ_{min}`] Minimum reinforcement ratio (CB2, 7de druk 2011, pag.55) [%].
@@ -0,0 +1,250 @@
+"""Module for the creep of concrete under a variable stress history, according to art.3.1.4 and annex B.1 of NEN-EN 1992-1-1."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10 import SubForm3Dot10FictionalCrossSection
+from blueprints.materials._broadcasting import expand_for_times
+from blueprints.materials.concrete import CementClass, cement_class_coefficients
+from blueprints.validations import any_true
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from blueprints.materials.concrete import ConcreteMaterial
+    from blueprints.type_alias import DAYS, MM, MM2, MPA, PERCENTAGE
+
+_ALPHA_CEMENT = {CementClass.S: -1.0, CementClass.N: 0.0, CementClass.R: 1.0}
+"""Exponent alpha of annex B.1 formula (B.9) by cement class [-]."""
+
+RETARDATION_TIMES = np.logspace(-5, 4.5, 21)
+"""Retardation times of the Kelvin units of the Dirichlet series, relative to :math:`β_H` [-]."""
+
+
+def _fit_dirichlet_series(retardation_times: np.ndarray) -> np.ndarray:
+    """Fit the coefficients of the Dirichlet series :math:`Σ a_μ (1 - e^{-x / τ_μ})` to :math:`β_c = (x / (1 + x))^{0.3}`, formula (B.7).
+
+    With :math:`x = (t - t_0) / β_H`, the coefficients are the same for every cross-section. The fit is weighted with :math:`1 / β_c`, to
+    keep the relative error small at early ages as well.
+    """
+    x = np.logspace(-4, 6, 1000)
+    beta_c = (x / (1 + x)) ** 0.3
+    basis = 1 - np.exp(-x[:, None] / retardation_times)
+    coefficients, *_ = np.linalg.lstsq(basis / beta_c[:, None], np.ones_like(x), rcond=None)
+    return coefficients
+
+
+DIRICHLET_COEFFICIENTS = _fit_dirichlet_series(RETARDATION_TIMES)
+"""Coefficients of the Kelvin units of the Dirichlet series, fitted to formula (B.7) for :math:`(t - t_0) / β_H` from 1e-4 to 1e6, with
+a relative error below 0.1% [-]."""
+
+
+class CreepModel:
+    """Linear creep of one or many concrete cross-sections under a variable stress history, NEN-EN 1992-1-1 annex B.1.
+
+    The creep coefficient :math:`φ(t, t_0) = φ_0(t_0) β_c(t - t_0)` of formula (B.1) is the product of a notional creep coefficient, which
+    depends on the age at loading, and a development in time, which only depends on the duration of loading relative to :math:`β_H`. The
+    development in time is approximated by a Dirichlet series (a chain of Kelvin units), so the creep strain of a stress history follows
+    from the superposition of the stress increments with a state of one variable per Kelvin unit. Every time step then costs the same,
+    instead of a convolution over all previous stress increments.
+
+    Creep is linear in the stress, formula (3.6), so the stress should not exceed :math:`0.45 f_{ck}(t_0)`, see art.3.1.4 (4). The
+    temperature adjustment of formula (B.10) is not included, the ages are at 20 °C.
+
+    The parameters are broadcast against each other, so arrays of parameters describe many cross-sections with the shape ``S`` of the
+    broadcast parameters (empty for a single cross-section).
+
+    Parameters
+    ----------
+    f_cm : MPA | npt.ArrayLike
+        [:math:`f_{cm}`] Mean compressive strength of concrete at 28 days [MPa].
+    cement_class : CementClass | str | npt.ArrayLike
+        The cement class, or the cement classes, as CementClass or as 'S', 'N' or 'R'.
+    h_0 : MM | npt.ArrayLike
+        [:math:`h_0`] Notional size of the cross-section [mm], see :meth:`from_cross_section`.
+    relative_humidity : PERCENTAGE | npt.ArrayLike
+        [:math:`RH`] Relative humidity of the ambient environment [%].
+    e_c : MPA | npt.ArrayLike
+        [:math:`E_c`] Tangent modulus of elasticity, 1.05 :math:`E_{cm}` according to art.3.1.4 (2) [MPa].
+
+    Raises
+    ------
+    ValueError
+        If a cement class is unknown, a relative humidity is outside 0 to 100 %, or a strength, notional size or modulus is zero or
+        negative.
+    """
+
+    def __init__(
+        self,
+        f_cm: MPA | npt.ArrayLike,
+        cement_class: CementClass | str | npt.ArrayLike,
+        h_0: MM | npt.ArrayLike,
+        relative_humidity: PERCENTAGE | npt.ArrayLike,
+        e_c: MPA | npt.ArrayLike,
+    ) -> None:
+        alpha_cement = cement_class_coefficients(cement_class, _ALPHA_CEMENT)
+        values = (np.asarray(value, dtype=np.float64) for value in (f_cm, h_0, relative_humidity, e_c))
+        alpha_cement, f_cm, h_0, relative_humidity, e_c = np.broadcast_arrays(alpha_cement, *values)
+        for name, value in (("f_cm", f_cm), ("h_0", h_0), ("e_c", e_c)):
+            if any_true(value <= 0):
+                raise ValueError(f"Invalid {name}: {value}. {name} cannot be negative or zero")
+        if any_true((relative_humidity < 0) | (relative_humidity > 100)):
+            raise ValueError(f"Invalid relative_humidity: {relative_humidity}. relative_humidity must be between 0 and 100 %")
+
+        # formula (B.8c), the factors only apply for f_cm > 35 MPa, which makes (B.3a) and (B.8a) special cases of (B.3b) and (B.8b)
+        alpha_1, alpha_2, alpha_3 = (np.where(f_cm > 35, (35 / f_cm) ** exponent, 1.0) for exponent in (0.7, 0.2, 0.5))
+        phi_rh = (1 + (1 - relative_humidity / 100) / (0.1 * np.cbrt(h_0)) * alpha_1) * alpha_2
+        beta_f_cm = 16.8 / np.sqrt(f_cm)
+
+        self.shape = f_cm.shape
+        """Shape ``S`` of the cross-sections."""
+        self.e_c = e_c
+        self.alpha_cement = alpha_cement
+        """Exponent alpha of formula (B.9), depending on the cement class [-]."""
+        self.beta_h = np.minimum(1.5 * (1 + (0.012 * relative_humidity) ** 18) * h_0 + 250 * alpha_3, 1500 * alpha_3)
+        """[:math:`β_H`] Coefficient depending on the relative humidity and the notional size, formula (B.8) [days]."""
+        self.phi_rh_beta_f_cm = phi_rh * beta_f_cm
+        """[:math:`φ_{RH} β(f_{cm})`] Part of the notional creep coefficient that does not depend on the age at loading, formulas (B.3) and
+        (B.4) [-]."""
+        self._retardation_times = self.beta_h[..., None] * RETARDATION_TIMES
+
+    @classmethod
+    def from_cross_section(
+        cls: type[Self],
+        material: ConcreteMaterial,
+        a_c: MM2 | npt.ArrayLike,
+        u: MM | npt.ArrayLike,
+        relative_humidity: PERCENTAGE | npt.ArrayLike,
+    ) -> Self:
+        """Create the creep model of cross-sections of a concrete material.
+
+        Parameters
+        ----------
+        material : ConcreteMaterial
+            The concrete material, which gives :math:`f_{cm}`, :math:`E_c = 1.05 E_{cm}` and the cement class.
+        a_c : MM2 | npt.ArrayLike
+            [:math:`A_c`] Area of the cross-section of the concrete [mm²].
+        u : MM | npt.ArrayLike
+            [:math:`u`] Perimeter of the part of the cross-section that is exposed to drying [mm].
+        relative_humidity : PERCENTAGE | npt.ArrayLike
+            [:math:`RH`] Relative humidity of the ambient environment [%].
+
+        Returns
+        -------
+        Self
+            The creep model, with :math:`h_0 = 2 A_c / u`.
+        """
+        h_0 = SubForm3Dot10FictionalCrossSection.evaluate_many(a_c=a_c, u=u)
+        return cls(
+            f_cm=material.f_cm,
+            cement_class=material.cement_class,
+            h_0=h_0,
+            relative_humidity=relative_humidity,
+            e_c=1.05 * material.e_cm,
+        )
+
+    def notional_creep_coefficient(self, t_0: DAYS | npt.ArrayLike) -> np.ndarray:
+        """[:math:`φ_0`] Notional creep coefficient, formulas (B.2), (B.5) and (B.9) [-].
+
+        Parameters
+        ----------
+        t_0 : DAYS | npt.ArrayLike
+            [:math:`t_0`] The ages of the concrete at loading [days], an array of any shape ``T`` (or a single age).
+
+        Returns
+        -------
+        np.ndarray
+            The notional creep coefficients, with shape ``S + T``.
+
+        Raises
+        ------
+        ValueError
+            If an age at loading is zero or negative.
+        """
+        t_0 = np.asarray(t_0, dtype=np.float64)
+        if any_true(t_0 <= 0):
+            raise ValueError(f"Invalid t_0: {t_0}. t_0 cannot be negative or zero")
+        # formula (B.9), the age at loading adjusted for the type of cement
+        alpha_cement = expand_for_times(self.alpha_cement, t_0)
+        adjusted_t_0 = np.maximum(t_0 * (9 / (2 + t_0**1.2) + 1) ** alpha_cement, 0.5)
+        return expand_for_times(self.phi_rh_beta_f_cm, t_0) / (0.1 + adjusted_t_0**0.20)
+
+    def creep_coefficient(self, t: DAYS | npt.ArrayLike, t_0: DAYS | npt.ArrayLike) -> np.ndarray:
+        """[:math:`φ(t, t_0)`] Creep coefficient, formulas (B.1) and (B.7), evaluated exactly [-].
+
+        The creep coefficient is zero up to the age at loading.
+
+        Parameters
+        ----------
+        t : DAYS | npt.ArrayLike
+            [:math:`t`] The ages of the concrete [days].
+        t_0 : DAYS | npt.ArrayLike
+            [:math:`t_0`] The ages of the concrete at loading [days], broadcast against ``t`` to shape ``T``.
+
+        Returns
+        -------
+        np.ndarray
+            The creep coefficients, with shape ``S + T``.
+
+        Raises
+        ------
+        ValueError
+            If an age at loading is zero or negative.
+        """
+        t, t_0 = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(t_0, dtype=np.float64))
+        duration = np.maximum(t - t_0, 0.0)
+        beta_c = (duration / (expand_for_times(self.beta_h, t) + duration)) ** 0.3
+        return self.notional_creep_coefficient(t_0) * beta_c
+
+    def creep_strain(self, t: DAYS | npt.ArrayLike, stress: MPA | npt.ArrayLike) -> np.ndarray:
+        """[:math:`ε_{cc}(t)`] Creep strain of a stress history, by superposition of formula (3.6) with the Dirichlet series [-].
+
+        The stress history is a step function: ``stress[k]`` acts from ``t[k]`` until ``t[k + 1]``. Every change of the stress is a load
+        increment with its own age at loading. The elastic strain is not included.
+
+        Parameters
+        ----------
+        t : DAYS | npt.ArrayLike
+            [:math:`t`] The increasing ages of the concrete [days], a one-dimensional array with ``n`` ages.
+        stress : MPA | npt.ArrayLike
+            [:math:`σ_c`] The stress from every age on [MPa], broadcast to shape ``S + (n,)``.
+
+        Returns
+        -------
+        np.ndarray
+            The creep strains at the ages, with shape ``S + (n,)``.
+
+        Raises
+        ------
+        ValueError
+            If the ages are not one-dimensional and increasing, or an age is zero or negative.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        if t.ndim != 1 or any_true(np.diff(t) <= 0):
+            raise ValueError("The ages t must be a one-dimensional array of increasing ages")
+        stress = np.broadcast_to(np.asarray(stress, dtype=np.float64), (*self.shape, t.size))
+
+        # strain per unit of beta_c of every load increment: the increment of the stress times phi_0(t_k) / E_c
+        amplitudes = np.diff(stress, axis=-1, prepend=0.0)
+        amplitudes *= self.notional_creep_coefficient(t) / self.e_c[..., None]
+
+        # the creep strain is sum_mu a_mu * (sum_k amplitude_k - q_mu), with q_mu = sum_k amplitude_k * exp(-(t - t_k) / tau_mu) the state
+        # of Kelvin unit mu, which is updated with a single decay per time step (computed again only when the time step changes)
+        strains = np.empty((*self.shape, t.size))
+        states = np.zeros((*self.shape, RETARDATION_TIMES.size))
+        total_amplitude = np.zeros(self.shape)
+        step, decay = np.nan, np.ones_like(self._retardation_times)
+        for index in range(t.size):
+            if index:
+                if t[index] - t[index - 1] != step:
+                    step = t[index] - t[index - 1]
+                    decay = np.exp(-step / self._retardation_times)
+                states *= decay
+            states += amplitudes[..., index, None]
+            total_amplitude += amplitudes[..., index]
+            strains[..., index] = (total_amplitude[..., None] - states) @ DIRICHLET_COEFFICIENTS
+        return strains
@@ -0,0 +1,217 @@
+"""Module for the shrinkage strain of concrete in time, according to art.3.1.4 (6) and annex B.2 of NEN-EN 1992-1-1."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10 import SubForm3Dot10FictionalCrossSection
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_12 import Form3Dot12AutogeneShrinkageInfinity
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_13 import Form3Dot13CoefficientTimeAutogeneShrinkage
+from blueprints.materials._broadcasting import expand_for_times
+from blueprints.materials.concrete import CementClass, cement_class_coefficients
+from blueprints.validations import any_true
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from blueprints.materials.concrete import ConcreteMaterial
+    from blueprints.type_alias import DAYS, MM, MM2, MPA, PERCENTAGE
+
+TABLE_3_3_H_0 = np.array([100.0, 200.0, 300.0, 500.0])
+"""[:math:`h_0`] Notional sizes of table 3.3 [mm]."""
+
+TABLE_3_3_K_H = np.array([1.0, 0.85, 0.75, 0.70])
+"""[:math:`k_h`] Coefficients of table 3.3 at the notional sizes of TABLE_3_3_H_0 [-]."""
+
+_ALPHA_DS_1 = {CementClass.S: 3.0, CementClass.N: 4.0, CementClass.R: 6.0}
+"""Coefficient alpha_ds1 of annex B.2 formula (B.11) by cement class [-]."""
+
+_ALPHA_DS_2 = {CementClass.S: 0.13, CementClass.N: 0.12, CementClass.R: 0.11}
+"""Coefficient alpha_ds2 of annex B.2 formula (B.11) by cement class [-]."""
+
+
+class ShrinkageModel:
+    """Shrinkage strain of one or many concrete cross-sections, NEN-EN 1992-1-1 art.3.1.4 (6), formulas (3.8) to (3.13).
+
+    Everything that does not depend on the age of the concrete (the coefficient :math:`k_h` of table 3.3, the nominal drying shrinkage
+    :math:`ε_{cd,0}` of annex B.2 and the autogenous shrinkage :math:`ε_{ca}(∞)`) is calculated once, when the model is created. The
+    shrinkage is then evaluated for complete arrays of ages at once.
+
+    The parameters are broadcast against each other, so arrays of parameters describe many cross-sections (for example the segments of a
+    bridge deck) with the shape of the broadcast parameters. Evaluating the model for ages with shape ``T`` gives shrinkage strains with
+    shape ``S + T``, with ``S`` the shape of the cross-sections (empty for a single cross-section).
+
+    Parameters
+    ----------
+    f_ck : MPA | npt.ArrayLike
+        [:math:`f_{ck}`] Characteristic compressive cylinder strength of concrete at 28 days [MPa].
+    cement_class : CementClass | str | npt.ArrayLike
+        The cement class, or the cement classes, as CementClass or as 'S', 'N' or 'R'.
+    h_0 : MM | npt.ArrayLike
+        [:math:`h_0`] Notional size of the cross-section [mm], see :meth:`from_cross_section`.
+    relative_humidity : PERCENTAGE | npt.ArrayLike
+        [:math:`RH`] Relative humidity of the ambient environment [%].
+    t_s : DAYS | npt.ArrayLike
+        [:math:`t_s`] Age of the concrete at the beginning of drying shrinkage (or swelling), normally the end of curing [days].
+
+    Raises
+    ------
+    ValueError
+        If a cement class is unknown, a notional size is zero or negative, a relative humidity is outside 0 to 100 % or an age at the
+        beginning of drying is negative.
+    """
+
+    def __init__(
+        self,
+        f_ck: MPA | npt.ArrayLike,
+        cement_class: CementClass | str | npt.ArrayLike,
+        h_0: MM | npt.ArrayLike,
+        relative_humidity: PERCENTAGE | npt.ArrayLike,
+        t_s: DAYS | npt.ArrayLike,
+    ) -> None:
+        alpha_ds_1, alpha_ds_2 = cement_class_coefficients(cement_class, _ALPHA_DS_1), cement_class_coefficients(cement_class, _ALPHA_DS_2)
+        values = (np.asarray(value, dtype=np.float64) for value in (f_ck, h_0, relative_humidity, t_s))
+        alpha_ds_1, alpha_ds_2, f_ck, h_0, relative_humidity, t_s = np.broadcast_arrays(alpha_ds_1, alpha_ds_2, *values)
+        if any_true(t_s < 0):
+            raise ValueError(f"Invalid t_s: {t_s}. t_s cannot be negative")
+        if any_true(h_0 <= 0):
+            raise ValueError(f"Invalid h_0: {h_0}. h_0 cannot be negative or zero")
+        if any_true((relative_humidity < 0) | (relative_humidity > 100)):
+            raise ValueError(f"Invalid relative_humidity: {relative_humidity}. relative_humidity must be between 0 and 100 %")
+
+        self.h_0 = h_0
+        self.t_s = t_s
+        self.k_h = np.interp(h_0, TABLE_3_3_H_0, TABLE_3_3_K_H)
+        """[:math:`k_h`] Coefficient depending on the notional size, table 3.3 (linearly interpolated) [-]."""
+        # annex B.2 uses the mean compressive strength f_cm = f_ck + 8 MPa
+        self.epsilon_cd_0 = _nominal_drying_shrinkage(f_ck + 8, alpha_ds_1, alpha_ds_2, relative_humidity)
+        """[:math:`ε_{cd,0}`] Nominal unrestrained drying shrinkage, annex B.2 formula (B.11) [-]."""
+        self.epsilon_ca_inf = Form3Dot12AutogeneShrinkageInfinity.evaluate_many(f_ck=f_ck)
+        """[:math:`ε_{ca}(∞)`] Autogenous shrinkage at infinity, formula (3.12) [-]."""
+        self.epsilon_cd_inf = self.k_h * self.epsilon_cd_0
+        """[:math:`k_h ε_{cd,0}`] Drying shrinkage at infinity, formula (3.9) with :math:`β_{ds}(∞, t_s) = 1` [-]."""
+        self._drying_time_constant = 0.04 * np.sqrt(h_0**3)
+
+    @classmethod
+    def from_cross_section(
+        cls: type[Self],
+        material: ConcreteMaterial,
+        a_c: MM2 | npt.ArrayLike,
+        u: MM | npt.ArrayLike,
+        relative_humidity: PERCENTAGE | npt.ArrayLike,
+        t_s: DAYS | npt.ArrayLike,
+    ) -> Self:
+        """Create the shrinkage model of cross-sections of a concrete material.
+
+        Parameters
+        ----------
+        material : ConcreteMaterial
+            The concrete material, which gives :math:`f_{ck}` and the cement class.
+        a_c : MM2 | npt.ArrayLike
+            [:math:`A_c`] Area of the cross-section of the concrete [mm²].
+        u : MM | npt.ArrayLike
+            [:math:`u`] Perimeter of the part of the cross-section that is exposed to drying [mm].
+        relative_humidity : PERCENTAGE | npt.ArrayLike
+            [:math:`RH`] Relative humidity of the ambient environment [%].
+        t_s : DAYS | npt.ArrayLike
+            [:math:`t_s`] Age of the concrete at the beginning of drying shrinkage (or swelling) [days].
+
+        Returns
+        -------
+        Self
+            The shrinkage model, with :math:`h_0 = 2 A_c / u`.
+        """
+        h_0 = SubForm3Dot10FictionalCrossSection.evaluate_many(a_c=a_c, u=u)
+        return cls(f_ck=material.f_ck, cement_class=material.cement_class, h_0=h_0, relative_humidity=relative_humidity, t_s=t_s)
+
+    def drying_shrinkage(self, t: DAYS | npt.ArrayLike) -> np.ndarray:
+        """[:math:`ε_{cd}(t)`] Drying shrinkage, formulas (3.9) and (3.10) [-].
+
+        The drying shrinkage is zero up to the beginning of drying :math:`t_s`.
+
+        Parameters
+        ----------
+        t : DAYS | npt.ArrayLike
+            [:math:`t`] The ages of the concrete [days], an array of any shape (or a single age).
+
+        Returns
+        -------
+        np.ndarray
+            The drying shrinkage, see :class:`ShrinkageModel` for its shape.
+
+        Raises
+        ------
+        ValueError
+            If an age is negative.
+        """
+        t = self._as_ages(t)
+        # beta_ds(t, t_s) = (t - t_s) / ((t - t_s) + 0.04 * sqrt(h_0 ** 3)) of formula (3.10), which does not allow ages up to t_s, so it is
+        # calculated here with zero up to t_s, in place as the arrays can be large
+        shape = self.t_s.shape + t.shape
+        elapsed = np.subtract(t, expand_for_times(self.t_s, t), out=np.empty(shape))
+        np.maximum(elapsed, 0.0, out=elapsed)
+        denominator = np.add(elapsed, expand_for_times(self._drying_time_constant, t), out=np.empty(shape))
+        elapsed /= denominator
+        elapsed *= expand_for_times(self.epsilon_cd_inf, t)
+        return elapsed
+
+    def autogenous_shrinkage(self, t: DAYS | npt.ArrayLike) -> np.ndarray:
+        """[:math:`ε_{ca}(t)`] Autogenous shrinkage, formulas (3.11) and (3.13) [-].
+
+        Parameters
+        ----------
+        t : DAYS | npt.ArrayLike
+            [:math:`t`] The ages of the concrete [days], an array of any shape (or a single age).
+
+        Returns
+        -------
+        np.ndarray
+            The autogenous shrinkage, see :class:`ShrinkageModel` for its shape.
+
+        Raises
+        ------
+        ValueError
+            If an age is negative.
+        """
+        t = self._as_ages(t)
+        beta_as = Form3Dot13CoefficientTimeAutogeneShrinkage.evaluate_many(t=t)
+        return np.multiply(beta_as, expand_for_times(self.epsilon_ca_inf, t))
+
+    def total_shrinkage(self, t: DAYS | npt.ArrayLike) -> np.ndarray:
+        """[:math:`ε_{cs}(t)`] Total shrinkage, formula (3.8) [-].
+
+        Parameters
+        ----------
+        t : DAYS | npt.ArrayLike
+            [:math:`t`] The ages of the concrete [days], an array of any shape (or a single age).
+
+        Returns
+        -------
+        np.ndarray
+            The total shrinkage, see :class:`ShrinkageModel` for its shape.
+
+        Raises
+        ------
+        ValueError
+            If an age is negative.
+        """
+        total = self.drying_shrinkage(t)
+        total += self.autogenous_shrinkage(t)
+        return total
+
+    @staticmethod
+    def _as_ages(t: DAYS | npt.ArrayLike) -> np.ndarray:
+        """Convert the ages to a float array, and validate them."""
+        t = np.asarray(t, dtype=np.float64)
+        if any_true(t < 0):
+            raise ValueError(f"Invalid t: {t}. t cannot be negative")
+        return t
+
+
+def _nominal_drying_shrinkage(f_cm: np.ndarray, alpha_ds_1: np.ndarray, alpha_ds_2: np.ndarray, relative_humidity: np.ndarray) -> np.ndarray:
+    """[:math:`ε_{cd,0}`] Nominal unrestrained drying shrinkage, annex B.2 formulas (B.11) and (B.12) [-]."""
+    beta_rh = 1.55 * (1 - (relative_humidity / 100) ** 3)
+    return 0.85 * (220 + 110 * alpha_ds_1) * np.exp(-alpha_ds_2 * f_cm / 10) * 1e-6 * beta_rh
@@ -0,0 +1,265 @@
+"""Module for the vectorized stress-strain diagrams of concrete in compression, according to art.3.1.5 and art.3.1.7 of NEN-EN 1992-1-1."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.materials.concrete import DiagramType
+from blueprints.materials.stress_strain import StressStrainDiagram, as_strain_array
+from blueprints.validations import raise_if_less_or_equal_to_zero
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from blueprints.materials.concrete import ConcreteMaterial
+    from blueprints.type_alias import DIMENSIONLESS, MPA
+
+PER_MILLE_TO_STRAIN = 1e-3
+"""Factor to convert the strains of ConcreteMaterial, in per mille, to dimensionless strains."""
+
+
+class ParabolaRectangleDiagram(StressStrainDiagram):
+    """Parabola-rectangle diagram for the design of cross-sections, NEN-EN 1992-1-1 art.3.1.7 (1), formulas (3.17) and (3.18).
+
+    Compressive strains and stresses are positive. Tensile strains, and strains beyond the ultimate strain (at which the concrete is
+    crushed), give no stress.
+
+    Parameters
+    ----------
+    f_c : MPA
+        [:math:`f_{cd}`] Compressive strength at the plateau of the diagram, usually the design value [MPa].
+    eps_c2 : DIMENSIONLESS
+        [:math:`ε_{c2}`] Strain at reaching the maximum strength [-].
+    eps_cu2 : DIMENSIONLESS
+        [:math:`ε_{cu2}`] Ultimate strain [-].
+    n : DIMENSIONLESS
+        [:math:`n`] Exponent of the parabola [-].
+    """
+
+    def __init__(self, f_c: MPA, eps_c2: DIMENSIONLESS, eps_cu2: DIMENSIONLESS, n: DIMENSIONLESS) -> None:
+        raise_if_less_or_equal_to_zero(f_c=f_c, eps_c2=eps_c2, eps_cu2=eps_cu2, n=n)
+        self.f_c = f_c
+        self.eps_c2 = eps_c2
+        self.eps_cu2 = eps_cu2
+        self.n = n
+        self._inverse_eps_c2 = 1 / eps_c2
+        self._initial_tangent = n * f_c / eps_c2
+
+    @classmethod
+    def from_material(cls: type[Self], material: ConcreteMaterial, f_c: MPA | None = None) -> Self:
+        """Create the diagram of a concrete material, with the strains and exponent of table 3.1.
+
+        Parameters
+        ----------
+        material : ConcreteMaterial
+            The concrete material.
+        f_c : MPA | None, default None
+            The compressive strength at the plateau [MPa]. Defaults to the design value :math:`f_{cd}` of the material.
+
+        Returns
+        -------
+        Self
+            The diagram.
+        """
+        return cls(
+            f_c=material.f_cd if f_c is None else f_c,
+            eps_c2=material.eps_c2 * PER_MILLE_TO_STRAIN,
+            eps_cu2=material.eps_cu2 * PER_MILLE_TO_STRAIN,
+            n=material.n_factor,
+        )
+
+    def stress(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the stress for an array of strains, see :meth:`StressStrainDiagram.stress`."""
+        strain = as_strain_array(strain)
+        # 1 - strain / eps_c2, clipped to 1 for tension (no stress) and to 0 at the plateau (full stress)
+        remainder = np.multiply(strain, -self._inverse_eps_c2, out=np.empty_like(strain))
+        remainder += 1.0
+        np.clip(remainder, 0.0, 1.0, out=remainder)
+        stress = np.power(remainder, self.n, out=remainder)
+        np.subtract(1.0, stress, out=stress)
+        stress *= self.f_c
+        stress[strain > self.eps_cu2] = 0.0
+        return stress
+
+    def tangent(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the tangent modulus for an array of strains, see :meth:`StressStrainDiagram.tangent`."""
+        strain = as_strain_array(strain)
+        remainder = np.multiply(strain, -self._inverse_eps_c2, out=np.empty_like(strain))
+        remainder += 1.0
+        np.clip(remainder, 0.0, 1.0, out=remainder)
+        tangent = np.power(remainder, self.n - 1, out=remainder)
+        tangent *= self._initial_tangent
+        tangent[(strain < 0) | (strain > self.eps_cu2)] = 0.0
+        return tangent
+
+
+class BilinearDiagram(StressStrainDiagram):
+    """Bi-linear diagram for the design of cross-sections, NEN-EN 1992-1-1 art.3.1.7 (2), figure 3.4.
+
+    Compressive strains and stresses are positive. Tensile strains, and strains beyond the ultimate strain (at which the concrete is
+    crushed), give no stress.
+
+    Parameters
+    ----------
+    f_c : MPA
+        [:math:`f_{cd}`] Compressive strength at the plateau of the diagram, usually the design value [MPa].
+    eps_c3 : DIMENSIONLESS
+        [:math:`ε_{c3}`] Strain at reaching the maximum strength [-].
+    eps_cu3 : DIMENSIONLESS
+        [:math:`ε_{cu3}`] Ultimate strain [-].
+    """
+
+    def __init__(self, f_c: MPA, eps_c3: DIMENSIONLESS, eps_cu3: DIMENSIONLESS) -> None:
+        raise_if_less_or_equal_to_zero(f_c=f_c, eps_c3=eps_c3, eps_cu3=eps_cu3)
+        self.f_c = f_c
+        self.eps_c3 = eps_c3
+        self.eps_cu3 = eps_cu3
+        self._modulus = f_c / eps_c3
+
+    @classmethod
+    def from_material(cls: type[Self], material: ConcreteMaterial, f_c: MPA | None = None) -> Self:
+        """Create the diagram of a concrete material, with the strains of table 3.1.
+
+        Parameters
+        ----------
+        material : ConcreteMaterial
+            The concrete material.
+        f_c : MPA | None, default None
+            The compressive strength at the plateau [MPa]. Defaults to the design value :math:`f_{cd}` of the material.
+
+        Returns
+        -------
+        Self
+            The diagram.
+        """
+        return cls(
+            f_c=material.f_cd if f_c is None else f_c,
+            eps_c3=material.eps_c3 * PER_MILLE_TO_STRAIN,
+            eps_cu3=material.eps_cu3 * PER_MILLE_TO_STRAIN,
+        )
+
+    def stress(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the stress for an array of strains, see :meth:`StressStrainDiagram.stress`."""
+        strain = as_strain_array(strain)
+        stress = np.clip(strain, 0.0, self.eps_c3, out=np.empty_like(strain))
+        stress *= self._modulus
+        stress[strain > self.eps_cu3] = 0.0
+        return stress
+
+    def tangent(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the tangent modulus for an array of strains, see :meth:`StressStrainDiagram.tangent`."""
+        strain = as_strain_array(strain)
+        return np.where((strain >= 0) & (strain < self.eps_c3), self._modulus, 0.0)
+
+
+class SarginDiagram(StressStrainDiagram):
+    """Diagram for non-linear structural analysis, NEN-EN 1992-1-1 art.3.1.5 (1), formula (3.14).
+
+    Compressive strains and stresses are positive. Tensile strains, and strains beyond the nominal ultimate strain (at which the concrete is
+    crushed), give no stress.
+
+    Parameters
+    ----------
+    f_cm : MPA
+        [:math:`f_{cm}`] Mean compressive strength [MPa].
+    e_cm : MPA
+        [:math:`E_{cm}`] Secant modulus of elasticity [MPa].
+    eps_c1 : DIMENSIONLESS
+        [:math:`ε_{c1}`] Strain at the peak stress [-].
+    eps_cu1 : DIMENSIONLESS
+        [:math:`ε_{cu1}`] Nominal ultimate strain [-].
+    """
+
+    def __init__(self, f_cm: MPA, e_cm: MPA, eps_c1: DIMENSIONLESS, eps_cu1: DIMENSIONLESS) -> None:
+        raise_if_less_or_equal_to_zero(f_cm=f_cm, e_cm=e_cm, eps_c1=eps_c1, eps_cu1=eps_cu1)
+        self.f_cm = f_cm
+        self.e_cm = e_cm
+        self.eps_c1 = eps_c1
+        self.eps_cu1 = eps_cu1
+        self.k = 1.05 * e_cm * eps_c1 / f_cm
+        """[:math:`k`] Factor of formula (3.14) [-]."""
+        self._inverse_eps_c1 = 1 / eps_c1
+
+    @classmethod
+    def from_material(cls: type[Self], material: ConcreteMaterial) -> Self:
+        """Create the diagram of a concrete material, with the mean strength, modulus of elasticity and strains of table 3.1.
+
+        Parameters
+        ----------
+        material : ConcreteMaterial
+            The concrete material.
+
+        Returns
+        -------
+        Self
+            The diagram.
+        """
+        return cls(
+            f_cm=material.f_cm,
+            e_cm=material.e_cm,
+            eps_c1=material.eps_c1 * PER_MILLE_TO_STRAIN,
+            eps_cu1=material.eps_cu1 * PER_MILLE_TO_STRAIN,
+        )
+
+    def stress(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the stress for an array of strains, see :meth:`StressStrainDiagram.stress`."""
+        strain = as_strain_array(strain)
+        eta = np.multiply(strain, self._inverse_eps_c1, out=np.empty_like(strain))
+        # sigma_c / f_cm = (k * eta - eta ** 2) / (1 + (k - 2) * eta)
+        denominator = np.multiply(eta, self.k - 2, out=np.empty_like(strain))
+        denominator += 1.0
+        stress = np.subtract(self.k, eta, out=np.empty_like(strain))
+        stress *= eta
+        stress /= denominator
+        stress *= self.f_cm
+        stress[(strain < 0) | (strain > self.eps_cu1)] = 0.0
+        return stress
+
+    def tangent(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the tangent modulus for an array of strains, see :meth:`StressStrainDiagram.tangent`."""
+        strain = as_strain_array(strain)
+        eta = np.multiply(strain, self._inverse_eps_c1, out=np.empty_like(strain))
+        # d(sigma_c) / d(eps_c) = f_cm / eps_c1 * (k - 2 * eta - (k - 2) * eta ** 2) / (1 + (k - 2) * eta) ** 2
+        denominator = np.multiply(eta, self.k - 2, out=np.empty_like(strain))
+        denominator += 1.0
+        np.square(denominator, out=denominator)
+        tangent = np.multiply(eta, 2 - self.k, out=np.empty_like(strain))
+        tangent -= 2.0
+        tangent *= eta
+        tangent += self.k
+        tangent /= denominator
+        tangent *= self.f_cm * self._inverse_eps_c1
+        tangent[(strain < 0) | (strain > self.eps_cu1)] = 0.0
+        return tangent
+
+
+def design_diagram(material: ConcreteMaterial, f_c: MPA | None = None) -> ParabolaRectangleDiagram | BilinearDiagram:
+    """Create the diagram for the design of cross-sections of a concrete material, of the type of its ``diagram_type``.
+
+    Parameters
+    ----------
+    material : ConcreteMaterial
+        The concrete material.
+    f_c : MPA | None, default None
+        The compressive strength at the plateau [MPa]. Defaults to the design value :math:`f_{cd}` of the material.
+
+    Returns
+    -------
+    ParabolaRectangleDiagram | BilinearDiagram
+        The parabola-rectangle diagram for a parabolic diagram type, or the bi-linear diagram for a bi-linear diagram type.
+
+    Raises
+    ------
+    ValueError
+        If the diagram type of the material is user defined.
+    """
+    match material.diagram_type:
+        case DiagramType.PARABOLIC:
+            return ParabolaRectangleDiagram.from_material(material, f_c=f_c)
+        case DiagramType.BILINEAR:
+            return BilinearDiagram.from_material(material, f_c=f_c)
+        case _:
+            raise ValueError(f"No design diagram available for diagram type '{material.diagram_type.value}'.")
@@ -0,0 +1,114 @@
+"""Module for the development of the properties of concrete materials in time, according to art.3.1.2 and art.3.1.3 of NEN-EN 1992-1-1."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_1 import Form3Dot1EstimationConcreteCompressiveStrength
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_2 import (
+    Form3Dot2CoefficientDependentOfConcreteAge,
+    SubForm3Dot2CoefficientTypeOfCementS,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_4 import (
+    Form3Dot4DevelopmentTensileStrength,
+    SubForm3Dot4CoefficientAgeConcreteAlpha,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_5 import (
+    Form3Dot5ApproximationVarianceElasticModulusOverTime,
+)
+from blueprints.materials.concrete import CementClass, ConcreteMaterial, concrete_class_properties
+
+_CEMENT_INDEX = {cement_class: index for index, cement_class in enumerate(CementClass)}
+"""Row of every cement class in the development coefficients."""
+
+_COEFFICIENT_S = SubForm3Dot2CoefficientTypeOfCementS.evaluate_many(np.array([cement_class.value for cement_class in CementClass]))
+"""[:math:`s`] Coefficient of formula (3.2) of every cement class [-]."""
+
+
+class ConcreteTimeHistory(NamedTuple):
+    """Development of the mean compressive strength, mean tensile strength and modulus of elasticity of concrete materials in time.
+
+    For a single material the properties have the shape of ``t``, for a sequence of materials they have an extra first axis with a row per
+    material.
+
+    Attributes
+    ----------
+    t : np.ndarray
+        [:math:`t`] Age of the concrete [days].
+    f_cm : np.ndarray
+        [:math:`f_{cm}(t)`] Mean compressive strength at the age t, formula (3.1) [MPa].
+    f_ctm : np.ndarray
+        [:math:`f_{ctm}(t)`] Mean tensile strength at the age t, formula (3.4) [MPa].
+    e_cm : np.ndarray
+        [:math:`E_{cm}(t)`] Modulus of elasticity at the age t, formula (3.5) [MPa].
+    """
+
+    t: np.ndarray
+    f_cm: np.ndarray
+    f_ctm: np.ndarray
+    e_cm: np.ndarray
+
+
+def concrete_time_history(materials: ConcreteMaterial | Iterable[ConcreteMaterial], t: npt.ArrayLike) -> ConcreteTimeHistory:
+    """Calculate the development of the properties of one or many concrete materials for all ages at once.
+
+    The coefficients :math:`β_{cc}(t)`, :math:`β_{cc}(t)^α` and :math:`β_{cc}(t)^{0.3}` only depend on the cement class and the age, so
+    they are calculated once per cement class with the formulas (3.1) to (3.5). The properties of every material are these coefficients
+    times its 28-day values of table 3.1.
+
+    Examples
+    --------
+    >>> history = concrete_time_history(ConcreteMaterial(ConcreteStrengthClass.C30_37), t=[3, 7, 28])
+    >>> history.f_cm
+    array([22.73313482, 29.59442976, 38.        ])
+
+    Parameters
+    ----------
+    materials : ConcreteMaterial | Iterable[ConcreteMaterial]
+        The concrete material, or the concrete materials.
+    t : npt.ArrayLike
+        [:math:`t`] The ages of the concrete [days], an array of any shape (or a single age).
+
+    Returns
+    -------
+    ConcreteTimeHistory
+        The properties at every age, see :class:`ConcreteTimeHistory` for their shape.
+
+    Raises
+    ------
+    ValueError
+        If an age is negative or zero.
+    """
+    if isinstance(materials, ConcreteMaterial):
+        history = concrete_time_history([materials], t)
+        return history._replace(f_cm=history.f_cm[0], f_ctm=history.f_ctm[0], e_cm=history.e_cm[0])
+    materials = list(materials)
+    t = np.asarray(t, dtype=np.float64)
+
+    cement_rows = np.fromiter((_CEMENT_INDEX[material.cement_class] for material in materials), dtype=np.intp, count=len(materials))
+    used_rows, material_rows = np.unique(cement_rows, return_inverse=True)
+    coefficient_s = _COEFFICIENT_S[used_rows].reshape(-1, *(1,) * t.ndim)
+
+    # the formulas are linear in the 28-day properties, so they are evaluated once per cement class for unit properties
+    beta_cc_t = Form3Dot2CoefficientDependentOfConcreteAge.evaluate_many(s=coefficient_s, t=t)
+    alpha = SubForm3Dot4CoefficientAgeConcreteAlpha.evaluate_many(t=t)
+    compressive = Form3Dot1EstimationConcreteCompressiveStrength.evaluate_many(beta_cc_t=beta_cc_t, f_cm=1.0)
+    tensile = Form3Dot4DevelopmentTensileStrength.evaluate_many(beta_cc_t=beta_cc_t, alpha=alpha, f_ctm=1.0)
+    stiffness = Form3Dot5ApproximationVarianceElasticModulusOverTime.evaluate_many(f_cm_t=beta_cc_t, f_cm=1.0, e_cm=1.0)
+
+    properties = [concrete_class_properties(material.concrete_class) for material in materials]
+    shape = (len(materials), *(1,) * t.ndim)
+    f_cm = np.fromiter((row.f_cm for row in properties), dtype=np.float64, count=len(properties)).reshape(shape)
+    f_ctm = np.fromiter((row.f_ctm for row in properties), dtype=np.float64, count=len(properties)).reshape(shape)
+    e_cm = np.fromiter((row.e_cm for row in properties), dtype=np.float64, count=len(properties)).reshape(shape)
+
+    return ConcreteTimeHistory(
+        t=t,
+        f_cm=np.multiply(compressive[material_rows], f_cm),
+        f_ctm=np.multiply(tensile[material_rows], f_ctm),
+        e_cm=np.multiply(stiffness[material_rows], e_cm),
+    )
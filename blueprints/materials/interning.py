@@ -0,0 +1,79 @@
+"""Module for the interning of frozen material dataclasses, so that equal materials share a single instance."""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class InternedMaterial:
+    """Mixin for frozen material dataclasses, which adds the interning factory :meth:`get`.
+
+    Large models often create an identical material per element or per reinforcement bar. :meth:`get` returns one shared (canonical)
+    instance for all materials with the same field values, so these models only keep one instance per material in memory and interned
+    materials can be compared, or used as the key of a cache, by identity.
+
+    The interned instances are held by weak references: an instance is evicted as soon as it is no longer used.
+
+    Examples
+    --------
+    >>> ConcreteMaterial.get(ConcreteStrengthClass.C30_37) is ConcreteMaterial.get(concrete_class=ConcreteStrengthClass.C30_37)
+    True
+    """
+
+    _instances: ClassVar[weakref.WeakValueDictionary[tuple, Any]]
+    """Canonical instances of the class, by the values of all their fields."""
+    _calls: ClassVar[weakref.WeakValueDictionary[tuple, Any]]
+    """Canonical instances of the class, by the arguments of the calls of :meth:`get` that returned them."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Give every material class its own registry of interned instances."""
+        super().__init_subclass__(**kwargs)
+        cls._instances = weakref.WeakValueDictionary()
+        cls._calls = weakref.WeakValueDictionary()
+
+    @classmethod
+    def get(cls: type[Self], *args, **kwargs) -> Self:
+        """Return the shared instance of the material with the given field values.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments of the material.
+        **kwargs
+            Keyword arguments of the material.
+
+        Returns
+        -------
+        Self
+            The canonical instance, which is identical for all calls with equal field values.
+        """
+        # repeated calls with the same arguments skip the creation of the material
+        call = (args, tuple(kwargs.items()))
+        material = cls._calls.get(call)
+        if material is None:
+            material = cls.intern(cls(*args, **kwargs))
+            cls._calls[call] = material
+        return material
+
+    @classmethod
+    def intern(cls: type[Self], material: Self) -> Self:
+        """Return the shared instance of a material, which is the material itself if no equal material was interned before.
+
+        Parameters
+        ----------
+        material : Self
+            The material.
+
+        Returns
+        -------
+        Self
+            The canonical instance of the material.
+        """
+        # all fields are part of the key, including the fields that are excluded from the comparison (such as a custom name)
+        key = (type(material), *(getattr(material, field.name) for field in fields(material)))  # type: ignore[arg-type]
+        return cls._instances.setdefault(key, material)
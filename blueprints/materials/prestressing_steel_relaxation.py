@@ -0,0 +1,204 @@
+"""Module for the relaxation losses of prestressing steel in time, according to art.3.3.2 and art.10.3.2.2 of NEN-EN 1992-1-1."""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_28 import Form3Dot28RatioLossOfPreStressClass1
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_29 import Form3Dot29RatioLossOfPreStressClass2
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_30 import Form3Dot30RatioLossOfPreStressClass3
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.sub_formula_3_28_29_30 import SubForm3Dot282930Mu
+from blueprints.materials._broadcasting import expand_for_times
+from blueprints.validations import any_true
+
+if TYPE_CHECKING:
+    from blueprints.codes.formula import Formula
+    from blueprints.type_alias import HOURS, MPA, PERCENTAGE
+
+LONG_TERM_HOURS = 500_000.0
+"""[:math:`t`] Time after prestressing for the long term (final) relaxation losses, art.3.3.2 (8) [hours]."""
+
+
+class RelaxationClass(Enum):
+    """Enumeration of the relaxation classes of prestressing steel according to NEN-EN 1992-1-1 art.3.3.2 (4)."""
+
+    CLASS_1 = "Class 1"
+    """Wire or strand, ordinary relaxation."""
+    CLASS_2 = "Class 2"
+    """Wire or strand, low relaxation."""
+    CLASS_3 = "Class 3"
+    """Hot rolled and processed bars."""
+
+
+_RELAXATION_FORMULAS: dict[RelaxationClass, type[Formula]] = {
+    RelaxationClass.CLASS_1: Form3Dot28RatioLossOfPreStressClass1,
+    RelaxationClass.CLASS_2: Form3Dot29RatioLossOfPreStressClass2,
+    RelaxationClass.CLASS_3: Form3Dot30RatioLossOfPreStressClass3,
+}
+"""Formula (3.28), (3.29) or (3.30) of every relaxation class."""
+
+RECOMMENDED_RHO_1000: dict[RelaxationClass, PERCENTAGE] = {
+    RelaxationClass.CLASS_1: 8.0,
+    RelaxationClass.CLASS_2: 2.5,
+    RelaxationClass.CLASS_3: 4.0,
+}
+"""[:math:`rho_{1000}`] Relaxation loss at 1000 hours of every relaxation class, when no certificate is available, art.3.3.2 (6) [%]."""
+
+
+class RelaxationModel:
+    """Relaxation losses of one or many tendons of one relaxation class, NEN-EN 1992-1-1 art.3.3.2 (7), formulas (3.28) to (3.30).
+
+    The ratio :math:`μ = σ_{pi} / f_{pk}`, the factor :math:`ρ_{1000} e^{bμ} 10^{-5}` and the exponent :math:`0.75 (1 - μ)` of every tendon
+    are calculated once, when the model is created. The losses are then evaluated for complete arrays of times at once.
+
+    The parameters are broadcast against each other, so arrays of parameters describe many tendons (for example every strand of every
+    precast element) with the shape of the broadcast parameters. Evaluating the model for times with shape ``T`` gives losses with shape
+    ``S + T``, with ``S`` the shape of the tendons (empty for a single tendon).
+
+    Parameters
+    ----------
+    relaxation_class : RelaxationClass
+        The relaxation class of the tendons.
+    sigma_pi : MPA | npt.ArrayLike
+        [:math:`σ_{pi}`] Initial prestress, the stress directly after tensioning or transfer [MPa].
+    f_pk : MPA | npt.ArrayLike
+        [:math:`f_{pk}`] Characteristic tensile strength of the prestressing steel [MPa].
+    rho_1000 : PERCENTAGE | npt.ArrayLike | None, default None
+        [:math:`ρ_{1000}`] Relaxation loss at 1000 hours after tensioning at an average temperature of 20 °C [%]. Defaults to the
+        recommended value of the relaxation class, see :data:`RECOMMENDED_RHO_1000`.
+    t_eq : HOURS | npt.ArrayLike, default 0
+        [:math:`t_{eq}`] Equivalent time of a heat treatment, which is added to the time after tensioning [hours], see
+        :func:`equivalent_time`.
+
+    Raises
+    ------
+    ValueError
+        If a characteristic tensile strength, relaxation loss at 1000 hours or equivalent time is negative.
+    """
+
+    def __init__(
+        self,
+        relaxation_class: RelaxationClass,
+        sigma_pi: MPA | npt.ArrayLike,
+        f_pk: MPA | npt.ArrayLike,
+        rho_1000: PERCENTAGE | npt.ArrayLike | None = None,
+        t_eq: HOURS | npt.ArrayLike = 0.0,
+    ) -> None:
+        if rho_1000 is None:
+            rho_1000 = RECOMMENDED_RHO_1000[relaxation_class]
+        values = (np.asarray(value, dtype=np.float64) for value in (sigma_pi, f_pk, rho_1000, t_eq))
+        sigma_pi, f_pk, rho_1000, t_eq = np.broadcast_arrays(*values)
+        if any_true(t_eq < 0):
+            raise ValueError(f"Invalid t_eq: {t_eq}. t_eq cannot be negative")
+
+        self.relaxation_class = relaxation_class
+        self.sigma_pi = sigma_pi
+        self.rho_1000 = rho_1000
+        self.t_eq = t_eq
+        self.mu = SubForm3Dot282930Mu.evaluate_many(sigma_pi=sigma_pi, f_pk=f_pk)
+        """[:math:`mu`] Ratio between the initial prestress and the characteristic tensile strength [-]."""
+        # at t = 1000 hours the time factor of the formulas is one, which leaves the factor of every tendon
+        self._factor = _RELAXATION_FORMULAS[relaxation_class].evaluate_many(rho_1000=rho_1000, mu=self.mu, t=1000.0)
+        self._exponent = 0.75 * (1 - self.mu)
+
+    def loss_ratio(self, t: HOURS | npt.ArrayLike) -> np.ndarray:
+        """[:math:`Δσ_{pr} / σ_{pi}`] Ratio between the relaxation loss and the initial prestress, formulas (3.28) to (3.30) [-].
+
+        Parameters
+        ----------
+        t : HOURS | npt.ArrayLike
+            [:math:`t`] The times after tensioning [hours], an array of any shape (or a single time). The equivalent time of the heat
+            treatment is added to these times.
+
+        Returns
+        -------
+        np.ndarray
+            The ratio of the losses, see :class:`RelaxationModel` for its shape.
+
+        Raises
+        ------
+        ValueError
+            If a time is negative.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        if any_true(t < 0):
+            raise ValueError(f"Invalid t: {t}. t cannot be negative")
+        # (factor) * ((t + t_eq) / 1000) ** (0.75 * (1 - mu)), calculated in place as the arrays can be large
+        ratio = np.add(t, expand_for_times(self.t_eq, t), out=np.empty(self.mu.shape + t.shape))
+        ratio /= 1000.0
+        np.power(ratio, expand_for_times(self._exponent, t), out=ratio)
+        ratio *= expand_for_times(self._factor, t)
+        return ratio
+
+    def loss(self, t: HOURS | npt.ArrayLike) -> np.ndarray:
+        """[:math:`Δσ_{pr}`] Relaxation loss of the prestress [MPa].
+
+        Parameters
+        ----------
+        t : HOURS | npt.ArrayLike
+            [:math:`t`] The times after tensioning [hours], an array of any shape (or a single time).
+
+        Returns
+        -------
+        np.ndarray
+            The losses, see :class:`RelaxationModel` for their shape.
+
+        Raises
+        ------
+        ValueError
+            If a time is negative.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        loss = self.loss_ratio(t)
+        loss *= expand_for_times(self.sigma_pi, t)
+        return loss
+
+    def final_loss(self) -> np.ndarray:
+        """[:math:`Δσ_{pr}`] Long term relaxation loss of the prestress, at :data:`LONG_TERM_HOURS` after tensioning, art.3.3.2 (8) [MPa].
+
+        Returns
+        -------
+        np.ndarray
+            The long term losses, with the shape of the tendons.
+        """
+        return self.loss(LONG_TERM_HOURS)
+
+
+def equivalent_time(temperatures: npt.ArrayLike, durations: HOURS | npt.ArrayLike) -> np.ndarray:
+    """[:math:`t_{eq}`] Equivalent time of a heat treatment for the relaxation losses, NEN-EN 1992-1-1 art.10.3.2.2, formula (10.2) [hours].
+
+    :math:`t_{eq} = 1.14^{T_{max} - 20} / (T_{max} - 20) Σ (T_{(Δt_i)} - 20) Δt_i`
+
+    The last axis of the temperatures holds the time intervals of a heat treatment, the other axes describe many heat treatments (for example
+    one per production cycle). A heat treatment with a maximum temperature of 20 °C or less has no equivalent time.
+
+    Parameters
+    ----------
+    temperatures : npt.ArrayLike
+        [:math:`T_{(Δt_i)}`] Temperature during every time interval [°C].
+    durations : HOURS | npt.ArrayLike
+        [:math:`Δt_i`] Duration of every time interval [hours], broadcast against the temperatures.
+
+    Returns
+    -------
+    np.ndarray
+        The equivalent times, with the shape of the temperatures without the last axis.
+
+    Raises
+    ------
+    ValueError
+        If a duration is negative.
+    """
+    temperatures, durations = np.broadcast_arrays(np.asarray(temperatures, dtype=np.float64), np.asarray(durations, dtype=np.float64))
+    if any_true(durations < 0):
+        raise ValueError(f"Invalid durations: {durations}. durations cannot be negative")
+    excess = temperatures - 20
+    max_excess = np.max(excess, axis=-1)
+    heated = max_excess > 0
+    # the quotient 1.14 ** x / x is only evaluated for heat treatments above 20 degrees Celsius, to avoid a division by zero
+    factor = np.divide(np.power(1.14, max_excess), max_excess, out=np.zeros_like(max_excess), where=heated)
+    return np.where(heated, factor * np.sum(excess * durations, axis=-1), 0.0)
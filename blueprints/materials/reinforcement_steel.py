@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from blueprints.materials.constants import STEEL_YOUNG_MODULUS
+from blueprints.materials.interning import InternedMaterial
 from blueprints.type_alias import DIMENSIONLESS, KG_M3, MPA, PER_MILLE
 
 
@@ -63,7 +64,7 @@ class ReinforcementDiagramType(Enum):
 
 
 @dataclass(frozen=True)
-class ReinforcementSteelMaterial:
+class ReinforcementSteelMaterial(InternedMaterial):
     """Representation of the properties of reinforcement steel suitable for use with NEN-EN 1992-1-1.
 
     Based on the analytical relations shown on table C.1 Annex C.
@@ -86,6 +87,8 @@ class ReinforcementSteelMaterial:
         User-defined name of the material (default= name of steel quality; example: 'B500B')
     custom_e_s: MPA
         User-defined Young's modulus of the material, if not provided the default value is used (default=200000)
+    material_factor: DIMENSIONLESS
+        [:math:`γ_s`] Partial factor for reinforcing steel (default=1.15)
 
     """
 
@@ -97,6 +100,7 @@ class ReinforcementSteelMaterial:
     diagram_type: ReinforcementDiagramType = field(default=ReinforcementDiagramType.BILINEAR_NOT_INCLINED)
     custom_name: str | None = field(default=None, compare=False)
     custom_e_s: MPA | None = field(default=None, metadata={"unit": "MPa"})
+    material_factor: DIMENSIONLESS = field(default=1.15)
 
     @property
     def name(self) -> str:
@@ -135,6 +139,17 @@ class ReinforcementSteelMaterial:
         """
         return float(self.steel_quality.value[1:-1])
 
+    @property
+    def f_yd(self) -> MPA:
+        """[:math:`f_yd`] Design yield strength of reinforcement (NEN-EN 1992-1-1 art.3.2.7 (2)) [MPa].
+
+        Returns
+        -------
+        MPA
+            Example: 434.78 (for B500B)
+        """
+        return self.f_yk / self.material_factor
+
     @property
     def steel_class(self) -> str:
         """Reinforcement class.
@@ -184,21 +199,21 @@ class ReinforcementSteelMaterial:
     def eps_uk(self) -> PER_MILLE:
         """[:math:`ε_uk`] Characteristic strain of reinforcement at maximum load [‰ (per mille)] (tabel C.1 Annex C from NEN-EN 1992-1-1).
 
-        * 250 ‰ for steel class A
-        * 500 ‰ for steel class B
-        * 750 ‰ for steel class C
+        * 25 ‰ for steel class A
+        * 50 ‰ for steel class B
+        * 75 ‰ for steel class C
 
         Returns
         -------
         PER_MILLE
-            Example: 500 (for B500B)
+            Example: 50 (for B500B)
         """
         match self.steel_class.lower():
             case "a":
-                return 250
+                return 25
             case "b":
-                return 500
+                return 50
             case "c":
-                return 750
+                return 75
             case _:
                 raise ValueError(f"Unknown steel class: {self.steel_class}")
@@ -0,0 +1,142 @@
+"""Module for the vectorized stress-strain diagrams of reinforcement steel, according to art.3.2.7 of NEN-EN 1992-1-1."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.materials.reinforcement_steel import ReinforcementDiagramType
+from blueprints.materials.stress_strain import StressStrainDiagram, as_strain_array
+from blueprints.validations import raise_if_less_or_equal_to_zero, raise_if_negative
+
+if TYPE_CHECKING:
+    from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+    from blueprints.type_alias import DIMENSIONLESS, MPA
+
+PER_MILLE_TO_STRAIN = 1e-3
+"""Factor to convert the strains of ReinforcementSteelMaterial, in per mille, to dimensionless strains."""
+
+RECOMMENDED_EPS_UD_FACTOR = 0.9
+"""Recommended ratio of the design strain limit :math:`ε_{ud}` to :math:`ε_{uk}`, NEN-EN 1992-1-1 art.3.2.7 (2) note 1 [-]."""
+
+
+class BilinearSteelDiagram(StressStrainDiagram):
+    """Bi-linear diagram of reinforcement steel, NEN-EN 1992-1-1 art.3.2.7, figure 3.8.
+
+    The diagram is linear elastic up to the yield strength, followed by a (possibly inclined) top branch, and is the same in tension and
+    compression. Strains beyond the strain limit, at which the reinforcement ruptures, give no stress.
+
+    Parameters
+    ----------
+    e_s : MPA
+        [:math:`E_s`] Modulus of elasticity [MPa].
+    f_y : MPA
+        [:math:`f_{yd}`] Yield strength, the characteristic or the design value [MPa].
+    e_h : MPA, default 0.0
+        Modulus of the top branch [MPa], 0 for a horizontal top branch.
+    eps_u : DIMENSIONLESS, default math.inf
+        [:math:`ε_{ud}`] Strain limit [-], infinite for a top branch without strain limit.
+    """
+
+    def __init__(self, e_s: MPA, f_y: MPA, e_h: MPA = 0.0, eps_u: DIMENSIONLESS = math.inf) -> None:
+        raise_if_less_or_equal_to_zero(e_s=e_s, f_y=f_y)
+        raise_if_negative(e_h=e_h)
+        self.e_s = e_s
+        self.f_y = f_y
+        self.e_h = e_h
+        self.eps_y = f_y / e_s
+        """[:math:`ε_{yd}`] Yield strain [-]."""
+        if eps_u <= self.eps_y:
+            raise ValueError(f"The strain limit eps_u ({eps_u}) must be greater than the yield strain eps_y ({self.eps_y}).")
+        if e_h >= e_s:
+            raise ValueError(f"The modulus of the top branch e_h ({e_h}) must be smaller than the modulus of elasticity e_s ({e_s}).")
+        self.eps_u = eps_u
+        self._top_branch_offset = f_y - e_h * self.eps_y
+
+    def stress(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the stress for an array of strains, see :meth:`StressStrainDiagram.stress`."""
+        strain = as_strain_array(strain)
+        magnitude = np.abs(strain, out=np.empty_like(strain))
+        # the elastic branch and the top branch intersect at the yield strain, so the stress is the smallest of both
+        stress = np.multiply(magnitude, self.e_h, out=np.empty_like(strain))
+        stress += self._top_branch_offset
+        np.minimum(stress, magnitude * self.e_s, out=stress)
+        np.copysign(stress, strain, out=stress)
+        stress[magnitude > self.eps_u] = 0.0
+        return stress
+
+    def tangent(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the tangent modulus for an array of strains, see :meth:`StressStrainDiagram.tangent`."""
+        strain = as_strain_array(strain)
+        magnitude = np.abs(strain, out=np.empty_like(strain))
+        tangent = np.where(magnitude < self.eps_y, self.e_s, self.e_h)
+        tangent[magnitude > self.eps_u] = 0.0
+        return tangent
+
+
+def characteristic_diagram(material: ReinforcementSteelMaterial) -> BilinearSteelDiagram:
+    """Create the characteristic diagram of a reinforcement steel material, of the type of its ``diagram_type``.
+
+    With an inclined top branch, the stress rises from :math:`f_{yk}` to :math:`k f_{yk}` at the strain limit :math:`ε_{uk}`. With a
+    horizontal top branch, the stress is limited to :math:`f_{yk}` without a strain limit.
+
+    Parameters
+    ----------
+    material : ReinforcementSteelMaterial
+        The reinforcement steel material.
+
+    Returns
+    -------
+    BilinearSteelDiagram
+        The characteristic diagram.
+
+    Raises
+    ------
+    ValueError
+        If the diagram type of the material is user defined.
+    """
+    return _bilinear_diagram(material=material, f_y=material.f_yk, eps_u_factor=1.0)
+
+
+def design_diagram(material: ReinforcementSteelMaterial, eps_ud_factor: DIMENSIONLESS = RECOMMENDED_EPS_UD_FACTOR) -> BilinearSteelDiagram:
+    """Create the design diagram of a reinforcement steel material, of the type of its ``diagram_type``, NEN-EN 1992-1-1 art.3.2.7 (2).
+
+    The design yield strength is :math:`f_{yd} = f_{yk} / γ_s`, with :math:`γ_s` the ``material_factor`` of the material. With an inclined
+    top branch, the stress rises to :math:`k f_{yk} / γ_s` at :math:`ε_{uk}`, and the strain is limited to :math:`ε_{ud}`, ``eps_ud_factor``
+    times :math:`ε_{uk}`. With a horizontal top branch, the stress is limited to :math:`f_{yd}` without a strain limit.
+
+    Parameters
+    ----------
+    material : ReinforcementSteelMaterial
+        The reinforcement steel material.
+    eps_ud_factor : DIMENSIONLESS, default RECOMMENDED_EPS_UD_FACTOR
+        Ratio of the design strain limit :math:`ε_{ud}` to :math:`ε_{uk}` [-].
+
+    Returns
+    -------
+    BilinearSteelDiagram
+        The design diagram.
+
+    Raises
+    ------
+    ValueError
+        If the diagram type of the material is user defined.
+    """
+    raise_if_less_or_equal_to_zero(eps_ud_factor=eps_ud_factor)
+    return _bilinear_diagram(material=material, f_y=material.f_yd, eps_u_factor=eps_ud_factor)
+
+
+def _bilinear_diagram(material: ReinforcementSteelMaterial, f_y: MPA, eps_u_factor: DIMENSIONLESS) -> BilinearSteelDiagram:
+    """Create the bi-linear diagram of a reinforcement steel material, with yield strength ``f_y``, scaled from the characteristic values."""
+    match material.diagram_type:
+        case ReinforcementDiagramType.BILINEAR_NOT_INCLINED:
+            return BilinearSteelDiagram(e_s=material.e_s, f_y=f_y)
+        case ReinforcementDiagramType.BILINEAR_INCLINED:
+            eps_uk = material.eps_uk * PER_MILLE_TO_STRAIN
+            e_h = (material.ductility_factor_k - 1) * f_y / (eps_uk - f_y / material.e_s)
+            return BilinearSteelDiagram(e_s=material.e_s, f_y=f_y, e_h=e_h, eps_u=eps_u_factor * eps_uk)
+        case _:
+            raise ValueError(f"No bi-linear diagram available for diagram type '{material.diagram_type.value}'.")
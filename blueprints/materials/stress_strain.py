@@ -0,0 +1,78 @@
+"""Module for the base class of vectorized stress-strain diagrams of materials."""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+import numpy.typing as npt
+
+
+class StressStrainDiagram(ABC):
+    """Base class of the stress-strain diagram of a material, evaluated for complete arrays of strains at once.
+
+    The constants of the diagram are calculated once, when it is created, so evaluating the diagram only takes a few array operations. This
+    makes it suitable as the kernel of a fiber-section analysis, where the diagram is evaluated for the strains of all fibers at once.
+
+    Strains are dimensionless [-], stresses and tangent moduli are in MPa.
+    """
+
+    @abstractmethod
+    def stress(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the stress for an array of strains.
+
+        Parameters
+        ----------
+        strain : npt.ArrayLike
+            The strains [-], an array of any shape (or a single strain).
+
+        Returns
+        -------
+        np.ndarray
+            The stresses [MPa], with the shape of ``strain``.
+        """
+
+    @abstractmethod
+    def tangent(self, strain: npt.ArrayLike) -> np.ndarray:
+        """Evaluate the tangent modulus (the derivative of the stress to the strain) for an array of strains.
+
+        Parameters
+        ----------
+        strain : npt.ArrayLike
+            The strains [-], an array of any shape (or a single strain).
+
+        Returns
+        -------
+        np.ndarray
+            The tangent moduli [MPa], with the shape of ``strain``.
+        """
+
+    def stress_and_tangent(self, strain: npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """Evaluate the stress and the tangent modulus for an array of strains.
+
+        Parameters
+        ----------
+        strain : npt.ArrayLike
+            The strains [-], an array of any shape (or a single strain).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The stresses and the tangent moduli [MPa], with the shape of ``strain``.
+        """
+        strain = as_strain_array(strain)
+        return self.stress(strain), self.tangent(strain)
+
+
+def as_strain_array(strain: npt.ArrayLike) -> np.ndarray:
+    """Convert strains to a float array, without copying an array that already is a float array.
+
+    Parameters
+    ----------
+    strain : npt.ArrayLike
+        The strains [-], an array of any shape (or a single strain).
+
+    Returns
+    -------
+    np.ndarray
+        The strains as array of floats.
+    """
+    return np.asarray(strain, dtype=np.float64)
@@ -1 +1,146 @@
 """Beam module."""
+
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import Self
+
+from blueprints.geometry.line_collection import LineCollection
+from blueprints.structural_elements.node import merge_nodes
+from blueprints.type_alias import MM
+
+
+class BeamConnectivity:
+    """Represents the connectivity of the nodes and beams of a structural model.
+
+    The beams connected to every node are stored in a compressed sparse row (CSR) layout: the beams of node ``i`` are
+    ``node_beams[node_offsets[i]:node_offsets[i + 1]]``, in ascending order.
+
+    Parameters
+    ----------
+    nodes : npt.ArrayLike
+        The coordinates of the nodes, an array with shape (K, 3).
+    beams : npt.ArrayLike
+        The indices of the start and end node of every beam, an integer array with shape (M, 2).
+
+    Raises
+    ------
+    ValueError
+        If the nodes do not have shape (K, 3), the beams do not have shape (M, 2), a beam refers to a node that does not exist, or the start
+        and end node of a beam are equal.
+    """
+
+    def __init__(self, nodes: npt.ArrayLike, beams: npt.ArrayLike) -> None:
+        """Initialize the connectivity."""
+        self._nodes = np.array(nodes, dtype=np.float64, ndmin=2)
+        self._beams = np.array(beams, dtype=np.intp, ndmin=2)
+        if self._nodes.ndim != 2 or self._nodes.shape[1] != 3:
+            msg = f"Nodes must have shape (K, 3), but got shape {self._nodes.shape}"
+            raise ValueError(msg)
+        if self._beams.ndim != 2 or self._beams.shape[1] != 2:
+            msg = f"Beams must have shape (M, 2), but got shape {self._beams.shape}"
+            raise ValueError(msg)
+        (invalid,) = np.nonzero(np.any((self._beams < 0) | (self._beams >= len(self._nodes)), axis=1))
+        if invalid.size:
+            msg = f"Beams must refer to the {len(self._nodes)} nodes. Beams with invalid nodes: {invalid.tolist()}"
+            raise ValueError(msg)
+        (equal,) = np.nonzero(self._beams[:, 0] == self._beams[:, 1])
+        if equal.size:
+            msg = f"Start and end node of a beam can't be equal. Beams with equal nodes: {equal.tolist()}"
+            raise ValueError(msg)
+
+        # sort the ends of the beams by their node, the stable sort keeps the beams of every node in ascending order
+        order = np.argsort(self._beams.ravel(), kind="stable")
+        self._node_beams = order // 2
+        self._node_offsets = np.zeros(len(self._nodes) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self._beams.ravel(), minlength=len(self._nodes)), out=self._node_offsets[1:])
+        for array in (self._nodes, self._beams, self._node_beams, self._node_offsets):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_lines(cls: type[Self], lines: LineCollection, tolerance: MM = 1e-3) -> Self:
+        """Create the connectivity of the beams along lines, with the end points of the lines within the tolerance merged into one node.
+
+        Parameters
+        ----------
+        lines : LineCollection
+            The lines of the beams, the beams are in the order of the lines.
+        tolerance : MM, default 1e-3
+            The largest distance between end points that are merged into one node [mm], see :func:`merge_nodes`.
+
+        Returns
+        -------
+        Self
+            The connectivity, with the nodes in the order of their first end point.
+
+        Raises
+        ------
+        ValueError
+            If both end points of a line are merged into one node, because the line is not longer than the tolerance.
+        """
+        nodes, node_indices = merge_nodes(np.stack((lines.start_points, lines.end_points), axis=1).reshape(-1, 3), tolerance)
+        return cls(nodes, node_indices.reshape(-1, 2))
+
+    @property
+    def nodes(self) -> np.ndarray:
+        """Return the coordinates of the nodes, a read-only array with shape (K, 3)."""
+        return self._nodes
+
+    @property
+    def beams(self) -> np.ndarray:
+        """Return the indices of the start and end node of every beam, a read-only array with shape (M, 2)."""
+        return self._beams
+
+    @property
+    def node_offsets(self) -> np.ndarray:
+        """Return the offsets of the beams of every node in ``node_beams``, a read-only array with shape (K + 1,)."""
+        return self._node_offsets
+
+    @property
+    def node_beams(self) -> np.ndarray:
+        """Return the beams connected to the nodes, grouped by node, a read-only array with shape (2 * M,)."""
+        return self._node_beams
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """Return the number of beams connected to every node, an array with shape (K,)."""
+        return np.diff(self._node_offsets)
+
+    @property
+    def lines(self) -> LineCollection:
+        """Return the lines of the beams between their nodes."""
+        return LineCollection(self._nodes[self._beams[:, 0]], self._nodes[self._beams[:, 1]])
+
+    def beams_at(self, node: int) -> np.ndarray:
+        """Return the beams connected to a node.
+
+        Parameters
+        ----------
+        node : int
+            The index of the node.
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the beams, in ascending order.
+        """
+        return self._node_beams[self._node_offsets[node] : self._node_offsets[node + 1]]
+
+    def neighbours(self, node: int) -> np.ndarray:
+        """Return the nodes connected to a node by a beam.
+
+        Parameters
+        ----------
+        node : int
+            The index of the node.
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the nodes at the other end of the beams of the node, in the order of the beams.
+        """
+        beams = self._beams[self.beams_at(node)]
+        return np.where(beams[:, 0] == node, beams[:, 1], beams[:, 0])
+
+    def __repr__(self) -> str:
+        """Return the representation of the connectivity."""
+        return f"BeamConnectivity({len(self._nodes)} nodes, {len(self._beams)} beams)"
@@ -1 +1,107 @@
 """Nodes module."""
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.type_alias import MM
+
+# the offsets of a cell to itself and to the 13 of its 26 neighbouring cells with a positive first non-zero offset, so that every pair of
+# neighbouring cells is visited once
+_NEIGHBOUR_OFFSETS = np.stack(np.meshgrid(*[np.arange(-1, 2)] * 3, indexing="ij"), axis=-1).reshape(-1, 3)[13:]
+# the multipliers of the hash of a cell, see M. Teschner et al., Optimized Spatial Hashing for Collision Detection of Deformable Objects (2003)
+_HASH_MULTIPLIERS = np.array([73_856_093, 19_349_663, 83_492_791], dtype=np.uint64)
+
+
+def merge_nodes(points: npt.ArrayLike, tolerance: MM = 1e-3) -> tuple[np.ndarray, np.ndarray]:
+    """Merge the coincident points into nodes, points within the tolerance of each other are snapped to one node.
+
+    Snapping is transitive: a chain of points with gaps within the tolerance is merged into one node. The node is placed at the first of its
+    points, so the coordinates of the nodes are exact input coordinates.
+
+    The points are found with a spatial hash with cells of the size of the tolerance, in which only the points in neighbouring cells are
+    compared. For points that are not clustered in a few cells, this costs O(N) on average instead of the O(N^2) of comparing every pair.
+
+    Parameters
+    ----------
+    points : npt.ArrayLike
+        The points, an array with shape (N, 3).
+    tolerance : MM, default 1e-3
+        The largest distance between points that are merged [mm].
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The coordinates of the nodes, an array with shape (K, 3) with the nodes in the order of their first point, and the index of the
+        node of every point, an array with shape (N,).
+
+    Raises
+    ------
+    ValueError
+        If the points do not have shape (N, 3), or the tolerance is not a positive value.
+    """
+    points = np.array(points, dtype=np.float64, ndmin=2)
+    if points.ndim != 2 or points.shape[1] != 3:
+        msg = f"Points must have shape (N, 3), but got shape {points.shape}"
+        raise ValueError(msg)
+    if tolerance <= 0:
+        msg = f"Tolerance must be a positive value, but got {tolerance}"
+        raise ValueError(msg)
+
+    first_points, second_points = _coincident_pairs(points, tolerance)
+
+    # label every point with the lowest point of its cluster, by propagating the lowest labels along the pairs until nothing changes
+    labels = np.arange(len(points))
+    while True:
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, first_points, labels[second_points])
+        np.minimum.at(new_labels, second_points, labels[first_points])
+        # the label of a label is at least as low, following these links shortens long chains
+        while np.any(new_labels[new_labels] != new_labels):
+            new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    node_points, node_indices = np.unique(labels, return_inverse=True)
+    return points[node_points], node_indices
+
+
+def _coincident_pairs(points: np.ndarray, tolerance: MM) -> tuple[np.ndarray, np.ndarray]:
+    """Return the pairs of different points within the tolerance of each other, with the lowest point of every pair first (a pair can repeat)."""
+    cells = np.floor(points / tolerance).astype(np.int64)
+    hashes = _cell_hashes(cells)
+
+    # group the points by their cell, sorted by the hash of the cell; different cells with the same hash are separate groups
+    order = np.lexsort((cells[:, 2], cells[:, 1], cells[:, 0], hashes))
+    sorted_cells = cells[order]
+    new_cell = np.concatenate(([True], np.any(sorted_cells[1:] != sorted_cells[:-1], axis=1)))
+    cell_starts = np.flatnonzero(new_cell)
+    cell_counts = np.diff(np.append(cell_starts, len(points)))
+    occupied_cells, cell_hashes = sorted_cells[cell_starts], hashes[order[cell_starts]]
+
+    first_points, second_points = [], []
+    for offset in _NEIGHBOUR_OFFSETS:
+        # the occupied cells with the hash of the neighbouring cell, different cells with that hash only add candidates that are filtered out
+        neighbour_hashes = _cell_hashes(occupied_cells + offset)
+        starts, ends = np.searchsorted(cell_hashes, neighbour_hashes, side="left"), np.searchsorted(cell_hashes, neighbour_hashes, side="right")
+        cell_pairs = np.repeat(np.arange(len(cell_starts)), ends - starts)
+        neighbour_cells = np.arange(cell_pairs.size) - np.repeat(np.cumsum(ends - starts) - ends, ends - starts)
+
+        # every point of the cell with every point of the neighbouring cell
+        first_counts, second_counts = cell_counts[cell_pairs], cell_counts[neighbour_cells]
+        sizes = first_counts * second_counts
+        positions = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        second_counts = np.repeat(second_counts, sizes)
+        candidates = order[np.repeat(cell_starts[cell_pairs], sizes) + positions // second_counts]
+        neighbours = order[np.repeat(cell_starts[neighbour_cells], sizes) + positions % second_counts]
+
+        close = (candidates != neighbours) & (np.linalg.norm(points[candidates] - points[neighbours], axis=1) <= tolerance)
+        first_points.append(np.minimum(candidates[close], neighbours[close]))
+        second_points.append(np.maximum(candidates[close], neighbours[close]))
+    return np.concatenate(first_points), np.concatenate(second_points)
+
+
+def _cell_hashes(cells: np.ndarray) -> np.ndarray:
+    """Return the hash of every cell of the spatial hash, the integer coordinates of the cells are multiplied with wrap-around."""
+    products = cells.astype(np.uint64) * _HASH_MULTIPLIERS
+    return products[:, 0] ^ products[:, 1] ^ products[:, 2]
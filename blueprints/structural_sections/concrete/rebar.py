@@ -18,7 +18,8 @@ class Rebar(CircularCrossSection):
     diameter : MM
         Diameter of the bar (for example: ⌀12, ⌀16, ⌀20, etc.) [mm]
     material : ReinforcementSteelMaterial
-        Representation of the properties of reinforcement steel suitable for use with NEN-EN 1992-1-1.
+        Representation of the properties of reinforcement steel suitable for use with NEN-EN 1992-1-1. Equal materials are interned, so
+        all rebars with equal materials share one material instance (see :meth:`ReinforcementSteelMaterial.get`).
     relative_start_position: RATIO
         Relative position of the start of the rebar in the longitudinal direction of the host element [-]
     relative_end_position: RATIO
@@ -30,7 +31,7 @@ class Rebar(CircularCrossSection):
     relative_end_position: RATIO = 1.0
 
     def __post_init__(self) -> None:
-        """Post-initialization to validate the diameter."""
+        """Post-initialization to validate the diameter and positions, and to intern the material."""
         super().__post_init__()
         if not 0.0 <= self.relative_end_position <= 1.0:
             msg = f"Relative end position of the rebar must be between 0.0 and 1.0, but got {self.relative_end_position}"
@@ -40,6 +41,8 @@ class Rebar(CircularCrossSection):
             msg = f"Relative start position of the rebar must be between 0.0 and 1.0, but got {self.relative_start_position}"
             raise ValueError(msg)
 
+        object.__setattr__(self, "material", self.material.intern(self.material))
+
     @property
     def weight_per_meter(self) -> KG_M:
         """Unit weight of rebar per meter [kg/m].
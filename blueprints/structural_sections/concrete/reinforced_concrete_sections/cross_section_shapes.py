@@ -2,17 +2,21 @@
 
 import math
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Protocol
 
+import numpy as np
+import shapely
 from shapely import Point, Polygon
 
-from blueprints.type_alias import MM, MM2
+from blueprints.type_alias import MM, MM2, MM3, MM4
 
 
 @dataclass(frozen=True)
 class CircularCrossSection:
     """
-    Class to represent a circular cross-section using shapely for geometric calculations.
+    Class to represent a circular cross-section. The section properties are calculated analytically, the shapely geometry approximates the
+    circle with a polygon and is created once per instance.
 
     Parameters
     ----------
@@ -22,17 +26,23 @@ class CircularCrossSection:
         The x-coordinate of the circle's center.
     y : MM
         The y-coordinate of the circle's center.
+    resolution : int
+        The number of segments per quarter of the circle in the shapely geometry. Default is 16.
     """
 
     diameter: MM
     x: MM
     y: MM
+    resolution: int = 16
 
     def __post_init__(self) -> None:
-        """Post-initialization to validate the diameter."""
+        """Post-initialization to validate the diameter and resolution."""
         if self.diameter <= 0:
             msg = f"Diameter must be a positive value, but got {self.diameter}"
             raise ValueError(msg)
+        if self.resolution < 1:
+            msg = f"Resolution must be at least 1, but got {self.resolution}"
+            raise ValueError(msg)
 
     @property
     def radius(self) -> MM:
@@ -46,17 +56,17 @@ class CircularCrossSection:
         """
         return self.diameter / 2.0
 
-    @property
+    @cached_property
     def geometry(self) -> Polygon:
         """
-        Shapely Polygon representing the circular cross-section.
+        Shapely Polygon representing the circular cross-section, with ``4 * resolution`` segments.
 
         Returns
         -------
         Polygon
             The shapely Polygon representing the circle.
         """
-        return self.centroid.buffer(self.radius)
+        return self.centroid.buffer(self.radius, quad_segs=self.resolution)
 
     @property
     def area(self) -> MM2:
@@ -94,6 +104,54 @@ class CircularCrossSection:
         """
         return Point(self.x, self.y)
 
+    @property
+    def moment_of_inertia_x(self) -> MM4:
+        """
+        Calculate the second moment of area of the circular cross-section about its centroidal axis parallel to the x-axis [mm⁴].
+
+        Returns
+        -------
+        MM4
+            The second moment of area of the circle.
+        """
+        return math.pi * self.diameter**4.0 / 64.0
+
+    @property
+    def moment_of_inertia_y(self) -> MM4:
+        """
+        Calculate the second moment of area of the circular cross-section about its centroidal axis parallel to the y-axis [mm⁴].
+
+        Returns
+        -------
+        MM4
+            The second moment of area of the circle.
+        """
+        return self.moment_of_inertia_x
+
+    @property
+    def section_modulus_x(self) -> MM3:
+        """
+        Calculate the elastic section modulus of the circular cross-section about its centroidal axis parallel to the x-axis [mm³].
+
+        Returns
+        -------
+        MM3
+            The elastic section modulus of the circle.
+        """
+        return math.pi * self.diameter**3.0 / 32.0
+
+    @property
+    def section_modulus_y(self) -> MM3:
+        """
+        Calculate the elastic section modulus of the circular cross-section about its centroidal axis parallel to the y-axis [mm³].
+
+        Returns
+        -------
+        MM3
+            The elastic section modulus of the circle.
+        """
+        return self.section_modulus_x
+
     @property
     def vertices(self) -> list[Point]:
         """
@@ -104,13 +162,14 @@ class CircularCrossSection:
         list[Point]
             The vertices of the circle.
         """
-        return [Point(x, y) for x, y in self.geometry.exterior.coords]
+        return list(np.asarray(shapely.points(np.asarray(self.geometry.exterior.coords))))
 
 
 @dataclass(frozen=True)
 class RectangularCrossSection:
     """
-    Class to represent a rectangular cross-section for geometric calculations.
+    Class to represent a rectangular cross-section. The section properties are calculated analytically, the shapely geometry is created once
+    per instance.
 
     Parameters
     ----------
@@ -129,7 +188,16 @@ class RectangularCrossSection:
     x: MM = 0
     y: MM = 0
 
-    @property
+    def __post_init__(self) -> None:
+        """Post-initialization to validate the width and height."""
+        if self.width <= 0:
+            msg = f"Width must be a positive value, but got {self.width}"
+            raise ValueError(msg)
+        if self.height <= 0:
+            msg = f"Height must be a positive value, but got {self.height}"
+            raise ValueError(msg)
+
+    @cached_property
     def geometry(self) -> Polygon:
         """
         Shapely Polygon representing the rectangular cross-section. Defines the coordinates of the rectangle based on width, height, x,
@@ -163,7 +231,7 @@ class RectangularCrossSection:
         MM2
             The area of the rectangle.
         """
-        return self.geometry.area
+        return self.width * self.height
 
     @property
     def perimeter(self) -> MM:
@@ -175,7 +243,7 @@ class RectangularCrossSection:
         MM
             The perimeter of the rectangle.
         """
-        return self.geometry.length
+        return 2.0 * (self.width + self.height)
 
     @property
     def centroid(self) -> Point:
@@ -187,7 +255,55 @@ class RectangularCrossSection:
         Point
             The centroid of the rectangle.
         """
-        return self.geometry.centroid
+        return Point(self.x, self.y)
+
+    @property
+    def moment_of_inertia_x(self) -> MM4:
+        """
+        Calculate the second moment of area of the rectangular cross-section about its centroidal axis parallel to the x-axis [mm⁴].
+
+        Returns
+        -------
+        MM4
+            The second moment of area of the rectangle.
+        """
+        return self.width * self.height**3.0 / 12.0
+
+    @property
+    def moment_of_inertia_y(self) -> MM4:
+        """
+        Calculate the second moment of area of the rectangular cross-section about its centroidal axis parallel to the y-axis [mm⁴].
+
+        Returns
+        -------
+        MM4
+            The second moment of area of the rectangle.
+        """
+        return self.height * self.width**3.0 / 12.0
+
+    @property
+    def section_modulus_x(self) -> MM3:
+        """
+        Calculate the elastic section modulus of the rectangular cross-section about its centroidal axis parallel to the x-axis [mm³].
+
+        Returns
+        -------
+        MM3
+            The elastic section modulus of the rectangle.
+        """
+        return self.width * self.height**2.0 / 6.0
+
+    @property
+    def section_modulus_y(self) -> MM3:
+        """
+        Calculate the elastic section modulus of the rectangular cross-section about its centroidal axis parallel to the y-axis [mm³].
+
+        Returns
+        -------
+        MM3
+            The elastic section modulus of the rectangle.
+        """
+        return self.height * self.width**2.0 / 6.0
 
     @property
     def vertices(self) -> list[Point]:
@@ -199,7 +315,7 @@ class RectangularCrossSection:
         list[Point]
             The vertices of the rectangle.
         """
-        return [Point(x, y) for x, y in self.geometry.exterior.coords]
+        return list(np.asarray(shapely.points(np.asarray(self.geometry.exterior.coords))))
 
 
 class CrossSection(Protocol):
@@ -221,6 +337,22 @@ class CrossSection(Protocol):
     def centroid(self) -> Point:
         """Centroid of the cross-section [mm]."""
 
+    @property
+    def moment_of_inertia_x(self) -> MM4:
+        """Second moment of area about the centroidal axis parallel to the x-axis [mm⁴]."""
+
+    @property
+    def moment_of_inertia_y(self) -> MM4:
+        """Second moment of area about the centroidal axis parallel to the y-axis [mm⁴]."""
+
+    @property
+    def section_modulus_x(self) -> MM3:
+        """Elastic section modulus about the centroidal axis parallel to the x-axis [mm³]."""
+
+    @property
+    def section_modulus_y(self) -> MM3:
+        """Elastic section modulus about the centroidal axis parallel to the y-axis [mm³]."""
+
     @property
     def vertices(self) -> list[Point]:
         """Vertices of the cross-section."""
@@ -0,0 +1,89 @@
+"""Module for lazily importing the submodules and attributes of a package (PEP 562)."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+# not imported from typing, as this module is imported by every package and importing typing is relatively slow
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+
+def lazy_import(
+    package_name: str,
+    submodules: Iterable[str] = (),
+    submodule_attributes: Mapping[str, Iterable[str]] | None = None,
+) -> tuple[Callable[[str], object], Callable[[], list[str]], list[str]]:
+    """Create the module-level ``__getattr__``, ``__dir__`` and ``__all__`` of a package, to import its contents only when first accessed.
+
+    This keeps importing the package (and a single formula) cheap, regardless of the number of chapters and formulas in the package.
+    An attribute is imported from its submodule on first access and then stored in the package, so later access is as fast as a normal attribute.
+
+    Examples
+    --------
+    In the ``__init__.py`` of a package:
+
+    >>> __getattr__, __dir__, __all__ = lazy_import(
+    ...     __name__,
+    ...     submodule_attributes={"formula_8_3": ["Form8Dot3RequiredAnchorageLength"]},
+    ... )
+
+    Parameters
+    ----------
+    package_name : str
+        The name of the package, ``__name__`` in its ``__init__.py``.
+    submodules : Iterable[str], default ()
+        Names of the submodules (or subpackages) to expose as attributes of the package.
+    submodule_attributes : Mapping[str, Iterable[str]] | None, default None
+        Names of the attributes to expose by the (relative) name of the submodule that defines them. Dots are allowed, for example
+        ``"chapter_8.formula_8_3"``.
+
+    Returns
+    -------
+    tuple[Callable[[str], object], Callable[[], list[str]], list[str]]
+        The ``__getattr__``, ``__dir__`` and ``__all__`` of the package.
+    """
+    submodules = set(submodules)
+    attribute_to_submodule = {attribute: submodule for submodule, attributes in (submodule_attributes or {}).items() for attribute in attributes}
+    __all__ = sorted(submodules | attribute_to_submodule.keys())
+
+    def __getattr__(name: str) -> object:  # noqa: N807
+        """Import the submodule or attribute with the given name."""
+        if name in submodules:
+            value = importlib.import_module(f"{package_name}.{name}")
+        elif name in attribute_to_submodule:
+            value = getattr(importlib.import_module(f"{package_name}.{attribute_to_submodule[name]}"), name)
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        """List the attributes of the package, including the ones that are not imported yet."""
+        return sorted(set(vars(sys.modules[package_name])) | set(__all__))
+
+    return __getattr__, __dir__, __all__
+
+
+def package_exports(package_name: str, module_exports: Mapping[str, Iterable[str]]) -> dict[str, Iterable[str]]:
+    """Select the attributes of the modules inside a package, by the name of the module relative to the package.
+
+    Used to pass ``submodule_attributes`` to :func:`lazy_import` from one map of the attributes of all modules, instead of repeating them in
+    every package.
+
+    Parameters
+    ----------
+    package_name : str
+        The name of the package, ``__name__`` in its ``__init__.py``.
+    module_exports : Mapping[str, Iterable[str]]
+        Names of the attributes by the full name of the module that defines them.
+
+    Returns
+    -------
+    dict[str, Iterable[str]]
+        Names of the attributes of the modules inside the package, by the relative name of the module.
+    """
+    prefix = f"{package_name}."
+    return {module.removeprefix(prefix): attributes for module, attributes in module_exports.items() if module.startswith(prefix)}
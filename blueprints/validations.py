@@ -1,5 +1,31 @@
 """Module for validation actions inside of Blueprints."""
 
+import sys
+import threading
+import time
+from collections.abc import Callable, Sized
+from contextvars import ContextVar
+from types import CodeType, FunctionType
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+validation_timer: ContextVar[Callable[[float], None] | None] = ContextVar("validation_timer", default=None)
+"""Callback that receives the duration (in seconds) of every validation in the current context, None if validations are not timed.
+
+Set by :class:`~blueprints.codes.formula_profiler.FormulaProfiler` while it is active, see :func:`enable_validation_timing`.
+"""
+
+# the validation functions that are timed while a profiler is entered, with their untimed copies by the code of their timed version
+_timeable_validations: list[tuple[FunctionType, CodeType, CodeType]] = []
+_untimed_validations: dict[CodeType, FunctionType] = {}
+# the number of profilers that are entered in all contexts, while positive the validation functions are timed
+_timing_users = 0
+_timing_lock = threading.Lock()
+
 
 class LessOrEqualToZeroError(Exception):
     """Raised when a value is less than or equal to zero."""
@@ -36,13 +62,137 @@ class ListsNotSameLengthError(Exception):
         super().__init__(message)
 
 
+class ArrayValidationError(Exception):
+    """Raised when one or more elements of one or more arrays are invalid.
+
+    All offending parameters and indices are reported at once, so a batch of values can be corrected in one go.
+
+    Attributes
+    ----------
+    requirement : str
+        Description of the requirement that the values do not meet, for example "must be greater than zero".
+    violations : dict[str, np.ndarray]
+        The flat indices of the invalid elements per parameter name, only for the parameters with invalid elements.
+    invalid_values : dict[str, np.ndarray]
+        The invalid values per parameter name, in the same order as the indices.
+    """
+
+    max_reported_indices = 10
+
+    def __init__(self, requirement: str, violations: dict[str, np.ndarray], invalid_values: dict[str, np.ndarray]) -> None:
+        self.requirement = requirement
+        self.violations = violations
+        self.invalid_values = invalid_values
+        reports = []
+        for name, indices in violations.items():
+            shown = ", ".join(str(index) for index in indices[: self.max_reported_indices])
+            more = f", ... ({len(indices)} in total)" if len(indices) > self.max_reported_indices else ""
+            reports.append(f"'{name}' at index [{shown}{more}]")
+        message = f"Invalid values for {'; '.join(reports)}. Values {requirement}."
+        super().__init__(message)
+
+
+class ArraysNotSameLengthError(Exception):
+    """Raised when two or more arrays are not of the same length.
+
+    Attributes
+    ----------
+    lengths : dict[str, int]
+        The length of every given array per parameter name.
+    """
+
+    def __init__(self, lengths: dict[str, int]) -> None:
+        self.lengths = lengths
+        reported_lengths = ", ".join(f"'{name}': {length}" for name, length in lengths.items())
+        message = f"The arrays are not of the same length. Lengths: {reported_lengths}."
+        super().__init__(message)
+
+
+def _timed_validation(*args: object, **kwargs: object) -> object:
+    """Code of the validation functions while they are timed: call the untimed validation and pass its duration to the validation timer.
+
+    The timer is disabled during the call, so validations that call other validations (like ``any_true``) are timed once.
+    """
+    untimed_validation = _untimed_validations[sys._getframe().f_code]  # noqa: SLF001
+    record_duration = validation_timer.get()
+    if record_duration is None:
+        return untimed_validation(*args, **kwargs)
+    token = validation_timer.set(None)
+    started_at = time.perf_counter()
+    try:
+        return untimed_validation(*args, **kwargs)
+    finally:
+        duration = time.perf_counter() - started_at
+        validation_timer.reset(token)
+        record_duration(duration)
+
+
+def _timeable(function: F) -> F:
+    """Register a validation function, to be timed while a profiler is entered."""
+    untimed_validation = FunctionType(function.__code__, function.__globals__, function.__name__, function.__defaults__, function.__closure__)
+    untimed_validation.__kwdefaults__ = function.__kwdefaults__
+    # every validation gets its own code object (with its name), by which the timed code finds its untimed validation
+    timed_code = _timed_validation.__code__.replace(co_name=function.__name__)
+    _untimed_validations[timed_code] = untimed_validation
+    _timeable_validations.append((function, function.__code__, timed_code))  # type: ignore[arg-type]
+    return function
+
+
+def enable_validation_timing() -> None:
+    """Time the validation functions of this module, called when a :class:`~blueprints.codes.formula_profiler.FormulaProfiler` is entered.
+
+    The code of the validation functions is replaced by a timed version, which passes the duration of every validation to the
+    :data:`validation_timer` of the current context. As the functions themselves are changed, the names imported by other modules are timed as
+    well, while the validations cost nothing extra when no profiler is entered. Every call must be matched by a call of
+    :func:`disable_validation_timing`.
+    """
+    global _timing_users  # noqa: PLW0603
+    with _timing_lock:
+        _timing_users += 1
+        if _timing_users == 1:
+            for function, _, timed_code in _timeable_validations:
+                function.__code__ = timed_code
+
+
+def disable_validation_timing() -> None:
+    """Restore the untimed validation functions once no profiler is entered anymore."""
+    global _timing_users  # noqa: PLW0603
+    with _timing_lock:
+        _timing_users -= 1
+        if _timing_users == 0:
+            for function, untimed_code, _ in _timeable_validations:
+                function.__code__ = untimed_code
+
+
+@_timeable
+def any_true(condition: bool | np.ndarray) -> bool:
+    """Check if a condition holds, for a scalar condition or for any element of an array of conditions.
+
+    This keeps the scalar path as cheap as a plain comparison, while also supporting the array inputs of :meth:`Formula.evaluate_many`.
+
+    Parameters
+    ----------
+    condition : bool | np.ndarray
+        The result of a (possibly element-wise) comparison.
+
+    Returns
+    -------
+    bool
+        True if the condition holds (for any element).
+    """
+    if isinstance(condition, np.ndarray):
+        return bool(condition.any())
+    return bool(condition)
+
+
+@_timeable
 def raise_if_less_or_equal_to_zero(**kwargs: float) -> None:
     """Raise a LessOrEqualToZeroError if any of the given keyword arguments are less than or equal to zero.
 
     Parameters
     ----------
     **kwargs : dict[str, float]
-        A dictionary of keyword arguments where keys are parameter names, and values are the values to validate.
+        A dictionary of keyword arguments where keys are parameter names, and values are the values (or arrays of values) to validate.
 
     Raises
     ------
@@ -51,17 +201,20 @@ def raise_if_less_or_equal_to_zero(**kwargs: float) -> None:
 
     """
     for key, value in kwargs.items():
-        if value <= 0:
+        invalid = value <= 0
+        # a comparison of plain numbers returns a bool, for which the call of any_true is skipped
+        if invalid is True or (invalid is not False and any_true(invalid)):
             raise LessOrEqualToZeroError(value_name=key, value=value)
 
 
+@_timeable
 def raise_if_negative(**kwargs: float) -> None:
     """Raise a NegativeValueError if any of the given keyword arguments are negative.
 
     Parameters
     ----------
     **kwargs : dict[str, float]
-        A dictionary of keyword arguments where keys are parameter names, and values are the values to validate.
+        A dictionary of keyword arguments where keys are parameter names, and values are the values (or arrays of values) to validate.
 
     Raises
     ------
@@ -70,17 +223,19 @@ def raise_if_negative(**kwargs: float) -> None:
 
     """
     for key, value in kwargs.items():
-        if value < 0:
+        invalid = value < 0
+        if invalid is True or (invalid is not False and any_true(invalid)):
             raise NegativeValueError(value_name=key, value=value)
 
 
+@_timeable
 def raise_if_greater_than_90(**kwargs: float) -> None:
     """Raise a GreaterThan90Error if any of the given keyword arguments are greater than 90.
 
     Parameters
     ----------
     **kwargs : dict[str, float]
-        A dictionary of keyword arguments where keys are parameter names, and values are the values to validate.
+        A dictionary of keyword arguments where keys are parameter names, and values are the values (or arrays of values) to validate.
 
     Raises
     ------
@@ -89,10 +244,12 @@ def raise_if_greater_than_90(**kwargs: float) -> None:
 
     """
     for key, value in kwargs.items():
-        if value > 90:
+        invalid = value > 90
+        if invalid is True or (invalid is not False and any_true(invalid)):
             raise GreaterThan90Error(value_name=key, value=value)
 
 
+@_timeable
 def raise_if_lists_differ_in_length(**kwargs: list) -> None:
     """Check if all provided lists are of the same length.
 
@@ -116,3 +273,141 @@ def raise_if_lists_differ_in_length(**kwargs: list) -> None:
     for list_name, lst in lists[1:]:
         if len(lst) != first_length:
             raise ListsNotSameLengthError(first_list_name, list_name, first_length, len(lst))
+
+
+def _validate_arrays(
+    requirement: str,
+    is_invalid: Callable[[np.ndarray], np.ndarray],
+    collect_errors: bool,
+    arrays: dict[str, npt.ArrayLike],
+) -> np.ndarray:
+    """Validate all elements of the given arrays at once.
+
+    Parameters
+    ----------
+    requirement : str
+        Description of the requirement for the values, used in the error message.
+    is_invalid : Callable[[np.ndarray], np.ndarray]
+        Element-wise function that returns True for the invalid elements of an array.
+    collect_errors : bool
+        If True, no error is raised and the mask of invalid elements is returned.
+    arrays : dict[str, npt.ArrayLike]
+        The arrays (or scalars) to validate per parameter name. They are broadcast against each other.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask with the broadcast shape of the arrays, True where any of the given parameters is invalid.
+
+    Raises
+    ------
+    ArrayValidationError
+        If any element is invalid and collect_errors is False.
+    """
+    broadcast = dict(zip(arrays, np.broadcast_arrays(*(np.asarray(array) for array in arrays.values()))))
+    invalid_masks = {name: is_invalid(array) for name, array in broadcast.items()}
+    invalid = np.zeros(np.broadcast_shapes(*(mask.shape for mask in invalid_masks.values())), dtype=bool)
+    for mask in invalid_masks.values():
+        invalid |= mask
+    if not collect_errors and invalid.any():
+        violations = {name: np.flatnonzero(mask) for name, mask in invalid_masks.items() if mask.any()}
+        invalid_values = {name: broadcast[name].ravel()[indices] for name, indices in violations.items()}
+        raise ArrayValidationError(requirement=requirement, violations=violations, invalid_values=invalid_values)
+    return invalid
+
+
+@_timeable
+def raise_if_any_less_or_equal_to_zero(*, collect_errors: bool = False, **kwargs: npt.ArrayLike) -> np.ndarray:
+    """Raise an ArrayValidationError if any element of the given arrays is less than or equal to zero.
+
+    All arrays are validated in one NumPy pass per array, and all offending parameters and indices are reported in a single error.
+
+    Parameters
+    ----------
+    collect_errors : bool, default False
+        If True, no error is raised. The returned mask can then be used to skip the invalid rows of a batch.
+    **kwargs : dict[str, npt.ArrayLike]
+        A dictionary of keyword arguments where keys are parameter names, and values are the arrays (or scalars) to validate.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask with the broadcast shape of the arrays, True where any of the values is less than or equal to zero.
+
+    Raises
+    ------
+    ArrayValidationError
+        If any value is less than or equal to zero and collect_errors is False.
+    """
+    return _validate_arrays("must be greater than zero", lambda array: array <= 0, collect_errors, kwargs)
+
+
+@_timeable
+def raise_if_any_negative(*, collect_errors: bool = False, **kwargs: npt.ArrayLike) -> np.ndarray:
+    """Raise an ArrayValidationError if any element of the given arrays is negative.
+
+    All arrays are validated in one NumPy pass per array, and all offending parameters and indices are reported in a single error.
+
+    Parameters
+    ----------
+    collect_errors : bool, default False
+        If True, no error is raised. The returned mask can then be used to skip the invalid rows of a batch.
+    **kwargs : dict[str, npt.ArrayLike]
+        A dictionary of keyword arguments where keys are parameter names, and values are the arrays (or scalars) to validate.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask with the broadcast shape of the arrays, True where any of the values is negative.
+
+    Raises
+    ------
+    ArrayValidationError
+        If any value is negative and collect_errors is False.
+    """
+    return _validate_arrays("cannot be negative", lambda array: array < 0, collect_errors, kwargs)
+
+
+@_timeable
+def raise_if_any_greater_than_90(*, collect_errors: bool = False, **kwargs: npt.ArrayLike) -> np.ndarray:
+    """Raise an ArrayValidationError if any element of the given arrays is greater than 90.
+
+    All arrays are validated in one NumPy pass per array, and all offending parameters and indices are reported in a single error.
+
+    Parameters
+    ----------
+    collect_errors : bool, default False
+        If True, no error is raised. The returned mask can then be used to skip the invalid rows of a batch.
+    **kwargs : dict[str, npt.ArrayLike]
+        A dictionary of keyword arguments where keys are parameter names, and values are the arrays (or scalars) to validate.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask with the broadcast shape of the arrays, True where any of the values is greater than 90.
+
+    Raises
+    ------
+    ArrayValidationError
+        If any value is greater than 90 and collect_errors is False.
+    """
+    return _validate_arrays("cannot be greater than 90", lambda array: array > 90, collect_errors, kwargs)
+
+
+@_timeable
+def raise_if_arrays_differ_in_length(**kwargs: Sized) -> None:
+    """Check if all provided arrays are of the same length, reporting the lengths of all arrays if not.
+
+    Parameters
+    ----------
+    **kwargs : dict[str, Sized]
+        A dictionary of keyword arguments where keys are array names and values are the arrays (or lists, series) to check.
+
+    Raises
+    ------
+    ArraysNotSameLengthError
+        If not all arrays are of the same length.
+    """
+    lengths = {name: len(array) for name, array in kwargs.items()}
+    if len(set(lengths.values())) > 1:
+        raise ArraysNotSameLengthError(lengths=lengths)
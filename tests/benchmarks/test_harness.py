@@ -0,0 +1,60 @@
+"""Module for testing the benchmark harness and the benchmark suite."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.cases import all_benchmarks
+from benchmarks.harness import Benchmark, Comparison, compare, load_baseline, run, save_baseline
+
+
+class TestHarness:
+    """Validation for the timing and comparison of benchmarks."""
+
+    def test_run(self) -> None:
+        """Test that every benchmark and the reference workload are timed."""
+        times, calibration = run([Benchmark(name="sum", function=lambda: sum(range(100)))], min_duration=0.001, repeat=2)
+
+        assert list(times) == ["sum"]
+        assert times["sum"] > 0
+        assert calibration > 0
+
+    def test_compare_scales_baseline_to_machine(self) -> None:
+        """Test that the baseline is scaled by the speed of the current machine, relative to the reference workload."""
+        baseline = {"calibration": 1.0, "benchmarks": {"fast": 1.0, "slow": 1.0}}
+
+        fast, slow, new = compare({"fast": 2.2, "slow": 2.6, "new": 1.0}, calibration=2.0, baseline=baseline, threshold=0.25)
+
+        assert fast == Comparison(name="fast", time=2.2, baseline_time=2.0, change=pytest.approx(0.1), is_regression=False)
+        assert slow.change == pytest.approx(0.3)
+        assert slow.is_regression
+        assert new == Comparison(name="new", time=1.0, baseline_time=None, change=None, is_regression=False)
+
+    def test_save_and_load_baseline(self, tmp_path: Path) -> None:
+        """Test that a stored baseline is loaded again."""
+        path = tmp_path / "baseline.json"
+        assert load_baseline(path) == {}
+
+        save_baseline({"b": 2.0, "a": 1.0}, calibration=0.5, path=path)
+        baseline = load_baseline(path)
+
+        assert baseline["calibration"] == 0.5
+        assert baseline["benchmarks"] == {"a": 1.0, "b": 2.0}
+
+
+class TestBenchmarks:
+    """Validation for the benchmarks of the suite."""
+
+    def test_names_are_unique(self) -> None:
+        """Test that every benchmark has a unique name, as the name identifies its baseline."""
+        names = [benchmark.name for benchmark in all_benchmarks()]
+        assert len(names) == len(set(names))
+
+    def test_benchmarks_run(self) -> None:
+        """Test that every benchmark runs without errors, so the suite keeps working when the code changes."""
+        for benchmark in all_benchmarks():
+            benchmark.function()
+
+    def test_baseline_covers_all_benchmarks(self) -> None:
+        """Test that the stored baseline has a time for every benchmark."""
+        assert set(load_baseline()["benchmarks"]) == {benchmark.name for benchmark in all_benchmarks()}
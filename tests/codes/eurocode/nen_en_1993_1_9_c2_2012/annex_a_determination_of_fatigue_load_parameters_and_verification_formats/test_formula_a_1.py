@@ -1,5 +1,6 @@
 """Testing formula A.1 from NEN-EN 1993-1-9+C2:2012: Annex A - Determination of fatigue load parameters and verification formats."""
 
+import numpy as np
 import pytest
 
 from blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_1 import (
@@ -23,6 +24,15 @@ class TestFormADot1DamageDuringDesignLife:
 
         assert form_a_1 == pytest.approx(expected=manually_calculated_result, rel=1e-9)
 
+    def test_evaluate_many(self) -> None:
+        """Test the evaluation of rows of bands at once, which matches the evaluation of the lists of every row."""
+        n_e = np.array([[5.0, 4.0, 3.0], [1.0, 2.0, 3.0]])  # [-]
+        n_r = [10.0, 20.0, 30.0]  # [-]
+
+        result = FormADot1DamageDuringDesignLife.evaluate_many(n_e=n_e, n_r=n_r)
+
+        assert result == pytest.approx([FormADot1DamageDuringDesignLife(n_e=list(row), n_r=n_r) for row in n_e], rel=1e-9)
+
     def test_raise_error_if_negative_n_e(self) -> None:
         """Test that a NegativeValueError is raised when a negative value is passed for n_e."""
         n_e = [-5.0, 4.0, 3.0]  # [-]
@@ -0,0 +1,78 @@
+"""Tests for the lazy imports of the formulas in the packages of the Eurocodes."""
+
+import ast
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import blueprints.codes.eurocode
+
+EUROCODE_DIRECTORY = Path(blueprints.codes.eurocode.__file__).parent
+DOCUMENT_PACKAGES = sorted(path.name for path in EUROCODE_DIRECTORY.iterdir() if (path / "__init__.py").exists())
+
+
+def _public_definitions(chapter_directory: Path) -> dict[str, str]:
+    """Public classes and functions defined in the modules of a chapter package, by name, with the name of the module."""
+    definitions = {}
+    for module_path in chapter_directory.glob("*.py"):
+        if module_path.name != "__init__.py":
+            for node in ast.parse(module_path.read_text(encoding="utf-8")).body:
+                if isinstance(node, ast.ClassDef | ast.FunctionDef) and not node.name.startswith("_"):
+                    definitions[node.name] = module_path.stem
+    return definitions
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Run an import statement in a fresh interpreter and return the names of the imported modules."""
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    return set(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split())
+
+
+@pytest.mark.parametrize("document", DOCUMENT_PACKAGES)
+def test_all_formulas_are_exposed(document: str) -> None:
+    """Test that every formula of a document is exposed by its chapter package and document package, so new formulas are not forgotten."""
+    document_package = importlib.import_module(f"blueprints.codes.eurocode.{document}")
+    for chapter_directory in (path for path in (EUROCODE_DIRECTORY / document).iterdir() if (path / "__init__.py").exists()):
+        chapter_package = importlib.import_module(f"{document_package.__name__}.{chapter_directory.name}")
+        for name, module_name in _public_definitions(chapter_directory).items():
+            defined = getattr(importlib.import_module(f"{chapter_package.__name__}.{module_name}"), name)
+            assert getattr(chapter_package, name) is defined
+            assert getattr(document_package, name) is defined
+
+
+def test_formula_import_from_document_package_only_imports_its_module() -> None:
+    """Test that importing a formula from its document package does not import the other formulas, chapters or heavy dependencies."""
+    modules = _imported_modules("from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import Form8Dot3RequiredAnchorageLength")
+    chapter_8 = "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons"
+
+    assert f"{chapter_8}.formula_8_3" in modules
+    assert {module for module in modules if module.startswith("blueprints.codes.eurocode.")} == {
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011",
+        chapter_8,
+        f"{chapter_8}.formula_8_3",
+    }
+    assert not modules & {"pandas", "shapely", "matplotlib", "typing_extensions", "blueprints.geometry", "blueprints.materials"}
+
+
+def test_package_import_does_not_import_subpackages() -> None:
+    """Test that importing the blueprints package does not import its subpackages or NumPy."""
+    modules = _imported_modules("import blueprints")
+
+    assert {module for module in modules if module.startswith("blueprints")} == {"blueprints", "blueprints.utils", "blueprints.utils.lazy_import"}
+    assert "numpy" not in modules
+
+
+def test_import_time_budget() -> None:
+    """Test that the modules of blueprints, imported for a single formula, stay within the import time budget.
+
+    Only the time spent in the modules of blueprints itself is counted, so the test does not depend on the import time of NumPy.
+    """
+    budget_in_microseconds = 100_000
+    code = "from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import Form8Dot3RequiredAnchorageLength"
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True).stderr
+    # lines like "import time:       620 |      86984 | blueprints.codes.formula", with the self time in microseconds first
+    self_times = [line.split("|") for line in stderr.splitlines() if line.startswith("import time:") and "blueprints" in line]
+    assert sum(int(columns[0].removeprefix("import time:")) for columns in self_times) < budget_in_microseconds
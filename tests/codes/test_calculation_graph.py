@@ -0,0 +1,140 @@
+"""Module for testing the CalculationGraph class."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.calculation_graph import CalculationGraph
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2 import (
+    Form8Dot2UltimateBondStress,
+    SubForm8Dot2CoefficientBarDiameter,
+    SubForm8Dot2CoefficientQualityOfBond,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_10 import (
+    Form8Dot10DesignLapLength,
+    SubForm8Dot10Alpha6,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_11 import (
+    Form8Dot11MinimumDesignLapLength,
+)
+
+
+@pytest.fixture()
+def graph() -> CalculationGraph:
+    """Chain of the lap length of chapter 8, from the bond stress (8.2) to the design lap length (8.10)."""
+    return (
+        CalculationGraph(diameter=16, sigma_sd=435, f_ctd=1.2, bond_quality="good", rho_1=50, alpha_1=1, alpha_2=0.9, alpha_3=1, alpha_5=1)
+        .add("eta_1", SubForm8Dot2CoefficientQualityOfBond)
+        .add("eta_2", SubForm8Dot2CoefficientBarDiameter)
+        .add("f_bd", Form8Dot2UltimateBondStress)
+        .add("l_b_rqd", Form8Dot3RequiredAnchorageLength)
+        .add("alpha_6", SubForm8Dot10Alpha6)
+        .add("l_0_min", Form8Dot11MinimumDesignLapLength)
+        .add("l_0", Form8Dot10DesignLapLength)
+    )
+
+
+class TestCalculationGraph:
+    """Validation for the CalculationGraph class."""
+
+    def test_results_match_chained_formulas(self, graph: CalculationGraph) -> None:
+        """Test that the results match the results of the formulas chained by hand."""
+        f_bd = Form8Dot2UltimateBondStress(eta_1=1, eta_2=1, f_ctd=1.2)
+        l_b_rqd = Form8Dot3RequiredAnchorageLength(diameter=16, sigma_sd=435, f_bd=f_bd)
+        alpha_6 = SubForm8Dot10Alpha6(rho_1=50)
+        l_0_min = Form8Dot11MinimumDesignLapLength(alpha_6=alpha_6, l_b_rqd=l_b_rqd, diameter=16)
+        expected = Form8Dot10DesignLapLength(alpha_1=1, alpha_2=0.9, alpha_3=1, alpha_5=1, alpha_6=alpha_6, l_b_rqd=l_b_rqd, l_0_min=l_0_min)
+
+        assert isinstance(graph["l_0"], Form8Dot10DesignLapLength)
+        assert graph["l_0"] == pytest.approx(expected)
+        assert graph["diameter"] == 16
+
+    def test_lazy_evaluation(self, graph: CalculationGraph) -> None:
+        """Test that only the requested node and its dependencies are evaluated."""
+        graph["l_b_rqd"]
+
+        assert graph.evaluations == 4
+        assert not graph.is_dirty("f_bd")
+        assert graph.is_dirty("alpha_6")
+
+    def test_only_dependent_nodes_are_evaluated_again(self, graph: CalculationGraph) -> None:
+        """Test that changing an input only evaluates the nodes that depend on it again."""
+        graph.evaluate()
+        assert graph.evaluations == 7
+
+        graph.set_inputs(f_ctd=1.5)
+        assert [name for name in ("eta_1", "eta_2", "f_bd", "l_b_rqd", "alpha_6", "l_0_min", "l_0") if graph.is_dirty(name)] == [
+            "f_bd",
+            "l_b_rqd",
+            "l_0_min",
+            "l_0",
+        ]
+        assert graph["l_0"] > graph["l_0_min"]
+        assert graph.evaluations == 7 + 4
+
+    def test_unchanged_input_does_not_invalidate(self, graph: CalculationGraph) -> None:
+        """Test that setting an input to its current value does not evaluate any node again."""
+        graph.evaluate()
+        graph.set_inputs(diameter=16, rho_1=50)
+        graph.evaluate()
+        assert graph.evaluations == 7
+
+    def test_array_inputs(self, graph: CalculationGraph) -> None:
+        """Test that array input values evaluate the chain for all values at once."""
+        diameters = np.array([10, 16, 25])
+        graph.set_inputs(diameter=diameters)
+
+        assert graph["l_b_rqd"] == pytest.approx(
+            [Form8Dot3RequiredAnchorageLength(diameter=diameter, sigma_sd=435, f_bd=graph["f_bd"][i]) for i, diameter in enumerate(diameters)]
+        )
+        assert isinstance(graph["l_0"], np.ndarray)
+        assert graph["l_0"].shape == (3,)
+
+    def test_array_input_changed_in_place(self, graph: CalculationGraph) -> None:
+        """Test that setting an array input again after changing it in place evaluates the dependent nodes again."""
+        diameters = np.array([10, 16, 25])
+        graph.set_inputs(diameter=diameters)
+        l_b_rqd = graph["l_b_rqd"].copy()
+
+        diameters[0] = 40
+        graph.set_inputs(diameter=diameters)
+
+        assert graph.is_dirty("l_b_rqd")
+        assert graph["l_b_rqd"][0] > l_b_rqd[0]
+        assert graph["l_b_rqd"][1:] == pytest.approx(l_b_rqd[1:])
+
+    def test_parameter_sources(self) -> None:
+        """Test that a parameter can be provided by an input or node with another name."""
+        graph = CalculationGraph(d=12, sigma=435, bond_stress=2.7).add(
+            "l_b_rqd", Form8Dot3RequiredAnchorageLength, diameter="d", sigma_sd="sigma", f_bd="bond_stress"
+        )
+        assert graph["l_b_rqd"] == pytest.approx(Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.7))
+
+    def test_raise_error_for_missing_input(self) -> None:
+        """Test that a missing input raises a KeyError naming the dependent formula."""
+        graph = CalculationGraph(diameter=12, sigma_sd=435).add("l_b_rqd", Form8Dot3RequiredAnchorageLength)
+        with pytest.raises(KeyError, match="No input or formula named 'f_bd' in the graph for 'l_b_rqd'"):
+            graph["l_b_rqd"]
+
+    def test_raise_error_for_circular_dependency(self) -> None:
+        """Test that a circular dependency raises a ValueError."""
+        graph = CalculationGraph(diameter=12, sigma_sd=435).add("f_bd", Form8Dot3RequiredAnchorageLength)
+        with pytest.raises(ValueError, match="Circular dependency in the graph: f_bd -> f_bd"):
+            graph["f_bd"]
+
+    def test_raise_error_for_duplicate_name(self, graph: CalculationGraph) -> None:
+        """Test that adding a node with an existing name raises a ValueError."""
+        with pytest.raises(ValueError, match="'diameter' already exists"):
+            graph.add("diameter", SubForm8Dot2CoefficientBarDiameter)
+
+    def test_raise_error_for_unknown_parameter_source(self, graph: CalculationGraph) -> None:
+        """Test that a source for an unknown parameter raises a ValueError."""
+        with pytest.raises(ValueError, match="has no parameters"):
+            graph.add("l_b_rqd_2", Form8Dot3RequiredAnchorageLength, phi="diameter")
+
+    def test_raise_error_when_setting_result_of_formula(self, graph: CalculationGraph) -> None:
+        """Test that the result of a formula cannot be set as input."""
+        with pytest.raises(ValueError, match="Cannot set the results of formulas"):
+            graph.set_inputs(f_bd=3.0)
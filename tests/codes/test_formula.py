@@ -1,8 +1,28 @@
 """Module for testing the Formula class."""
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_18 import Form3Dot18CompressiveStressConcrete
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
+    Carbonation,
+    Chemical,
+    Chloride,
+    ChlorideSeawater,
+    FreezeThaw,
+    Table4Dot1ExposureClasses,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
+    Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7 import Form5Dot7EffectiveFlangeWidth
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
 from blueprints.codes.formula import Formula
+from blueprints.codes.formula_registry import FormulaRegistry
+from blueprints.validations import NegativeValueError
 
 
 class FormulaTest(Formula):
@@ -40,6 +60,14 @@ def test_raise_error_when_changing_value_after_initialization() -> None:
         dummy_testing_formula.first = 3
 
 
+def test_initialization_flag_is_not_stored_in_instance_dictionary() -> None:
+    """Test that the initialization flag is stored in a slot, so only the input values are kept in the instance dictionary."""
+    dummy_testing_formula = FormulaTest(first=1, second=2)
+    assert vars(dummy_testing_formula) == {"first": 1, "second": 2}
+    with pytest.raises(AttributeError):
+        dummy_testing_formula._initialized = False  # noqa: SLF001
+
+
 def test_raise_not_implemented_error_detailed_result() -> None:
     """Test that an error is raised when the detailed result is not implemented."""
     # example values
@@ -48,3 +76,176 @@ def test_raise_not_implemented_error_detailed_result() -> None:
     dummy_testing_formula = FormulaTest(first=first, second=second)
     with pytest.raises(NotImplementedError):
         _ = dummy_testing_formula.detailed_result
+
+
+def test_evaluate_many_broadcasts_input_values() -> None:
+    """Test that evaluate_many broadcasts scalars, sequences, arrays and series against each other."""
+    first = pd.Series([1.0, 2.0, 3.0])
+    second = np.array([[10.0], [20.0]])
+    result = FormulaTest.evaluate_many(first=first, second=second)
+
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (2, 3)
+    assert result == pytest.approx(np.array([[11.0, 12.0, 13.0], [21.0, 22.0, 23.0]]))
+
+
+def _exposure_classes(
+    carbonation: Carbonation = Carbonation.NA, chloride: Chloride = Chloride.NA, chloride_seawater: ChlorideSeawater = ChlorideSeawater.NA
+) -> Table4Dot1ExposureClasses:
+    """Exposure classes without freeze/thaw attack and chemical attack."""
+    return Table4Dot1ExposureClasses(carbonation, chloride, chloride_seawater, FreezeThaw.NA, Chemical.NA)
+
+
+EXPOSURE_CLASSES = [
+    _exposure_classes(Carbonation.XC1),
+    _exposure_classes(Carbonation.XC3),
+    _exposure_classes(Carbonation.XC4),
+    _exposure_classes(Carbonation.XC2, Chloride.XD1),
+    _exposure_classes(chloride_seawater=ChlorideSeawater.XS3),
+    _exposure_classes(),
+]
+
+# input values of the formulas with branches, with every branch taken by at least one set of input values
+BRANCHING_FORMULA_INPUTS: dict[str, dict] = {
+    "Form3Dot19And20EffectivePressureZoneHeight": {"f_ck": [12, 50, 70, 90]},
+    "SubForm3Dot2CoefficientTypeOfCementS": {"cement_class": ["R", "n", "S", "r"]},
+    "Form3Dot21And22EffectiveStrength": {"f_ck": [12, 50, 70, 90]},
+    "Form3Dot23FlexuralTensileStrength": {"h": [100, 600, 1000, 2000], "f_ctm": [2.9, 2.9, 3.5, 3.5]},
+    "SubForm3Dot4CoefficientAgeConcreteAlpha": {"t": [1, 27, 28, 90]},
+    "Form4Dot2MinimumConcreteCover": {"c_min_b": [5, 25, 5, 5], "c_min_dur": [15, 15, 5, 40], "delta_c_dur_gamma": [5, 0, 0, 5]},
+    "Table4Dot4nMinimumCoverDurabilityReinforcementSteel": {"exposure_classes": EXPOSURE_CLASSES, "structural_class": [1, 4, 6, 3, 5, 2]},
+    "Table4Dot5nMinimumCoverDurabilityPrestressingSteel": {"exposure_classes": EXPOSURE_CLASSES, "structural_class": [1, 4, 6, 3, 5, 2]},
+    "SubForm5Dot1ReductionFactorLengthOrHeight": {"length": [1, 4, 6, 16]},
+    "Form5Dot16EffectiveLengthUnbraced": {"k_1": [0.1, 1, 0.5, 2], "k_2": [0.2, 1, 0.01, 3], "height": [3, 3, 4, 5]},
+    "Form5Dot7EffectiveFlangeWidth": {"b_w": [0.2, 0.6, 0.3, 1.0], "b": [0.5, 0.4, 0.3, 2.0]},
+    "Form5Dot7abFlangeEffectiveFlangeWidth": {"b_i": [1, 0.1, 5, 3], "l_0": [10, 10, 1, 20]},
+    "Form5Dot7aFlangeEffectiveFlangeWidth": {"b_i": [1, 0.1, 5, 3], "l_0": [10, 10, 1, 20]},
+    "Form5Dot7bFlangeEffectiveFlangeWidth": {"b_i": [1, 0.1, 5, 3], "l_0": [10, 10, 1, 20]},
+    "Form7Dot3CoefficientKc": {"f_cr": [100, -100, 1, 500], "a_ct": [1000, 1000, 1000, 2000], "f_ct_eff": [2.9, 2.9, 2.9, 3.5]},
+    "Form8Dot3RequiredAnchorageLength": {"diameter": [8, 12, 16, 40], "sigma_sd": [435, 435, 300, 250], "f_bd": [2.7, 3.0, 3.0, 2.1]},
+    "Form8Dot4DesignAnchorageLength": {
+        "alpha_1": [1, 0.7, 1, 0.7],
+        "alpha_2": [1, 1, 0.8, 1],
+        "alpha_3": [1, 1, 1, 0.7],
+        "alpha_4": [1, 0.7, 1, 1],
+        "alpha_5": [1, 1, 0.7, 1],
+        "l_b_rqd": [644, 200, 300, 100],
+        "l_b_min": [200, 200, 150, 100],
+    },
+    "Form8Dot6MinimumTensionAnchorage": {"l_b_rqd": [100, 300, 600, 1000], "diameter": [8, 12, 16, 40]},
+    "Form8Dot7MinimumCompressionAnchorage": {"l_b_rqd": [100, 300, 600, 1000], "diameter": [8, 12, 16, 40]},
+    "Form8Dot8nAnchorageCapacityWeldedTransverseBar": {
+        "l_td": [50, 200, 100, 150],
+        "diameter_t": [8, 12, 10, 16],
+        "sigma_td": [10, 20, 15, 5],
+        "f_wd": [10, 20, 30, 5],
+    },
+    "SubForm8Dot8nDesignLengthOfTransverseBar": {
+        "diameter_t": [8, 12, 16, 20],
+        "f_yd": [435, 435, 435, 435],
+        "sigma_td": [10, 10, 20, 5],
+        "l_t": [50, 200, 100, 500],
+    },
+    "SubForm8Dot8nConcreteStress": {"f_ctd": [1.2, 1.5, 2, 1], "sigma_cm": [0, 5, 10, 2], "y_function": [1, 0.5, 1, 1.2], "f_cd": [20, 2, 3, 20]},
+    "Form8Dot9AnchorageCapacityWeldedTransverseBarSmallDiameter": {
+        "f_wd": [10, 100, 50, 5],
+        "diameter_t": [8, 12, 10, 6],
+        "diameter_l": [16, 20, 12, 12],
+        "a_s": [201, 314, 113, 50],
+        "f_cd": [20, 20, 20, 20],
+    },
+    "Form8Dot10DesignLapLength": {
+        "alpha_1": [1, 0.7, 1, 1],
+        "alpha_2": [1, 1, 0.8, 1],
+        "alpha_3": [1, 1, 1, 0.7],
+        "alpha_5": [1, 1, 0.7, 1],
+        "alpha_6": [1, 1.5, 1.2, 1],
+        "l_b_rqd": [644, 100, 500, 50],
+        "l_0_min": [200, 200, 200, 200],
+    },
+    "SubForm8Dot10Alpha6": {"rho_1": [0, 30, 50, 100]},
+    "Form8Dot11MinimumDesignLapLength": {"alpha_6": [1, 1.5, 1, 1], "l_b_rqd": [1000, 100, 100, 2000], "diameter": [8, 8, 20, 12]},
+    "Form8Dot14EquivalentDiameterBundledBars": {"diameter": [16, 25, 32, 40], "n_b": [2, 3, 3, 2]},
+    "SubForm8Dot15EtaP1": {"type_of_wire": ["indented", "3_7_wire_strands", "INDENTED", "3_7_Wire_Strands"]},
+    "SubForm8Dot16Alpha1": {"release_type": ["gradual", "sudden", "Sudden", "GRADUAL"]},
+    "SubForm8Dot16Alpha2": {"type_of_wire": ["circular", "3_7_wire_strands", "Circular", "3_7_WIRE_STRANDS"]},
+    "SubForm8Dot2CoefficientBarDiameter": {"diameter": [8, 32, 33, 40]},
+    "SubForm8Dot2CoefficientQualityOfBond": {"bond_quality": ["good", "other", "Good", "OTHER"]},
+    "Form9Dot1nMinimumTensileReinforcementBeam": {
+        "f_ctm": [2.9, 2.2, 4.1, 1.6],
+        "f_yk": [500, 500, 500, 500],
+        "b_t": [300, 300, 250, 400],
+        "d": [500] * 4,
+    },
+    "Form9Dot8nMaximumTransverseDistanceLegsSeriesShearLinks": {"d": [300, 800, 1000, 500]},
+    "Form9Dot12nMinimumLongitudinalReinforcementColumns": {"n_ed": [100, 1000, 2000, 50], "f_yd": [435] * 4, "a_c": [90000, 90000, 40000, 200000]},
+    "Form9Dot16MinimumForceOnInternalBeamLine": {"q_3": [10, 20, 5, 1], "l_1": [5, 6, 4, 2], "l_2": [5, 4, 6, 2], "q_4": [70, 70, 70, 70]},
+    "Form5Dot9ReducedBendingMomentResistance": {
+        "beta_b": [0.8] * 4,
+        "w_pl": [500e3, 500e3, 800e3, 300e3],
+        "rho": [0.25] * 4,
+        "a_v": [100] * 4,
+        "t_w": [10] * 4,
+        "alpha": [45] * 4,
+        "f_y": [250, 250, 355, 355],
+        "gamma_m_0": [1.0] * 4,
+        "mc_rd": [400, 50, 100, 200],
+    },
+}
+
+
+def _calls_branch_helper(formula: type) -> bool:
+    """Check if the formula calls one of the branch helpers of the formula module, which take a different path for scalars and arrays."""
+    evaluate = getattr(formula, "_evaluate", None)
+    return evaluate is not None and bool({"maximum", "minimum", "clip", "where", "select", "lookup"}.intersection(evaluate.__code__.co_names))
+
+
+BRANCHING_FORMULAS = {entry.name: formula for entry in FormulaRegistry() if _calls_branch_helper(formula := entry.load())} | {
+    "Form8Dot3RequiredAnchorageLength": Form8Dot3RequiredAnchorageLength
+}
+
+
+@pytest.mark.parametrize("name", sorted(BRANCHING_FORMULAS))
+def test_evaluate_many_matches_single_evaluations(name: str) -> None:
+    """Test that evaluate_many returns the same results as creating a formula instance per set of input values."""
+    assert name in BRANCHING_FORMULA_INPUTS, f"Add input values for {name}, which has branches, to BRANCHING_FORMULA_INPUTS"
+    formula, kwargs = BRANCHING_FORMULAS[name], BRANCHING_FORMULA_INPUTS[name]
+    expected = [formula(**dict(zip(kwargs, values))) for values in zip(*kwargs.values())]
+
+    assert formula.evaluate_many(**kwargs) == pytest.approx(expected)
+
+
+def test_evaluate_many_with_records_as_input_values() -> None:
+    """Test that evaluate_many treats tuples, like the exposure classes, as single values."""
+    exposure_classes_xc1 = Table4Dot1ExposureClasses(Carbonation.XC1, Chloride.NA, ChlorideSeawater.NA, FreezeThaw.NA, Chemical.NA)
+    exposure_classes_xd1 = Table4Dot1ExposureClasses(Carbonation.XC2, Chloride.XD1, ChlorideSeawater.NA, FreezeThaw.NA, Chemical.NA)
+
+    result = Table4Dot4nMinimumCoverDurabilityReinforcementSteel.evaluate_many(
+        exposure_classes=[exposure_classes_xc1, exposure_classes_xd1, exposure_classes_xd1],
+        structural_class=[4, 4, 6],
+    )
+
+    assert result == pytest.approx([15, 35, 45])
+
+
+def test_evaluate_many_with_positional_arguments() -> None:
+    """Test that evaluate_many passes positional arguments to the formula."""
+    result = Form5Dot7EffectiveFlangeWidth.evaluate_many([0.1, 0.2], [0.3, 0.3], b_w=0.2, b=[1.0, 0.5])
+
+    assert result == pytest.approx([0.6, 0.5])
+
+
+def test_evaluate_many_returns_new_array() -> None:
+    """Test that a formula that returns its input value does not return the array of the caller."""
+    f_cd = np.array([20.0, 30.0])
+    result = Form3Dot18CompressiveStressConcrete.evaluate_many(f_cd=f_cd)
+
+    assert not np.shares_memory(result, f_cd)
+    result[0] = 0.0
+    assert f_cd[0] == 20.0
+
+
+def test_evaluate_many_raises_error_for_invalid_input_value() -> None:
+    """Test that the validations of the formula also apply to the array inputs of evaluate_many."""
+    with pytest.raises(NegativeValueError):
+        Form8Dot3RequiredAnchorageLength.evaluate_many(diameter=[12, -16], sigma_sd=435, f_bd=3.0)
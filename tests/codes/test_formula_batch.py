@@ -0,0 +1,121 @@
+"""Module for testing the BatchRunner class."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+from blueprints.codes.formula_batch import BatchRunner, RowError
+from blueprints.validations import ArraysNotSameLengthError, LessOrEqualToZeroError
+
+
+def _anchorage_length_check(diameter: float, available_length: float) -> bool:
+    """Check if the available anchorage length is sufficient (module level, so it can be used in a process pool)."""
+    if available_length < 0:
+        raise ValueError("The available length cannot be negative.")
+    return Form8Dot3RequiredAnchorageLength(diameter=diameter, sigma_sd=435, f_bd=2.7) <= available_length
+
+
+class TestBatchRunner:
+    """Validation for the BatchRunner class."""
+
+    @pytest.fixture()
+    def inputs(self) -> pd.DataFrame:
+        """Input values of formula 8.3 for 2000 rows."""
+        return pd.DataFrame({"diameter": np.linspace(8, 40, 2000), "sigma_sd": 435.0, "f_bd": np.linspace(2.0, 4.0, 2000)})
+
+    @pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+    def test_results_in_order(self, executor: str, inputs: pd.DataFrame) -> None:
+        """Test that the results of all executors are in the order of the input values."""
+        batch = BatchRunner(Form8Dot3RequiredAnchorageLength, executor=executor, max_workers=2, chunk_size=300).run(inputs)  # type: ignore[arg-type]
+
+        np.testing.assert_allclose(batch.results, Form8Dot3RequiredAnchorageLength.evaluate_many(**inputs))
+        assert batch.errors == {}
+        assert batch.processed.all()
+
+    @pytest.mark.parametrize("executor", ["serial", "process"])
+    def test_errors_are_captured_per_row(self, executor: str) -> None:
+        """Test that the error of an invalid row is captured, while the other rows of the chunk still get a result."""
+        inputs = {"diameter": [12.0, -16.0, 20.0, 25.0], "sigma_sd": 435, "f_bd": 2.7}
+        batch = BatchRunner(Form8Dot3RequiredAnchorageLength, executor=executor, max_workers=2, chunk_size=2).run(inputs)  # type: ignore[arg-type]
+
+        assert list(batch.errors) == [1]
+        assert batch.errors[1] == RowError(
+            error_type="NegativeValueError", message="Invalid value for 'diameter': -16.0. Values for 'diameter' cannot be negative."
+        )
+        assert np.isnan(batch.results[1])
+        assert batch.results[[0, 2, 3]] == pytest.approx([483.333, 805.556, 1006.944], rel=1e-5)
+
+    def test_check_callable(self) -> None:
+        """Test a check callable, which is called per row, on a process pool."""
+        inputs = {"diameter": [12, 16, 20], "available_length": [500.0, 500.0, -1.0]}
+        batch = BatchRunner(_anchorage_length_check, max_workers=2, chunk_size=1).run(inputs)
+
+        np.testing.assert_array_equal(batch.results[:2], [1.0, 0.0])
+        assert batch.errors == {2: RowError(error_type="ValueError", message="The available length cannot be negative.")}
+
+    def test_progress(self, inputs: pd.DataFrame) -> None:
+        """Test that the progress is reported after every chunk."""
+        reported: list[tuple[int, int]] = []
+        BatchRunner(Form8Dot3RequiredAnchorageLength, executor="thread", chunk_size=500, progress=lambda *args: reported.append(args)).run(inputs)
+
+        assert reported == [(500, 2000), (1000, 2000), (1500, 2000), (2000, 2000)]
+
+    def test_cancel(self, inputs: pd.DataFrame) -> None:
+        """Test that cancelling skips the chunks that are not started yet."""
+        runner = BatchRunner(Form8Dot3RequiredAnchorageLength, executor="serial", chunk_size=500)
+        runner.progress = lambda done, _total: runner.cancel() if done >= 1000 else None
+        batch = runner.run(inputs)
+
+        assert batch.processed.sum() == 1000
+        assert np.isnan(batch.results[~batch.processed]).all()
+        assert not np.isnan(batch.results[batch.processed]).any()
+
+    def test_cancel_before_run(self, inputs: pd.DataFrame) -> None:
+        """Test that cancelling before a run cancels that run only, so the next run processes all rows."""
+        runner = BatchRunner(Form8Dot3RequiredAnchorageLength, executor="serial", chunk_size=500)
+        runner.cancel()
+
+        assert not runner.run(inputs).processed.any()
+        assert runner.run(inputs).processed.all()
+
+    def test_cancel_resets_after_run(self, inputs: pd.DataFrame) -> None:
+        """Test that a run that was cancelled while running does not cancel the next run."""
+        runner = BatchRunner(Form8Dot3RequiredAnchorageLength, executor="serial", chunk_size=500)
+        runner.progress = lambda done, _total: runner.cancel() if done >= 500 else None
+        assert not runner.run(inputs).processed.all()
+
+        runner.progress = None
+        assert runner.run(inputs).processed.all()
+
+    def test_raise_error_for_arrays_of_different_length(self) -> None:
+        """Test that arrays of input values of different length raise an error, instead of being evaluated row by row."""
+        with pytest.raises(ArraysNotSameLengthError):
+            BatchRunner(Form8Dot3RequiredAnchorageLength, executor="serial").run(
+                {"diameter": [12.0, 16.0, 20.0], "sigma_sd": 435, "f_bd": [2.7, 3.0]}
+            )
+
+    def test_chunk_size_is_tuned(self) -> None:
+        """Test that the chunk size aims at the target chunk duration, while keeping at least four chunks per worker."""
+        runner = BatchRunner(Form8Dot3RequiredAnchorageLength, max_workers=4, target_chunk_duration=0.1)
+
+        assert runner._tune_chunk_size(pilot_duration=0.01, pilot_size=512, remaining_rows=1_000_000) == 5120  # noqa: SLF001
+        assert runner._tune_chunk_size(pilot_duration=1e-5, pilot_size=512, remaining_rows=1_000_000) == 62500  # noqa: SLF001
+        assert runner._tune_chunk_size(pilot_duration=100.0, pilot_size=512, remaining_rows=1_000_000) == 1  # noqa: SLF001
+
+    def test_tuned_run(self, inputs: pd.DataFrame) -> None:
+        """Test a run with a tuned chunk size, which evaluates a pilot chunk first."""
+        batch = BatchRunner(Form8Dot3RequiredAnchorageLength, executor="thread").run(inputs)
+        np.testing.assert_allclose(batch.results, Form8Dot3RequiredAnchorageLength.evaluate_many(**inputs))
+
+    def test_raise_error_for_invalid_executor(self) -> None:
+        """Test that an invalid executor raises an error."""
+        with pytest.raises(ValueError, match="Invalid executor"):
+            BatchRunner(Form8Dot3RequiredAnchorageLength, executor="cluster")  # type: ignore[arg-type]
+
+    def test_raise_error_for_invalid_chunk_size(self) -> None:
+        """Test that the chunk size must be greater than zero."""
+        with pytest.raises(LessOrEqualToZeroError):
+            BatchRunner(Form8Dot3RequiredAnchorageLength, chunk_size=0)
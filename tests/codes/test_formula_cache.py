@@ -0,0 +1,148 @@
+"""Module for testing the FormulaCache class."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2 import (
+    SubForm8Dot2CoefficientBarDiameter,
+)
+from blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_1 import (
+    FormADot1DamageDuringDesignLife,
+)
+from blueprints.codes.formula import FormulaMeta
+from blueprints.codes.formula_cache import CacheInfo, FormulaCache
+from blueprints.validations import LessOrEqualToZeroError
+
+
+class TestFormulaCache:
+    """Validation for the FormulaCache class."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test that every instantiation creates a new instance when no cache is active."""
+        assert FormulaCache.active() is None
+        assert SubForm8Dot2CoefficientBarDiameter(diameter=40) is not SubForm8Dot2CoefficientBarDiameter(diameter=40)
+
+    def test_returns_cached_instance_for_identical_input_values(self) -> None:
+        """Test that identical input values return the cached instance, regardless of the order of the keyword arguments."""
+        with FormulaCache() as cache:
+            first = SubForm8Dot2CoefficientBarDiameter(diameter=40)
+            second = SubForm8Dot2CoefficientBarDiameter(diameter=40)
+            other = SubForm8Dot2CoefficientBarDiameter(diameter=36)
+
+            assert first is second
+            assert other is not first
+            assert first == pytest.approx(0.92)
+            assert cache.info() == CacheInfo(hits=1, misses=2, maxsize=4096, currsize=2)
+
+    def test_distinguishes_types_of_input_values(self) -> None:
+        """Test that input values of different types, but equal value, do not share a cached result."""
+        with FormulaCache():
+            integer_input = SubForm8Dot2CoefficientBarDiameter(diameter=40)
+            float_input = SubForm8Dot2CoefficientBarDiameter(diameter=40.0)
+
+            assert integer_input is not float_input
+            assert isinstance(float_input.diameter, float)
+
+    def test_cached_instance_is_read_only(self) -> None:
+        """Test that the cached instance cannot be modified."""
+        with FormulaCache():
+            result = SubForm8Dot2CoefficientBarDiameter(diameter=40)
+            with pytest.raises(AttributeError):
+                result.diameter = 12
+            assert SubForm8Dot2CoefficientBarDiameter(diameter=40).diameter == 40
+
+    def test_evicts_least_recently_used_result(self) -> None:
+        """Test that the least recently used result is evicted when the cache is full."""
+        with FormulaCache(maxsize=2) as cache:
+            first = SubForm8Dot2CoefficientBarDiameter(diameter=10)
+            SubForm8Dot2CoefficientBarDiameter(diameter=20)
+            SubForm8Dot2CoefficientBarDiameter(diameter=10)  # marks diameter 10 as most recently used
+            SubForm8Dot2CoefficientBarDiameter(diameter=30)  # evicts diameter 20
+
+            assert len(cache) == 2
+            assert SubForm8Dot2CoefficientBarDiameter(diameter=10) is first
+            assert cache.info().hits == 2
+
+    def test_unhashable_input_values_are_not_cached(self) -> None:
+        """Test that formulas with unhashable input values, like lists, are evaluated without caching."""
+        with FormulaCache() as cache:
+            first = FormADot1DamageDuringDesignLife(n_e=[1, 2], n_r=[10, 10])
+            second = FormADot1DamageDuringDesignLife(n_e=[1, 2], n_r=[10, 10])
+
+            assert first is not second
+            assert len(cache) == 0
+
+    def test_context_manager_clears_and_restores_previous_cache(self) -> None:
+        """Test that leaving the context clears the cache and re-activates the previously active cache."""
+        with FormulaCache() as outer_cache:
+            with FormulaCache() as inner_cache:
+                SubForm8Dot2CoefficientBarDiameter(diameter=40)
+                assert FormulaCache.active() is inner_cache
+                assert len(inner_cache) == 1
+            assert FormulaCache.active() is outer_cache
+            assert len(inner_cache) == 0
+            assert len(outer_cache) == 0
+        assert FormulaCache.active() is None
+
+    def test_instrumentation_is_installed_while_entered(self) -> None:
+        """Test that formulas are only instantiated through the cache lookup while a cache is entered."""
+        assert "__call__" not in vars(FormulaMeta)
+        with FormulaCache():
+            assert "__call__" in vars(FormulaMeta)
+            with FormulaCache():
+                assert "__call__" in vars(FormulaMeta)
+            assert "__call__" in vars(FormulaMeta)
+        assert "__call__" not in vars(FormulaMeta)
+
+    def test_thread_safety(self) -> None:
+        """Test that the cache can be used from multiple threads at once, by running the work in copies of the context."""
+        with FormulaCache(maxsize=50) as cache, ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(copy_context().run, SubForm8Dot2CoefficientBarDiameter, diameter=i % 100) for i in range(5000)]
+            results = [future.result() for future in futures]
+
+            assert [float(result) for result in results[:100]] == [float(SubForm8Dot2CoefficientBarDiameter(diameter=i)) for i in range(100)]
+            assert cache.info().hits + cache.info().misses == 5000 + 100
+            assert len(cache) <= 50
+
+    def test_caches_are_activated_per_thread(self) -> None:
+        """Test that threads entering and leaving caches in an interleaved order only affect their own active cache."""
+        first_entered, second_entered, first_exited = threading.Event(), threading.Event(), threading.Event()
+        active_caches: dict[str, FormulaCache | None] = {}
+
+        def first_thread() -> None:
+            with FormulaCache() as cache:
+                first_entered.set()
+                second_entered.wait()
+                active_caches["first entered"] = cache
+                active_caches["first inside"] = FormulaCache.active()
+            active_caches["first after"] = FormulaCache.active()
+            first_exited.set()
+
+        def second_thread() -> None:
+            first_entered.wait()
+            with FormulaCache() as cache:
+                second_entered.set()
+                first_exited.wait()
+                active_caches["second entered"] = cache
+                active_caches["second inside"] = FormulaCache.active()
+            active_caches["second after"] = FormulaCache.active()
+
+        threads = [threading.Thread(target=first_thread), threading.Thread(target=second_thread)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert active_caches["first inside"] is active_caches["first entered"]
+        assert active_caches["second inside"] is active_caches["second entered"]
+        assert active_caches["first after"] is None
+        assert active_caches["second after"] is None
+        assert FormulaCache.active() is None
+
+    def test_raise_error_when_maxsize_is_zero(self) -> None:
+        """Test that the maximum size must be greater than zero."""
+        with pytest.raises(LessOrEqualToZeroError):
+            FormulaCache(maxsize=0)
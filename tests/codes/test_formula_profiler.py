@@ -0,0 +1,172 @@
+"""Module for testing the FormulaProfiler class."""
+
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from blueprints.codes import formula_profiler
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_71 import (
+    Form6Dot71CriteriaBasedOnStressRange,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+from blueprints.codes.formula import FormulaMeta
+from blueprints.codes.formula_cache import FormulaCache
+from blueprints.codes.formula_profiler import FormulaProfiler, ProfileRecord
+from blueprints.validations import (
+    NegativeValueError,
+    disable_validation_timing,
+    enable_validation_timing,
+    raise_if_negative,
+    validation_timer,
+)
+
+
+class TestFormulaProfiler:
+    """Validation for the FormulaProfiler class."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test that no profiler is active and the formulas and validations are not instrumented."""
+        assert FormulaProfiler.active() is None
+        assert validation_timer.get() is None
+        assert "__call__" not in vars(FormulaMeta)
+        untimed_code = raise_if_negative.__code__
+        with FormulaProfiler():
+            assert "__call__" in vars(FormulaMeta)
+            assert raise_if_negative.__code__ is not untimed_code
+        assert "__call__" not in vars(FormulaMeta)
+        assert raise_if_negative.__code__ is untimed_code
+
+    def test_records_calls_per_formula(self) -> None:
+        """Test that every instantiation is counted, with consistent timings."""
+        with FormulaProfiler() as profiler:
+            for diameter in range(10, 20):
+                Form8Dot3RequiredAnchorageLength(diameter=diameter, sigma_sd=435, f_bd=2.25)
+
+        (record,) = profiler.records()
+        assert record.source_document == NEN_EN_1992_1_1_C2_2011
+        assert record.label == "8.3"
+        assert record.formula == "Form8Dot3RequiredAnchorageLength"
+        assert record.calls == 10
+        assert record.total_time > 0
+        assert record.mean_time == pytest.approx(record.total_time / 10)
+        assert record.p50_time <= record.p90_time <= record.p99_time
+        assert 0 < record.validation_time < record.total_time
+
+    def test_keeps_a_bounded_sample_of_durations(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that all calls are counted and timed while the percentiles come from a bounded sample of the durations."""
+        monkeypatch.setattr(formula_profiler, "_SAMPLE_SIZE", 10)
+        with FormulaProfiler() as profiler:
+            for diameter in range(10, 110):
+                Form8Dot3RequiredAnchorageLength(diameter=diameter, sigma_sd=435, f_bd=2.25)
+
+        (record,) = profiler.records()
+        assert record.calls == 100
+        assert record.mean_time == pytest.approx(record.total_time / 100)
+        assert record.p50_time <= record.p90_time <= record.p99_time <= record.total_time
+
+    def test_records_failed_calls(self) -> None:
+        """Test that an instantiation that raises an error is counted as well."""
+        with FormulaProfiler() as profiler, pytest.raises(NegativeValueError):
+            Form8Dot3RequiredAnchorageLength(diameter=-1, sigma_sd=435, f_bd=2.25)
+
+        assert profiler.records()[0].calls == 1
+
+    def test_records_check_and_its_formulas(self) -> None:
+        """Test that the evaluation of a check is recorded, including the formulas evaluated by it."""
+        check = Form6Dot71CriteriaBasedOnStressRange(gamma_f_fat=1.0, delta_sigma_s_equ_n_star=100, delta_sigma_rsk_n_star=162.5, gamma_s_fat=1.15)
+        with FormulaProfiler() as profiler:
+            assert bool(check)
+
+        records = {record.formula: record for record in profiler.records()}
+        assert set(records) == {
+            "Form6Dot71CriteriaBasedOnStressRange",
+            "Form6Dot71CriteriaBasedOnStressRangeLHS",
+            "Form6Dot71CriteriaBasedOnStressRangeRHS",
+        }
+        check_record = records["Form6Dot71CriteriaBasedOnStressRange"]
+        assert check_record.calls == 1
+        assert check_record.label == "6.71"
+        assert check_record.total_time >= records["Form6Dot71CriteriaBasedOnStressRangeLHS"].total_time
+        # validations of the formulas are attributed to the formulas, not to the check
+        assert check_record.validation_time == 0
+
+    def test_sets_and_restores_validation_timer(self) -> None:
+        """Test that the validations are timed only while a profiler is active, also with nested profilers."""
+        with FormulaProfiler() as outer:
+            assert validation_timer.get() == outer.record_validation
+            with FormulaProfiler() as inner:
+                assert FormulaProfiler.active() is inner
+                assert validation_timer.get() == inner.record_validation
+            assert FormulaProfiler.active() is outer
+            assert validation_timer.get() == outer.record_validation
+        assert FormulaProfiler.active() is None
+        assert validation_timer.get() is None
+
+    def test_nested_validations_are_timed_once(self) -> None:
+        """Test that a validation that calls another validation passes a single duration to the profiler."""
+        durations: list[float] = []
+        enable_validation_timing()
+        token = validation_timer.set(durations.append)
+        try:
+            raise_if_negative(a=np.array([1, 2]), b=np.array([3, 4]))
+        finally:
+            validation_timer.reset(token)
+            disable_validation_timing()
+
+        assert len(durations) == 1
+
+    def test_profilers_are_activated_per_thread(self) -> None:
+        """Test that a profiler activated in another thread does not profile the formulas of this thread."""
+        entered, evaluated = threading.Event(), threading.Event()
+        other_profiler = FormulaProfiler()
+
+        def other_thread() -> None:
+            with other_profiler:
+                entered.set()
+                evaluated.wait()
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        entered.wait()
+        try:
+            assert FormulaProfiler.active() is None
+            Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.25)
+        finally:
+            evaluated.set()
+            thread.join()
+        assert FormulaProfiler.active() is None
+        assert other_profiler.records() == []
+
+    def test_with_cache(self) -> None:
+        """Test that formulas are profiled while a cache is active, including the instantiations that return a cached result."""
+        with FormulaCache(), FormulaProfiler() as profiler:
+            first = Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.25)
+            second = Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.25)
+
+        assert first is second
+        assert profiler.records()[0].calls == 2
+
+    def test_exports(self) -> None:
+        """Test that the profiles are exported as DataFrame and JSON."""
+        with FormulaProfiler() as profiler:
+            Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.25)
+
+        dataframe = profiler.to_dataframe()
+        assert list(dataframe.columns) == list(ProfileRecord._fields)
+        assert dataframe.loc[0, "label"] == "8.3"
+        assert dataframe.loc[0, "calls"] == 1
+        assert json.loads(profiler.to_json()) == [profiler.records()[0]._asdict()]
+
+    def test_clear(self) -> None:
+        """Test that clearing removes all recorded profiles."""
+        with FormulaProfiler() as profiler:
+            Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.25)
+        profiler.clear()
+
+        assert profiler.records() == []
+        assert profiler.to_dataframe().empty
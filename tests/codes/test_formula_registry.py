@@ -0,0 +1,126 @@
+"""Module for testing the FormulaRegistry class."""
+
+import inspect
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2 import (
+    Form8Dot2UltimateBondStress,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+from blueprints.codes.formula_manifest import FORMULA_MANIFEST, MODULE_EXPORTS
+from blueprints.codes.formula_registry import FormulaEntry, FormulaRegistry, build_exports, build_manifest, build_type_checking_imports
+
+NEN_EN_1992_1_1_C2_2011 = "NEN-EN 1992-1-1+C2:2011"
+
+
+class TestFormulaRegistry:
+    """Validation for the FormulaRegistry class."""
+
+    @pytest.fixture()
+    def registry(self) -> FormulaRegistry:
+        """Registry of all formulas in the manifest."""
+        return FormulaRegistry()
+
+    def test_manifest_is_up_to_date(self) -> None:
+        """Test that the manifest contains all formulas; run `python -m blueprints.codes.formula_registry` if this test fails."""
+        assert [FormulaEntry(*entry) for entry in FORMULA_MANIFEST] == build_manifest()
+
+    def test_module_exports_are_up_to_date(self) -> None:
+        """Test that the manifest contains the public names of all modules; run `python -m blueprints.codes.formula_registry` if this test fails."""
+        assert build_exports() == MODULE_EXPORTS
+
+    def test_type_checking_imports_are_up_to_date(self) -> None:
+        """Test that the packages import the names they expose for type checkers; run `python -m blueprints.codes.formula_registry` if
+        this test fails.
+        """
+        for init_path, imports in build_type_checking_imports().items():
+            assert imports in init_path.read_text(encoding="utf-8"), init_path
+
+    def test_build_manifest_with_equal_names_in_different_modules(self, tmp_path: Path) -> None:
+        """Test that classes and constants with the same name in different modules are resolved within their own module."""
+        codes_directory = tmp_path / "blueprints" / "codes"
+        for document, label, parameter in (("document_a", "1.1", "first"), ("document_b", "2.1", "second")):
+            package = codes_directory / document
+            package.mkdir(parents=True)
+            (package / "__init__.py").write_text(f'DOCUMENT = "{document.upper()}"\n')
+            (package / "formula.py").write_text(
+                f"from blueprints.codes.{document} import DOCUMENT\n"
+                "class BaseFormula:\n"
+                "    source_document = DOCUMENT\n"
+                "class Formula(BaseFormula):\n"
+                f'    label = "{label}"\n'
+                f"    def __init__(self, {parameter}): ...\n"
+            )
+
+        assert build_manifest(codes_directory) == [
+            FormulaEntry("DOCUMENT_A", "1.1", None, ("first",), "blueprints.codes.document_a.formula", "Formula"),
+            FormulaEntry("DOCUMENT_B", "2.1", None, ("second",), "blueprints.codes.document_b.formula", "Formula"),
+        ]
+
+    def test_entries_match_formula_classes(self, registry: FormulaRegistry) -> None:
+        """Test that the document, label and parameters of every entry match the class of the formula."""
+        for entry in registry:
+            formula = entry.load()
+            assert (formula.label, formula.source_document) == (entry.label, entry.document)
+            parameters = inspect.signature(formula.__init__).parameters.values()
+            assert entry.parameters == tuple(
+                f"*{parameter.name}" if parameter.kind is parameter.VAR_POSITIONAL else parameter.name
+                for parameter in parameters
+                if parameter.name != "self"
+            )
+
+    def test_get(self, registry: FormulaRegistry) -> None:
+        """Test getting a formula by document and label."""
+        assert registry.get(document=NEN_EN_1992_1_1_C2_2011, label="8.3") is Form8Dot3RequiredAnchorageLength
+
+    def test_get_prefers_main_formula_over_sub_formulas(self, registry: FormulaRegistry) -> None:
+        """Test that the main formula is returned when sub-formulas share its label."""
+        assert len(registry.find(document=NEN_EN_1992_1_1_C2_2011, label="8.2")) == 3
+        assert registry.get(document=NEN_EN_1992_1_1_C2_2011, label="8.2") is Form8Dot2UltimateBondStress
+
+    def test_get_raises_error_for_unknown_label(self, registry: FormulaRegistry) -> None:
+        """Test that an unknown label raises a LookupError."""
+        with pytest.raises(LookupError, match="Expected one formula with label '99.9'"):
+            registry.get(document=NEN_EN_1992_1_1_C2_2011, label="99.9")
+
+    def test_find_checks(self, registry: FormulaRegistry) -> None:
+        """Test that checks, which are not Formula subclasses, are registered as well."""
+        assert [entry.name for entry in registry.find(document=NEN_EN_1992_1_1_C2_2011, label="6.71")] == ["Form6Dot71CriteriaBasedOnStressRange"]
+        assert registry.find(label="6.71")[0].return_symbol == "CHECK"
+
+    def test_find_by_return_symbol_and_parameters(self, registry: FormulaRegistry) -> None:
+        """Test finding formulas by return symbol and parameter names."""
+        assert [entry.name for entry in registry.find(return_symbol="l_{b,rqd}")] == ["Form8Dot3RequiredAnchorageLength"]
+        assert {entry.label for entry in registry.find(parameters=["diameter", "sigma_sd"])} >= {"8.3"}
+        assert registry.find(document="NEN-EN 1993-5:2008", parameters=["diameter"]) == []
+
+    def test_documents(self, registry: FormulaRegistry) -> None:
+        """Test the source documents in the registry."""
+        assert set(registry.documents) == {
+            "NEN 9997-1-C2:2017",
+            NEN_EN_1992_1_1_C2_2011,
+            "NEN-EN 1993-1-1+C2+A1:2016",
+            "NEN-EN 1993-1-9+C2:2012",
+            "NEN-EN 1993-5:2008",
+        }
+        assert len(registry) == len(FORMULA_MANIFEST)
+
+    def test_lookup_only_imports_found_formula(self) -> None:
+        """Test that getting a formula from the registry only imports the module of that formula."""
+        code = (
+            "import sys\n"
+            "from blueprints.codes.formula_registry import FormulaRegistry\n"
+            "FormulaRegistry().get(document='NEN-EN 1992-1-1+C2:2011', label='8.3')\n"
+            "print('\\n'.join(module for module in sys.modules if module.startswith('blueprints.codes.eurocode.')))"
+        )
+        modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+
+        assert [module for module in modules if ".formula_" in module or ".table_" in module] == [
+            "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3"
+        ]
@@ -0,0 +1,107 @@
+"""Module for testing the FormulaResults class."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_18 import Form3Dot18CompressiveStressConcrete
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
+    Carbonation,
+    Chemical,
+    Chloride,
+    ChlorideSeawater,
+    FreezeThaw,
+    Table4Dot1ExposureClasses,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
+    Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7 import Form5Dot7EffectiveFlangeWidth
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+from blueprints.codes.formula_results import FormulaResults
+from blueprints.validations import NegativeValueError
+
+
+class TestFormulaResults:
+    """Validation for the FormulaResults class."""
+
+    @pytest.fixture()
+    def results(self) -> FormulaResults:
+        """Records of formula 8.3 for three bar diameters."""
+        return FormulaResults(Form8Dot3RequiredAnchorageLength, diameter=np.array([12.0, 16.0, 20.0]), sigma_sd=435, f_bd=2.7)
+
+    def test_results_match_single_evaluations(self, results: FormulaResults) -> None:
+        """Test that the results match the results of the single evaluations."""
+        expected = [Form8Dot3RequiredAnchorageLength(diameter=diameter, sigma_sd=435, f_bd=2.7) for diameter in (12, 16, 20)]
+        np.testing.assert_allclose(results.results, expected)
+        assert list(results) == pytest.approx(expected)
+        assert len(results) == 3
+
+    def test_label_and_source_document(self, results: FormulaResults) -> None:
+        """Test that the label and source document are those of the formula."""
+        assert results.label == "8.3"
+        assert results.source_document == "NEN-EN 1992-1-1+C2:2011"
+
+    def test_arrays_are_read_only(self, results: FormulaResults) -> None:
+        """Test that the results and input values cannot be modified."""
+        with pytest.raises(ValueError, match="read-only"):
+            results.results[0] = 0
+        with pytest.raises(ValueError, match="read-only"):
+            results.inputs["diameter"][0] = 0
+        with pytest.raises(ValueError, match="read-only"):
+            results.inputs["sigma_sd"][0] = 0
+
+    def test_input_arrays_of_caller_stay_writeable(self) -> None:
+        """Test that the arrays passed as input values are not made read-only."""
+        diameters = np.array([12.0, 16.0])
+        FormulaResults(Form8Dot3RequiredAnchorageLength, diameter=diameters, sigma_sd=435, f_bd=2.7)
+        diameters[0] = 10.0
+        assert diameters.flags.writeable
+
+    def test_input_array_returned_as_result_stays_writeable(self) -> None:
+        """Test that the array of the caller stays writeable for a formula that returns its input value."""
+        f_cd = np.array([20.0, 30.0])
+        results = FormulaResults(Form3Dot18CompressiveStressConcrete, f_cd=f_cd)
+        f_cd[0] = 5.0
+        assert f_cd.flags.writeable
+        np.testing.assert_allclose(results.results, [20.0, 30.0])
+
+    def test_scalar_input_values_are_not_repeated(self) -> None:
+        """Test that scalar input values are broadcast without copying, so only the results and varying input values use memory."""
+        results = FormulaResults(Form8Dot3RequiredAnchorageLength, diameter=np.linspace(8, 40, 1000), sigma_sd=435, f_bd=2.7)
+        np.testing.assert_array_equal(results.inputs["sigma_sd"], np.full(1000, 435))
+        assert results.nbytes == 2 * 1000 * 8 + 2 * 8
+
+    def test_getitem_creates_formula_instance(self, results: FormulaResults) -> None:
+        """Test that indexing creates the formula instance of a single record, with plain Python input values."""
+        record = results[1]
+        assert isinstance(record, Form8Dot3RequiredAnchorageLength)
+        assert record == pytest.approx(results.results[1])
+        assert type(record.diameter) is float
+        assert record.diameter == 16
+
+    def test_latex(self, results: FormulaResults) -> None:
+        """Test the LaTeX representation of a single record."""
+        assert results.latex(2).complete == Form8Dot3RequiredAnchorageLength(diameter=20.0, sigma_sd=435, f_bd=2.7).latex().complete
+
+    def test_positional_arguments_and_pandas_series(self) -> None:
+        """Test records of a formula with positional arguments, given as pandas Series."""
+        results = FormulaResults(Form5Dot7EffectiveFlangeWidth, pd.Series([0.1, 0.2]), 0.3, b_w=0.2, b=pd.Series([1.0, 0.5]))
+        assert results[1] == Form5Dot7EffectiveFlangeWidth(0.2, 0.3, b_w=0.2, b=0.5)
+
+    def test_records_as_input_values(self) -> None:
+        """Test records with named tuples (exposure classes) as input values."""
+        exposure_classes = [
+            Table4Dot1ExposureClasses(Carbonation.XC1, Chloride.NA, ChlorideSeawater.NA, FreezeThaw.NA, Chemical.NA),
+            Table4Dot1ExposureClasses(Carbonation.XC2, Chloride.XD3, ChlorideSeawater.NA, FreezeThaw.NA, Chemical.NA),
+        ]
+        results = FormulaResults(Table4Dot4nMinimumCoverDurabilityReinforcementSteel, exposure_classes=exposure_classes, structural_class=4)
+        assert results[1] == Table4Dot4nMinimumCoverDurabilityReinforcementSteel(exposure_classes=exposure_classes[1], structural_class=4)
+        assert repr(results) == "FormulaResults(Table4Dot4nMinimumCoverDurabilityReinforcementSteel, 2 results)"
+
+    def test_raise_error_for_invalid_input_value(self) -> None:
+        """Test that invalid input values raise the error of the formula."""
+        with pytest.raises(NegativeValueError):
+            FormulaResults(Form8Dot3RequiredAnchorageLength, diameter=[12, -16], sigma_sd=435, f_bd=2.7)
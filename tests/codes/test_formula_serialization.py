@@ -0,0 +1,102 @@
+"""Module for testing the pickling and serialization of Formula results."""
+
+import copy
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
+    Carbonation,
+    Chemical,
+    Chloride,
+    ChlorideSeawater,
+    FreezeThaw,
+    Table4Dot1ExposureClasses,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
+    Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+from blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_1 import (
+    FormADot1DamageDuringDesignLife,
+)
+from blueprints.codes.formula import Formula
+from blueprints.codes.formula_serialization import dumps_results, loads_results
+
+
+def _anchorage_length(diameter: float) -> Form8Dot3RequiredAnchorageLength:
+    """Evaluate formula 8.3 in a worker process."""
+    return Form8Dot3RequiredAnchorageLength(diameter=diameter, sigma_sd=435, f_bd=2.7)
+
+
+def _assert_same_result(restored: Formula, original: Formula) -> None:
+    """Assert that a restored result has the class, value and input values of the original result."""
+    assert type(restored) is type(original)
+    assert float(restored) == float(original)
+    assert vars(restored) == vars(original)
+
+
+class TestPickle:
+    """Validation for pickling and copying Formula results."""
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_round_trip(self, protocol: int) -> None:
+        """Test that a result keeps its value and input values after pickling, for every pickle protocol."""
+        original = Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.7)
+        _assert_same_result(pickle.loads(pickle.dumps(original, protocol=protocol)), original)
+
+    def test_round_trip_does_not_evaluate_formula(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that unpickling does not evaluate the formula again."""
+        data = pickle.dumps(Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.7))
+
+        def _raise(*_args, **_kwargs) -> None:
+            raise AssertionError("The formula is evaluated again.")
+
+        monkeypatch.setattr(Form8Dot3RequiredAnchorageLength, "_evaluate", staticmethod(_raise))
+        assert pickle.loads(data) == pytest.approx(483.33, rel=1e-4)
+
+    def test_restored_result_is_read_only(self) -> None:
+        """Test that the restored result cannot be modified."""
+        restored = copy.deepcopy(Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.7))
+        with pytest.raises(AttributeError):
+            restored.diameter = 16
+
+    def test_process_pool(self) -> None:
+        """Test that results can be sent between the processes of a process pool."""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_anchorage_length, [12, 16]))
+        _assert_same_result(results[1], _anchorage_length(16))
+
+
+class TestDumpsLoadsResults:
+    """Validation for dumps_results and loads_results."""
+
+    def test_round_trip_of_mixed_results(self) -> None:
+        """Test that results of several formulas, with numbers, lists and records as input values, keep their order, values and inputs."""
+        exposure_classes = Table4Dot1ExposureClasses(Carbonation.XC1, Chloride.NA, ChlorideSeawater.NA, FreezeThaw.NA, Chemical.NA)
+        original = [
+            Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=2.7),
+            Table4Dot4nMinimumCoverDurabilityReinforcementSteel(exposure_classes=exposure_classes, structural_class=4),
+            Form8Dot3RequiredAnchorageLength(diameter=16.0, sigma_sd=435, f_bd=2.7),
+            FormADot1DamageDuringDesignLife(n_e=[1, 2], n_r=[10, 10]),
+            Form8Dot3RequiredAnchorageLength(diameter=-0.0, sigma_sd=435, f_bd=2.7),
+        ]
+        restored = loads_results(dumps_results(original))
+
+        assert len(restored) == len(original)
+        for restored_result, original_result in zip(restored, original):
+            _assert_same_result(restored_result, original_result)
+        assert type(restored[0].diameter) is int
+        assert str(restored[4].diameter) == "-0.0"
+
+    def test_empty(self) -> None:
+        """Test that an empty sequence of results can be serialized."""
+        assert loads_results(dumps_results([])) == []
+
+    def test_smaller_than_pickle(self) -> None:
+        """Test that the serialized results are smaller than the pickled list of results."""
+        original = [Form8Dot3RequiredAnchorageLength(diameter=8 + i / 100, sigma_sd=435, f_bd=2.7) for i in range(1000)]
+        assert len(dumps_results(original)) < len(pickle.dumps(original, protocol=pickle.HIGHEST_PROTOCOL)) / 2
@@ -23,6 +23,11 @@ class TestLine:
         with pytest.raises(ValueError):
             Line(Point(0, 0, 0), Point(0, 0, 0))
 
+    def test_error_same_points_without_z_value(self) -> None:
+        """Test the error when the same points are given, one of them without z value."""
+        with pytest.raises(ValueError):
+            Line(Point(1, 2), Point(1, 2, 0))
+
     def test_initiate_with_no_z_value(self) -> None:
         """Test the initiation with no z value."""
         line = Line(Point(0, 0), Point(3, 4))
@@ -0,0 +1,139 @@
+"""Test LineCollection class."""
+
+import numpy as np
+import pytest
+from shapely import Point
+
+from blueprints.geometry.line import Line
+from blueprints.geometry.line_collection import LineCollection
+from blueprints.geometry.operations import CoordinateSystemOptions
+
+
+class TestLineCollection:
+    """Test LineCollection."""
+
+    @pytest.fixture()
+    def lines(self) -> list[Line]:
+        """Fixture with lines in every direction."""
+        return [
+            Line(Point(0, 0, 0), Point(3, 4, 5)),
+            Line(Point(1, 1, 1), Point(-2, 1, 3)),
+            Line(Point(5, 0, 0), Point(5, -2, -7)),
+            Line(Point(0, 0, 0), Point(0, 0, 10)),
+        ]
+
+    @pytest.fixture()
+    def collection(self, lines: list[Line]) -> LineCollection:
+        """Fixture of the line collection of the lines."""
+        return LineCollection.from_lines(lines)
+
+    def test_round_trip(self, lines: list[Line], collection: LineCollection) -> None:
+        """Test the conversion from and to lines."""
+        assert len(collection) == 4
+        assert collection.to_lines() == lines
+        assert collection[1] == lines[1]
+        assert collection[[0, 2]].to_lines() == [lines[0], lines[2]]
+        assert len(collection[1:]) == 3
+
+    def test_properties_match_line(self, lines: list[Line], collection: LineCollection) -> None:
+        """Test the vectorized properties against the properties of the lines."""
+        np.testing.assert_allclose(collection.lengths, [line.length for line in lines])
+        np.testing.assert_allclose(collection.unit_vectors, [line.unit_vector.ravel() for line in lines])
+        np.testing.assert_allclose(collection.midpoints, [line.midpoint.coords[0] for line in lines])
+        np.testing.assert_allclose(collection.delta_x, [line.delta_x for line in lines])
+        np.testing.assert_allclose(collection.delta_y, [line.delta_y for line in lines])
+        np.testing.assert_allclose(collection.delta_z, [line.delta_z for line in lines])
+
+    @pytest.mark.parametrize("coordinate_system", list(CoordinateSystemOptions))
+    def test_angles_match_line(self, lines: list[Line], collection: LineCollection, coordinate_system: CoordinateSystemOptions) -> None:
+        """Test the angles in every plane against the angles of the lines."""
+        lines_in_plane = [index for index, line in enumerate(lines) if not (coordinate_system is CoordinateSystemOptions.XY and index == 3)]
+
+        angles = collection.angles(coordinate_system)
+
+        np.testing.assert_allclose(angles[lines_in_plane], [lines[index].angle(coordinate_system) for index in lines_in_plane])
+
+    @pytest.mark.parametrize("reference", ["start", "end"])
+    def test_internal_points_match_line(self, lines: list[Line], collection: LineCollection, reference: str) -> None:
+        """Test the internal points against the internal points of the lines."""
+        distances = np.array([1.0, 2.0, 0.5, 10.0])
+
+        points = collection.get_internal_points(distances, reference=reference)  # type: ignore[arg-type]
+
+        expected = [line.get_internal_point(distance, reference=reference).coords[0] for line, distance in zip(lines, distances)]  # type: ignore[arg-type]
+        np.testing.assert_allclose(points, expected, atol=1e-12)
+
+    def test_internal_points_errors(self, collection: LineCollection) -> None:
+        """Test the errors for invalid distances and references."""
+        with pytest.raises(ValueError):
+            collection.get_internal_points(100)
+        with pytest.raises(ValueError):
+            collection.get_internal_points(-1)
+        with pytest.raises(ValueError):
+            collection.get_internal_points(1, reference="middle")  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("direction", ["start", "end"])
+    def test_adjust_length_matches_line(self, lines: list[Line], collection: LineCollection, direction: str) -> None:
+        """Test the adjusted lines against the adjusted lines of the lines."""
+        distances = np.array([2.0, -1.0, 3.0, -5.0])
+
+        adjusted = collection.adjust_length(distances, direction=direction)  # type: ignore[arg-type]
+
+        expected = [line.adjust_length(distance, direction=direction) for line, distance in zip(lines, distances)]  # type: ignore[arg-type]
+        assert adjusted.to_lines() == expected
+        np.testing.assert_allclose(adjusted.lengths, collection.lengths + distances)
+
+    def test_adjust_length_errors(self, collection: LineCollection) -> None:
+        """Test the errors when shortening too much and for an invalid direction."""
+        with pytest.raises(ValueError):
+            collection.adjust_length(-5.0)
+        with pytest.raises(ValueError):
+            collection.adjust_length(1.0, direction="middle")  # type: ignore[arg-type]
+
+    def test_evenly_spaced_points_match_line(self, lines: list[Line], collection: LineCollection) -> None:
+        """Test the evenly spaced points against the points of the lines."""
+        points = collection.get_evenly_spaced_points(5)
+
+        expected = [[point.coords[0] for point in line.get_evenly_spaced_points(5)] for line in lines]
+        assert points.shape == (4, 5, 3)
+        np.testing.assert_allclose(points, expected, atol=1e-12)
+        np.testing.assert_array_equal(points[:, -1], collection.end_points)
+
+    def test_divide_into_n_lines_matches_line(self, lines: list[Line], collection: LineCollection) -> None:
+        """Test the divided lines against the divided lines of the lines."""
+        divided = collection.divide_into_n_lines(3)
+
+        assert divided.to_lines() == [part for line in lines for part in line.divide_into_n_lines(3)]
+
+    @pytest.mark.parametrize(("n", "error"), [(1, ValueError), (2.5, TypeError)])
+    def test_division_errors(self, collection: LineCollection, n: int, error: type[Exception]) -> None:
+        """Test the errors for an invalid number of points or lines."""
+        with pytest.raises(error):
+            collection.get_evenly_spaced_points(n)
+        with pytest.raises(error):
+            collection.divide_into_n_lines(n)
+
+    def test_points_without_z_value(self) -> None:
+        """Test that points without z value are declared with zero z value."""
+        collection = LineCollection([[0, 0], [1, 1]], [[3, 4], [1, 2]])
+
+        np.testing.assert_array_equal(collection.end_points, [[3, 4, 0], [1, 2, 0]])
+        np.testing.assert_allclose(collection.lengths, [5, 1])
+
+    @pytest.mark.parametrize(
+        ("start_points", "end_points"),
+        [
+            ([[0, 0, 0], [1, 1, 1]], [[1, 0, 0], [1, 1, 1]]),
+            ([[0, 0, 0]], [[1, 0, 0], [2, 0, 0]]),
+            ([[0, 0, 0, 0]], [[1, 0, 0, 0]]),
+        ],
+    )
+    def test_invalid_points(self, start_points: list, end_points: list) -> None:
+        """Test the errors for equal points and invalid shapes."""
+        with pytest.raises(ValueError):
+            LineCollection(start_points, end_points)
+
+    def test_arrays_are_read_only(self, collection: LineCollection) -> None:
+        """Test that the stored arrays can not be changed."""
+        with pytest.raises(ValueError):
+            collection.start_points[0, 0] = 1.0
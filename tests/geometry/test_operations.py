@@ -2,10 +2,11 @@
 
 import math
 
+import numpy as np
 import pytest
 from shapely import Point
 
-from blueprints.geometry.operations import CoordinateSystemOptions, calculate_rotation_angle
+from blueprints.geometry.operations import CoordinateSystemOptions, calculate_rotation_angle, calculate_rotation_angles
 from blueprints.type_alias import RAD
 
 
@@ -81,3 +82,45 @@ class TestCalculateRotationAngle:
         """Test if the rotation angle is calculated correctly for the given keypoints and coordinate system."""
         result = calculate_rotation_angle(start_point=start_point, end_point=end_point, coordinate_system=coordinate_system)
         assert result == expected_result
+
+
+class TestCalculateRotationAngles:
+    """Tests for the calculate_rotation_angles function."""
+
+    @pytest.mark.parametrize("coordinate_system", list(CoordinateSystemOptions))
+    def test_matches_calculate_rotation_angle(self, coordinate_system: CoordinateSystemOptions) -> None:
+        """Test the rotation angles of many point pairs against the rotation angle of every pair."""
+        start_points = np.random.default_rng(1).uniform(-10, 10, size=(50, 3))
+        end_points = np.random.default_rng(2).uniform(-10, 10, size=(50, 3))
+
+        angles, degenerate = calculate_rotation_angles(start_points, end_points, coordinate_system)
+
+        expected = [calculate_rotation_angle(Point(start), Point(end), coordinate_system) for start, end in zip(start_points, end_points)]
+        np.testing.assert_allclose(angles, expected, rtol=1e-14)
+        assert not degenerate.any()
+
+    def test_degenerate_pairs(self) -> None:
+        """Test that equal points and points perpendicular to the plane are masked instead of raising an error."""
+        angles, degenerate = calculate_rotation_angles([[0, 0, 0], [1, 1, 1], [0, 0, 0]], [[0, 0, 0], [1, 1, 5], [0, -1, 0]])
+
+        np.testing.assert_array_equal(degenerate, [True, True, False])
+        np.testing.assert_allclose(angles, [0, 0, 3 / 2 * math.pi])
+
+    def test_range_excludes_full_turn(self) -> None:
+        """Test that a tiny negative angle is not rounded up to 2*pi."""
+        angles, _ = calculate_rotation_angles([[0, 0]], [[1, -1e-17]])
+
+        assert 0 <= angles[0] < 2 * math.pi
+
+    @pytest.mark.parametrize(
+        ("start_points", "end_points", "coordinate_system"),
+        [
+            ([[0, 0]], [[1, 1]], CoordinateSystemOptions.XZ),
+            ([[0, 0]], [[1, 1]], CoordinateSystemOptions.YZ),
+            ([[0, 0, 0]], [[1, 1, 1], [2, 2, 2]], CoordinateSystemOptions.XY),
+        ],
+    )
+    def test_invalid_points(self, start_points: list, end_points: list, coordinate_system: CoordinateSystemOptions) -> None:
+        """Test if ValueError is raised for points without z value in the XZ or YZ plane, and for points with different shapes."""
+        with pytest.raises(ValueError):
+            calculate_rotation_angles(start_points, end_points, coordinate_system)
@@ -0,0 +1,52 @@
+"""Test Point3D class."""
+
+import numpy as np
+import pytest
+from shapely import Point
+
+from blueprints.geometry.point import Point3D
+
+
+class TestPoint3D:
+    """Test Point3D."""
+
+    def test_coordinates(self) -> None:
+        """Test the coordinates of a point, with the default zero z value."""
+        point = Point3D(1, 2)
+
+        assert (point.x, point.y, point.z) == (1.0, 2.0, 0.0)
+        np.testing.assert_array_equal(np.asarray(point), [1, 2, 0])
+        assert repr(point) == "Point3D(1.0, 2.0, 0.0)"
+
+    @pytest.mark.parametrize(("shapely_point", "expected"), [(Point(1, 2, 3), (1, 2, 3)), (Point(1, 2), (1, 2, 0))])
+    def test_shapely_round_trip(self, shapely_point: Point, expected: tuple) -> None:
+        """Test the conversion from and to shapely points."""
+        point = Point3D.from_shapely(shapely_point)
+
+        assert point == Point3D(*expected)
+        assert point.to_shapely() == Point(*expected)
+
+    def test_from_array(self) -> None:
+        """Test the creation from arrays with and without z value, and the error for an invalid shape."""
+        assert Point3D.from_array([1, 2, 3]) == Point3D(1, 2, 3)
+        assert Point3D.from_array(np.array([1, 2])) == Point3D(1, 2, 0)
+        with pytest.raises(ValueError):
+            Point3D.from_array([[1, 2, 3]])
+
+    def test_distance(self) -> None:
+        """Test the 3D distance between points."""
+        assert Point3D(0, 0, 0).distance(Point3D(2, 3, 6)) == 7.0
+
+    def test_equality_and_hash(self) -> None:
+        """Test that equal points are equal and have equal hashes."""
+        assert Point3D(0.0, 1, 2) == Point3D(-0.0, 1, 2)
+        assert len({Point3D(0.0, 1, 2), Point3D(-0.0, 1, 2), Point3D(1, 1, 2)}) == 2
+        assert Point3D(1, 2, 3) != (1, 2, 3)
+
+    def test_coordinates_are_read_only(self) -> None:
+        """Test that the coordinates can not be changed, and that a point has no attribute dictionary."""
+        point = Point3D(1, 2, 3)
+        with pytest.raises(ValueError):
+            point.coordinates[0] = 0.0
+        with pytest.raises(AttributeError):
+            point.label = "A"  # type: ignore[attr-defined]
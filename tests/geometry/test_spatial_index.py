@@ -0,0 +1,124 @@
+"""Test LineIndex class."""
+
+import numpy as np
+import pytest
+
+from blueprints.geometry.line_collection import LineCollection
+from blueprints.geometry.spatial_index import LineIndex
+
+
+def brute_force_distances(points: np.ndarray, lines: LineCollection) -> np.ndarray:
+    """Return the 3D distance of every point to every line, an array with shape (N, number of lines)."""
+    offsets = points[:, None, :] - lines.start_points[None, :, :]
+    fractions = np.clip(np.einsum("nlk,lk->nl", offsets, lines.delta) / lines.lengths**2, 0, 1)
+    return np.linalg.norm(offsets - fractions[..., None] * lines.delta[None, :, :], axis=2)
+
+
+class TestLineIndex:
+    """Test LineIndex."""
+
+    @pytest.fixture()
+    def lines(self) -> LineCollection:
+        """Fixture with random lines in 3D, including lines on top of each other in the XY-plane."""
+        rng = np.random.default_rng(0)
+        start_points = rng.uniform(0, 100, size=(300, 3))
+        end_points = start_points + rng.uniform(-10, 10, size=(300, 3))
+        end_points[:50, :2] = start_points[:50, :2]
+        return LineCollection(start_points, end_points)
+
+    @pytest.fixture()
+    def points(self) -> np.ndarray:
+        """Fixture with random points in 3D."""
+        return np.random.default_rng(1).uniform(-10, 110, size=(200, 3))
+
+    def test_nearest_matches_brute_force(self, lines: LineCollection, points: np.ndarray) -> None:
+        """Test the nearest lines and their distances against the distances to all lines."""
+        indices, distances = LineIndex(lines).nearest(points)
+
+        expected = brute_force_distances(points, lines)
+        np.testing.assert_array_equal(indices, expected.argmin(axis=1))
+        np.testing.assert_allclose(distances, expected.min(axis=1))
+
+    def test_within_distance_matches_brute_force(self, lines: LineCollection, points: np.ndarray) -> None:
+        """Test the pairs of points and lines within a distance per point against the distances to all lines."""
+        distance = np.linspace(1, 10, len(points))
+
+        pairs = LineIndex(lines).within_distance(points, distance)
+
+        expected = np.nonzero(brute_force_distances(points, lines) <= distance[:, None])
+        assert pairs.shape[0] == 2
+        assert set(zip(*pairs.tolist())) == set(zip(*expected))
+        assert np.all(np.diff(pairs[0]) >= 0)
+
+    def test_in_boxes_matches_sampling(self, lines: LineCollection) -> None:
+        """Test the pairs of boxes and lines against densely sampled points of all lines."""
+        lower_corners = np.array([[0, 0, 0], [20, 20, 20], [40, 0, 50], [90, 90, -10]])
+        upper_corners = lower_corners + np.array([[10, 10, 10], [30, 5, 30], [5, 100, 5], [200, 200, 200]])
+
+        pairs = LineIndex(lines).in_boxes(lower_corners, upper_corners)
+
+        samples = lines.get_evenly_spaced_points(2001)
+        inside = np.all((samples[None] >= lower_corners[:, None, None]) & (samples[None] <= upper_corners[:, None, None]), axis=3).any(axis=2)
+        found = set(zip(*pairs.tolist()))
+        assert set(zip(*np.nonzero(inside))) <= found
+        # lines that are found without a sampled point inside the box only touch it within the spacing of the samples
+        spacing = (lines.lengths / 2000).max()
+        for box, line in found - set(zip(*np.nonzero(inside))):
+            nearest = np.clip(samples[line], lower_corners[box], upper_corners[box])
+            assert np.linalg.norm(samples[line] - nearest, axis=1).min() <= spacing
+
+    def test_in_boxes_parallel_lines(self) -> None:
+        """Test boxes with lines parallel to the faces of the box, inside and outside the box."""
+        lines = LineCollection([[0, 5, 5], [0, 15, 5], [5, 5, -10]], [[20, 5, 5], [20, 15, 5], [5, 5, -1]])
+
+        pairs = LineIndex(lines).in_boxes([[0, 0, 0]], [[10, 10, 10]])
+
+        np.testing.assert_array_equal(pairs, [[0], [0]])
+
+    def test_intersections(self) -> None:
+        """Test the intersections of segments with crossing, touching, skew and parallel lines."""
+        lines = LineCollection(
+            [[0, 0, 0], [5, -5, 0], [5, -5, 1], [10, 0, 0], [0, 1, 0]],
+            [[10, 0, 0], [5, 5, 0], [5, 5, 1], [20, 0, 0], [10, 1, 0]],
+        )
+        segments = LineCollection([[5, -5, 0], [10, 0, 0], [0, 0.5, 0]], [[5, 5, 0], [10, 10, 10], [10, 0.5, 0]])
+
+        pairs = LineIndex(lines).intersections(segments)
+
+        assert set(zip(*pairs.tolist())) == {(0, 0), (0, 1), (0, 4), (1, 0), (1, 3), (2, 1)}
+
+    def test_intersections_with_tolerance(self) -> None:
+        """Test that skew lines intersect within a tolerance larger than their distance."""
+        lines = LineCollection([[5, -5, 1]], [[5, 5, 1]])
+        segments = LineCollection([[0, 0, 0]], [[10, 0, 0]])
+
+        assert LineIndex(lines).intersections(segments).shape == (2, 0)
+        np.testing.assert_array_equal(LineIndex(lines).intersections(segments, tolerance=1.0), [[0], [0]])
+
+    def test_default_cell_size(self, lines: LineCollection) -> None:
+        """Test that the default cell size is the median length of the lines."""
+        assert LineIndex(lines).cell_size == pytest.approx(np.median(lines.lengths))
+
+    def test_long_diagonal_lines_with_small_cells(self) -> None:
+        """Test long diagonal lines in small cells, which are registered in the cells along the lines instead of their bounding boxes."""
+        lines = LineCollection([[0, 0, 0], [0, 100_000, 0], [10, 10, 20]], [[100_000, 100_000, 100_000], [100_000, 0, 100_000], [20, 10, 10]])
+        index = LineIndex(lines, cell_size=1.0)
+        rng = np.random.default_rng(2)
+        points = lines.start_points[[0, 1]] + rng.uniform(0, 1, size=(100, 1, 1)) * lines.delta[[0, 1]] + rng.uniform(-5, 5, size=(100, 2, 3))
+        points = points.reshape(-1, 3)
+
+        indices, distances = index.nearest(points)
+        expected = brute_force_distances(points, lines)
+        np.testing.assert_array_equal(indices, expected.argmin(axis=1))
+        np.testing.assert_allclose(distances, expected.min(axis=1))
+        np.testing.assert_array_equal(index.intersections(LineCollection([[50_000, 50_000, 0]], [[50_000, 50_000, 100_000]])), [[0, 0], [0, 1]])
+
+    def test_raise_error_for_too_small_cell_size(self, lines: LineCollection) -> None:
+        """Test the error for a cell size that would split the lines into too many pieces."""
+        with pytest.raises(ValueError, match="Cell size of 1e-06 mm is too small"):
+            LineIndex(lines, cell_size=1e-6)
+
+    def test_invalid_points(self, lines: LineCollection) -> None:
+        """Test the error for points without z value."""
+        with pytest.raises(ValueError):
+            LineIndex(lines).nearest([[0, 0]])
@@ -1,8 +1,19 @@
 """Test Concrete material from table 3.1 of NEN-EN 1992-1-1+C2:2011."""
 
+import numpy as np
 import pytest
 
-from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.concrete import (
+    TABLE_3_1,
+    CementClass,
+    ConcreteClassProperties,
+    ConcreteMaterial,
+    ConcreteStrengthClass,
+    cement_class_coefficients,
+    concrete_class_properties,
+    table_3_1,
+    table_3_1_dataframe,
+)
 
 
 class TestConcreteMaterial:
@@ -183,3 +194,75 @@ class TestConcreteMaterial:
     def test_inequality_with_different_concrete_class(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
         """Test inequality with different concrete class."""
         assert fixture_concrete_material_c30_37 != ConcreteMaterial(concrete_class=ConcreteStrengthClass.C12_15)
+
+
+class TestTable3Dot1:
+    """Test class for the precomputed table 3.1."""
+
+    @pytest.mark.parametrize("concrete_class", list(ConcreteStrengthClass))
+    def test_rows_match_concrete_material(self, concrete_class: ConcreteStrengthClass) -> None:
+        """Tests that every row of the table equals the properties of the concrete material."""
+        material = ConcreteMaterial(concrete_class=concrete_class)
+        row = TABLE_3_1[list(ConcreteStrengthClass).index(concrete_class)]
+        for name in ConcreteClassProperties._fields:
+            assert getattr(concrete_class_properties(concrete_class), name) == getattr(material, name)
+            assert row[name] == getattr(material, name)
+
+    def test_high_strength_concrete(self) -> None:
+        """Tests the row of a high strength concrete class."""
+        properties = concrete_class_properties(ConcreteStrengthClass.C90_105)
+        assert properties.f_ck == 90
+        assert properties.f_ck_cube == 105
+        assert properties.e_cm == 43630
+        assert properties.eps_cu2 == 2.6
+        assert properties.n_factor == 1.4
+
+    def test_table_is_read_only(self) -> None:
+        """Tests that the table cannot be modified."""
+        with pytest.raises(ValueError):
+            TABLE_3_1["f_ck"][0] = 100
+
+    def test_vectorized_lookup_of_property(self) -> None:
+        """Tests the lookup of a property for a two-dimensional array of concrete strength classes and names."""
+        concrete_classes = np.array([[ConcreteStrengthClass.C20_25, "C30/37"], ["C90/105", ConcreteStrengthClass.C20_25]], dtype=object)
+        np.testing.assert_array_equal(table_3_1(concrete_classes, "f_ck"), [[20, 30], [90, 20]])
+        assert table_3_1(concrete_classes, "f_ctm")[0, 1] == ConcreteMaterial(ConcreteStrengthClass.C30_37).f_ctm
+
+    def test_vectorized_lookup_of_rows(self) -> None:
+        """Tests the lookup of complete rows."""
+        rows = table_3_1([ConcreteStrengthClass.C12_15, ConcreteStrengthClass.C50_60])
+        assert rows.dtype == TABLE_3_1.dtype
+        np.testing.assert_array_equal(rows["f_cm"], [20, 58])
+
+    def test_lookup_of_unknown_concrete_class(self) -> None:
+        """Tests that an unknown concrete strength class raises a ValueError."""
+        with pytest.raises(ValueError, match="C100/115"):
+            table_3_1(["C30/37", "C100/115"])
+
+    def test_lookup_of_unknown_property(self) -> None:
+        """Tests that an unknown property raises a ValueError."""
+        with pytest.raises(ValueError, match="f_yk"):
+            table_3_1(["C30/37"], "f_yk")
+
+    def test_dataframe(self) -> None:
+        """Tests the table as DataFrame."""
+        dataframe = table_3_1_dataframe()
+        assert list(dataframe.columns) == list(ConcreteClassProperties._fields)
+        assert len(dataframe) == len(ConcreteStrengthClass)
+        assert dataframe.loc["C30/37", "e_cm"] == 32836
+
+
+class TestCementClassCoefficients:
+    """Test class for the coefficients that depend on the cement class."""
+
+    def test_lookup(self) -> None:
+        """Tests the lookup of cement classes and their names, in any case, keeping the shape."""
+        coefficients = {CementClass.S: 3.0, CementClass.N: 4.0, CementClass.R: 6.0}
+
+        assert cement_class_coefficients(CementClass.N, coefficients) == 4
+        np.testing.assert_array_equal(cement_class_coefficients([["s", CementClass.R], ["N", "R"]], coefficients), [[3, 6], [4, 6]])
+
+    def test_unknown_cement_class(self) -> None:
+        """Tests the error for an unknown cement class."""
+        with pytest.raises(ValueError, match="Invalid cement class: X"):
+            cement_class_coefficients(["N", "X"], {CementClass.S: 3.0, CementClass.N: 4.0, CementClass.R: 6.0})
@@ -0,0 +1,116 @@
+"""Test the creep of concrete under a variable stress history of annex B.1 of NEN-EN 1992-1-1+C2:2011."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_6 import Form3Dot6CreepDeformationOfConcrete
+from blueprints.materials.concrete import CementClass, ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.concrete_creep import DIRICHLET_COEFFICIENTS, RETARDATION_TIMES, CreepModel
+
+
+def exact_creep_strain(model: CreepModel, t: np.ndarray, stress: np.ndarray) -> np.ndarray:
+    """Creep strain of a stress history of a single cross-section, by the convolution over all previous stress increments."""
+    increments = np.diff(stress, prepend=0.0)
+    return np.array([np.sum(increments[: index + 1] * model.creep_coefficient(t[index], t[: index + 1])) for index in range(t.size)]) / model.e_c
+
+
+class TestDirichletSeries:
+    """Test class for the Dirichlet series of the development of creep in time."""
+
+    def test_relative_error(self) -> None:
+        """Tests that the series approximates formula (B.7) with a relative error below 0.1%."""
+        x = np.logspace(-4, 6, 2000)
+        beta_c = (x / (1 + x)) ** 0.3
+
+        series = (1 - np.exp(-x[:, None] / RETARDATION_TIMES)) @ DIRICHLET_COEFFICIENTS
+
+        np.testing.assert_allclose(series, beta_c, rtol=1e-3)
+
+    def test_positive_coefficients(self) -> None:
+        """Tests that all Kelvin units have a positive coefficient."""
+        assert np.all(DIRICHLET_COEFFICIENTS > 0)
+
+
+class TestCreepModel:
+    """Test class for the creep model."""
+
+    @pytest.fixture()
+    def model(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> CreepModel:
+        """Creep model of a 300 x 500 mm cross-section of C30/37 drying on all sides, at 50% relative humidity."""
+        return CreepModel.from_cross_section(fixture_concrete_material_c30_37, a_c=300 * 500, u=2 * (300 + 500), relative_humidity=50)
+
+    def test_creep_coefficient(self, model: CreepModel) -> None:
+        """Tests the creep coefficient against a calculation by hand of annex B.1."""
+        h_0 = 2 * 300 * 500 / 1600
+        phi_rh = 1 + (1 - 0.5) / (0.1 * h_0 ** (1 / 3)) * (35 / 38) ** 0.7
+        phi_0 = phi_rh * (35 / 38) ** 0.2 * 16.8 / 38**0.5 / (0.1 + 28**0.2)
+        beta_h = 1.5 * (1 + (0.012 * 50) ** 18) * h_0 + 250 * (35 / 38) ** 0.5
+        beta_c = (972 / (beta_h + 972)) ** 0.3
+
+        assert model.beta_h == pytest.approx(beta_h)
+        assert model.creep_coefficient(t=1000, t_0=28) == pytest.approx(phi_0 * beta_c)
+        assert model.creep_coefficient(t=[7, 28], t_0=28) == pytest.approx([0, 0])
+
+    @pytest.mark.parametrize(("cement_class", "alpha"), [(CementClass.S, -1), (CementClass.N, 0), (CementClass.R, 1)])
+    def test_cement_class_adjusts_age_at_loading(self, cement_class: CementClass, alpha: int) -> None:
+        """Tests the adjustment of the age at loading of formula (B.9), through the notional creep coefficient."""
+        model = CreepModel(f_cm=38, cement_class=cement_class, h_0=200, relative_humidity=50, e_c=34478)
+        reference = CreepModel(f_cm=38, cement_class=CementClass.N, h_0=200, relative_humidity=50, e_c=34478)
+
+        adjusted_t_0 = 10 * (9 / (2 + 10**1.2) + 1) ** alpha
+        assert model.notional_creep_coefficient(10) == pytest.approx(reference.notional_creep_coefficient(adjusted_t_0))
+
+    def test_constant_stress_matches_formula_3_6(self, model: CreepModel) -> None:
+        """Tests that a constant stress gives the creep strain of formula (3.6)."""
+        t = np.geomspace(28, 1e5, 200)
+
+        strains = model.creep_strain(t, stress=10)
+
+        expected = Form3Dot6CreepDeformationOfConcrete(phi_inf_t0=float(model.creep_coefficient(1e5, 28)), sigma_c=10, e_c=float(model.e_c))
+        assert strains[0] == 0
+        assert strains[-1] == pytest.approx(expected, rel=1e-3)
+
+    def test_stress_history_matches_superposition(self, model: CreepModel) -> None:
+        """Tests a staged stress history, with loading, unloading and irregular time steps, against the exact superposition."""
+        t = np.concatenate([np.arange(7, 100, 1.0), np.geomspace(100, 10_000, 150)[1:]])
+        stress = np.where(t < 40, 4.0, 9.0) - np.where(t > 2000, 6.0, 0.0) + np.sin(t / 50)
+
+        strains = model.creep_strain(t, stress)
+
+        np.testing.assert_allclose(strains, exact_creep_strain(model, t, stress), rtol=2e-3, atol=1e-3 * np.abs(strains).max())
+
+    def test_many_cross_sections(self) -> None:
+        """Tests that every cross-section gets a row, which equals the creep strain of the cross-section on its own."""
+        material = ConcreteMaterial(ConcreteStrengthClass.C45_55, cement_class=CementClass.R)
+        a_c = np.array([1e5, 4e5, 9e5])
+        t = np.linspace(14, 3000, 100)
+        stress = np.array([[5.0], [8.0], [2.0]]) * np.ones(100)
+
+        model = CreepModel.from_cross_section(material, a_c=a_c, u=2000, relative_humidity=[40, 60, 80])
+        strains = model.creep_strain(t, stress)
+
+        assert model.shape == (3,)
+        assert strains.shape == (3, 100)
+        for row in range(3):
+            single = CreepModel.from_cross_section(material, a_c=a_c[row], u=2000, relative_humidity=[40, 60, 80][row])
+            np.testing.assert_allclose(strains[row], single.creep_strain(t, stress[row]), rtol=1e-12)
+
+    @pytest.mark.parametrize("t", [[28, 28, 50], [[28, 50]], [0, 28]])
+    def test_raise_error_when_invalid_ages(self, model: CreepModel, t: list) -> None:
+        """Tests the errors for ages that are not increasing, not one-dimensional or not positive."""
+        with pytest.raises(ValueError):
+            model.creep_strain(t, stress=1)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"cement_class": "X"},
+            {"f_cm": 0},
+            {"h_0": -1},
+            {"relative_humidity": 120},
+        ],
+    )
+    def test_raise_error_when_invalid_values(self, kwargs: dict) -> None:
+        """Tests the errors for invalid parameters."""
+        with pytest.raises(ValueError):
+            CreepModel(**{"f_cm": 38, "cement_class": "N", "h_0": 200, "relative_humidity": 50, "e_c": 34478} | kwargs)
@@ -0,0 +1,118 @@
+"""Test the shrinkage strain of concrete of art.3.1.4 (6) and annex B.2 of NEN-EN 1992-1-1+C2:2011."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_8 import Form3Dot8TotalShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_9 import Form3Dot9DryingShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10 import (
+    Form3Dot10CoefficientAgeConcreteDryingShrinkage,
+    SubForm3Dot10FictionalCrossSection,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_11 import Form3Dot11AutogeneShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_12 import Form3Dot12AutogeneShrinkageInfinity
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_13 import Form3Dot13CoefficientTimeAutogeneShrinkage
+from blueprints.materials.concrete import CementClass, ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.concrete_shrinkage import ShrinkageModel
+
+
+class TestShrinkageModel:
+    """Test class for the shrinkage model."""
+
+    def test_matches_formulas(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests the shrinkage against the formulas (3.8) to (3.13), chained for one age at a time."""
+        model = ShrinkageModel.from_cross_section(fixture_concrete_material_c30_37, a_c=300 * 500, u=2 * (300 + 500), relative_humidity=70, t_s=7)
+        ages = [7.5, 10, 28, 100, 365, 10_000]
+
+        total = model.total_shrinkage(ages)
+
+        h_0 = SubForm3Dot10FictionalCrossSection(a_c=300 * 500, u=2 * (300 + 500))
+        epsilon_ca_inf = Form3Dot12AutogeneShrinkageInfinity(f_ck=30)
+        for index, t in enumerate(ages):
+            beta_ds = Form3Dot10CoefficientAgeConcreteDryingShrinkage(t=t, t_s=7, h_0=h_0)
+            epsilon_cd = Form3Dot9DryingShrinkage(beta_ds_tt_s=beta_ds, k_h=float(model.k_h), epsilon_cd_0=float(model.epsilon_cd_0))
+            epsilon_ca = Form3Dot11AutogeneShrinkage(beta_as_t=Form3Dot13CoefficientTimeAutogeneShrinkage(t=t), epsilon_ca_inf=epsilon_ca_inf)
+            assert total[index] == pytest.approx(Form3Dot8TotalShrinkage(epsilon_cd=epsilon_cd, epsilon_ca=epsilon_ca), rel=1e-12)
+
+    @pytest.mark.parametrize(
+        ("concrete_class", "relative_humidity", "expected"),
+        [
+            (ConcreteStrengthClass.C20_25, 40, 0.58e-3),
+            (ConcreteStrengthClass.C20_25, 80, 0.30e-3),
+            (ConcreteStrengthClass.C40_50, 60, 0.38e-3),
+            (ConcreteStrengthClass.C80_95, 90, 0.08e-3),
+            (ConcreteStrengthClass.C40_50, 100, 0),
+        ],
+    )
+    def test_nominal_drying_shrinkage_table_3_2(self, concrete_class: ConcreteStrengthClass, relative_humidity: float, expected: float) -> None:
+        """Tests the nominal drying shrinkage of annex B.2 against table 3.2, for cement class N."""
+        model = ShrinkageModel.from_cross_section(ConcreteMaterial(concrete_class), a_c=1e6, u=1e4, relative_humidity=relative_humidity, t_s=1)
+
+        assert model.epsilon_cd_0 == pytest.approx(expected, abs=0.005e-3)
+
+    @pytest.mark.parametrize(("h_0", "expected"), [(50, 1.0), (100, 1.0), (150, 0.925), (300, 0.75), (400, 0.725), (800, 0.70)])
+    def test_k_h_table_3_3(self, h_0: float, expected: float) -> None:
+        """Tests the interpolation of the coefficient k_h of table 3.3."""
+        model = ShrinkageModel(f_ck=30, cement_class=CementClass.N, h_0=h_0, relative_humidity=50, t_s=1)
+
+        assert model.k_h == pytest.approx(expected)
+
+    def test_no_drying_shrinkage_before_t_s(self) -> None:
+        """Tests that the drying shrinkage is zero up to the beginning of drying."""
+        model = ShrinkageModel(f_ck=30, cement_class="r", h_0=200, relative_humidity=50, t_s=14)
+
+        drying = model.drying_shrinkage([0, 7, 14, 15])
+
+        np.testing.assert_array_equal(drying[:3], 0)
+        assert drying[3] > 0
+
+    def test_long_term_values(self) -> None:
+        """Tests that the shrinkage tends to k_h * eps_cd,0 + eps_ca(inf)."""
+        model = ShrinkageModel(f_ck=50, cement_class="S", h_0=150, relative_humidity=65, t_s=3)
+
+        assert model.total_shrinkage(1e9) == pytest.approx(model.epsilon_cd_inf + model.epsilon_ca_inf, rel=1e-3)
+
+    def test_many_cross_sections(self) -> None:
+        """Tests that every cross-section gets a row, which equals the shrinkage of the cross-section on its own."""
+        f_ck = np.array([20, 30, 45])
+        cement_class = ["S", CementClass.N, "R"]
+        h_0 = np.array([100, 250, 600])
+        t = np.linspace(1, 1000, 50)
+
+        model = ShrinkageModel(f_ck=f_ck, cement_class=cement_class, h_0=h_0, relative_humidity=75, t_s=[1, 3, 7])
+        total = model.total_shrinkage(t)
+
+        assert total.shape == (3, 50)
+        for row in range(3):
+            single = ShrinkageModel(f_ck=f_ck[row], cement_class=cement_class[row], h_0=h_0[row], relative_humidity=75, t_s=[1, 3, 7][row])
+            np.testing.assert_allclose(total[row], single.total_shrinkage(t), rtol=1e-14)
+
+    def test_shapes(self) -> None:
+        """Tests the shapes of the shrinkage of a single cross-section and of a grid of cross-sections."""
+        single = ShrinkageModel(f_ck=30, cement_class="N", h_0=200, relative_humidity=50, t_s=7)
+        grid = ShrinkageModel(f_ck=30, cement_class="N", h_0=np.full((2, 3), 200), relative_humidity=50, t_s=7)
+
+        assert single.total_shrinkage(28).shape == ()
+        assert single.autogenous_shrinkage([[28, 56]]).shape == (1, 2)
+        assert grid.total_shrinkage(np.arange(1, 5)).shape == (2, 3, 4)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"cement_class": "X"},
+            {"h_0": 0},
+            {"relative_humidity": 101},
+            {"t_s": -1},
+        ],
+    )
+    def test_raise_error_when_invalid_values(self, kwargs: dict) -> None:
+        """Tests the errors for an unknown cement class, an invalid notional size, relative humidity and beginning of drying."""
+        with pytest.raises(ValueError):
+            ShrinkageModel(**{"f_ck": 30, "cement_class": "N", "h_0": 200, "relative_humidity": 50, "t_s": 7} | kwargs)
+
+    def test_raise_error_when_negative_age(self) -> None:
+        """Tests the error for a negative age."""
+        model = ShrinkageModel(f_ck=30, cement_class="N", h_0=200, relative_humidity=50, t_s=7)
+
+        with pytest.raises(ValueError):
+            model.total_shrinkage([28, -1])
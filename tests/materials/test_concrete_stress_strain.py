@@ -0,0 +1,164 @@
+"""Test the vectorized stress-strain diagrams of concrete of art.3.1.5 and art.3.1.7 of NEN-EN 1992-1-1+C2:2011."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_14 import (
+    Form3Dot14StressStrainForShortTermLoading,
+    SubForm3Dot14Eta,
+    SubForm3Dot14K,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_17 import Form3Dot17CompressiveStressConcrete
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass, DiagramType
+from blueprints.materials.concrete_stress_strain import BilinearDiagram, ParabolaRectangleDiagram, SarginDiagram, design_diagram
+from blueprints.validations import LessOrEqualToZeroError
+
+
+class TestParabolaRectangleDiagram:
+    """Test class for the parabola-rectangle diagram."""
+
+    @pytest.mark.parametrize("concrete_class", [ConcreteStrengthClass.C30_37, ConcreteStrengthClass.C90_105])
+    def test_stress_matches_formula_3_17(self, concrete_class: ConcreteStrengthClass) -> None:
+        """Tests the stresses of the parabola against formula (3.17)."""
+        material = ConcreteMaterial(concrete_class=concrete_class)
+        diagram = ParabolaRectangleDiagram.from_material(material)
+        strains = np.linspace(0, min(diagram.eps_c2, diagram.eps_cu2), 11)
+
+        expected = [Form3Dot17CompressiveStressConcrete(material.f_cd, strain, diagram.eps_c2, diagram.n) for strain in strains]
+
+        np.testing.assert_allclose(diagram.stress(strains), expected, rtol=1e-12)
+
+    def test_plateau_tension_and_crushing(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests the stresses at the plateau, in tension and beyond the ultimate strain."""
+        diagram = ParabolaRectangleDiagram.from_material(fixture_concrete_material_c30_37)
+
+        stress = diagram.stress([-0.001, 0.0025, 0.0035, 0.0036])
+
+        np.testing.assert_allclose(stress, [0, 20, 20, 0])
+
+    def test_tangent_matches_finite_difference(self, fixture_concrete_material_c90_105: ConcreteMaterial) -> None:
+        """Tests the tangent moduli against a central difference of the stresses."""
+        diagram = ParabolaRectangleDiagram.from_material(fixture_concrete_material_c90_105)
+        strains = np.linspace(1e-5, diagram.eps_c2 - 1e-5, 50)
+        step = 1e-9
+
+        difference = (diagram.stress(strains + step) - diagram.stress(strains - step)) / (2 * step)
+
+        np.testing.assert_allclose(diagram.tangent(strains), difference, rtol=1e-5)
+
+    def test_tangent_outside_parabola(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests the tangent modulus at the start, in tension, at the plateau and beyond the ultimate strain."""
+        diagram = ParabolaRectangleDiagram.from_material(fixture_concrete_material_c30_37)
+
+        tangent = diagram.tangent([-0.001, 0, 0.003, 0.004])
+
+        np.testing.assert_allclose(tangent, [0, 2 * 20 / 0.002, 0, 0])
+
+    def test_shape_and_custom_strength(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests that the shape of the strains is kept, and a custom strength at the plateau."""
+        diagram = ParabolaRectangleDiagram.from_material(fixture_concrete_material_c30_37, f_c=fixture_concrete_material_c30_37.f_ck)
+
+        stress, tangent = diagram.stress_and_tangent(np.full((3, 4), 0.003))
+
+        assert stress.shape == tangent.shape == (3, 4)
+        np.testing.assert_allclose(stress, 30)
+
+    def test_raise_error_when_invalid_values(self) -> None:
+        """Tests the validation of the parameters."""
+        with pytest.raises(LessOrEqualToZeroError):
+            ParabolaRectangleDiagram(f_c=-20, eps_c2=0.002, eps_cu2=0.0035, n=2)
+
+
+class TestBilinearDiagram:
+    """Test class for the bi-linear diagram."""
+
+    def test_stress(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests the stresses of the linear part, the plateau, in tension and beyond the ultimate strain."""
+        diagram = BilinearDiagram.from_material(fixture_concrete_material_c30_37)
+
+        stress = diagram.stress([-0.001, 0, 0.000875, 0.00175, 0.003, 0.0036])
+
+        np.testing.assert_allclose(stress, [0, 0, 10, 20, 20, 0])
+
+    def test_tangent(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests the tangent moduli."""
+        diagram = BilinearDiagram.from_material(fixture_concrete_material_c30_37)
+
+        tangent = diagram.tangent([-0.001, 0, 0.001, 0.003, 0.0036])
+
+        np.testing.assert_allclose(tangent, [0, 20 / 0.00175, 20 / 0.00175, 0, 0])
+
+    def test_raise_error_when_invalid_values(self) -> None:
+        """Tests the validation of the parameters."""
+        with pytest.raises(LessOrEqualToZeroError):
+            BilinearDiagram(f_c=20, eps_c3=0, eps_cu3=0.0035)
+
+
+class TestSarginDiagram:
+    """Test class for the diagram of formula (3.14)."""
+
+    def test_stress_matches_formula_3_14(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests the stresses against formula (3.14)."""
+        material = fixture_concrete_material_c30_37
+        diagram = SarginDiagram.from_material(material)
+        strains = np.linspace(0, diagram.eps_cu1, 15)
+
+        k = SubForm3Dot14K(e_cm=material.e_cm, epsilon_c1=diagram.eps_c1, f_cm=material.f_cm)
+        expected = [material.f_cm * Form3Dot14StressStrainForShortTermLoading(k, SubForm3Dot14Eta(strain, diagram.eps_c1)) for strain in strains]
+
+        assert diagram.k == pytest.approx(k)
+        np.testing.assert_allclose(diagram.stress(strains), expected, rtol=1e-12)
+
+    def test_peak_stress(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests that the peak stress f_cm is reached at eps_c1 with a horizontal tangent."""
+        diagram = SarginDiagram.from_material(fixture_concrete_material_c30_37)
+
+        stress, tangent = diagram.stress_and_tangent(diagram.eps_c1)
+
+        assert stress == pytest.approx(38)
+        assert tangent == pytest.approx(0, abs=1e-6)
+
+    def test_tangent_matches_finite_difference(self, fixture_concrete_material_c90_105: ConcreteMaterial) -> None:
+        """Tests the tangent moduli against a central difference of the stresses."""
+        diagram = SarginDiagram.from_material(fixture_concrete_material_c90_105)
+        strains = np.linspace(1e-5, diagram.eps_cu1 - 1e-5, 50)
+        step = 1e-9
+
+        difference = (diagram.stress(strains + step) - diagram.stress(strains - step)) / (2 * step)
+
+        np.testing.assert_allclose(diagram.tangent(strains), difference, rtol=1e-5, atol=1e-3)
+
+    def test_tension_and_crushing(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests the stresses and tangent moduli in tension and beyond the nominal ultimate strain."""
+        diagram = SarginDiagram.from_material(fixture_concrete_material_c30_37)
+
+        stress, tangent = diagram.stress_and_tangent([-0.001, 0.004])
+
+        np.testing.assert_array_equal(stress, [0, 0])
+        np.testing.assert_array_equal(tangent, [0, 0])
+
+    def test_raise_error_when_invalid_values(self) -> None:
+        """Tests the validation of the parameters."""
+        with pytest.raises(LessOrEqualToZeroError):
+            SarginDiagram(f_cm=38, e_cm=0, eps_c1=0.002, eps_cu1=0.0035)
+
+
+class TestDesignDiagram:
+    """Test class for the design diagram of a concrete material."""
+
+    @pytest.mark.parametrize(
+        ("diagram_type", "expected_type"),
+        [(DiagramType.PARABOLIC, ParabolaRectangleDiagram), (DiagramType.BILINEAR, BilinearDiagram)],
+    )
+    def test_diagram_type(self, diagram_type: DiagramType, expected_type: type) -> None:
+        """Tests the diagram for the diagram type of the material."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=diagram_type)
+
+        assert isinstance(design_diagram(material), expected_type)
+
+    def test_raise_error_when_user_defined(self) -> None:
+        """Tests the error for a user defined diagram type."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=DiagramType.USER)
+
+        with pytest.raises(ValueError, match="User defined"):
+            design_diagram(material)
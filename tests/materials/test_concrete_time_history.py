@@ -0,0 +1,88 @@
+"""Test the development of the properties of concrete in time of art.3.1.2 and art.3.1.3 of NEN-EN 1992-1-1+C2:2011."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_1 import Form3Dot1EstimationConcreteCompressiveStrength
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_2 import (
+    Form3Dot2CoefficientDependentOfConcreteAge,
+    SubForm3Dot2CoefficientTypeOfCementS,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_4 import (
+    Form3Dot4DevelopmentTensileStrength,
+    SubForm3Dot4CoefficientAgeConcreteAlpha,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_5 import (
+    Form3Dot5ApproximationVarianceElasticModulusOverTime,
+)
+from blueprints.materials.concrete import CementClass, ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.concrete_time_history import concrete_time_history
+
+AGES = [0.5, 1, 3, 7, 14, 27.9, 28, 90, 365, 10_000]
+
+
+class TestConcreteTimeHistory:
+    """Test class for the development of the properties of concrete in time."""
+
+    @pytest.mark.parametrize("cement_class", list(CementClass))
+    def test_matches_formulas(self, cement_class: CementClass) -> None:
+        """Tests the properties against the formulas (3.1) to (3.5), evaluated for one age at a time."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C45_55, cement_class=cement_class)
+
+        history = concrete_time_history(material, t=AGES)
+
+        s = SubForm3Dot2CoefficientTypeOfCementS(cement_class.value)
+        for index, t in enumerate(AGES):
+            beta_cc_t = Form3Dot2CoefficientDependentOfConcreteAge(s=s, t=t)
+            f_cm_t = Form3Dot1EstimationConcreteCompressiveStrength(beta_cc_t=beta_cc_t, f_cm=material.f_cm)
+            alpha = SubForm3Dot4CoefficientAgeConcreteAlpha(t=t)
+            assert history.f_cm[index] == pytest.approx(f_cm_t, rel=1e-12)
+            assert history.f_ctm[index] == pytest.approx(Form3Dot4DevelopmentTensileStrength(beta_cc_t, alpha, material.f_ctm), rel=1e-12)
+            assert history.e_cm[index] == pytest.approx(
+                Form3Dot5ApproximationVarianceElasticModulusOverTime(f_cm_t, material.f_cm, material.e_cm), rel=1e-12
+            )
+
+    def test_28_day_values(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests that the properties at 28 days are the values of table 3.1."""
+        history = concrete_time_history(fixture_concrete_material_c30_37, t=28)
+
+        assert history.f_cm == pytest.approx(38)
+        assert history.f_ctm == pytest.approx(fixture_concrete_material_c30_37.f_ctm)
+        assert history.e_cm == pytest.approx(32836)
+
+    def test_many_materials(self) -> None:
+        """Tests that every material gets a row, which equals the history of the material on its own."""
+        materials = [
+            ConcreteMaterial(concrete_class=ConcreteStrengthClass.C20_25, cement_class=CementClass.S),
+            ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, cement_class=CementClass.R),
+            ConcreteMaterial(concrete_class=ConcreteStrengthClass.C90_105, cement_class=CementClass.S),
+        ]
+        t = np.arange(1, 366)
+
+        history = concrete_time_history(materials, t=t)
+
+        assert history.f_cm.shape == history.f_ctm.shape == history.e_cm.shape == (3, 365)
+        for row, material in enumerate(materials):
+            single = concrete_time_history(material, t=t)
+            np.testing.assert_array_equal(history.f_cm[row], single.f_cm)
+            np.testing.assert_array_equal(history.f_ctm[row], single.f_ctm)
+            np.testing.assert_array_equal(history.e_cm[row], single.e_cm)
+
+    def test_shape_of_ages(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
+        """Tests that the shape of the ages is kept."""
+        history = concrete_time_history([fixture_concrete_material_c30_37] * 2, t=np.full((4, 5), 10.0))
+
+        assert history.t.shape == (4, 5)
+        assert history.f_cm.shape == (2, 4, 5)
+
+    def test_no_materials(self) -> None:
+        """Tests the history of an empty sequence of materials."""
+        history = concrete_time_history([], t=[1, 2, 3])
+
+        assert history.f_cm.shape == (0, 3)
+
+    @pytest.mark.parametrize("t", [0, -1, [7, 0]])
+    def test_raise_error_when_invalid_age(self, fixture_concrete_material_c30_37: ConcreteMaterial, t: float | list[float]) -> None:
+        """Tests the error for an age of zero or less."""
+        with pytest.raises(ValueError):
+            concrete_time_history(fixture_concrete_material_c30_37, t=t)
@@ -0,0 +1,44 @@
+"""Test the interning of materials."""
+
+import gc
+import weakref
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+
+
+class TestInternedMaterial:
+    """Test class for the interning factory of the materials."""
+
+    def test_equal_materials_are_identical(self) -> None:
+        """Tests that equal materials, created with positional or keyword arguments, share one instance."""
+        first = ConcreteMaterial.get(ConcreteStrengthClass.C35_45)
+        second = ConcreteMaterial.get(concrete_class=ConcreteStrengthClass.C35_45)
+        third = ConcreteMaterial.get(ConcreteStrengthClass.C35_45, material_factor=1.5)
+
+        assert first is second is third
+
+    def test_different_materials_are_not_identical(self) -> None:
+        """Tests that different materials, including materials that only differ in the custom name, have their own instance."""
+        material = ReinforcementSteelMaterial.get(ReinforcementSteelQuality.B500B)
+
+        assert material is not ReinforcementSteelMaterial.get(ReinforcementSteelQuality.B500C)
+        assert material is not ReinforcementSteelMaterial.get(ReinforcementSteelQuality.B500B, custom_name="Rebar")
+        assert ReinforcementSteelMaterial.get(ReinforcementSteelQuality.B500B, custom_name="Rebar").name == "Rebar"
+
+    def test_intern_existing_material(self) -> None:
+        """Tests that interning a material returns the canonical instance of an equal material."""
+        canonical = ConcreteMaterial.get(ConcreteStrengthClass.C40_50)
+
+        assert ConcreteMaterial.intern(ConcreteMaterial(ConcreteStrengthClass.C40_50)) is canonical
+
+    def test_unused_materials_are_evicted(self) -> None:
+        """Tests that the interned instances are evicted when they are no longer used."""
+        material = ConcreteMaterial.get(ConcreteStrengthClass.C90_105, density=2400.0)
+        reference = weakref.ref(material)
+
+        del material
+        gc.collect()
+
+        assert reference() is None
+        assert ConcreteMaterial.get(ConcreteStrengthClass.C90_105, density=2400.0).density == 2400.0
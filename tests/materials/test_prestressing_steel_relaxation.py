@@ -0,0 +1,100 @@
+"""Test the relaxation losses of prestressing steel of art.3.3.2 and art.10.3.2.2 of NEN-EN 1992-1-1+C2:2011."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_28 import Form3Dot28RatioLossOfPreStressClass1
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_29 import Form3Dot29RatioLossOfPreStressClass2
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_30 import Form3Dot30RatioLossOfPreStressClass3
+from blueprints.materials.prestressing_steel_relaxation import LONG_TERM_HOURS, RelaxationClass, RelaxationModel, equivalent_time
+
+
+class TestRelaxationModel:
+    """Test class for the relaxation model of tendons."""
+
+    @pytest.mark.parametrize(
+        ("relaxation_class", "formula"),
+        [
+            (RelaxationClass.CLASS_1, Form3Dot28RatioLossOfPreStressClass1),
+            (RelaxationClass.CLASS_2, Form3Dot29RatioLossOfPreStressClass2),
+            (RelaxationClass.CLASS_3, Form3Dot30RatioLossOfPreStressClass3),
+        ],
+    )
+    def test_loss_ratio_matches_formulas(self, relaxation_class: RelaxationClass, formula: type) -> None:
+        """Tests the ratios of the losses of many tendons against formulas (3.28) to (3.30)."""
+        sigma_pi = np.array([1000.0, 1200.0, 1395.0])
+        t = np.array([[1, 10, 100], [1000, 10_000, 500_000]])
+        model = RelaxationModel(relaxation_class, sigma_pi=sigma_pi, f_pk=1860, rho_1000=2.5)
+
+        expected = [[[float(formula(2.5, stress / 1860, time)) for time in row] for row in t] for stress in sigma_pi]
+
+        np.testing.assert_allclose(model.loss_ratio(t), expected, rtol=1e-12)
+        np.testing.assert_allclose(model.loss(t), np.multiply(expected, sigma_pi[:, None, None]), rtol=1e-12)
+
+    def test_recommended_rho_1000(self) -> None:
+        """Tests the recommended relaxation loss at 1000 hours of every relaxation class."""
+        ratios = [RelaxationModel(relaxation_class, sigma_pi=1395, f_pk=1860).rho_1000 for relaxation_class in RelaxationClass]
+
+        np.testing.assert_array_equal(ratios, [8.0, 2.5, 4.0])
+
+    def test_equivalent_time_is_added(self) -> None:
+        """Tests that the equivalent time of a heat treatment is added to the time after tensioning."""
+        heat_treated = RelaxationModel(RelaxationClass.CLASS_2, sigma_pi=1395, f_pk=1860, t_eq=[0.0, 50.0])
+        reference = RelaxationModel(RelaxationClass.CLASS_2, sigma_pi=1395, f_pk=1860)
+
+        np.testing.assert_allclose(heat_treated.loss([0, 100]), [reference.loss([0, 100]), reference.loss([50, 150])])
+
+    def test_final_loss(self) -> None:
+        """Tests the long term loss at 500 000 hours."""
+        model = RelaxationModel(RelaxationClass.CLASS_2, sigma_pi=[1200, 1395], f_pk=1860)
+
+        np.testing.assert_allclose(model.final_loss(), model.loss(LONG_TERM_HOURS))
+        assert model.final_loss().shape == (2,)
+
+    def test_single_tendon_and_time(self) -> None:
+        """Tests the shape for a single tendon and a single time."""
+        model = RelaxationModel(RelaxationClass.CLASS_1, sigma_pi=1395, f_pk=1860)
+
+        loss = model.loss(1000)
+
+        assert loss.shape == ()
+        assert loss == pytest.approx(8 * 5.39 * np.exp(6.7 * 0.75) * 1e-5 * 1395)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "t"),
+        [
+            ({"sigma_pi": 1395, "f_pk": -1860}, 100),
+            ({"sigma_pi": 1395, "f_pk": 1860, "rho_1000": -2.5}, 100),
+            ({"sigma_pi": 1395, "f_pk": 1860, "t_eq": -1}, 100),
+            ({"sigma_pi": 1395, "f_pk": 1860}, [100, -1]),
+        ],
+    )
+    def test_raise_error_when_negative_values(self, kwargs: dict, t: list) -> None:
+        """Tests the validation of the parameters and the times."""
+        with pytest.raises(ValueError):
+            RelaxationModel(RelaxationClass.CLASS_2, **kwargs).loss(t)
+
+
+class TestEquivalentTime:
+    """Test class for the equivalent time of formula (10.2)."""
+
+    def test_evaluation(self) -> None:
+        """Tests the equivalent time of a heat treatment."""
+        t_eq = equivalent_time(temperatures=[40, 60, 60, 40], durations=[2, 4, 4, 2])
+
+        assert t_eq == pytest.approx(1.14**40 / 40 * (20 * 2 + 40 * 4 + 40 * 4 + 20 * 2))
+
+    def test_many_heat_treatments(self) -> None:
+        """Tests the equivalent times of many heat treatments, including one without heating."""
+        temperatures = np.array([[40, 60, 60, 40], [20, 20, 15, 15], [30, 30, 30, 30]])
+
+        t_eq = equivalent_time(temperatures, durations=[2, 4, 4, 2])
+
+        expected = [float(equivalent_time(row, [2, 4, 4, 2])) for row in temperatures]
+        np.testing.assert_allclose(t_eq, expected)
+        np.testing.assert_allclose(t_eq[1:], [0, 1.14**10 / 10 * 10 * 12])
+
+    def test_raise_error_when_negative_duration(self) -> None:
+        """Tests the error for a negative duration."""
+        with pytest.raises(ValueError):
+            equivalent_time(temperatures=[60, 60], durations=[2, -1])
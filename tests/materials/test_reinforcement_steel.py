@@ -36,6 +36,15 @@ class TestReinforcementSteelMaterial:
         """Tests the f_yk property."""
         assert fixture_reinforcement_steel_material_b500b.f_yk == 500
 
+    def test_f_yd(self, fixture_reinforcement_steel_material_b500b: ReinforcementSteelMaterial) -> None:
+        """Tests the f_yd property."""
+        assert fixture_reinforcement_steel_material_b500b.f_yd == pytest.approx(434.78, abs=0.01)
+
+    def test_f_yd_custom_material_factor(self) -> None:
+        """Tests the f_yd property with a custom material factor."""
+        steel_material = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B, material_factor=1.0)
+        assert steel_material.f_yd == 500
+
     def test_steel_class(self, fixture_reinforcement_steel_material_b500b: ReinforcementSteelMaterial) -> None:
         """Tests the steel_class property."""
         assert fixture_reinforcement_steel_material_b500b.steel_class == "B"
@@ -67,9 +76,9 @@ class TestReinforcementSteelMaterial:
     @pytest.mark.parametrize(
         ("steel_quality", "expected"),
         [
-            (ReinforcementSteelQuality.B500A, 250),
-            (ReinforcementSteelQuality.B500B, 500),
-            (ReinforcementSteelQuality.B500C, 750),
+            (ReinforcementSteelQuality.B500A, 25),
+            (ReinforcementSteelQuality.B500B, 50),
+            (ReinforcementSteelQuality.B500C, 75),
         ],
     )
     def test_eps_uk(self, steel_quality: ReinforcementSteelQuality, expected: str) -> None:
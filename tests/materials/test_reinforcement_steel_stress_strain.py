@@ -0,0 +1,116 @@
+"""Test the vectorized stress-strain diagrams of reinforcement steel of art.3.2.7 of NEN-EN 1992-1-1+C2:2011."""
+
+import math
+
+import numpy as np
+import pytest
+
+from blueprints.materials.reinforcement_steel import ReinforcementDiagramType, ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.materials.reinforcement_steel_stress_strain import BilinearSteelDiagram, characteristic_diagram, design_diagram
+from blueprints.validations import LessOrEqualToZeroError
+
+
+class TestBilinearSteelDiagram:
+    """Test class for the bi-linear diagram of reinforcement steel."""
+
+    def test_horizontal_top_branch(self) -> None:
+        """Tests the stresses of the elastic branch and the horizontal top branch, in tension and compression."""
+        diagram = BilinearSteelDiagram(e_s=200_000, f_y=500)
+
+        stress = diagram.stress([-0.05, -0.001, 0, 0.001, 0.0025, 0.05])
+
+        np.testing.assert_allclose(stress, [-500, -200, 0, 200, 500, 500])
+
+    def test_inclined_top_branch(self) -> None:
+        """Tests the stresses of the inclined top branch and beyond the strain limit."""
+        diagram = BilinearSteelDiagram(e_s=200_000, f_y=500, e_h=1000, eps_u=0.05)
+
+        stress = diagram.stress([0.0025, 0.0125, -0.0125, 0.051, -0.051])
+
+        np.testing.assert_allclose(stress, [500, 510, -510, 0, 0])
+
+    def test_tangent(self) -> None:
+        """Tests the tangent moduli of the elastic branch, the top branch and beyond the strain limit."""
+        diagram = BilinearSteelDiagram(e_s=200_000, f_y=500, e_h=1000, eps_u=0.05)
+
+        tangent = diagram.tangent([-0.01, -0.001, 0, 0.001, 0.01, 0.06])
+
+        np.testing.assert_allclose(tangent, [1000, 200_000, 200_000, 200_000, 1000, 0])
+
+    def test_scalar_and_shape(self) -> None:
+        """Tests that the shape of the strains is kept."""
+        diagram = BilinearSteelDiagram(e_s=200_000, f_y=500)
+
+        stress, tangent = diagram.stress_and_tangent(np.full((2, 3), 0.001))
+
+        assert stress.shape == tangent.shape == (2, 3)
+        assert diagram.stress(-0.001) == pytest.approx(-200)
+        assert diagram.eps_u == math.inf
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"e_s": 200_000, "f_y": 500, "e_h": 1000, "eps_u": 0.002},
+            {"e_s": 200_000, "f_y": 500, "e_h": 200_000},
+        ],
+    )
+    def test_raise_error_when_invalid_branches(self, kwargs: dict) -> None:
+        """Tests the error for a strain limit below the yield strain and a top branch steeper than the elastic branch."""
+        with pytest.raises(ValueError):
+            BilinearSteelDiagram(**kwargs)
+
+    def test_raise_error_when_invalid_values(self) -> None:
+        """Tests the validation of the parameters."""
+        with pytest.raises(LessOrEqualToZeroError):
+            BilinearSteelDiagram(e_s=200_000, f_y=0)
+
+
+class TestMaterialDiagrams:
+    """Test class for the characteristic and design diagrams of a reinforcement steel material."""
+
+    def test_characteristic_horizontal(self, fixture_reinforcement_steel_material_b500b: ReinforcementSteelMaterial) -> None:
+        """Tests the characteristic diagram with a horizontal top branch."""
+        diagram = characteristic_diagram(fixture_reinforcement_steel_material_b500b)
+
+        assert diagram.f_y == 500
+        assert diagram.e_h == 0
+        np.testing.assert_allclose(diagram.stress([0.001, 0.1]), [200, 500])
+
+    def test_design_horizontal(self, fixture_reinforcement_steel_material_b500b: ReinforcementSteelMaterial) -> None:
+        """Tests the design diagram with a horizontal top branch, with f_yd = f_yk / 1.15."""
+        diagram = design_diagram(fixture_reinforcement_steel_material_b500b)
+
+        np.testing.assert_allclose(diagram.stress([-0.1, 0.001, 0.1]), [-500 / 1.15, 200, 500 / 1.15])
+
+    def test_inclined(self) -> None:
+        """Tests that the inclined top branch reaches k * f_yk (/ γ_s) at eps_uk, and the design strain limit of 0.9 eps_uk."""
+        material = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B, diagram_type=ReinforcementDiagramType.BILINEAR_INCLINED)
+        eps_uk = material.eps_uk / 1000
+
+        characteristic = characteristic_diagram(material)
+        design = design_diagram(material)
+
+        assert characteristic.stress(eps_uk) == pytest.approx(540)
+        assert characteristic.eps_u == pytest.approx(eps_uk)
+        assert design.f_y + design.e_h * (eps_uk - design.eps_y) == pytest.approx(540 / 1.15)
+        assert design.stress(0.9 * eps_uk) == pytest.approx(design.f_y + design.e_h * (0.9 * eps_uk - design.eps_y))
+        assert design.eps_u == pytest.approx(0.9 * eps_uk)
+        assert design.stress(0.95 * eps_uk) == 0
+
+    def test_characteristic_b500b_ruptures_at_eps_uk(self) -> None:
+        """Tests that the characteristic diagram of B500B with an inclined top branch ruptures just past ε_uk = 5 %."""
+        material = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B, diagram_type=ReinforcementDiagramType.BILINEAR_INCLINED)
+
+        diagram = characteristic_diagram(material)
+
+        # e_h = (k - 1) * f_yk / (ε_uk - f_yk / E_s) with k = 1.08, f_yk = 500 MPa, ε_uk = 0.05 and E_s = 200 GPa
+        assert diagram.e_h == pytest.approx((1.08 - 1) * 500 / (0.05 - 500 / 200_000))
+        assert diagram.eps_u == pytest.approx(0.05)
+        np.testing.assert_allclose(diagram.stress([0.0499, 0.05, 0.0501]), [500 + diagram.e_h * (0.0499 - 0.0025), 540, 0])
+
+    def test_raise_error_when_user_defined(self) -> None:
+        """Tests the error for a user defined diagram type."""
+        material = ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.USER)
+
+        with pytest.raises(ValueError, match="User-defined"):
+            design_diagram(material)
@@ -0,0 +1,63 @@
+"""Test BeamConnectivity class."""
+
+import numpy as np
+import pytest
+
+from blueprints.geometry.line_collection import LineCollection
+from blueprints.structural_elements.beam import BeamConnectivity
+
+
+class TestBeamConnectivity:
+    """Test BeamConnectivity."""
+
+    @pytest.fixture()
+    def frame(self) -> BeamConnectivity:
+        """Fixture of a portal frame with a cantilever, with end points that differ within the tolerance."""
+        lines = LineCollection(
+            [[0, 0, 0], [0, 0, 3000], [6000, 0, 0], [6000.0004, 0, 3000]],
+            [[0, 0, 3000.0002], [6000, 0, 3000], [6000, 0, 3000], [8000, 0, 3000]],
+        )
+        return BeamConnectivity.from_lines(lines)
+
+    def test_from_lines(self, frame: BeamConnectivity) -> None:
+        """Test the merged nodes and the nodes of the beams."""
+        np.testing.assert_array_equal(frame.nodes, [[0, 0, 0], [0, 0, 3000.0002], [6000, 0, 3000], [6000, 0, 0], [8000, 0, 3000]])
+        np.testing.assert_array_equal(frame.beams, [[0, 1], [1, 2], [3, 2], [2, 4]])
+        assert repr(frame) == "BeamConnectivity(5 nodes, 4 beams)"
+
+    def test_adjacency(self, frame: BeamConnectivity) -> None:
+        """Test the beams and neighbours of the nodes in the compressed sparse row layout."""
+        np.testing.assert_array_equal(frame.node_offsets, [0, 1, 3, 6, 7, 8])
+        np.testing.assert_array_equal(frame.node_beams, [0, 0, 1, 1, 2, 3, 2, 3])
+        np.testing.assert_array_equal(frame.degrees, [1, 2, 3, 1, 1])
+        np.testing.assert_array_equal(frame.beams_at(2), [1, 2, 3])
+        np.testing.assert_array_equal(frame.neighbours(2), [1, 3, 4])
+
+    def test_lines(self, frame: BeamConnectivity) -> None:
+        """Test the lines of the beams between the merged nodes."""
+        np.testing.assert_array_equal(frame.lines.start_points, frame.nodes[[0, 1, 3, 2]])
+        np.testing.assert_array_equal(frame.lines.end_points, frame.nodes[[1, 2, 2, 4]])
+
+    def test_arrays_are_read_only(self, frame: BeamConnectivity) -> None:
+        """Test that the stored arrays can not be changed."""
+        with pytest.raises(ValueError):
+            frame.node_beams[0] = 1
+
+    @pytest.mark.parametrize(
+        ("nodes", "beams"),
+        [
+            ([[0, 0]], [[0, 0]]),
+            ([[0, 0, 0], [1, 0, 0]], [[0, 1, 1]]),
+            ([[0, 0, 0], [1, 0, 0]], [[0, 2]]),
+            ([[0, 0, 0], [1, 0, 0]], [[1, 1]]),
+        ],
+    )
+    def test_invalid_input(self, nodes: list, beams: list) -> None:
+        """Test the errors for invalid shapes, nodes that do not exist and beams with equal nodes."""
+        with pytest.raises(ValueError):
+            BeamConnectivity(nodes, beams)
+
+    def test_short_line_is_collapsed(self) -> None:
+        """Test the error for a line that is not longer than the tolerance."""
+        with pytest.raises(ValueError):
+            BeamConnectivity.from_lines(LineCollection([[0, 0, 0]], [[0.1, 0, 0]]), tolerance=1.0)
@@ -0,0 +1,55 @@
+"""Test the merging of nodes."""
+
+import numpy as np
+import pytest
+
+from blueprints.structural_elements.node import merge_nodes
+
+
+class TestMergeNodes:
+    """Test merge_nodes."""
+
+    def test_merge_within_tolerance(self) -> None:
+        """Test that points within the tolerance are merged into the node of the first point."""
+        points = [[0, 0, 0], [1000, 0, 0], [0.0005, 0, 0], [1000, 0.0009, -0.0001], [1000, 0.002, 0]]
+
+        nodes, node_indices = merge_nodes(points)
+
+        np.testing.assert_array_equal(nodes, [[0, 0, 0], [1000, 0, 0], [1000, 0.002, 0]])
+        np.testing.assert_array_equal(node_indices, [0, 1, 0, 1, 2])
+
+    def test_merge_across_cells(self) -> None:
+        """Test that points on both sides of the boundary of a cell of the spatial hash are merged."""
+        nodes, node_indices = merge_nodes([[0.99, -0.01, 5.0], [1.01, 0.01, 5.0]], tolerance=0.1)
+
+        np.testing.assert_array_equal(nodes, [[0.99, -0.01, 5.0]])
+        np.testing.assert_array_equal(node_indices, [0, 0])
+
+    def test_chains_are_merged(self) -> None:
+        """Test that a chain of points with gaps within the tolerance is merged into one node."""
+        points = np.column_stack((np.arange(100)[::-1] * 0.9, np.zeros(100), np.zeros(100)))
+
+        nodes, node_indices = merge_nodes(points, tolerance=1.0)
+
+        np.testing.assert_array_equal(nodes, points[:1])
+        np.testing.assert_array_equal(node_indices, np.zeros(100))
+
+    def test_matches_brute_force(self) -> None:
+        """Test the nodes of clustered random points against the connected components of all pairs within the tolerance."""
+        rng = np.random.default_rng(0)
+        points = np.repeat(rng.uniform(0, 100, size=(200, 3)), 3, axis=0) + rng.uniform(-0.3, 0.3, size=(600, 3))
+
+        nodes, node_indices = merge_nodes(points, tolerance=0.5)
+
+        close = np.linalg.norm(points[:, None] - points[None], axis=2) <= 0.5
+        reachable = close.copy()
+        for _ in range(10):
+            reachable = (reachable.astype(int) @ close.astype(int)) > 0
+        expected = reachable.argmax(axis=1)
+        np.testing.assert_array_equal(nodes[node_indices], points[expected])
+
+    @pytest.mark.parametrize(("points", "tolerance"), [([[0, 0]], 1e-3), ([[0, 0, 0]], 0.0)])
+    def test_invalid_input(self, points: list, tolerance: float) -> None:
+        """Test the errors for points without z value and a tolerance that is not positive."""
+        with pytest.raises(ValueError):
+            merge_nodes(points, tolerance)
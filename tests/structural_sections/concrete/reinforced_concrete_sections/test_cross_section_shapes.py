@@ -35,6 +35,29 @@ class TestCircularCrossSection:
         assert (first_vertex.x, first_vertex.y) == pytest.approx(expected=(100.0, 0.0), rel=1e-6)
         assert (last_vertex.x, last_vertex.y) == pytest.approx(expected=(100.0, 0.0), rel=1e-6)
 
+    def test_second_moments_and_section_moduli(self, circular_cross_section: CircularCrossSection) -> None:
+        """Test the second moments of area and section moduli of the CircularCrossSection class."""
+        assert circular_cross_section.moment_of_inertia_x == pytest.approx(expected=78539816.34, rel=1e-6)
+        assert circular_cross_section.moment_of_inertia_y == circular_cross_section.moment_of_inertia_x
+        assert circular_cross_section.section_modulus_x == pytest.approx(expected=785398.16, rel=1e-6)
+        assert circular_cross_section.section_modulus_y == circular_cross_section.section_modulus_x
+
+    def test_geometry_is_cached(self, circular_cross_section: CircularCrossSection) -> None:
+        """Test that the geometry is created once per instance."""
+        assert circular_cross_section.geometry is circular_cross_section.geometry
+
+    def test_resolution(self) -> None:
+        """Test the number of vertices and the area of the geometry for a given resolution."""
+        circular_cross_section = CircularCrossSection(diameter=200.0, x=0.0, y=0.0, resolution=64)
+        assert len(circular_cross_section.vertices) == 257
+        assert circular_cross_section.geometry.area == pytest.approx(expected=circular_cross_section.area, rel=1e-3)
+
+    @pytest.mark.parametrize(("diameter", "resolution"), [(0.0, 16), (200.0, 0)])
+    def test_invalid_input(self, diameter: float, resolution: int) -> None:
+        """Test the errors for a diameter that is not positive and a resolution below 1."""
+        with pytest.raises(ValueError):
+            CircularCrossSection(diameter=diameter, x=0.0, y=0.0, resolution=resolution)
+
 
 class TestRectangularCrossSection:
     """Tests for the RectangularCrossSection class."""
@@ -65,3 +88,28 @@ class TestRectangularCrossSection:
         assert len(vertices) == 5
         assert (first_vertex.x, first_vertex.y) == pytest.approx(expected=(-50.0, -100.00), rel=1e-6)
         assert (last_vertex.x, last_vertex.y) == pytest.approx(expected=(-50.0, -100.00), rel=1e-6)
+
+    def test_second_moments_and_section_moduli(self, rectangular_cross_section: RectangularCrossSection) -> None:
+        """Test the second moments of area and section moduli of the RectangularCrossSection class."""
+        assert rectangular_cross_section.moment_of_inertia_x == pytest.approx(expected=66666666.67, rel=1e-6)
+        assert rectangular_cross_section.moment_of_inertia_y == pytest.approx(expected=16666666.67, rel=1e-6)
+        assert rectangular_cross_section.section_modulus_x == pytest.approx(expected=666666.67, rel=1e-6)
+        assert rectangular_cross_section.section_modulus_y == pytest.approx(expected=333333.33, rel=1e-6)
+
+    def test_properties_match_geometry(self) -> None:
+        """Test the analytic properties against the properties of the shapely geometry of a rectangle outside the origin."""
+        rectangular_cross_section = RectangularCrossSection(width=300.0, height=500.0, x=150.0, y=-250.0)
+        geometry = rectangular_cross_section.geometry
+        assert rectangular_cross_section.area == pytest.approx(expected=geometry.area, rel=1e-9)
+        assert rectangular_cross_section.perimeter == pytest.approx(expected=geometry.length, rel=1e-9)
+        assert rectangular_cross_section.centroid.equals(geometry.centroid)
+
+    def test_geometry_is_cached(self, rectangular_cross_section: RectangularCrossSection) -> None:
+        """Test that the geometry is created once per instance."""
+        assert rectangular_cross_section.geometry is rectangular_cross_section.geometry
+
+    @pytest.mark.parametrize(("width", "height"), [(0.0, 200.0), (100.0, -200.0)])
+    def test_invalid_dimensions(self, width: float, height: float) -> None:
+        """Test the errors for a width or height that is not positive."""
+        with pytest.raises(ValueError):
+            RectangularCrossSection(width=width, height=height)
@@ -46,6 +46,12 @@ class TestRebar:
         """Test the weight_per_meter property of the Rebar class."""
         assert rebar.weight_per_meter == pytest.approx(expected=2.4661, rel=1e-4)
 
+    def test_material_is_interned(self, rebar: Rebar) -> None:
+        """Test that rebars with equal materials share one material instance."""
+        other = Rebar(diameter=16.0, x=100.0, y=0.0, material=ReinforcementSteelMaterial())
+
+        assert other.material is rebar.material is ReinforcementSteelMaterial.get()
+
     def test_relative_start_position(self, rebar: Rebar) -> None:
         """Test the relative_start_position property of the Rebar class."""
         assert rebar.relative_start_position == 0.1
@@ -4,15 +4,26 @@ Pytest tests for validation functions in Blueprints.
 It includes tests for:
 - raise_if_less_or_equal_to_zero: Ensuring it raises an exception for non-positive values.
 - raise_if_negative: Ensuring it raises an exception for negative values.
+- any_true: Ensuring it handles both scalar and array conditions.
+- raise_if_any_*: Ensuring all invalid elements of arrays are reported at once, or returned as a mask.
 """
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from blueprints.validations import (
+    ArraysNotSameLengthError,
+    ArrayValidationError,
     GreaterThan90Error,
     LessOrEqualToZeroError,
     ListsNotSameLengthError,
     NegativeValueError,
+    any_true,
+    raise_if_any_greater_than_90,
+    raise_if_any_less_or_equal_to_zero,
+    raise_if_any_negative,
+    raise_if_arrays_differ_in_length,
     raise_if_greater_than_90,
     raise_if_less_or_equal_to_zero,
     raise_if_lists_differ_in_length,
@@ -78,3 +89,75 @@ def test_raise_if_lists_differ_in_length_with_different_lengths() -> None:
     """Test that ListsNotSameLengthError is raised for lists with different length."""
     with pytest.raises(ListsNotSameLengthError):
         raise_if_lists_differ_in_length(a=[1, 2], b=[3, 4], c=[5, 6, 7])
+
+
+def test_any_true_with_scalar_condition() -> None:
+    """Test that any_true returns the scalar condition."""
+    value = 1.0
+    assert any_true(value > 0)
+    assert not any_true(value < 0)
+
+
+def test_any_true_with_array_condition() -> None:
+    """Test that any_true returns True if any element of the array condition holds."""
+    assert any_true(np.array([1, -1, 2]) < 0)
+    assert not any_true(np.array([1, 0, 2]) < 0)
+
+
+def test_raise_if_negative_with_array() -> None:
+    """Test that NegativeValueError is raised for an array with a negative value."""
+    raise_if_negative(a=np.array([0, 1, 2]))
+    with pytest.raises(NegativeValueError):
+        raise_if_negative(a=np.array([0, -1, 2]))
+
+
+def test_raise_if_any_less_or_equal_to_zero_with_positive_arrays() -> None:
+    """Test that no exception is raised and an all-False mask is returned for positive arrays."""
+    mask = raise_if_any_less_or_equal_to_zero(a=np.array([1, 2, 3]), b=4)
+    assert mask.tolist() == [False, False, False]
+
+
+def test_raise_if_any_less_or_equal_to_zero_reports_all_violations() -> None:
+    """Test that ArrayValidationError reports every offending parameter and index."""
+    with pytest.raises(ArrayValidationError) as error_info:
+        raise_if_any_less_or_equal_to_zero(a=np.array([1, 0, 3, -1]), b=np.array([1, 2, 3, 4]), c=np.array([-5, 2, 3, 4]))
+    assert list(error_info.value.violations) == ["a", "c"]
+    assert error_info.value.violations["a"].tolist() == [1, 3]
+    assert error_info.value.invalid_values["a"].tolist() == [0, -1]
+    assert error_info.value.violations["c"].tolist() == [0]
+
+
+def test_raise_if_any_negative_collect_errors_returns_mask() -> None:
+    """Test that no exception is raised in collect errors mode and the mask marks every invalid row."""
+    mask = raise_if_any_negative(collect_errors=True, a=np.array([1, -1, 3, 4]), b=np.array([0, 2, 3, -4]))
+    assert mask.tolist() == [False, True, False, True]
+
+
+def test_raise_if_any_negative_with_negative_array() -> None:
+    """Test that ArrayValidationError is raised for an array with negative values."""
+    with pytest.raises(ArrayValidationError):
+        raise_if_any_negative(a=pd.Series([0, 1, -2]))
+
+
+def test_raise_if_any_greater_than_90_broadcasts_arrays() -> None:
+    """Test that the arrays are broadcast against each other."""
+    mask = raise_if_any_greater_than_90(collect_errors=True, a=np.array([[10], [95]]), b=np.array([0, 45, 90]))
+    assert mask.tolist() == [[False, False, False], [True, True, True]]
+
+
+def test_raise_if_any_greater_than_90_limits_reported_indices() -> None:
+    """Test that the error message only shows the first indices of a large number of violations."""
+    with pytest.raises(ArrayValidationError, match=r"\(100 in total\)"):
+        raise_if_any_greater_than_90(a=np.full(100, 95))
+
+
+def test_raise_if_arrays_differ_in_length_with_equal_lengths() -> None:
+    """Test that no exception is raised for arrays of equal length."""
+    raise_if_arrays_differ_in_length(a=np.array([1, 2]), b=[3, 4], c=pd.Series([5, 6]))
+
+
+def test_raise_if_arrays_differ_in_length_reports_all_lengths() -> None:
+    """Test that ArraysNotSameLengthError reports the lengths of all arrays."""
+    with pytest.raises(ArraysNotSameLengthError) as error_info:
+        raise_if_arrays_differ_in_length(a=np.array([1, 2]), b=[3, 4, 5], c=np.array([6]))
+    assert error_info.value.lengths == {"a": 2, "b": 3, "c": 1}
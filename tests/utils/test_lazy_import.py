@@ -0,0 +1,44 @@
+"""Tests for the lazy_import function."""
+
+import pytest
+
+import blueprints.codes
+from blueprints.codes.formula_cache import FormulaCache
+from blueprints.utils.lazy_import import package_exports
+
+
+class TestLazyImport:
+    """Validation for the lazy_import function."""
+
+    def test_attribute_is_imported_from_submodule(self) -> None:
+        """Test that an attribute is imported from its submodule and stored in the package."""
+        assert blueprints.codes.FormulaCache is FormulaCache
+        assert vars(blueprints.codes)["FormulaCache"] is FormulaCache
+
+    def test_submodule_is_imported(self) -> None:
+        """Test that a submodule is imported on attribute access."""
+        assert blueprints.codes.eurocode.__name__ == "blueprints.codes.eurocode"
+
+    def test_dir_and_all_list_lazy_attributes(self) -> None:
+        """Test that __dir__ and __all__ list the attributes that are not imported yet."""
+        assert "BatchRunner" in dir(blueprints.codes)
+        assert "eurocode" in blueprints.codes.__all__
+
+    def test_raise_error_for_unknown_attribute(self) -> None:
+        """Test that accessing an unknown attribute raises an AttributeError."""
+        with pytest.raises(AttributeError, match="module 'blueprints.codes' has no attribute 'Unknown'"):
+            _ = blueprints.codes.Unknown  # type: ignore[attr-defined]
+
+
+class TestPackageExports:
+    """Validation for the package_exports function."""
+
+    def test_selects_modules_inside_package(self) -> None:
+        """Test that only the modules inside the package are selected, by their relative name."""
+        module_exports = {
+            "codes.document.chapter.formula_1": ("Form1",),
+            "codes.document_b.chapter.formula_2": ("Form2",),
+            "codes.document": ("DOCUMENT",),
+        }
+        assert package_exports("codes.document", module_exports) == {"chapter.formula_1": ("Form1",)}
+        assert package_exports("codes.document.chapter", module_exports) == {"formula_1": ("Form1",)}